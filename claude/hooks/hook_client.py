@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Hook Client - Thin client for the user-prompt-submit hook server.
+
+Sends the prompt (plus the hook's environment and cwd) to hook_server.py
+over a Unix socket and prints the combined stage output, so the hook pays
+for one small interpreter start instead of one per stage.
+
+Deliberately stdlib-only with no Maia imports: start-up time is the whole
+point.
+
+Usage:
+    # From user-prompt-submit (Stage 0.01):
+    python3 hook_client.py "$CLAUDE_USER_MESSAGE"
+
+Exit codes:
+    0 / 1: Stage result from the server (1 = prompt blocked)
+    75:    Server unavailable, timed out or failed mid-request - hook falls
+           back to running each stage script (a server is started in the
+           background for the next prompt when none is listening)
+
+Environment Variables:
+    MAIA_HOOK_SOCKET            - Override the socket path
+    MAIA_HOOK_SERVER_AUTOSTART  - "false" to never start the server
+
+Author: Maia System
+Created: 2026-10-16
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+PROTOCOL_VERSION = 1
+
+# EX_TEMPFAIL - tells the hook to use the per-stage fallback path
+EXIT_UNAVAILABLE = 75
+
+CONNECT_TIMEOUT_SECONDS = 0.2
+RESPONSE_TIMEOUT_SECONDS = 15.0
+
+MAIA_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def socket_path(maia_root: Path = MAIA_ROOT) -> Path:
+    """Socket for this checkout (one server per Maia root)."""
+    if override := os.environ.get("MAIA_HOOK_SOCKET"):
+        return Path(override)
+    digest = hashlib.sha1(str(maia_root).encode()).hexdigest()[:8]
+    return Path.home() / ".maia" / "run" / f"hook_server_{digest}.sock"
+
+
+def read_message(sock: socket.socket) -> dict:
+    """Read one newline-terminated JSON message."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    if not chunks:
+        raise ConnectionError("empty response")
+    return json.loads(b"".join(chunks))
+
+
+def start_server() -> None:
+    """Launch hook_server.py detached (it exits on its own when idle)."""
+    if os.environ.get("MAIA_HOOK_SERVER_AUTOSTART", "true").lower() == "false":
+        return
+    import subprocess
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).with_name("hook_server.py")), "serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def main() -> int:
+    message = " ".join(sys.argv[1:]) or os.environ.get("CLAUDE_USER_MESSAGE", "")
+    request = {
+        "version": PROTOCOL_VERSION,
+        "message": message,
+        "env": dict(os.environ),
+        "cwd": os.getcwd(),
+        # The hook's bash process - the server walks the process tree from
+        # here to find the Claude Code window (context ID)
+        "pid": os.getppid(),
+    }
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(str(socket_path()))
+        except OSError:
+            start_server()
+            return EXIT_UNAVAILABLE
+
+        sock.settimeout(RESPONSE_TIMEOUT_SECONDS)
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            response = read_message(sock)
+        except (OSError, ValueError):
+            # Timed out or crashed mid-request: fall back to the per-stage
+            # scripts so the prompt is still screened (Stage 0.0 fails closed).
+            # Non-blocking stages may run twice if the server is still busy.
+            return EXIT_UNAVAILABLE
+    finally:
+        sock.close()
+
+    status = response.get("status")
+    if status == "restart":
+        # Server exited because its code changed on disk
+        start_server()
+    if status != "ok":
+        return EXIT_UNAVAILABLE
+
+    output = response.get("output", "")
+    if output:
+        sys.stdout.write(output + "\n")
+    return int(response.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
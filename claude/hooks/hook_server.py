@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Hook Server - Long-lived process that runs the user-prompt-submit stages.
+
+user-prompt-submit used to start a fresh python3 for every Python stage
+(learning session, injection defense, context enforcer, context injector,
+router health, capability check, swarm auto-loader) and the swarm stage
+spawned yet another interpreter for coordinator_agent.py. This server
+imports every stage module once, keeps the CoordinatorAgent warm, and runs
+all stages in-process for each prompt sent by hook_client.py.
+
+Stage semantics match the bash hook exactly: each stage's main() runs with
+the same argv, the client's environment and cwd, and its stdout/stderr and
+exit code are handled the way the hook handles them (silent, passthrough,
+blocking, or warning). If the server is unavailable the hook runs the
+original per-stage scripts.
+
+Lifecycle:
+    - Started in the background by hook_client.py on the first miss
+    - Exits after IDLE_TIMEOUT_SECONDS without requests
+    - Exits (client restarts it) when any stage source file changes, so
+      edits to hook code take effect on the next prompt
+
+Usage:
+    python3 hook_server.py serve [--idle-timeout 3600]
+    python3 hook_server.py status
+    python3 hook_server.py stop
+
+Author: Maia System
+Created: 2026-10-16
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MAIA_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.hooks.hook_client import (
+    PROTOCOL_VERSION,
+    CONNECT_TIMEOUT_SECONDS,
+    read_message,
+    socket_path,
+)
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT_SECONDS = 3600
+POLL_INTERVAL_SECONDS = 1.0
+LOG_FILE = Path.home() / ".maia" / "logs" / "hook_server.log"
+
+# How a stage's result is handled (mirrors user-prompt-submit)
+SILENT = "silent"            # output discarded, exit code ignored
+PASSTHROUGH = "passthrough"  # stdout shown, stderr discarded
+BLOCK = "block"              # non-zero exit: show banner + output, stop with exit 1
+WARN = "warn"                # exit 1: show banner + output, continue
+
+
+@dataclass(frozen=True)
+class HookStage:
+    """One Python stage of user-prompt-submit."""
+    name: str
+    path: str                          # script path relative to MAIA_ROOT
+    argv: Tuple[str, ...]              # "{message}" is replaced by the prompt
+    mode: str
+    banner: str = ""                   # "{output}" is replaced by stage output
+    module: Optional[str] = None       # dotted import name (None: load from path)
+    requires_message: bool = True
+
+
+# Same order, arguments and handling as user-prompt-submit Stages 0.05-0.8
+HOOK_STAGES = (
+    HookStage("learning_session_start", "claude/hooks/learning_session_start.py",
+              ("{message}",), SILENT, module="claude.hooks.learning_session_start"),
+    HookStage("injection_defense", "claude/tools/security/hook_integration.py",
+              ("--check-message", "{message}"), BLOCK, banner="🛡️ SECURITY: {output}",
+              module="claude.tools.security.hook_integration"),
+    HookStage("context_enforcer", "claude/hooks/context_loading_enforcer.py",
+              ("check",), BLOCK, banner="🚨 CONTEXT LOADING VIOLATION\n{output}",
+              module="claude.hooks.context_loading_enforcer", requires_message=False),
+    HookStage("context_injector", "claude/hooks/context_pre_injector/context_pre_injector.py",
+              ("{message}",), PASSTHROUGH,
+              module="claude.hooks.context_pre_injector.context_pre_injector"),
+    HookStage("router_health", "claude/tools/🛠️_general/llm_router_health_monitor.py",
+              ("protect",), SILENT, requires_message=False),
+    HookStage("capability_check", "claude/hooks/capability_check_enforcer.py",
+              ("{message}",), WARN, banner="🔍 DUPLICATE CAPABILITY DETECTED\n{output}",
+              module="claude.hooks.capability_check_enforcer"),
+    HookStage("swarm_auto_loader", "claude/hooks/swarm_auto_loader.py",
+              ("{message}",), PASSTHROUGH, module="claude.hooks.swarm_auto_loader"),
+)
+
+
+def _load_module(stage: HookStage, maia_root: Path):
+    """Import a stage module once (by name when possible, else by file path)."""
+    if stage.module:
+        return importlib.import_module(stage.module)
+    spec = importlib.util.spec_from_file_location(
+        f"_hook_stage_{stage.name}", maia_root / stage.path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _call_main(module, argv: List[str], merge_stderr: bool) -> Tuple[int, str]:
+    """Run module.main() as if it were `python3 script argv...`."""
+    out = io.StringIO()
+    err = out if merge_stderr else io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [module.__file__] + argv
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                module.main()
+                code = 0
+            except SystemExit as e:
+                if e.code is None:
+                    code = 0
+                elif isinstance(e.code, int):
+                    code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+            except Exception as e:
+                print(f"{type(e).__name__}: {e}", file=sys.stderr)
+                code = 1
+    finally:
+        sys.argv = saved_argv
+    # Bash $(...) strips trailing newlines
+    return code, out.getvalue().rstrip("\n")
+
+
+class HookRunner:
+    """Runs the hook stages in-process with warm modules."""
+
+    def __init__(self, stages=HOOK_STAGES, maia_root: Path = MAIA_ROOT):
+        self.maia_root = maia_root
+        self.stages = [s for s in stages if (maia_root / s.path).is_file()]
+        self.modules = {}
+        self.load_errors: Dict[str, str] = {}
+        for stage in self.stages:
+            try:
+                self.modules[stage.name] = _load_module(stage, maia_root)
+            except Exception as e:
+                # Stage runs as a plain script in the fallback path only
+                logger.warning(f"Stage {stage.name} failed to load: {e}")
+                self.load_errors[stage.name] = f"{type(e).__name__}: {e}"
+        self._mtimes = self._source_mtimes()
+
+        swarm = self.modules.get("swarm_auto_loader")
+        if swarm is not None and hasattr(swarm, "use_warm_coordinator"):
+            swarm.use_warm_coordinator()
+
+    def _source_mtimes(self) -> Dict[str, float]:
+        paths = [module.__file__ for module in self.modules.values()]
+        # A fixed stage that failed to load also restarts the server
+        paths += [str(self.maia_root / s.path) for s in self.stages if s.name in self.load_errors]
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime
+            except OSError:
+                mtimes[path] = 0.0
+        return mtimes
+
+    def is_stale(self) -> bool:
+        """True if any stage source changed since it was imported."""
+        return self._source_mtimes() != self._mtimes
+
+    @contextlib.contextmanager
+    def _client_context(self, request: dict):
+        """Apply the client's environment and cwd for the duration of a request."""
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+        try:
+            with contextlib.suppress(OSError):
+                os.chdir(request.get("cwd") or saved_cwd)
+            self._bind_swarm_context(request)
+            yield
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            with contextlib.suppress(OSError):
+                os.chdir(saved_cwd)
+
+    def _bind_swarm_context(self, request: dict) -> None:
+        """Point swarm_auto_loader's per-process state at the client's window."""
+        swarm = self.modules.get("swarm_auto_loader")
+        if swarm is None:
+            return
+        pid = int(request.get("pid") or os.getpid())
+        swarm._CONTEXT_ID_CACHE = swarm.resolve_context_id(pid, pid)
+        swarm.SESSION_STATE_FILE = swarm.get_session_file_path()
+        # main() measures its SLA from module start_time
+        swarm.start_time = time.time()
+
+    def run(self, request: dict) -> dict:
+        """Run all stages for one prompt; returns the response payload."""
+        # Skipping a blocking stage would let the prompt through unchecked;
+        # let the hook run the per-stage scripts instead (fail closed there)
+        unloaded = [s.name for s in self.stages if s.mode == BLOCK and s.name in self.load_errors]
+        if unloaded:
+            return {"status": "unavailable",
+                    "error": f"blocking stage failed to load: {', '.join(unloaded)}"}
+
+        message = request.get("message", "")
+        started = time.perf_counter()
+        outputs = []
+        timings = {}
+        exit_code = 0
+
+        with self._client_context(request):
+            for stage in self.stages:
+                module = self.modules.get(stage.name)
+                if module is None or (stage.requires_message and not message):
+                    continue
+                stage_start = time.perf_counter()
+                argv = [arg.replace("{message}", message) for arg in stage.argv]
+                code, output = _call_main(module, argv, merge_stderr=stage.mode in (BLOCK, WARN))
+                timings[stage.name] = round((time.perf_counter() - stage_start) * 1000, 1)
+
+                if stage.mode == PASSTHROUGH and output:
+                    outputs.append(output)
+                elif stage.mode == BLOCK and code != 0:
+                    outputs.append(stage.banner.replace("{output}", output))
+                    exit_code = 1
+                    break
+                elif stage.mode == WARN and code == 1:
+                    outputs.append(stage.banner.replace("{output}", output))
+
+        return {
+            "status": "ok",
+            "exit_code": exit_code,
+            "output": "\n".join(outputs),
+            "timings_ms": timings,
+            "total_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server: HookServer = self.server
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = server.dispatch(request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class HookServer(socketserver.UnixStreamServer):
+    """Serial Unix socket server (stages mutate process-wide state)."""
+
+    def __init__(self, path: Path, runner: HookRunner,
+                 idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        self.path = Path(path)
+        self.runner = runner
+        self.idle_timeout = idle_timeout
+        self.timeout = POLL_INTERVAL_SECONDS
+        self.started_at = time.time()
+        self.last_request = time.time()
+        self.requests_served = 0
+        self.total_ms = 0.0
+        self.stopping = False
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def dispatch(self, request: dict) -> dict:
+        self.last_request = time.time()
+        op = request.get("op", "run")
+        if op == "status":
+            return {"status": "ok", **self.stats()}
+        if op == "stop":
+            self.stopping = True
+            return {"status": "ok"}
+        if request.get("version") != PROTOCOL_VERSION:
+            return {"status": "error", "error": "protocol version mismatch"}
+        if self.runner.is_stale():
+            self.stopping = True
+            return {"status": "restart"}
+
+        response = self.runner.run(request)
+        if response["status"] != "ok":
+            return response
+        self.requests_served += 1
+        self.total_ms += response["total_ms"]
+        if response["total_ms"] > 200:
+            logger.info(f"Slow prompt: {response['total_ms']}ms {response['timings_ms']}")
+        return response
+
+    def stats(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at),
+            "requests_served": self.requests_served,
+            "avg_ms": round(self.total_ms / self.requests_served, 1) if self.requests_served else 0.0,
+            "stages": [s.name for s in self.runner.stages if s.name in self.runner.modules],
+        }
+
+    def handle_timeout(self):
+        if time.time() - self.last_request > self.idle_timeout:
+            self.stopping = True
+
+    def serve_until_stopped(self) -> None:
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.path.unlink()
+
+
+def _send(path: Path, request: dict) -> Optional[dict]:
+    """Send one request; None if no server is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+    try:
+        sock.connect(str(path))
+        sock.settimeout(5)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        return read_message(sock)
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+def serve(idle_timeout: float = IDLE_TIMEOUT_SECONDS) -> int:
+    path = socket_path()
+    # A previous server may still be shutting down after a restart
+    for _ in range(10):
+        if _send(path, {"op": "status"}) is None:
+            break
+        time.sleep(0.1)
+    else:
+        return 0  # Another server is running
+
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        filename=str(LOG_FILE), level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    started = time.perf_counter()
+    runner = HookRunner()
+    server = HookServer(path, runner, idle_timeout=idle_timeout)
+    logger.info(
+        f"Hook server {os.getpid()} listening on {path} "
+        f"(warm-up {(time.perf_counter() - started) * 1000:.0f}ms)"
+    )
+    server.serve_until_stopped()
+    logger.info(f"Hook server {os.getpid()} stopped after {server.requests_served} requests")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="user-prompt-submit hook server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Run the server (foreground)")
+    serve_parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT_SECONDS,
+                              help=f"Exit after this many idle seconds (default: {IDLE_TIMEOUT_SECONDS})")
+    subparsers.add_parser("status", help="Show server statistics")
+    subparsers.add_parser("stop", help="Stop the server")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        return serve(args.idle_timeout)
+
+    response = _send(socket_path(), {"op": args.command})
+    if response is None:
+        print("Hook server not running")
+        return 1
+    if args.command == "status":
+        print(json.dumps(response, indent=2))
+    else:
+        print("Hook server stopping")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -57,6 +57,12 @@ start_time = time.time()
 # Context ID cache (Phase 135.6: Performance optimization - cache expensive process tree walk)
 _CONTEXT_ID_CACHE = None
 
+# In-process (module, CoordinatorAgent) set by use_warm_coordinator()
+_WARM_COORDINATOR = None
+
+# CompiledClassifier loaded by _get_compiled_classifier() (False = unavailable)
+_COMPILED_CLASSIFIER = None
+
 
 def get_context_id() -> str:
     """
@@ -67,12 +73,6 @@ def get_context_id() -> str:
     Phase 134.4: Fix PPID instability by walking process tree to Claude binary
     Phase 135.6: Cache result to avoid repeated process tree walks (121ms → <5ms)
 
-    Strategy:
-    1. Check for CLAUDE_SESSION_ID env var (if Claude provides it)
-    2. Walk process tree to find stable Claude Code binary PID
-    3. Fall back to PPID if tree walk fails
-    4. Ensures each context window has independent agent session
-
     Returns:
         Stable context identifier (e.g., "context_12345")
     """
@@ -82,15 +82,38 @@ def get_context_id() -> str:
     if _CONTEXT_ID_CACHE is not None:
         return _CONTEXT_ID_CACHE
 
+    _CONTEXT_ID_CACHE = resolve_context_id(os.getpid(), os.getppid())
+    return _CONTEXT_ID_CACHE
+
+
+def resolve_context_id(start_pid: int, fallback_pid: int) -> str:
+    """
+    Resolve the context ID for a process (uncached).
+
+    get_context_id() resolves it for this process; the hook server resolves
+    it for each client's hook process.
+
+    Strategy:
+    1. Check for CLAUDE_SESSION_ID env var (if Claude provides it)
+    2. Walk process tree from start_pid to find stable Claude Code binary PID
+    3. Fall back to fallback_pid (the caller's PPID) if tree walk fails
+    4. Ensures each context window has independent agent session
+
+    Args:
+        start_pid: PID to start the process tree walk from
+        fallback_pid: Context ID to use if no Claude binary is found
+
+    Returns:
+        Stable context identifier
+    """
     # Option 1: Claude-provided session ID (if available)
     if session_id := os.getenv("CLAUDE_SESSION_ID"):
-        _CONTEXT_ID_CACHE = session_id
         return session_id
 
     # Option 2: Walk process tree to find stable Claude Code binary
     # This PID is stable across all subprocess invocations in same window
     try:
-        current_pid = os.getpid()
+        current_pid = start_pid
         visited = set()  # Prevent infinite loops
 
         # Walk up process tree looking for Claude Code binary
@@ -123,8 +146,7 @@ def get_context_id() -> str:
 
                 # Found Claude Code binary (stable PID)
                 if 'claude' in comm.lower() and 'native-binary' in comm:
-                    _CONTEXT_ID_CACHE = str(current_pid)
-                    return _CONTEXT_ID_CACHE
+                    return str(current_pid)
 
                 current_pid = ppid
 
@@ -135,9 +157,7 @@ def get_context_id() -> str:
         pass  # Fall back to PPID
 
     # Option 3: Fall back to PPID (may be unstable but better than nothing)
-    ppid = os.getppid()
-    _CONTEXT_ID_CACHE = str(ppid)
-    return _CONTEXT_ID_CACHE
+    return str(fallback_pid)
 
 
 def get_sessions_dir() -> Path:
@@ -291,38 +311,108 @@ def cleanup_stale_sessions(max_age_hours: int = 24):
 SESSION_STATE_FILE = get_session_file_path()
 
 
-def classify_query(query: str) -> Optional[Dict[str, Any]]:
+def use_warm_coordinator() -> bool:
     """
-    Classify user query using coordinator agent.
+    Keep a CoordinatorAgent in this process for classify_query().
 
-    Returns classification result or None if classification fails.
-    Performance target: <500ms (coordinator startup + classification)
+    Long-lived callers (the hook server) call this once so classification
+    skips the coordinator subprocess and its interpreter/registry start-up.
+
+    Returns:
+        True if the in-process coordinator is available
     """
-    try:
-        coordinator_cli = MAIA_ROOT / "claude/tools/orchestration/coordinator_agent.py"
-        if not coordinator_cli.exists():
-            return None
+    global _WARM_COORDINATOR
+    if _WARM_COORDINATOR is None:
+        try:
+            orchestration_dir = str(MAIA_ROOT / "claude/tools/orchestration")
+            if orchestration_dir not in sys.path:
+                sys.path.insert(0, orchestration_dir)
+            import coordinator_agent
+            _WARM_COORDINATOR = (coordinator_agent, coordinator_agent.CoordinatorAgent())
+        except Exception as e:
+            log_error(f"Warm coordinator unavailable: {e}")
+            return False
+    return True
 
-        # Run classification with JSON output (Phase 134 enhancement)
-        result = subprocess.run(
-            [sys.executable, str(coordinator_cli), "classify", query, "--json"],
-            capture_output=True,
-            text=True,
-            timeout=0.5  # 500ms timeout (coordinator needs startup time)
-        )
 
-        # Return code handling:
-        # 0 = routing available
-        # 1 = classification error
-        # 2 = no routing needed (low confidence/complexity)
-        if result.returncode == 1:
-            return None  # Error
+def _get_compiled_classifier():
+    """
+    Load the precompiled routing tables (compiled_classifier artifact).
 
-        if result.returncode == 2:
-            return None  # No routing needed
+    Stdlib-only import, so classification costs well under a millisecond
+    instead of a coordinator subprocess. The artifact is rebuilt when the
+    coordinator's tables change on disk.
+    """
+    global _COMPILED_CLASSIFIER
+    if _COMPILED_CLASSIFIER is False:
+        return None
+    if _COMPILED_CLASSIFIER is None or _COMPILED_CLASSIFIER.is_stale():
+        try:
+            orchestration_dir = str(MAIA_ROOT / "claude/tools/orchestration")
+            if orchestration_dir not in sys.path:
+                sys.path.insert(0, orchestration_dir)
+            from compiled_classifier import load_classifier
+            _COMPILED_CLASSIFIER = load_classifier() or False
+        except Exception as e:
+            log_error(f"Compiled classifier unavailable: {e}")
+            _COMPILED_CLASSIFIER = False
+    return _COMPILED_CLASSIFIER or None
+
+
+def _classify_subprocess(query: str) -> Optional[Dict[str, Any]]:
+    """Run coordinator_agent.py classify --json and return its payload."""
+    coordinator_cli = MAIA_ROOT / "claude/tools/orchestration/coordinator_agent.py"
+    if not coordinator_cli.exists():
+        return None
+
+    # Run classification with JSON output (Phase 134 enhancement)
+    result = subprocess.run(
+        [sys.executable, str(coordinator_cli), "classify", query, "--json"],
+        capture_output=True,
+        text=True,
+        timeout=0.5  # 500ms timeout (coordinator needs startup time)
+    )
 
-        # Parse JSON output (return code 0)
-        data = json.loads(result.stdout)
+    # Return code handling:
+    # 0 = routing available
+    # 1 = classification error
+    # 2 = no routing needed (low confidence/complexity)
+    if result.returncode == 1:
+        return None  # Error
+
+    if result.returncode == 2:
+        return None  # No routing needed
+
+    # Parse JSON output (return code 0)
+    return json.loads(result.stdout)
+
+
+def classify_query(query: str) -> Optional[Dict[str, Any]]:
+    """
+    Classify user query using coordinator agent.
+
+    Uses the precompiled classifier artifact when available, then the warm
+    in-process coordinator (use_warm_coordinator()), then the coordinator
+    CLI as a subprocess.
+
+    Returns classification result or None if classification fails.
+    Performance target: <5ms compiled, <500ms subprocess fallback
+    """
+    try:
+        compiled = _get_compiled_classifier()
+        if compiled is not None:
+            exit_code, data = compiled.classify(query)
+            if exit_code != 0:
+                return None
+        elif _WARM_COORDINATOR is not None:
+            coordinator_agent, coordinator = _WARM_COORDINATOR
+            exit_code, data, _ = coordinator_agent.classify_for_hook(coordinator, query)
+            if exit_code != 0:
+                return None
+        else:
+            data = _classify_subprocess(query)
+            if data is None:
+                return None
 
         # Check if routing needed
         if not data.get("routing_needed", False):
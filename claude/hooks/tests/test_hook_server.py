@@ -0,0 +1,204 @@
+"""
+Tests for hook_server.py / hook_client.py - warm in-process hook stages.
+
+Uses throwaway stage scripts so the stage semantics (passthrough, blocking,
+warning, silent) can be checked against what user-prompt-submit does.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+from claude.hooks import hook_client
+from claude.hooks.hook_server import (
+    BLOCK, PASSTHROUGH, SILENT, WARN, HookRunner, HookServer, HookStage,
+)
+
+STAGE_SCRIPT = '''
+import os, sys
+
+def main():
+    print(f"{NAME}: {' '.join(sys.argv[1:])} env={os.environ.get('HOOK_TEST_VAR', '')}")
+    print("stderr from {NAME}", file=sys.stderr)
+    sys.exit(int(os.environ.get("HOOK_TEST_EXIT_{NAME}", "0")))
+'''
+
+
+def _write_stage(root, name):
+    path = root / f"{name}.py"
+    path.write_text(STAGE_SCRIPT.replace("{NAME}", name))
+    return path
+
+
+@pytest.fixture
+def stages(tmp_path):
+    for name in ("silent", "inject", "check", "warn", "route"):
+        _write_stage(tmp_path, name)
+    return tmp_path, (
+        HookStage("silent", "silent.py", ("{message}",), SILENT),
+        HookStage("inject", "inject.py", ("{message}",), PASSTHROUGH),
+        HookStage("check", "check.py", ("--check-message", "{message}"), BLOCK,
+                  banner="BLOCKED: {output}"),
+        HookStage("warn", "warn.py", ("{message}",), WARN, banner="WARNING\n{output}"),
+        HookStage("route", "route.py", ("{message}",), PASSTHROUGH),
+        HookStage("missing", "not_there.py", ("{message}",), PASSTHROUGH),
+    )
+
+
+def _request(message, **env):
+    return {"version": hook_client.PROTOCOL_VERSION, "message": message,
+            "env": {**os.environ, **env}, "cwd": os.getcwd(), "pid": os.getpid()}
+
+
+class TestHookRunner:
+    def test_stages_run_in_order_with_client_env(self, stages):
+        root, stage_list = stages
+        runner = HookRunner(stage_list, maia_root=root)
+
+        response = runner.run(_request("hello world", HOOK_TEST_VAR="from-client"))
+
+        assert response["exit_code"] == 0
+        assert response["output"] == (
+            "inject: hello world env=from-client\n"
+            "route: hello world env=from-client"
+        )
+        assert list(response["timings_ms"]) == ["silent", "inject", "check", "warn", "route"]
+        # Client environment is not left behind in the server
+        assert "HOOK_TEST_VAR" not in os.environ
+
+    def test_blocking_stage_stops_pipeline(self, stages):
+        root, stage_list = stages
+        runner = HookRunner(stage_list, maia_root=root)
+
+        response = runner.run(_request("bad", HOOK_TEST_EXIT_check="1"))
+
+        assert response["exit_code"] == 1
+        assert response["output"].splitlines()[-2:] == [
+            "BLOCKED: check: --check-message bad env=", "stderr from check"
+        ]
+        assert "route" not in response["timings_ms"]
+
+    def test_warning_stage_continues(self, stages):
+        root, stage_list = stages
+        runner = HookRunner(stage_list, maia_root=root)
+
+        response = runner.run(_request("dup", HOOK_TEST_EXIT_warn="1"))
+
+        assert response["exit_code"] == 0
+        assert "WARNING\nwarn: dup env=\nstderr from warn" in response["output"]
+        assert response["output"].endswith("route: dup env=")
+
+    def test_blocking_stage_that_fails_to_load_fails_closed(self, stages):
+        root, stage_list = stages
+        (root / "check.py").write_text("raise ImportError('broken dependency')\n")
+        runner = HookRunner(stage_list, maia_root=root)
+
+        response = runner.run(_request("hello"))
+
+        assert response["status"] == "unavailable"
+        assert "check" in response["error"]
+        assert "check" in runner.load_errors
+
+    def test_non_blocking_stage_that_fails_to_load_is_skipped(self, stages):
+        root, stage_list = stages
+        (root / "route.py").write_text("raise ImportError('broken dependency')\n")
+        runner = HookRunner(stage_list, maia_root=root)
+
+        response = runner.run(_request("hello"))
+
+        assert response["status"] == "ok"
+        assert response["output"] == "inject: hello env="
+
+    def test_detects_changed_stage_source(self, stages):
+        root, stage_list = stages
+        runner = HookRunner(stage_list, maia_root=root)
+        assert not runner.is_stale()
+
+        later = time.time() + 10
+        os.utime(root / "route.py", (later, later))
+        assert runner.is_stale()
+
+
+class TestHookServer:
+    @pytest.fixture
+    def server(self, stages, tmp_path, monkeypatch):
+        root, stage_list = stages
+        path = tmp_path / "hook.sock"
+        monkeypatch.setenv("MAIA_HOOK_SOCKET", str(path))
+        monkeypatch.setenv("MAIA_HOOK_SERVER_AUTOSTART", "false")
+        server = HookServer(path, HookRunner(stage_list, maia_root=root))
+        thread = threading.Thread(target=server.serve_until_stopped, daemon=True)
+        thread.start()
+        yield server
+        server.stopping = True
+        thread.join(timeout=5)
+
+    def test_client_round_trip(self, server, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["hook_client.py", "route me"])
+
+        assert hook_client.main() == 0
+        assert capsys.readouterr().out == "inject: route me env=\nroute: route me env=\n"
+        assert server.requests_served == 1
+
+    def test_client_reports_block(self, server, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["hook_client.py", "bad"])
+        monkeypatch.setenv("HOOK_TEST_EXIT_check", "2")
+
+        assert hook_client.main() == 1
+        assert "BLOCKED: check: --check-message bad" in capsys.readouterr().out
+
+    def test_stale_server_asks_for_restart(self, server, stages, monkeypatch):
+        root, _ = stages
+        later = time.time() + 10
+        os.utime(root / "inject.py", (later, later))
+        monkeypatch.setattr(sys, "argv", ["hook_client.py", "hi"])
+
+        assert hook_client.main() == hook_client.EXIT_UNAVAILABLE
+        assert server.stopping
+
+
+def test_client_falls_back_when_blocking_stage_fails_to_load(stages, tmp_path, monkeypatch):
+    root, stage_list = stages
+    (root / "check.py").write_text("raise ImportError('broken dependency')\n")
+    path = tmp_path / "hook.sock"
+    monkeypatch.setenv("MAIA_HOOK_SOCKET", str(path))
+    monkeypatch.setenv("MAIA_HOOK_SERVER_AUTOSTART", "false")
+    monkeypatch.setattr(sys, "argv", ["hook_client.py", "hi"])
+    server = HookServer(path, HookRunner(stage_list, maia_root=root))
+    thread = threading.Thread(target=server.serve_until_stopped, daemon=True)
+    thread.start()
+
+    try:
+        assert hook_client.main() == hook_client.EXIT_UNAVAILABLE
+        assert server.requests_served == 0
+    finally:
+        server.stopping = True
+        thread.join(timeout=5)
+
+
+def test_client_falls_back_without_server(tmp_path, monkeypatch):
+    monkeypatch.setenv("MAIA_HOOK_SOCKET", str(tmp_path / "none.sock"))
+    monkeypatch.setenv("MAIA_HOOK_SERVER_AUTOSTART", "false")
+    monkeypatch.setattr(sys, "argv", ["hook_client.py", "hi"])
+
+    assert hook_client.main() == hook_client.EXIT_UNAVAILABLE
+
+
+def test_client_falls_back_when_server_times_out(tmp_path, monkeypatch):
+    path = tmp_path / "hung.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen(1)
+    monkeypatch.setenv("MAIA_HOOK_SOCKET", str(path))
+    monkeypatch.setattr(hook_client, "RESPONSE_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(sys, "argv", ["hook_client.py", "hi"])
+
+    try:
+        # Accepted by the backlog but never answered
+        assert hook_client.main() == hook_client.EXIT_UNAVAILABLE
+    finally:
+        listener.close()
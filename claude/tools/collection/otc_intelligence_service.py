@@ -195,14 +195,14 @@ class OTCIntelligenceService(BaseIntelligenceService):
     def refresh(self) -> bool:
         """Refresh OTC data by calling existing ETL pipeline.
 
-        Executes: python3 -m claude.tools.integrations.otc.load_to_postgres all
+        Executes: python3 -m claude.tools.integrations.otc.load_to_postgres all --incremental
 
         Returns:
             True if refresh successful, False otherwise
         """
         try:
             result = subprocess.run(
-                ["python3", "-m", "claude.tools.integrations.otc.load_to_postgres", "all"],
+                ["python3", "-m", "claude.tools.integrations.otc.load_to_postgres", "all", "--incremental"],
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout
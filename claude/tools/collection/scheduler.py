@@ -68,7 +68,7 @@ class CollectionScheduler:
         "otc": {
             "refresh_time": "06:30",
             "enabled": True,
-            "refresh_command": "python3 -m claude.tools.integrations.otc.load_to_postgres all"
+            "refresh_command": "python3 -m claude.tools.integrations.otc.load_to_postgres all --incremental"
         }
     }
 
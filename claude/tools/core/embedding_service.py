@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Embedding Service - Batched, cached Ollama embeddings for all RAG tools.
+
+The RAG tools (email, interview, CV, conversation memory) used to POST one
+text at a time to Ollama's /api/embed and re-embed identical text on every
+reindex. EmbeddingService:
+
+- sends texts in batches (/api/embed accepts a list ``input``)
+- runs batches on a bounded worker pool
+- caches vectors in SQLite keyed by (model, sha256(text)), so a second
+  index pass over unchanged content makes no embedding requests
+
+Vectors are stored as float32 blobs, and fresh vectors are rounded through
+float32 too, so cached and freshly computed results are identical.
+
+Usage:
+    from claude.tools.core.embedding_service import EmbeddingService
+
+    embedder = EmbeddingService(model="nomic-embed-text",
+                                cache_path=Path(db_path) / "embedding_cache.db")
+    vectors = embedder.embed(["first text", "second text"])
+    vector = embedder.embed_one("query text")
+    print(embedder.stats)   # {'requested': 3, 'cached': 0, 'computed': 3, 'requests': 2}
+
+Author: Maia System
+Created: 2026-10-16
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+DEFAULT_OLLAMA_URL = "http://localhost:11434"
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_WORKERS = 4
+
+
+def default_cache_path() -> Path:
+    """Shared cache DB (MAIA_EMBEDDING_CACHE overrides)."""
+    override = os.environ.get("MAIA_EMBEDDING_CACHE")
+    if override:
+        return Path(override)
+    return Path.home() / ".maia" / "cache" / "embeddings.db"
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _to_blob(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _from_blob(blob: bytes) -> List[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """SQLite store of float32 vectors keyed by (model, sha256(text))."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Check-same-thread off: lookups and writes happen on the caller's
+        # thread only, serialised by the lock
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID;
+        """)
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            # Stay well under SQLITE_MAX_VARIABLE_NUMBER
+            for start in range(0, len(unique), 500):
+                chunk = unique[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? "
+                    f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                    (model, *chunk)
+                ).fetchall()
+                for digest, blob in rows:
+                    found[digest] = _from_blob(blob)
+        return found
+
+    def put_many(self, model: str, items: Sequence[Tuple[str, List[float]]]):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dim, vector) VALUES (?, ?, ?, ?)",
+                [(model, digest, len(vector), _to_blob(vector)) for digest, vector in items]
+            )
+
+    def count(self, model: Optional[str] = None) -> int:
+        with self._lock:
+            if model:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM embeddings WHERE model = ?", (model,)
+                ).fetchone()
+            else:
+                row = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return row[0]
+
+    def close(self):
+        self._conn.close()
+
+
+class EmbeddingService:
+    """Batched Ollama embedding client with a content-hash vector cache."""
+
+    def __init__(
+        self,
+        model: str = "nomic-embed-text",
+        ollama_url: str = DEFAULT_OLLAMA_URL,
+        cache_path: Optional[Path] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: int = 30,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            model: Ollama embedding model
+            ollama_url: Ollama base URL
+            cache_path: Vector cache DB (default: ~/.maia/cache/embeddings.db)
+            batch_size: Texts per /api/embed request
+            max_workers: Concurrent requests in flight
+            timeout: Per-request timeout in seconds
+            use_cache: Disable to always call Ollama
+        """
+        self.model = model
+        self.ollama_url = ollama_url.rstrip("/")
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.cache = EmbeddingCache(cache_path or default_cache_path()) if use_cache else None
+        self.stats = {"requested": 0, "cached": 0, "computed": 0, "requests": 0}
+        self._stats_lock = threading.Lock()
+
+    def _request(self, texts: List[str]) -> List[List[float]]:
+        """Embed one batch with a single /api/embed call."""
+        response = requests.post(
+            f"{self.ollama_url}/api/embed",
+            json={"model": self.model, "input": texts if len(texts) > 1 else texts[0]},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        embeddings = response.json()["embeddings"]
+        if len(embeddings) != len(texts):
+            raise ValueError(
+                f"Ollama returned {len(embeddings)} embeddings for {len(texts)} inputs"
+            )
+        with self._stats_lock:
+            self.stats["requests"] += 1
+        # Round through float32 so fresh vectors match cached ones exactly
+        return [array("f", vector).tolist() for vector in embeddings]
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Embed texts, preserving order.
+
+        Cached vectors are returned without a request; duplicate texts are
+        embedded once. Raises the underlying requests/ValueError on failure.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+
+        hashes = [text_hash(text) for text in texts]
+        vectors: Dict[str, List[float]] = {}
+        if self.cache:
+            vectors.update(self.cache.get_many(self.model, hashes))
+
+        # One request slot per distinct uncached text
+        pending: Dict[str, str] = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in vectors and digest not in pending:
+                pending[digest] = text
+
+        if pending:
+            items = list(pending.items())
+            batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+
+            def run(batch):
+                return batch, self._request([text for _, text in batch])
+
+            if len(batches) == 1 or self.max_workers == 1:
+                results = map(run, batches)
+                executor = None
+            else:
+                executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches)))
+                results = executor.map(run, batches)
+            try:
+                for batch, embeddings in results:
+                    computed = [(digest, vector) for (digest, _), vector in zip(batch, embeddings)]
+                    vectors.update(computed)
+                    if self.cache:
+                        self.cache.put_many(self.model, computed)
+            finally:
+                if executor:
+                    executor.shutdown(wait=True)
+
+        self.stats["requested"] += len(texts)
+        self.stats["computed"] += len(pending)
+        self.stats["cached"] += len(texts) - len(pending)
+        return [vectors[digest] for digest in hashes]
+
+    def embed_one(self, text: str) -> List[float]:
+        """Embed a single text (cached)."""
+        return self.embed([text])[0]
@@ -13,7 +13,8 @@ import os
 import sys
 import json
 import hashlib
-import requests
+import math
+import time
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from datetime import datetime
@@ -36,9 +37,15 @@ def _check_chromadb_available():
     if not CHROMADB_AVAILABLE:
         raise ImportError("chromadb required. Install with: pip3 install chromadb")
 
+from claude.tools.core.embedding_service import EmbeddingService
 from claude.tools.macos_mail_bridge import MacOSMailBridge
 from claude.tools.contact_extractor import SignatureParser, MacOSContactsBridge
 
+# Emails embedded and upserted per ChromaDB write
+UPSERT_BATCH_SIZE = 64
+# Hours re-requested before a mailbox's last complete fetch (clock skew, late delivery)
+WATERMARK_OVERLAP_HOURS = 1
+
 
 class EmailRAGOllama:
     """Email RAG with Ollama local embeddings"""
@@ -56,6 +63,10 @@ class EmailRAGOllama:
         self.embedding_model = embedding_model
         self.ollama_url = "http://localhost:11434"
         self.extract_contacts = extract_contacts
+        self.embedder = EmbeddingService(
+            model=embedding_model, ollama_url=self.ollama_url,
+            cache_path=Path(self.db_path) / "embedding_cache.db"
+        )
 
         # Initialize contact extraction components
         if self.extract_contacts:
@@ -85,8 +96,10 @@ class EmailRAGOllama:
         """Load index state"""
         if os.path.exists(self.index_state_file):
             with open(self.index_state_file, 'r') as f:
-                return json.load(f)
-        return {"indexed_emails": {}, "last_index_time": None}
+                state = json.load(f)
+            state.setdefault("watermarks", {})  # State files predating watermarks
+            return state
+        return {"indexed_emails": {}, "last_index_time": None, "watermarks": {}}
 
     def _save_index_state(self):
         """Save index state"""
@@ -99,26 +112,119 @@ class EmailRAGOllama:
         return hashlib.md5(key.encode()).hexdigest()
 
     def _get_embedding(self, text: str) -> List[float]:
-        """Get embedding from Ollama"""
-        response = requests.post(
-            f"{self.ollama_url}/api/embed",
-            json={"model": self.embedding_model, "input": text},
-            timeout=30
+        """Get embedding from Ollama (cached by content hash)"""
+        return self.embedder.embed_one(text)
+
+    def _fetch_window_hours(self, mailbox: str, hours_ago: Optional[int], force: bool) -> Optional[int]:
+        """
+        Hours of mail to request for a mailbox.
+
+        Narrows the requested window to the time since the mailbox was last
+        fetched completely (plus an overlap), capped at hours_ago.
+        """
+        mark = self.index_state["watermarks"].get(mailbox, {})
+        if force or not mark.get("last_fetch"):
+            return hours_ago
+        since = datetime.now() - datetime.fromisoformat(mark["last_fetch"])
+        window = math.ceil(since.total_seconds() / 3600) + WATERMARK_OVERLAP_HOURS
+        return max(1, min(hours_ago, window) if hours_ago else window)
+
+    @staticmethod
+    def _message_number(message_id: Any) -> Optional[int]:
+        """Mail.app message ids are increasing integers; None if not numeric"""
+        try:
+            return int(str(message_id))
+        except ValueError:
+            return None
+
+    def _fetch_mailbox(self, mailbox: str, limit: int, hours: Optional[int]) -> List[Dict[str, Any]]:
+        """Fetch message headers from one mailbox, tagged with the mailbox name"""
+        if mailbox == "Inbox":
+            messages = self.mail_bridge.get_inbox_messages(limit=limit, hours_ago=hours)
+        elif mailbox == "Sent Items":
+            messages = self.mail_bridge.get_sent_messages(limit=limit, hours_ago=hours)
+        else:
+            messages = self.mail_bridge.search_messages_in_account(
+                account="Exchange", mailbox_type=mailbox, limit=limit, hours_ago=hours
+            )
+        for msg in messages:
+            msg['mailbox'] = mailbox
+        return messages
+
+    def _update_watermark(self, mailbox: str, progress: Dict[str, Any], fetch_started: datetime):
+        """
+        Advance a mailbox's high-water mark after a run.
+
+        The mark only moves past messages that were indexed or skipped, never
+        past a failed one, and not at all if the fetch hit the limit (older
+        unfetched messages may remain inside the window).
+        """
+        if progress["truncated"]:
+            return
+        mark = self.index_state["watermarks"].setdefault(mailbox, {})
+        done = progress["done"]
+        if progress["failed"]:
+            first_failure = min(progress["failed"])
+            done = [n for n in done if n < first_failure]
+        else:
+            mark["last_fetch"] = fetch_started.isoformat()
+        if done and max(done) > mark.get("last_id", -1):
+            mark["last_id"] = max(done)
+
+    def _upsert_batch(self, documents: List[str], metadatas: List[Dict[str, Any]], ids: List[str]):
+        """Embed a batch in bulk and upsert it into ChromaDB"""
+        embeddings = self.embedder.embed(documents)
+        self.collection.upsert(
+            documents=documents,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=embeddings
         )
-        response.raise_for_status()
-        return response.json()["embeddings"][0]
+
+        indexed_at = datetime.now().isoformat()
+        for msg_id in ids:
+            self.index_state["indexed_emails"][msg_id] = indexed_at
+        self._save_index_state()
+
+    def _store_batch(self, documents: List[str], metadatas: List[Dict[str, Any]], ids: List[str],
+                     numbers: List[tuple], progress: Dict[str, Dict[str, Any]], stats: Dict[str, Any]):
+        """
+        Upsert one batch; on failure count it as errors and move its
+        (mailbox, message number) pairs from done to failed so the
+        watermark stops before them and the next run retries them.
+        """
+        print(f"\n💾 Embedding and storing {len(documents)} emails...")
+        try:
+            self._upsert_batch(documents, metadatas, ids)
+        except Exception as e:
+            print(f"  ⚠️  Batch failed: {e}")
+            stats["errors"] += len(documents)
+            for mailbox, number in numbers:
+                progress[mailbox]["done"].remove(number)
+                progress[mailbox]["failed"].append(number)
+            return
+        stats["embedded"] += len(documents)
 
     def index_inbox(self, limit: Optional[int] = None, force: bool = False, hours_ago: int = 24, include_sent: bool = True, include_cc: bool = True) -> Dict[str, int]:
         """
         Index emails with Ollama embeddings
 
+        Each mailbox keeps a high-water mark (highest indexed message id and
+        last complete fetch time) in the index state, so scheduled runs only
+        request and process mail newer than the previous run.
+
         Args:
             limit: Max messages per mailbox (None = all within time window)
-            force: Re-index already indexed emails
+            force: Re-index already indexed emails (ignores watermarks)
             hours_ago: Only index messages from last N hours (default: 24)
             include_sent: Also index sent messages (default: True)
             include_cc: Also index CC folder messages (default: True)
+
+        Returns:
+            Stats: total/fetched, new/embedded, skipped, errors,
+            contacts_added and elapsed_seconds
         """
+        start_time = time.time()
         fetch_limit = limit or 200  # Default to 200 messages max per mailbox
 
         print("=" * 60)
@@ -130,41 +236,38 @@ class EmailRAGOllama:
         print(f"📥 Indexing {folders} (last {hours_ago}h)...")
         print("=" * 60)
 
-        # Get inbox messages
-        print(f"📧 Retrieving inbox messages (last {hours_ago}h)...")
-        messages = self.mail_bridge.get_inbox_messages(limit=fetch_limit, hours_ago=hours_ago)
-        # Mark inbox messages explicitly
-        for msg in messages:
-            msg['mailbox'] = 'Inbox'
-
-        # Get sent messages if requested
+        mailboxes = [("Inbox", "📧 Retrieving inbox messages")]
         if include_sent:
-            print(f"📤 Retrieving sent messages (last {hours_ago}h)...")
-            sent_messages = self.mail_bridge.get_sent_messages(limit=fetch_limit, hours_ago=hours_ago)
-            # Mark sent messages so we can identify them
-            for msg in sent_messages:
-                msg['mailbox'] = 'Sent Items'
-            messages.extend(sent_messages)
-
-        # Get CC folder messages if requested
+            mailboxes.append(("Sent Items", "📤 Retrieving sent messages"))
         if include_cc:
-            print(f"📋 Retrieving CC folder messages (last {hours_ago}h)...")
+            mailboxes.append(("CC", "📋 Retrieving CC folder messages"))
+
+        messages = []
+        fetched_at = {}
+        progress = {}
+        for mailbox, label in mailboxes:
+            hours = self._fetch_window_hours(mailbox, hours_ago, force)
+            print(f"{label} (last {hours}h)...")
+            fetched_at[mailbox] = datetime.now()
             try:
-                cc_messages = self.mail_bridge.search_messages_in_account(
-                    account="Exchange",
-                    mailbox_type="CC",
-                    limit=fetch_limit,
-                    hours_ago=hours_ago
-                )
-                # Mark CC messages so we can identify them
-                for msg in cc_messages:
-                    msg['mailbox'] = 'CC'
-                messages.extend(cc_messages)
-                print(f"   Found {len(cc_messages)} CC messages")
+                mailbox_messages = self._fetch_mailbox(mailbox, fetch_limit, hours)
             except Exception as e:
+                if mailbox != "CC":
+                    raise
+                # CC folder is optional
                 print(f"   ⚠️  CC folder unavailable: {str(e)[:80]}")
+                continue
+            if mailbox == "CC":
+                print(f"   Found {len(mailbox_messages)} CC messages")
+            progress[mailbox] = {
+                "done": [], "failed": [], "truncated": len(mailbox_messages) >= fetch_limit
+            }
+            messages.extend(mailbox_messages)
 
-        stats = {"total": len(messages), "new": 0, "skipped": 0, "errors": 0, "contacts_added": 0}
+        stats = {
+            "total": len(messages), "fetched": len(messages), "new": 0, "embedded": 0,
+            "skipped": 0, "errors": 0, "contacts_added": 0, "elapsed_seconds": 0.0
+        }
 
         # Load existing contacts once at the start
         if self.extract_contacts:
@@ -182,13 +285,25 @@ class EmailRAGOllama:
         documents = []
         metadatas = []
         ids = []
-        embeddings = []
+        numbers = []  # (mailbox, message number) queued in the current batch
 
         for i, msg in enumerate(messages, 1):
+            mailbox_type = msg.get('mailbox', 'Inbox')  # Default to Inbox if not specified
+            mailbox_progress = progress[mailbox_type]
+            number = self._message_number(msg['id'])
+            last_id = self.index_state["watermarks"].get(mailbox_type, {}).get("last_id")
+
+            # Below the high-water mark: indexed by an earlier run
+            if not force and number is not None and last_id is not None and number <= last_id:
+                stats["skipped"] += 1
+                continue
+
             msg_hash = self._email_hash(msg)
 
             if not force and msg_hash in self.index_state["indexed_emails"]:
                 stats["skipped"] += 1
+                if number is not None:
+                    mailbox_progress["done"].append(number)
                 continue
 
             try:
@@ -197,15 +312,13 @@ class EmailRAGOllama:
                 # Skip if message not found (deleted/moved)
                 if content is None:
                     stats["skipped"] += 1
+                    if number is not None:
+                        mailbox_progress["done"].append(number)
                     continue
 
                 doc_text = f"{content['subject']}\n\n{content['content'][:2000]}"  # Limit content
 
-                print(f"  [{i}/{len(messages)}] Embedding: {content['subject'][:50]}...")
-                embedding = self._get_embedding(doc_text)
-
-                # Determine mailbox type from message metadata
-                mailbox_type = msg.get('mailbox', 'Inbox')  # Default to Inbox if not specified
+                print(f"  [{i}/{len(messages)}] Queued: {content['subject'][:50]}...")
 
                 metadata = {
                     "message_id": msg['id'],
@@ -219,7 +332,9 @@ class EmailRAGOllama:
                 documents.append(doc_text)
                 metadatas.append(metadata)
                 ids.append(msg_hash)
-                embeddings.append(embedding)
+                if number is not None:
+                    mailbox_progress["done"].append(number)
+                    numbers.append((mailbox_type, number))
 
                 stats["new"] += 1
 
@@ -246,23 +361,23 @@ class EmailRAGOllama:
             except Exception as e:
                 print(f"  ⚠️  Error: {e}")
                 stats["errors"] += 1
+                if number is not None:
+                    mailbox_progress["failed"].append(number)
                 continue
 
-        if documents:
-            print(f"\n💾 Storing {len(documents)} emails in vector database...")
-            self.collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids,
-                embeddings=embeddings
-            )
+            if len(documents) >= UPSERT_BATCH_SIZE:
+                self._store_batch(documents, metadatas, ids, numbers, progress, stats)
+                documents, metadatas, ids, numbers = [], [], [], []
 
-            for msg_id in ids:
-                self.index_state["indexed_emails"][msg_id] = datetime.now().isoformat()
+        if documents:
+            self._store_batch(documents, metadatas, ids, numbers, progress, stats)
 
-            self.index_state["last_index_time"] = datetime.now().isoformat()
-            self._save_index_state()
+        for mailbox, mailbox_progress in progress.items():
+            self._update_watermark(mailbox, mailbox_progress, fetched_at[mailbox])
+        self.index_state["last_index_time"] = datetime.now().isoformat()
+        self._save_index_state()
 
+        stats["elapsed_seconds"] = round(time.time() - start_time, 2)
         return stats
 
     def semantic_search(
@@ -549,6 +664,7 @@ def main():
         print(f"   • New: {index_stats['new']}")
         print(f"   • Skipped: {index_stats['skipped']}")
         print(f"   • Errors: {index_stats['errors']}")
+        print(f"   • Embedded: {index_stats['embedded']} in {index_stats['elapsed_seconds']}s")
         if index_stats.get('contacts_added', 0) > 0:
             print(f"   • Contacts Added: {index_stats['contacts_added']}")
 
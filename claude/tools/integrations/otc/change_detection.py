@@ -0,0 +1,96 @@
+"""
+OTC Change Detection
+
+Client-side change detection for incremental OTC syncs.
+
+The OTC views take only a GUID - there is no modified-since filter - so every
+sync downloads the whole view. To avoid rewriting unchanged rows, each loaded
+row's hash is kept in servicedesk.otc_row_hashes; rows whose hash is already
+known are dropped before they reach COPY.
+
+A row's hash is taken over its COPY text encoding, so a row counts as
+unchanged exactly when PostgreSQL would receive the same values.
+
+Usage:
+    from claude.tools.integrations.otc.change_detection import ChangeDetector
+
+    detector = ChangeDetector(key_positions=[0], watermark_position=6, known_hashes=known)
+    for row in rows:
+        if detector.is_changed(row):
+            yield row + detector.tag(row)
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional, Sequence, Set, Tuple
+
+from .streaming import copy_text_value
+
+
+def row_hash(row: Sequence[Any]) -> int:
+    """Signed 64-bit hash of a row's COPY encoding (fits a BIGINT column)."""
+    encoded = '\t'.join(copy_text_value(v) for v in row).encode('utf-8')
+    digest = hashlib.blake2b(encoded, digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def row_key(row: Sequence[Any], key_positions: Sequence[int], digest: int) -> str:
+    """
+    Text key identifying a row in the hash store.
+
+    Rows with a NULL key column never conflict in the target table, so they
+    are keyed by their own hash instead of colliding on the NULL.
+    """
+    values = [row[p] for p in key_positions]
+    if any(v is None for v in values):
+        return f"#{digest}"
+    return '\t'.join(copy_text_value(v) for v in values)
+
+
+class ChangeDetector:
+    """
+    Filter rows down to those not seen in previous syncs.
+
+    Also tracks the view's watermark: the latest value of its modification
+    (or creation) column across all rows fetched, changed or not.
+    """
+
+    def __init__(self, key_positions: Sequence[int], watermark_position: Optional[int] = None,
+                 known_hashes: Optional[Set[int]] = None):
+        """
+        Args:
+            key_positions: Row indexes of the conflict key columns
+            watermark_position: Row index of the watermark column, if any
+            known_hashes: Hashes stored by previous syncs (empty = full load)
+        """
+        self.key_positions = list(key_positions)
+        self.watermark_position = watermark_position
+        self.known_hashes = known_hashes if known_hashes is not None else set()
+        self.watermark: Optional[datetime] = None
+        self.changed = 0
+        self.unchanged = 0
+        self._last: Optional[Tuple[Sequence[Any], int]] = None
+
+    def is_changed(self, row: Sequence[Any]) -> bool:
+        """True if the row is new or differs from its last loaded version."""
+        if self.watermark_position is not None:
+            value = row[self.watermark_position]
+            if isinstance(value, datetime) and (self.watermark is None or value > self.watermark):
+                self.watermark = value
+
+        digest = row_hash(row)
+        self._last = (row, digest)
+        if digest in self.known_hashes:
+            self.unchanged += 1
+            return False
+
+        self.changed += 1
+        return True
+
+    def tag(self, row: Sequence[Any]) -> Tuple[str, int]:
+        """(row_key, row_hash) for a row just passed to is_changed()."""
+        if self._last is not None and self._last[0] is row:
+            digest = self._last[1]
+        else:
+            digest = row_hash(row)
+        return row_key(row, self.key_positions, digest), digest
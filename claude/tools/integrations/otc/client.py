@@ -17,6 +17,10 @@ Usage:
     # Sync all views (with 30s gaps between requests)
     all_data = client.sync_all()
 
+    # Stream a large view record-by-record
+    for comment in client.iter_records(OTCViews.COMMENTS):
+        ...
+
     # Health check
     status = client.health_check()
 
@@ -30,7 +34,7 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import requests
 
@@ -44,6 +48,7 @@ from .exceptions import (
     OTCRateLimitError,
     OTCServerError,
 )
+from .streaming import iter_json_records
 from .views import OTCViews, OTCView
 
 logger = logging.getLogger(__name__)
@@ -218,6 +223,7 @@ class OTCClient:
     INITIAL_BACKOFF = 10  # 10 seconds initial backoff
     MAX_BACKOFF = 300  # 5 minutes max backoff
     VIEW_GAP_SECONDS = 30  # 30 seconds between different views
+    STREAM_CHUNK_BYTES = 64 * 1024  # iter_records read size
 
     def __init__(self):
         """Initialize OTC client with credentials from Keychain."""
@@ -254,6 +260,23 @@ class OTCClient:
         Returns:
             Parsed JSON response
 
+        Raises:
+            OTCAPIError: On any API error
+        """
+        response = self._request(view)
+        return self._parse_response(response, view)
+
+    def _request(self, view: OTCView, stream: bool = False) -> requests.Response:
+        """
+        Send the view request with rate limiting, circuit breaker and retries.
+
+        Args:
+            view: The OTCView to fetch
+            stream: Leave the body unread (caller iterates and closes it)
+
+        Returns:
+            HTTP 200 response
+
         Raises:
             OTCAPIError: On any API error
         """
@@ -274,22 +297,23 @@ class OTCClient:
                 start_time = time.time()
                 logger.info(f"Fetching OTC view: {view.name} (attempt {retry_count + 1})")
 
-                response = self.session.get(url, timeout=self.TIMEOUT)
+                response = self.session.get(url, timeout=self.TIMEOUT, stream=stream)
 
                 duration_ms = (time.time() - start_time) * 1000
                 self._metrics['request_count'] += 1
                 self._metrics['total_duration_ms'] += duration_ms
                 self.rate_limiter.record_request()
 
+                size = response.headers.get('Content-Length', '?') if stream else len(response.content)
                 logger.debug(
                     f"OTC response: status={response.status_code}, "
-                    f"duration={duration_ms:.0f}ms, size={len(response.content)} bytes"
+                    f"duration={duration_ms:.0f}ms, size={size} bytes"
                 )
 
                 # Handle response codes
                 if response.status_code == 200:
                     self.circuit_breaker.record_success()
-                    return self._parse_response(response, view)
+                    return response
 
                 elif response.status_code == 401:
                     self.circuit_breaker.record_failure()
@@ -388,6 +412,48 @@ class OTCClient:
                 raw_data=preview
             )
 
+    def iter_records(self, view: OTCView) -> Iterator[Dict]:
+        """
+        Stream a view's records without materialising the response.
+
+        The body is parsed incrementally as it downloads, so memory stays
+        bounded by the chunk size rather than the view size (comments and
+        tickets run to hundreds of MB).
+
+        Args:
+            view: The OTCView to fetch
+
+        Yields:
+            Record dicts, in response order
+
+        Raises:
+            OTCAPIError: On any API error
+            OTCDataError: If the body is not valid JSON
+        """
+        response = self._request(view, stream=True)
+        count = 0
+
+        try:
+            for record in iter_json_records(response.iter_content(self.STREAM_CHUNK_BYTES)):
+                count += 1
+                yield record
+
+        except json.JSONDecodeError as e:
+            raise OTCDataError(
+                f"Failed to parse streamed JSON after {count} records: {e}",
+                raw_data=e.doc[max(0, e.pos - 250):e.pos + 250]
+            )
+
+        except requests.exceptions.RequestException as e:
+            self.circuit_breaker.record_failure()
+            self._metrics['error_count'] += 1
+            raise OTCConnectionError(e)
+
+        finally:
+            response.close()
+
+        logger.info(f"Streamed {count} records from {view.name}")
+
     def fetch_tickets(self, raw: bool = False) -> Union[List, Dict]:
         """
         Fetch all tickets from OTC.
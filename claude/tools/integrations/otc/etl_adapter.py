@@ -299,19 +299,27 @@ class OTCETLSync:
     3. Clean data
     4. Insert to PostgreSQL
 
+    run_incremental_sync() is the routine scheduled path: it streams each
+    view into PostgreSQL, writing only rows changed since the last load and
+    recording per-view watermarks in servicedesk.etl_metadata.
+
     Usage:
         sync = OTCETLSync()
         result = sync.run_full_sync()
+        result = sync.run_incremental_sync()
     """
 
-    def __init__(self, adapter: Optional['OTCETLAdapter'] = None):
+    def __init__(self, adapter: Optional['OTCETLAdapter'] = None, loader: Optional[Any] = None):
         """
         Initialize sync orchestrator.
 
         Args:
             adapter: OTCETLAdapter instance. If None, creates new adapter.
+            loader: OTCPostgresLoader for incremental syncs. If None, created
+                on first use.
         """
         self.adapter = adapter or OTCETLAdapter()
+        self.loader = loader
 
     def run_full_sync(self, dry_run: bool = False) -> dict:
         """
@@ -384,6 +392,72 @@ class OTCETLSync:
 
         return result
 
+    def run_incremental_sync(self) -> dict:
+        """
+        Sync only rows changed since the last load.
+
+        The OTC API cannot filter by modification time, so each view is
+        still downloaded in full; unchanged rows are detected by row hash
+        and dropped before they reach PostgreSQL.
+
+        Returns:
+            Sync result with per-entity fetched/unchanged/inserted/updated
+            counts and watermark.
+        """
+        logger.info("=" * 60)
+        logger.info("OTC INCREMENTAL SYNC STARTING")
+        logger.info("=" * 60)
+
+        start_time = datetime.now()
+        result = {
+            'status': 'unknown',
+            'start_time': start_time.isoformat(),
+            'mode': 'incremental',
+            'entities': {},
+        }
+
+        if self.loader is None:
+            from .load_to_postgres import OTCPostgresLoader
+            self.loader = OTCPostgresLoader()
+
+        failed = []
+        for entity in ('comments', 'timesheets', 'tickets'):
+            try:
+                stats = self.loader.load_view_streaming(entity, incremental=True)
+            except Exception as e:
+                logger.error(f"Incremental sync of {entity} failed: {e}")
+                result['entities'][entity] = {'error': str(e)}
+                failed.append(entity)
+                continue
+
+            watermark = stats.get('watermark')
+            result['entities'][entity] = {
+                'fetched_count': stats['fetched'],
+                'unchanged_count': stats['unchanged'],
+                'inserted_count': stats['inserted'],
+                'updated_count': stats['updated'],
+                'error_count': stats['errors'],
+                'watermark': watermark.isoformat() if watermark else None,
+            }
+
+        if not failed:
+            result['status'] = 'success'
+        elif len(failed) < len(result['entities']):
+            result['status'] = 'partial'
+        else:
+            result['status'] = 'failed'
+
+        end_time = datetime.now()
+        result['end_time'] = end_time.isoformat()
+        result['duration_seconds'] = (end_time - start_time).total_seconds()
+
+        logger.info("=" * 60)
+        logger.info(f"OTC INCREMENTAL SYNC {result['status'].upper()}")
+        logger.info(f"Duration: {result['duration_seconds']:.1f}s")
+        logger.info("=" * 60)
+
+        return result
+
 
 # CLI interface
 if __name__ == "__main__":
@@ -427,7 +501,10 @@ if __name__ == "__main__":
         elif command == "sync":
             sync = OTCETLSync()
             dry_run = "--dry-run" in sys.argv
-            result = sync.run_full_sync(dry_run=dry_run)
+            if "--incremental" in sys.argv:
+                result = sync.run_incremental_sync()
+            else:
+                result = sync.run_full_sync(dry_run=dry_run)
             print(json.dumps(result, indent=2))
 
         elif command == "stats":
@@ -436,7 +513,7 @@ if __name__ == "__main__":
 
         else:
             print(f"Unknown command: {command}")
-            print("Available: tickets, comments, timesheets, all, sync, stats")
+            print("Available: tickets, comments, timesheets, all, sync [--dry-run|--incremental], stats")
 
     else:
         print("OTC ETL Adapter CLI")
@@ -448,4 +525,5 @@ if __name__ == "__main__":
         print("  python3 -m claude.tools.integrations.otc.etl_adapter all        # Fetch all")
         print("  python3 -m claude.tools.integrations.otc.etl_adapter sync       # Full sync")
         print("  python3 -m claude.tools.integrations.otc.etl_adapter sync --dry-run")
+        print("  python3 -m claude.tools.integrations.otc.etl_adapter sync --incremental")
         print("  python3 -m claude.tools.integrations.otc.etl_adapter stats      # Show stats")
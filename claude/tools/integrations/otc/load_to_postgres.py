@@ -5,19 +5,38 @@ OTC to PostgreSQL Loader
 Loads OTC API data (comments, tickets, timesheets) into PostgreSQL database.
 Handles deduplication and provides detailed logging.
 
+Two paths:
+- load_comments/load_tickets/load_timesheets: fetch the whole view, upsert
+  in 500-row execute_batch batches
+- load_view_streaming: parse the response incrementally, COPY rows into a
+  temp staging table, merge with one set-based upsert (reports rows/sec;
+  peak memory only with --measure-memory, as tracemalloc slows the load)
+
+Incremental mode (--incremental, implies --stream) drops rows whose hash
+matches the last loaded version before COPY, so routine syncs write only
+new/changed rows. Each streaming run records the view's watermark (latest
+modified/created time seen) in servicedesk.etl_metadata.
+
 Usage:
-    python3 -m claude.tools.integrations.otc.load_to_postgres
+    python3 -m claude.tools.integrations.otc.load_to_postgres [view] [--stream] [--incremental]
+        [--measure-memory]
 """
 
 import logging
+import time
+import tracemalloc
 import psycopg2
 from psycopg2.extras import execute_batch
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 import os
 
+from .change_detection import ChangeDetector
 from .client import OTCClient
 from .models import OTCComment, OTCTicket, OTCTimesheet
+from .streaming import CopyRowStream
+from .views import OTCView, OTCViews
 import sys
 
 logger = logging.getLogger(__name__)
@@ -58,6 +77,89 @@ def get_pg_config() -> Dict:
 PG_CONFIG = get_pg_config()
 
 
+@dataclass(frozen=True)
+class StreamSpec:
+    """How one OTC view maps onto its target table for streaming loads."""
+    view: OTCView
+    table: str
+    model: type
+    columns: Tuple[str, ...]
+    key: Tuple[str, ...]
+    update: Tuple[str, ...]
+    row: Callable[[Any], tuple]
+    key_required: bool = True  # Key is a primary key: rows with NULL key are errors
+    watermark: Optional[str] = None  # Modification/creation column tracked per run
+
+
+# Hashes of the last loaded version of each row, per view (incremental mode)
+ROW_HASHES_TABLE = 'servicedesk.otc_row_hashes'
+
+# Normally applied once by infrastructure/servicedesk-dashboard/migrations/
+# 007_create_otc_incremental_sync.sql; see _ensure_incremental_schema
+INCREMENTAL_SCHEMA = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {ROW_HASHES_TABLE} (
+        view_name TEXT NOT NULL,
+        row_key TEXT NOT NULL,
+        row_hash BIGINT NOT NULL,
+        PRIMARY KEY (view_name, row_key)
+    )
+    """,
+    """
+    ALTER TABLE servicedesk.etl_metadata
+        ADD COLUMN IF NOT EXISTS watermark TIMESTAMP,
+        ADD COLUMN IF NOT EXISTS records_unchanged INTEGER,
+        ADD COLUMN IF NOT EXISTS sync_mode TEXT
+    """,
+]
+
+
+# Same columns/conflict targets as the batch loaders below
+STREAM_SPECS: Dict[str, StreamSpec] = {
+    'comments': StreamSpec(
+        view=OTCViews.COMMENTS,
+        table='servicedesk.comments',
+        model=OTCComment,
+        columns=('comment_id', 'ticket_id', 'comment_text', 'user_id', 'user_name',
+                 'owner_type', 'created_time', 'visible_to_customer', 'comment_type', 'team'),
+        key=('comment_id',),
+        update=('comment_text', 'visible_to_customer', 'comment_type', 'team'),
+        row=lambda c: (c.comment_id, c.ticket_id, c.comment_text, c.user_id, c.user_name,
+                       c.owner_type, c.created_time, c.visible_to_customer, c.comment_type, c.team),
+        watermark='created_time',
+    ),
+    'tickets': StreamSpec(
+        view=OTCViews.TICKETS,
+        table='servicedesk.tickets',
+        model=OTCTicket,
+        columns=('"TKT-Ticket ID"', '"TKT-Title"', '"TKT-Status"', '"TKT-Severity"', '"TKT-Category"',
+                 '"TKT-Team"', '"TKT-Assigned To User"', '"TKT-Created Time"', '"TKT-Modified Time"',
+                 '"TKT-Account Name"', '"TKT-Client Name"'),
+        key=('"TKT-Ticket ID"',),
+        update=('"TKT-Title"', '"TKT-Status"', '"TKT-Severity"', '"TKT-Category"', '"TKT-Team"',
+                '"TKT-Assigned To User"', '"TKT-Modified Time"', '"TKT-Account Name"', '"TKT-Client Name"'),
+        row=lambda t: (t.id, t.summary, t.status, t.priority, t.category, t.team, t.assignee,
+                       t.created_time, t.modified_time, t.account_name, t.client_name),
+        watermark='"TKT-Modified Time"',
+    ),
+    'timesheets': StreamSpec(
+        view=OTCViews.TIMESHEETS,
+        table='servicedesk.timesheets',
+        model=OTCTimesheet,
+        columns=('"TS-User Username"', '"TS-User Full Name"', '"TS-Date"', '"TS-Time From"',
+                 '"TS-Time To"', '"TS-Hours"', '"TS-Category"', '"TS-Sub Category"', '"TS-Type"',
+                 '"TS-Crm ID"', '"TS-Description"', '"TS-Account Name"'),
+        key=('"TS-User Username"', '"TS-Date"', '"TS-Time From"', '"TS-Crm ID"'),
+        update=('"TS-Hours"', '"TS-Description"', '"TS-Category"', '"TS-Sub Category"'),
+        row=lambda ts: (ts.user, ts.user_fullname, ts.date, ts.time_from, ts.time_to, ts.hours,
+                        ts.category, ts.sub_category, ts.work_type, ts.crm_id, ts.description,
+                        ts.account_name),
+        key_required=False,  # UNIQUE constraint: NULL keys never conflict
+        watermark='"TS-Date"',
+    ),
+}
+
+
 class OTCPostgresLoader:
     """Loads OTC data into PostgreSQL with conflict handling."""
 
@@ -223,6 +325,258 @@ class OTCPostgresLoader:
         finally:
             self.close()
 
+    def load_view_streaming(self, view_name: str, measure_memory: bool = False,
+                            incremental: bool = False) -> Dict:
+        """
+        Stream an OTC view into PostgreSQL via COPY and one set-based upsert.
+
+        The response is parsed record-by-record (OTCClient.iter_records),
+        validated, and piped straight into COPY on a temp staging table.
+        A single INSERT ... SELECT ... ON CONFLICT then merges staging into
+        the target, keeping the last occurrence of each duplicate key.
+
+        Every run refreshes the view's row hashes in otc_row_hashes. With
+        incremental=True, rows whose hash is already stored are dropped
+        before COPY; a full run replaces the stored hashes, so it also
+        resyncs after the target table was changed outside the loader.
+
+        Args:
+            view_name: 'comments', 'tickets', or 'timesheets'
+            measure_memory: Track peak Python heap with tracemalloc (slows
+                parsing several-fold - benchmarks only, not scheduled runs)
+            incremental: Skip rows unchanged since the last load
+
+        Returns:
+            Stats dict with counts (unchanged = skipped by change detection),
+            watermark, duration_seconds, rows_per_second and peak_memory_mb
+            (None when not measured)
+        """
+        spec = STREAM_SPECS[view_name]
+        sync_mode = 'incremental' if incremental else 'full'
+
+        logger.info("=" * 60)
+        logger.info(f"STREAMING OTC {view_name.upper()} TO POSTGRESQL (COPY, {sync_mode})")
+        logger.info("=" * 60)
+
+        start_time = datetime.now()
+        started = time.perf_counter()
+        self.stats = {'fetched': 0, 'inserted': 0, 'updated': 0, 'skipped': 0, 'errors': 0,
+                      'unchanged': 0, 'sync_mode': sync_mode}
+
+        tracing = measure_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+
+        self.connect()
+
+        try:
+            self._ensure_incremental_schema()
+
+            cursor = self.conn.cursor()
+            known_hashes = self._load_row_hashes(view_name) if incremental else set()
+            detector = ChangeDetector(
+                key_positions=[spec.columns.index(k) for k in spec.key],
+                watermark_position=spec.columns.index(spec.watermark) if spec.watermark else None,
+                known_hashes=known_hashes,
+            )
+            if incremental:
+                logger.info(f"   {len(known_hashes)} row hashes from previous loads")
+
+            columns = ', '.join(spec.columns)
+            stage = f"otc_stage_{view_name}"
+
+            # Staging table with the target's column types, dropped at commit
+            cursor.execute(f"""
+                CREATE TEMP TABLE {stage} ON COMMIT DROP AS
+                SELECT {columns} FROM {spec.table} WITH NO DATA
+            """)
+            cursor.execute(f"""
+                ALTER TABLE {stage}
+                    ADD COLUMN _row_key TEXT,
+                    ADD COLUMN _row_hash BIGINT,
+                    ADD COLUMN _ord BIGSERIAL
+            """)
+
+            logger.info("Step 1: Streaming API response into staging table (COPY)...")
+            client = OTCClient()
+            rows = CopyRowStream(self._stream_rows(client.iter_records(spec.view), spec, detector))
+            cursor.copy_expert(f"COPY {stage} ({columns}, _row_key, _row_hash) FROM STDIN", rows)
+            self.stats['unchanged'] = detector.unchanged
+            self.stats['watermark'] = detector.watermark
+            logger.info(f"   Staged {rows.rows_written} of {self.stats['fetched']} records "
+                        f"({detector.unchanged} unchanged)")
+
+            logger.info("Step 2: Merging staging into target (set-based upsert)...")
+            cursor.execute(self._merge_sql(spec, stage))
+            inserted, updated = cursor.fetchone()
+            self.stats['inserted'] = inserted
+            self.stats['updated'] = updated
+            # Duplicate keys within the response collapse to one row
+            self.stats['skipped'] = rows.rows_written - inserted - updated
+
+            logger.info("Step 3: Recording row hashes...")
+            if not incremental:
+                cursor.execute(f"DELETE FROM {ROW_HASHES_TABLE} WHERE view_name = %s", (view_name,))
+            cursor.execute(self._row_hashes_sql(stage), (view_name,))
+
+            cursor.close()
+
+            duration = time.perf_counter() - started
+            self.stats['duration_seconds'] = round(duration, 2)
+            self.stats['rows_per_second'] = round(self.stats['fetched'] / duration, 1) if duration > 0 else 0
+            self.stats['peak_memory_mb'] = (
+                round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1) if tracing else None
+            )
+
+            logger.info("=" * 60)
+            logger.info("LOAD COMPLETE")
+            logger.info(f"Duration: {duration:.1f}s ({self.stats['rows_per_second']} rows/sec)")
+            logger.info(f"Fetched: {self.stats['fetched']}")
+            logger.info(f"Unchanged: {self.stats['unchanged']}")
+            logger.info(f"Inserted: {self.stats['inserted']}")
+            logger.info(f"Updated: {self.stats['updated']}")
+            logger.info(f"Errors: {self.stats['errors']}")
+            logger.info(f"Watermark: {self.stats['watermark']}")
+            if tracing:
+                logger.info(f"Peak memory: {self.stats['peak_memory_mb']} MB")
+            logger.info("=" * 60)
+
+            self._record_etl_metadata(view_name, self.stats, start_time, datetime.now())
+
+            self.conn.commit()
+            logger.info("Transaction committed successfully")
+
+            return self.stats
+
+        except Exception as e:
+            logger.error(f"Streaming load failed: {e}")
+            if self.conn:
+                self.conn.rollback()
+                logger.error("Transaction rolled back")
+            raise
+        finally:
+            if tracing:
+                tracemalloc.stop()
+            self.close()
+
+    def _ensure_incremental_schema(self):
+        """
+        Apply INCREMENTAL_SCHEMA if migration 007 has not been run.
+
+        Checks the catalog first (no locks), so routine runs never take the
+        ACCESS EXCLUSIVE lock of ALTER TABLE or need table ownership. When
+        something is missing, the DDL runs in its own short transaction,
+        committed before the load starts.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT to_regclass(%s) IS NOT NULL,
+                   (SELECT COUNT(*) FROM information_schema.columns
+                    WHERE table_schema = 'servicedesk' AND table_name = 'etl_metadata'
+                      AND column_name IN ('watermark', 'records_unchanged', 'sync_mode'))
+        """, (ROW_HASHES_TABLE,))
+        has_hashes_table, metadata_columns = cursor.fetchone()
+        self.conn.commit()
+
+        if has_hashes_table and metadata_columns == 3:
+            return
+
+        logger.warning("Incremental sync schema missing - applying migration 007 inline")
+        try:
+            for statement in INCREMENTAL_SCHEMA:
+                cursor.execute(statement)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _stream_rows(self, records: Iterable[Dict], spec: StreamSpec,
+                     detector: ChangeDetector) -> Iterator[tuple]:
+        """
+        Validate streamed records into row tuples for COPY.
+
+        Invalid records (and NULL primary keys) are counted as errors and
+        skipped rather than aborting the COPY. Rows the detector has seen
+        before are dropped; the rest get (_row_key, _row_hash) appended.
+        """
+        key_positions = [spec.columns.index(k) for k in spec.key]
+
+        for i, record in enumerate(records):
+            self.stats['fetched'] += 1
+            try:
+                row = spec.row(spec.model.model_validate(record))
+            except Exception as e:
+                logger.warning(f"Failed to process {spec.view.name} record {i}: {e}")
+                self.stats['errors'] += 1
+                continue
+
+            if spec.key_required and any(row[p] is None for p in key_positions):
+                logger.warning(f"Skipping {spec.view.name} record {i}: missing key")
+                self.stats['errors'] += 1
+                continue
+
+            if detector.is_changed(row):
+                yield row + detector.tag(row)
+
+            if (i + 1) % 10000 == 0:
+                logger.info(f"   Streamed {i + 1} records...")
+
+    def _load_row_hashes(self, view_name: str) -> Set[int]:
+        """Row hashes stored for a view, read through a server-side cursor."""
+        cursor = self.conn.cursor(name=f"otc_row_hashes_{view_name}")
+        cursor.itersize = 50000
+        cursor.execute(f"SELECT row_hash FROM {ROW_HASHES_TABLE} WHERE view_name = %s", (view_name,))
+        known = {row_hash for (row_hash,) in cursor}
+        cursor.close()
+        return known
+
+    @staticmethod
+    def _merge_sql(spec: StreamSpec, stage: str) -> str:
+        """
+        Set-based upsert from staging, returning (inserted, updated).
+
+        DISTINCT ON keeps the last staged row per key (ON CONFLICT cannot
+        touch a row twice in one statement). Rows with a NULL key column
+        stay distinct, matching how the UNIQUE constraint treats them.
+        """
+        columns = ', '.join(spec.columns)
+        keys = ', '.join(spec.key)
+        null_key = ' OR '.join(f"{k} IS NULL" for k in spec.key)
+        distinct = f"{keys}, CASE WHEN {null_key} THEN _ord END"
+        updates = ',\n                    '.join(f"{c} = EXCLUDED.{c}" for c in spec.update)
+
+        return f"""
+            WITH upserted AS (
+                INSERT INTO {spec.table} ({columns})
+                SELECT {columns} FROM (
+                    SELECT DISTINCT ON ({distinct}) *
+                    FROM {stage}
+                    ORDER BY {distinct}, _ord DESC
+                ) latest
+                ON CONFLICT ({keys}) DO UPDATE SET
+                    {updates}
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                COUNT(*) FILTER (WHERE inserted),
+                COUNT(*) FILTER (WHERE NOT inserted)
+            FROM upserted
+        """
+
+    @staticmethod
+    def _row_hashes_sql(stage: str) -> str:
+        """Upsert staged row hashes (last occurrence per key), view_name as %s."""
+        return f"""
+            INSERT INTO {ROW_HASHES_TABLE} (view_name, row_key, row_hash)
+            SELECT DISTINCT ON (_row_key) %s, _row_key, _row_hash
+            FROM {stage}
+            ORDER BY _row_key, _ord DESC
+            ON CONFLICT (view_name, row_key) DO UPDATE SET
+                row_hash = EXCLUDED.row_hash
+        """
+
     def _insert_batch(self, cursor, insert_sql: str, update_sql: str, batch: List):
         """
         Insert a batch of records with individual error handling.
@@ -266,42 +620,40 @@ class OTCPostgresLoader:
 
         Args:
             view_name: 'tickets', 'comments', or 'timesheets'
-            stats: Stats dict with fetched/inserted/updated/errors
+            stats: Stats dict with fetched/inserted/updated/errors (streaming
+                loads add unchanged/watermark/sync_mode)
             start_time: When load started
             end_time: When load completed
             status: 'success', 'partial', or 'failed'
             error_message: Error details if failed
         """
+        row = {
+            'view_name': view_name,
+            'records_fetched': stats.get('fetched', 0),
+            'records_inserted': stats.get('inserted', 0),
+            'records_updated': stats.get('updated', 0),
+            'records_errors': stats.get('errors', 0),
+            'load_start': start_time,
+            'load_end': end_time,
+            'load_duration_seconds': (end_time - start_time).total_seconds(),
+            'load_status': status,
+            'error_message': error_message,
+            'last_load_time': end_time,
+        }
+        if 'sync_mode' in stats:
+            # Streaming loads (columns added by migration 007)
+            row.update({
+                'watermark': stats.get('watermark'),
+                'records_unchanged': stats.get('unchanged', 0),
+                'sync_mode': stats['sync_mode'],
+            })
+
         try:
             cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO servicedesk.etl_metadata (
-                    view_name,
-                    records_fetched,
-                    records_inserted,
-                    records_updated,
-                    records_errors,
-                    load_start,
-                    load_end,
-                    load_duration_seconds,
-                    load_status,
-                    error_message,
-                    last_load_time
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                view_name,
-                stats.get('fetched', 0),
-                stats.get('inserted', 0),
-                stats.get('updated', 0),
-                stats.get('errors', 0),
-                start_time,
-                end_time,
-                (end_time - start_time).total_seconds(),
-                status,
-                error_message,
-                end_time
-            ))
+            cursor.execute(f"""
+                INSERT INTO servicedesk.etl_metadata ({', '.join(row)})
+                VALUES ({', '.join(['%s'] * len(row))})
+            """, tuple(row.values()))
             self.conn.commit()
             logger.info(f"Recorded ETL metadata for {view_name}")
         except Exception as e:
@@ -385,26 +737,32 @@ class OTCPostgresLoader:
 
         return stats
 
-    def load_all(self, batch_size: int = 500) -> Dict:
+    def load_all(self, batch_size: int = 500, streaming: bool = False,
+                 incremental: bool = False) -> Dict:
         """
         Load all OTC views (comments, tickets, timesheets) to PostgreSQL.
 
         Args:
             batch_size: Number of records to insert per batch
+            streaming: Use load_view_streaming (COPY + set-based upsert)
+            incremental: Streaming load of changed rows only (implies streaming)
 
         Returns:
             Combined stats dict
         """
         all_stats = {}
+        streaming = streaming or incremental
 
         print("=" * 60)
-        print("FULL OTC ETL - ALL VIEWS")
+        print(f"{'INCREMENTAL' if incremental else 'FULL'} OTC ETL - ALL VIEWS")
         print("=" * 60)
 
         # Load comments (10 days)
         print("\n1. Loading Comments (10 days)...")
         try:
-            all_stats['comments'] = self.load_comments(batch_size)
+            all_stats['comments'] = (
+                self.load_view_streaming('comments', incremental=incremental) if streaming else self.load_comments(batch_size)
+            )
         except Exception as e:
             print(f"   ❌ Comments failed: {e}")
             all_stats['comments'] = {'error': str(e)}
@@ -412,7 +770,9 @@ class OTCPostgresLoader:
         # Load timesheets (18 months)
         print("\n2. Loading Timesheets (18 months)...")
         try:
-            all_stats['timesheets'] = self.load_timesheets(batch_size)
+            all_stats['timesheets'] = (
+                self.load_view_streaming('timesheets', incremental=incremental) if streaming else self.load_timesheets(batch_size)
+            )
         except Exception as e:
             print(f"   ❌ Timesheets failed: {e}")
             all_stats['timesheets'] = {'error': str(e)}
@@ -420,7 +780,9 @@ class OTCPostgresLoader:
         # Load tickets (3 years)
         print("\n3. Loading Tickets (3 years - may take several minutes)...")
         try:
-            all_stats['tickets'] = self.load_tickets(batch_size)
+            all_stats['tickets'] = (
+                self.load_view_streaming('tickets', incremental=incremental) if streaming else self.load_tickets(batch_size)
+            )
         except Exception as e:
             print(f"   ❌ Tickets failed: {e}")
             all_stats['tickets'] = {'error': str(e)}
@@ -731,11 +1093,27 @@ def main():
     )
 
     # Check command line args
-    view = sys.argv[1] if len(sys.argv) > 1 else 'all'
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    view = args[0] if args else 'all'
+    incremental = '--incremental' in sys.argv
+    measure_memory = '--measure-memory' in sys.argv
+    streaming = '--stream' in sys.argv or incremental
 
     loader = OTCPostgresLoader()
 
-    if view == 'comments':
+    if streaming and view in STREAM_SPECS:
+        stats = loader.load_view_streaming(view, measure_memory=measure_memory, incremental=incremental)
+        print(f"\n✅ {view.capitalize()} streaming load complete ({stats['sync_mode']})")
+        print(f"   Fetched: {stats['fetched']}")
+        print(f"   Unchanged: {stats['unchanged']}")
+        print(f"   Inserted: {stats['inserted']}")
+        print(f"   Updated: {stats['updated']}")
+        print(f"   Errors: {stats['errors']}")
+        print(f"   Rate: {stats['rows_per_second']} rows/sec")
+        if measure_memory:
+            print(f"   Peak memory: {stats['peak_memory_mb']} MB")
+        print(f"   Watermark: {stats['watermark']}")
+    elif view == 'comments':
         stats = loader.load_comments()
         print("\n✅ Comments load complete")
         print(f"   Fetched: {stats['fetched']}")
@@ -755,18 +1133,21 @@ def main():
         print(f"   Inserted: {stats['inserted']}")
         print(f"   Errors: {stats['errors']}")
     elif view == 'all':
-        stats = loader.load_all()
+        stats = loader.load_all(streaming=streaming, incremental=incremental)
         for view_name, view_stats in stats.items():
             print(f"\n{view_name.upper()}:")
             if 'error' in view_stats:
                 print(f"   ❌ Error: {view_stats['error']}")
             else:
                 print(f"   Fetched: {view_stats.get('fetched', 0)}")
+                if 'unchanged' in view_stats:
+                    print(f"   Unchanged: {view_stats['unchanged']}")
                 print(f"   Inserted: {view_stats.get('inserted', 0)}")
                 print(f"   Updated: {view_stats.get('updated', 0)}")
     else:
         print(f"Unknown view: {view}")
-        print("Usage: python -m claude.tools.integrations.otc.load_to_postgres [comments|timesheets|tickets|all]")
+        print("Usage: python -m claude.tools.integrations.otc.load_to_postgres "
+              "[comments|timesheets|tickets|all] [--stream] [--incremental] [--measure-memory]")
 
 
 if __name__ == "__main__":
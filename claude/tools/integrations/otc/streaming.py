@@ -0,0 +1,216 @@
+"""
+OTC Streaming Helpers
+
+Incremental JSON record parsing for large OTC view responses and a
+file-like adapter that feeds normalised rows to PostgreSQL COPY.
+
+Views are returned as one JSON body - a bare array, {"data": [...]} or
+{"message": {"data": [...]}}. iter_json_records() locates the records array
+and decodes one record at a time from response chunks, so memory is bounded
+by the chunk size and the largest single record instead of the whole view.
+
+Usage:
+    from claude.tools.integrations.otc.streaming import iter_json_records, CopyRowStream
+
+    for record in iter_json_records(response.iter_content(65536)):
+        ...
+
+    cursor.copy_expert("COPY stage (a, b) FROM STDIN", CopyRowStream(rows))
+"""
+
+import codecs
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+# Keys whose array value holds the records (see OTCETLAdapter._normalize_response)
+RECORD_ARRAY_KEYS = frozenset({'data', 'records'})
+
+_WHITESPACE = ' \t\n\r'
+
+
+def _normalize(data: Any) -> list:
+    """Records from a fully parsed response that had no records array."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ('message', *RECORD_ARRAY_KEYS):
+            if key in data:
+                inner = data[key]
+                return _normalize(inner) if key == 'message' else (
+                    inner if isinstance(inner, list) else [inner]
+                )
+        return [data]
+    return []
+
+
+def iter_json_records(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield records from a JSON view response as its chunks arrive.
+
+    Args:
+        chunks: Response body chunks (e.g. response.iter_content())
+
+    Yields:
+        Each element of the records array
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunk_iter = iter(chunks)
+
+    buf = ''
+    eof = False
+
+    def read_more() -> bool:
+        nonlocal buf, eof
+        for chunk in chunk_iter:
+            if chunk:
+                buf += utf8.decode(chunk)
+                return True
+        buf += utf8.decode(b'', final=True)
+        eof = True
+        return False
+
+    # Phase 1: find the records array - top-level '[' or the value of a
+    # 'data'/'records' key - tracking strings so brackets in text are ignored
+    pos = 0
+    depth = []          # open containers: '{' or '['
+    in_string = escape = False
+    string_start = 0
+    last_string: Optional[str] = None
+    after_colon = False
+    found = False
+
+    while not found:
+        if pos >= len(buf):
+            if eof or not read_more():
+                break
+            continue
+
+        ch = buf[pos]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+                last_string = json.loads(buf[string_start:pos + 1])
+        elif ch == '"':
+            in_string = True
+            string_start = pos
+            after_colon = False
+        elif ch == ':':
+            after_colon = True
+        elif ch == '[':
+            if not depth or (depth[-1] == '{' and after_colon and last_string in RECORD_ARRAY_KEYS):
+                found = True
+            depth.append(ch)
+            after_colon = False
+        elif ch == '{':
+            depth.append(ch)
+            after_colon = False
+        elif ch in '}]':
+            if depth:
+                depth.pop()
+            after_colon = False
+        elif ch == ',':
+            after_colon = False
+        pos += 1
+
+    if not found:
+        # No records array (single object / empty body): parse whole
+        yield from _normalize(json.loads(buf)) if buf.strip() else ()
+        return
+
+    # Phase 2: decode one element at a time after the '['
+    buf = buf[pos:]
+    pos = 0
+    while True:
+        while True:
+            while pos < len(buf) and (buf[pos] in _WHITESPACE or buf[pos] == ','):
+                pos += 1
+            if pos < len(buf) or not read_more():
+                break
+
+        if pos >= len(buf):
+            raise json.JSONDecodeError("Unterminated records array", buf, pos)
+        if buf[pos] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # Record split across chunks - drop consumed text, read more
+            buf = buf[pos:]
+            pos = 0
+            if eof or not read_more():
+                raise
+            continue
+
+        if not eof and not isinstance(record, (dict, list)) and (
+                end == len(buf) or buf[end] not in _WHITESPACE + ',]'):
+            # A scalar at the buffer edge may continue in the next chunk
+            # (e.g. "67." decodes as 67 until the fraction arrives)
+            read_more()
+            continue
+
+        yield record
+        pos = end
+        if pos > 1 << 16:
+            buf = buf[pos:]
+            pos = 0
+
+
+# =============================================================================
+# COPY
+# =============================================================================
+
+def copy_text_value(value: Any) -> str:
+    """Encode one value for PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+class CopyRowStream:
+    """
+    File-like reader over row tuples for cursor.copy_expert().
+
+    Rows are encoded lazily as COPY reads, so the whole view never sits in
+    memory as text.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows = iter(rows)
+        self._buffer = ''
+        self.rows_written = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer += '\t'.join(copy_text_value(v) for v in row) + '\n'
+            self.rows_written += 1
+
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
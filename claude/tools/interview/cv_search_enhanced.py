@@ -14,7 +14,6 @@ Created: 2025-12-16 (Phase: CV Integration - Optional Enhancements)
 import os
 import sys
 import json
-import requests
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
@@ -32,6 +31,7 @@ except ImportError:
     CHROMADB_AVAILABLE = False
     print("Warning: chromadb not available. Semantic search disabled.")
 
+from claude.tools.core.embedding_service import EmbeddingService
 from claude.tools.interview.cv_parser import CVParser, ParsedCV, SkillEntry
 from claude.tools.interview.dual_source_matcher import (
     DualSourceMatcher,
@@ -117,6 +117,10 @@ class EnhancedCVSearch:
         self.ollama_url = "http://localhost:11434"
 
         os.makedirs(self.chroma_path, exist_ok=True)
+        self.embedder = EmbeddingService(
+            model=embedding_model, ollama_url=self.ollama_url,
+            cache_path=Path(self.chroma_path) / "embedding_cache.db"
+        )
 
         self.cv_parser = CVParser()
         self._init_chromadb()
@@ -142,15 +146,13 @@ class EnhancedCVSearch:
         )
 
     def _get_embedding(self, text: str) -> List[float]:
-        """Get embedding from Ollama"""
+        """Get embedding from Ollama (cached by content hash)"""
+        return self._get_embeddings([text])[0]
+
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for many texts in batched, cached requests"""
         try:
-            response = requests.post(
-                f"{self.ollama_url}/api/embed",
-                json={"model": self.embedding_model, "input": text},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()["embeddings"][0]
+            return self.embedder.embed(texts)
         except Exception as e:
             print(f"Embedding error: {e}")
             raise
@@ -177,14 +179,11 @@ class EnhancedCVSearch:
         documents = []
         metadatas = []
         ids = []
-        embeddings = []
 
         for i, chunk in enumerate(chunks):
             if len(chunk.strip()) < 50:
                 continue
 
-            embedding = self._get_embedding(chunk)
-
             documents.append(chunk)
             metadatas.append({
                 "document_id": document_id,
@@ -193,9 +192,9 @@ class EnhancedCVSearch:
                 "chunk_length": len(chunk)
             })
             ids.append(f"{document_id}_chunk_{i}")
-            embeddings.append(embedding)
 
         if documents:
+            embeddings = self._get_embeddings(documents)
             self.collection.add(
                 documents=documents,
                 metadatas=metadatas,
@@ -49,6 +49,7 @@ def _check_chromadb_available():
     if not CHROMADB_AVAILABLE:
         raise ImportError("chromadb required. Install with: pip3 install chromadb")
 
+from claude.tools.core.embedding_service import EmbeddingService
 from claude.tools.interview.interview_vtt_parser import InterviewVTTParser, ParsedInterview, VTTSegment
 
 
@@ -233,6 +234,10 @@ class InterviewSearchSystem:
 
         self.embedding_model = embedding_model
         self.ollama_url = "http://localhost:11434"
+        self.embedder = EmbeddingService(
+            model=embedding_model, ollama_url=self.ollama_url,
+            cache_path=Path(self.chroma_path) / "embedding_cache.db"
+        )
 
         # Initialize parser
         self.parser = InterviewVTTParser()
@@ -292,15 +297,13 @@ class InterviewSearchSystem:
         return conn
 
     def _get_embedding(self, text: str) -> List[float]:
-        """Get embedding from Ollama"""
+        """Get embedding from Ollama (cached by content hash)"""
+        return self._get_embeddings([text])[0]
+
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for many texts in batched, cached requests"""
         try:
-            response = requests.post(
-                f"{self.ollama_url}/api/embed",
-                json={"model": self.embedding_model, "input": text},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()["embeddings"][0]
+            return self.embedder.embed(texts)
         except Exception as e:
             print(f"Embedding error: {e}")
             raise
@@ -402,15 +405,11 @@ class InterviewSearchSystem:
         documents = []
         metadatas = []
         ids = []
-        embeddings = []
 
         for segment in segments:
             # Create document text (speaker: text format for context)
             doc_text = f"{segment.speaker}: {segment.text}"
 
-            # Generate embedding
-            embedding = self._get_embedding(doc_text)
-
             # Create metadata
             metadata = {
                 "interview_id": interview_id,
@@ -425,10 +424,10 @@ class InterviewSearchSystem:
             documents.append(doc_text)
             metadatas.append(metadata)
             ids.append(f"{interview_id}_{segment.index}")
-            embeddings.append(embedding)
 
-        # Batch insert to ChromaDB
+        # Batch embed and insert to ChromaDB
         if documents:
+            embeddings = self._get_embeddings(documents)
             self.collection.add(
                 documents=documents,
                 metadatas=metadatas,
@@ -9,11 +9,12 @@ queue and high-water mark tracking.
 Architecture:
 1. Scan all active Claude projects (~/.claude/projects/*/transcript.jsonl)
 2. For each project:
-   - Load state (high-water mark)
-   - Count messages, detect compaction
+   - Load state (high-water mark + byte offset)
+   - Skip if the transcript's inode/size/mtime are unchanged (one stat)
+   - Detect compaction/rotation, seek to the byte offset, parse new lines
    - Extract learnings from new messages only
    - Write to queue file
-   - Update high-water mark
+   - Update high-water mark and byte offset
 3. Sleep configured interval
 4. Repeat
 
@@ -145,7 +146,16 @@ class ContinuousCaptureDaemon:
                 continue
 
             # Use the most recently modified transcript if multiple exist
-            transcript_path = max(transcript_files, key=lambda p: p.stat().st_mtime)
+            # (stat once; the result is reused for change detection)
+            stats = []
+            for path in transcript_files:
+                try:
+                    stats.append((path.stat(), path))
+                except FileNotFoundError:
+                    continue
+            if not stats:
+                continue
+            transcript_stat, transcript_path = max(stats, key=lambda item: item[0].st_mtime)
 
             # Extract context ID from directory name
             context_id = project_dir.name
@@ -153,6 +163,7 @@ class ContinuousCaptureDaemon:
             projects.append({
                 'context_id': context_id,
                 'transcript_path': transcript_path,
+                'transcript_stat': transcript_stat,
                 'project_dir': project_dir
             })
 
@@ -164,7 +175,7 @@ class ContinuousCaptureDaemon:
 
         For each project:
         1. Load state (high-water mark)
-        2. Count messages
+        2. Skip unchanged transcripts
         3. Detect compaction
         4. Extract learnings from new messages
         5. Write to queue
@@ -204,94 +215,81 @@ class ContinuousCaptureDaemon:
         context_id = project['context_id']
         transcript_path = project['transcript_path']
 
+        try:
+            file_stat = project.get('transcript_stat') or transcript_path.stat()
+        except FileNotFoundError:
+            self.logger.debug(f"Transcript for {context_id} disappeared, skipping")
+            return
+
         # Load current state
         state = self.state_manager.load_state(context_id)
 
-        # Count current messages
-        current_count = self._count_messages(transcript_path)
-
-        if current_count == 0:
-            self.logger.debug(f"Project {context_id} has no messages, skipping")
+        # Unchanged since the last cycle: nothing to read
+        if self.state_manager.is_unchanged(state, file_stat):
+            self.logger.debug(f"No new messages in {context_id}")
             return
 
-        # Detect compaction
-        compaction_detected = False
-        if state['last_message_count'] > 0 and current_count < state['last_message_count']:
-            self.logger.info(
-                f"Compaction detected in {context_id}: "
-                f"{state['last_message_count']} → {current_count} messages"
+        # State from before byte-offset tracking: find the offset once
+        if state.get('byte_offset') is None:
+            state['byte_offset'] = self.extractor.offset_after_lines(
+                transcript_path, state['last_message_index']
             )
-            compaction_detected = True
-            state['compaction_count'] += 1
-            state['last_message_index'] = 0  # Reset high-water mark
 
-        # Check if there are new messages to process
-        if not compaction_detected and current_count <= state['last_message_index']:
-            self.logger.debug(f"No new messages in {context_id}")
-            return
+        # Detect compaction (transcript replaced, truncated or rewritten)
+        if state['byte_offset'] is None or self.state_manager.detect_rotation(
+            state, transcript_path, file_stat
+        ):
+            if state['last_message_count'] > 0:
+                self.logger.info(
+                    f"Compaction detected in {context_id}: transcript rewritten "
+                    f"after {state['last_message_count']} messages"
+                )
+                state['compaction_count'] += 1
+            state['last_message_index'] = 0  # Reset high-water mark
+            state['byte_offset'] = 0
 
-        # Extract learnings from new messages
-        learnings = self.extractor.extract_from_transcript(
-            transcript_path=transcript_path,
-            start_index=state['last_message_index'],
-            end_index=current_count
+        # Parse only the lines appended since the saved offset
+        start_index = state['last_message_index']
+        messages, line_count, byte_offset = self.extractor.read_from_offset(
+            transcript_path, state['byte_offset']
         )
-
-        # Write to queue if learnings extracted
-        if learnings:
-            self.logger.info(
-                f"Extracted {len(learnings)} learnings from {context_id} "
-                f"(messages {state['last_message_index']}→{current_count})"
-            )
-
-            self.queue_writer.write_queue_file(
-                context_id=context_id,
-                learnings=learnings,
-                metadata={
-                    'compaction_number': state['compaction_count'],
-                    'message_range': [state['last_message_index'], current_count]
-                }
-            )
+        current_count = start_index + line_count
+
+        if line_count:
+            # Extract learnings from new messages
+            learnings = self.extractor.extract_from_messages(messages)
+
+            # Write to queue if learnings extracted
+            if learnings:
+                self.logger.info(
+                    f"Extracted {len(learnings)} learnings from {context_id} "
+                    f"(messages {start_index}→{current_count})"
+                )
+
+                self.queue_writer.write_queue_file(
+                    context_id=context_id,
+                    learnings=learnings,
+                    metadata={
+                        'compaction_number': state['compaction_count'],
+                        'message_range': [start_index, current_count]
+                    }
+                )
+            else:
+                self.logger.debug(f"No learnings extracted from {context_id}")
         else:
-            self.logger.debug(f"No learnings extracted from {context_id}")
-
-        # Update state
-        state['last_message_index'] = current_count
-        state['last_message_count'] = current_count
+            self.logger.debug(f"No new messages in {context_id}")
 
-        # Save state (unpack dict to parameters)
+        # Save state with the new offset and file identity
         self.state_manager.save_state(
             context_id=context_id,
-            last_message_index=state['last_message_index'],
-            last_message_count=state['last_message_count'],
-            compaction_count=state['compaction_count']
+            last_message_index=current_count,
+            last_message_count=current_count,
+            compaction_count=state['compaction_count'],
+            byte_offset=byte_offset,
+            file_stat=file_stat,
+            head_hash=self.state_manager.transcript_fingerprint(transcript_path, byte_offset)
         )
 
-    def _count_messages(self, transcript_path: Path) -> int:
-        """
-        Count messages in transcript file.
-
-        Args:
-            transcript_path: Path to transcript.jsonl
-
-        Returns:
-            Number of messages
-        """
-        if not transcript_path.exists():
-            return 0
-
-        count = 0
-        try:
-            with open(transcript_path, 'r') as f:
-                for line in f:
-                    if line.strip():  # Non-empty line
-                        count += 1
-        except Exception as e:
-            self.logger.error(f"Error counting messages in {transcript_path}: {e}")
-            return 0
-
-        return count
-
     def run(self):
         """
         Main daemon loop: capture cycle → sleep → repeat.
@@ -5,11 +5,15 @@ Incremental Learning Extractor
 Extracts learnings from transcript slices (start to end index) rather than
 full transcripts. Designed to work with high-water mark tracking for
 continuous capture.
+
+read_from_offset() tails a transcript from a saved byte offset, so a
+polling cycle only reads and parses lines appended since the last one.
 """
 
+import itertools
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from claude.tools.learning.extraction import LearningExtractor, LEARNING_PATTERNS
@@ -62,18 +66,14 @@ class IncrementalExtractor:
         if not transcript_path.exists():
             return []
 
-        # Read and parse transcript
-        messages = self._read_transcript(transcript_path)
-
-        if not messages:
-            return []
-
         # No new messages to process
         if start_index >= end_index:
             return []
 
-        # Slice messages to range
-        message_slice = messages[start_index:end_index]
+        # Parse only up to end_index and keep only the requested slice
+        message_slice = list(itertools.islice(
+            self._iter_transcript(transcript_path), start_index, end_index
+        ))
 
         if not message_slice:
             return []
@@ -115,8 +115,14 @@ class IncrementalExtractor:
         Returns:
             List of parsed message dictionaries
         """
-        messages = []
+        try:
+            return list(self._iter_transcript(transcript_path))
+        except (IOError, OSError):
+            # File read error - return empty
+            return []
 
+    def _iter_transcript(self, transcript_path: Path):
+        """Yield parsed messages lazily, skipping blank and malformed lines."""
         try:
             with open(transcript_path, 'r') as f:
                 for line in f:
@@ -125,17 +131,79 @@ class IncrementalExtractor:
                         continue
 
                     try:
-                        msg = json.loads(line)
-                        messages.append(msg)
+                        yield json.loads(line)
                     except json.JSONDecodeError:
                         # Skip malformed lines
                         continue
+        except (IOError, OSError):
+            # File read error - stop
+            return
+
+    def read_from_offset(
+        self,
+        transcript_path: Path,
+        byte_offset: int
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Read complete lines appended after byte_offset.
 
+        A trailing line without a newline (still being written) is left for
+        the next read.
+
+        Args:
+            transcript_path: Path to JSONL transcript
+            byte_offset: Offset to seek to (end of the last line read)
+
+        Returns:
+            Tuple of (parsed messages, non-empty lines read, new byte offset).
+            Malformed lines count as read but are not returned.
+        """
+        try:
+            with open(transcript_path, 'rb') as f:
+                f.seek(byte_offset)
+                data = f.read()
         except (IOError, OSError):
-            # File read error - return empty
-            return []
+            return [], 0, byte_offset
+
+        end = data.rfind(b'\n') + 1
+        messages = []
+        line_count = 0
+        for line in data[:end].split(b'\n'):
+            if not line.strip():
+                continue
+            line_count += 1
+            try:
+                messages.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # Skip malformed lines
+                continue
+
+        return messages, line_count, byte_offset + end
+
+    def offset_after_lines(self, transcript_path: Path, line_count: int) -> Optional[int]:
+        """
+        Byte offset just past the first line_count non-empty lines.
 
-        return messages
+        Used once to migrate index-only state to byte offsets. Returns None
+        if the transcript has fewer lines (it was replaced or compacted).
+        """
+        if line_count <= 0:
+            return 0
+        seen = 0
+        offset = 0
+        try:
+            with open(transcript_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    offset += len(line)
+                    if line.strip():
+                        seen += 1
+                        if seen == line_count:
+                            return offset
+        except (IOError, OSError):
+            pass
+        return None
 
     def extract_from_messages(
         self,
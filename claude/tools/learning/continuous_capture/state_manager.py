@@ -4,13 +4,22 @@ Capture State Manager for Continuous Learning Capture
 
 Tracks high-water marks (last processed message index) per context
 to enable incremental learning capture that survives compaction.
+
+Alongside the message index, the state records the transcript byte offset
+reached and the file's inode/size/mtime, so the daemon can skip unchanged
+transcripts with one stat and seek straight to new lines otherwise.
 """
 
+import hashlib
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# Leading transcript bytes hashed to detect a rewrite in place
+HEAD_FINGERPRINT_BYTES = 1024
+
 
 class CaptureStateManager:
     """
@@ -25,7 +34,12 @@ class CaptureStateManager:
         "last_message_index": int,  # Last processed message (0-indexed)
         "last_message_count": int,  # Total messages when last captured
         "last_capture_timestamp": str,  # ISO timestamp
-        "compaction_count": int  # Number of compactions detected
+        "compaction_count": int,  # Number of compactions detected
+        "byte_offset": int | None,  # Offset matching last_message_index (None = unknown)
+        "file_inode": int | None,  # Transcript identity when last read
+        "file_size": int,
+        "file_mtime_ns": int,
+        "head_hash": str | None  # sha256 of the first bytes up to byte_offset
     }
     """
 
@@ -48,6 +62,21 @@ class CaptureStateManager:
         safe_id = context_id.replace("/", "-").replace(":", "-")
         return self.state_dir / f"{safe_id}.json"
 
+    @staticmethod
+    def _default_state(context_id: str) -> Dict[str, Any]:
+        return {
+            'context_id': context_id,
+            'last_message_index': 0,
+            'last_message_count': 0,
+            'last_capture_timestamp': datetime.now().isoformat(),
+            'compaction_count': 0,
+            'byte_offset': 0,
+            'file_inode': None,
+            'file_size': 0,
+            'file_mtime_ns': 0,
+            'head_hash': None
+        }
+
     def load_state(self, context_id: str) -> Dict[str, Any]:
         """
         Load state for a context.
@@ -62,33 +91,30 @@ class CaptureStateManager:
 
         if not state_file.exists():
             # Return defaults for new context
-            return {
-                'context_id': context_id,
-                'last_message_index': 0,
-                'last_message_count': 0,
-                'last_capture_timestamp': datetime.now().isoformat(),
-                'compaction_count': 0
-            }
+            return self._default_state(context_id)
 
         try:
             with open(state_file, 'r') as f:
-                return json.load(f)
+                state = json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             # Corrupted or unreadable - return defaults
-            return {
-                'context_id': context_id,
-                'last_message_index': 0,
-                'last_message_count': 0,
-                'last_capture_timestamp': datetime.now().isoformat(),
-                'compaction_count': 0
-            }
+            return self._default_state(context_id)
+
+        # State files written before byte-offset tracking: no 'byte_offset' key
+        for key, value in self._default_state(context_id).items():
+            if key != 'byte_offset':
+                state.setdefault(key, value)
+        return state
 
     def save_state(
         self,
         context_id: str,
         last_message_index: int,
         last_message_count: int,
-        compaction_count: int = 0
+        compaction_count: int = 0,
+        byte_offset: Optional[int] = None,
+        file_stat: Optional[os.stat_result] = None,
+        head_hash: Optional[str] = None
     ) -> None:
         """
         Save state for a context.
@@ -98,13 +124,22 @@ class CaptureStateManager:
             last_message_index: Index of last processed message
             last_message_count: Total message count
             compaction_count: Number of compactions detected
+            byte_offset: Transcript offset matching last_message_index
+                (None = unknown; the daemon recomputes it by skipping lines)
+            file_stat: Transcript stat at read time (for change/rotation detection)
+            head_hash: Fingerprint from transcript_fingerprint() at byte_offset
         """
         state = {
             'context_id': context_id,
             'last_message_index': last_message_index,
             'last_message_count': last_message_count,
             'last_capture_timestamp': datetime.now().isoformat(),
-            'compaction_count': compaction_count
+            'compaction_count': compaction_count,
+            'byte_offset': byte_offset,
+            'file_inode': file_stat.st_ino if file_stat else None,
+            'file_size': file_stat.st_size if file_stat else 0,
+            'file_mtime_ns': file_stat.st_mtime_ns if file_stat else 0,
+            'head_hash': head_hash
         }
 
         state_file = self._get_state_file(context_id)
@@ -123,6 +158,49 @@ class CaptureStateManager:
                 temp_file.unlink()
             raise RuntimeError(f"Failed to save state for {context_id}: {e}") from e
 
+    @staticmethod
+    def transcript_fingerprint(transcript_path: Path, byte_offset: int) -> Optional[str]:
+        """Hash of the transcript's first bytes (up to byte_offset), or None."""
+        length = min(byte_offset, HEAD_FINGERPRINT_BYTES)
+        if length <= 0:
+            return None
+        try:
+            with open(transcript_path, 'rb') as f:
+                return hashlib.sha256(f.read(length)).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def is_unchanged(state: Dict[str, Any], file_stat: os.stat_result) -> bool:
+        """True if the transcript has the same inode, size and mtime as when last read."""
+        return (
+            state.get('byte_offset') is not None
+            and state.get('file_inode') == file_stat.st_ino
+            and state.get('file_size') == file_stat.st_size
+            and state.get('file_mtime_ns') == file_stat.st_mtime_ns
+        )
+
+    def detect_rotation(
+        self,
+        state: Dict[str, Any],
+        transcript_path: Path,
+        file_stat: os.stat_result
+    ) -> bool:
+        """
+        Detect a replaced or rewritten transcript.
+
+        True if the file is a different inode, shorter than the saved offset,
+        or its leading bytes no longer match the saved fingerprint.
+        """
+        offset = state.get('byte_offset') or 0
+        if state.get('file_inode') is not None and state['file_inode'] != file_stat.st_ino:
+            return True
+        if file_stat.st_size < offset:
+            return True
+        if state.get('head_hash') and offset:
+            return self.transcript_fingerprint(transcript_path, offset) != state['head_hash']
+        return False
+
     def detect_compaction(self, context_id: str, current_message_count: int) -> bool:
         """
         Detect if compaction occurred by comparing message counts.
@@ -159,7 +237,8 @@ class CaptureStateManager:
             context_id=context_id,
             last_message_index=0,  # Reset to start
             last_message_count=new_message_count,
-            compaction_count=state['compaction_count'] + 1
+            compaction_count=state['compaction_count'] + 1,
+            byte_offset=0
         )
 
     def update_high_water_mark(
@@ -17,11 +17,13 @@ __version__ = "1.2.0"
 
 # Compression utilities (Phase 229)
 from .compression import compress_json, decompress_json, is_compressed, COMPRESSION_LEVEL
+from .compression import CODEC_ZLIB, CODEC_ZSTD, ZSTD_AVAILABLE, get_table_codec, load_dictionaries
 
 # Core database classes
 from .log_database import IRLogDatabase
 from .log_importer import LogImporter, ImportResult
 from .log_query import LogQuery
+from .parallel_importer import ParallelLogImporter, ParallelImportReport
 
 # Existing parser classes
 from .m365_log_parser import (
@@ -39,11 +41,18 @@ __all__ = [
     'decompress_json',
     'is_compressed',
     'COMPRESSION_LEVEL',
+    'CODEC_ZLIB',
+    'CODEC_ZSTD',
+    'ZSTD_AVAILABLE',
+    'get_table_codec',
+    'load_dictionaries',
     # Phase 226 - Database
     'IRLogDatabase',
     'LogImporter',
     'ImportResult',
     'LogQuery',
+    'ParallelLogImporter',
+    'ParallelImportReport',
     # Phase 225 - Parser
     'M365LogParser',
     'LogType',
@@ -25,6 +25,11 @@ MAIA_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(MAIA_ROOT))
 
 from claude.tools.m365_ir.m365_log_parser import SignInLogEntry, LegacyAuthEntry
+from claude.tools.m365_ir.impossible_travel import (
+    find_impossible_travel,
+    sort_by_user_time,
+    timestamp_seconds,
+)
 
 
 class AnomalyType(Enum):
@@ -122,6 +127,19 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def resolve_coordinates(city: str, country: str) -> Tuple[float, float]:
+    """
+    Resolve a sign-in location to (lat, lon).
+
+    Uses city-level coordinates when known, falling back to the country
+    centroid and finally (0, 0).
+    """
+    coords = CITY_COORDS.get((city, country))
+    if not coords:
+        coords = COUNTRY_COORDS.get(country, (0, 0))
+    return coords
+
+
 def calculate_travel_distance(
     city1: str, country1: str,
     city2: str, country2: str
@@ -136,15 +154,8 @@ def calculate_travel_distance(
     Returns:
         Distance in kilometers
     """
-    # Try city-level coordinates first
-    coords1 = CITY_COORDS.get((city1, country1))
-    coords2 = CITY_COORDS.get((city2, country2))
-
-    # Fall back to country centroids
-    if not coords1:
-        coords1 = COUNTRY_COORDS.get(country1, (0, 0))
-    if not coords2:
-        coords2 = COUNTRY_COORDS.get(country2, (0, 0))
+    coords1 = resolve_coordinates(city1, country1)
+    coords2 = resolve_coordinates(city2, country2)
 
     return haversine_distance(coords1[0], coords1[1], coords2[0], coords2[1])
 
@@ -156,6 +167,10 @@ def detect_impossible_travel(
     """
     Detect impossible travel - logins from distant locations in short time.
 
+    Entries are flattened into (user, time, lat, lon) columns, sorted per
+    user, and every consecutive pair is scored in bulk by the shared
+    impossible_travel engine.
+
     Args:
         entries: List of sign-in entries
         max_speed_kmh: Maximum plausible travel speed
@@ -163,59 +178,60 @@ def detect_impossible_travel(
     Returns:
         List of impossible travel anomalies
     """
-    anomalies = []
-
-    # Group by user
-    user_entries: Dict[str, List[SignInLogEntry]] = defaultdict(list)
+    entries = list(entries)
+    if len(entries) < 2:
+        return []
+
+    # Build columns; users are coded in first-seen order and coordinates are
+    # resolved once per distinct location
+    user_index: Dict[str, int] = {}
+    location_coords: Dict[Tuple[str, str], Tuple[float, float]] = {}
+    user_codes, seconds, lats, lons = [], [], [], []
     for entry in entries:
-        user_entries[entry.user_principal_name].append(entry)
-
-    for user, user_logins in user_entries.items():
-        # Sort by time
-        sorted_logins = sorted(user_logins, key=lambda e: e.created_datetime)
-
-        for i in range(1, len(sorted_logins)):
-            prev = sorted_logins[i-1]
-            curr = sorted_logins[i]
-
-            # Skip if same location
-            if prev.country == curr.country and prev.city == curr.city:
-                continue
+        user_codes.append(user_index.setdefault(entry.user_principal_name, len(user_index)))
+        seconds.append(timestamp_seconds(entry.created_datetime))
+        location = (entry.city, entry.country)
+        coords = location_coords.get(location)
+        if coords is None:
+            coords = location_coords[location] = resolve_coordinates(*location)
+        lats.append(coords[0])
+        lons.append(coords[1])
+
+    order = sort_by_user_time(user_codes, seconds)
+    legs = find_impossible_travel(
+        [user_codes[i] for i in order],
+        [seconds[i] for i in order],
+        [lats[i] for i in order],
+        [lons[i] for i in order],
+        max_speed_kmh=max_speed_kmh,
+        min_distance_km=500,  # Ignore small distances
+    )
 
-            # Calculate distance and time
-            distance = calculate_travel_distance(
-                prev.city, prev.country,
-                curr.city, curr.country
-            )
-            time_delta = curr.created_datetime - prev.created_datetime
-            hours = time_delta.total_seconds() / 3600
-
-            if hours <= 0:
-                continue
-
-            # Calculate required speed
-            required_speed = distance / hours
-
-            # Check if impossible (faster than max speed)
-            if required_speed > max_speed_kmh and distance > 500:  # Ignore small distances
-                anomalies.append(Anomaly(
-                    anomaly_type=AnomalyType.IMPOSSIBLE_TRAVEL,
-                    user_principal_name=user,
-                    timestamp=curr.created_datetime,
-                    description=f"Impossible travel: {prev.city}, {prev.country} to {curr.city}, {curr.country} in {hours:.1f}h ({distance:.0f}km, {required_speed:.0f}km/h required)",
-                    severity="HIGH",
-                    evidence={
-                        "source_entry": prev,
-                        "dest_entry": curr,
-                        "distance_km": distance,
-                        "time_hours": hours,
-                        "required_speed_kmh": required_speed,
-                    },
-                    source_location=f"{prev.city}, {prev.country}",
-                    dest_location=f"{curr.city}, {curr.country}",
-                    time_delta=time_delta,
-                    distance_km=distance,
-                ))
+    anomalies = []
+    for leg in legs:
+        prev = entries[order[leg.prev_index]]
+        curr = entries[order[leg.index]]
+        distance = leg.distance_km
+        hours = leg.hours
+        required_speed = leg.speed_kmh
+        anomalies.append(Anomaly(
+            anomaly_type=AnomalyType.IMPOSSIBLE_TRAVEL,
+            user_principal_name=curr.user_principal_name,
+            timestamp=curr.created_datetime,
+            description=f"Impossible travel: {prev.city}, {prev.country} to {curr.city}, {curr.country} in {hours:.1f}h ({distance:.0f}km, {required_speed:.0f}km/h required)",
+            severity="HIGH",
+            evidence={
+                "source_entry": prev,
+                "dest_entry": curr,
+                "distance_km": distance,
+                "time_hours": hours,
+                "required_speed_kmh": required_speed,
+            },
+            source_location=f"{prev.city}, {prev.country}",
+            dest_location=f"{curr.city}, {curr.country}",
+            time_delta=curr.created_datetime - prev.created_datetime,
+            distance_km=distance,
+        ))
 
     return anomalies
 
@@ -419,13 +435,8 @@ if __name__ == "__main__":
         signin_entries = parser.merge_exports(export_paths, LogType.SIGNIN)
         print(f"Loaded {len(signin_entries)} sign-in entries")
 
-        # Load legacy auth if available
-        legacy_entries = []
-        for export in export_paths:
-            discovered = parser.discover_log_files(export)
-            if LogType.LEGACY_AUTH in discovered:
-                legacy_entries.extend(parser.parse_legacy_auth(discovered[LogType.LEGACY_AUTH]))
-        print(f"Loaded {len(legacy_entries)} legacy auth entries")
+        # Stream legacy auth if available (detect_all makes a single pass)
+        legacy_entries = parser.iter_exports(export_paths, LogType.LEGACY_AUTH)
 
         # Detect anomalies
         detector = AnomalyDetector()
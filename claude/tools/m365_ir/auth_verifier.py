@@ -33,7 +33,10 @@ import logging
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, NamedTuple, Optional
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .columnar_export import ColumnarAnalytics
 
 logger = logging.getLogger(__name__)
 
@@ -399,7 +402,8 @@ class AuditVerificationSummary:
 def _check_field_reliability(
     db_path: str,
     table: str,
-    field: str
+    field: str,
+    analytics: Optional["ColumnarAnalytics"] = None
 ) -> tuple[float, bool]:
     """
     Check if a field is reliable (has meaningful variation).
@@ -410,11 +414,27 @@ def _check_field_reliability(
 
     A field is RELIABLE if it has at least 2 distinct values with reasonable distribution.
 
+    Args:
+        analytics: Optional Parquet snapshot to read the field from instead of db_path
+
     Returns:
         (discriminatory_power, is_reliable)
         - discriminatory_power: distinct values / total rows (0-1)
         - is_reliable: True if field has meaningful variation
     """
+    if analytics is not None:
+        profile = analytics.field_profile(table, field)
+        total = profile.total_records
+        if total == 0:
+            return (0.0, False)
+        # Same counts as the SQL below: COUNT(DISTINCT) skips NULL but not '',
+        # and GROUP BY puts all NULLs (and all '') in one group each
+        distinct = profile.distinct_values + (1 if profile.empty_count else 0)
+        if distinct == 1:
+            return (1.0 / total, False)
+        mode_count = max(profile.most_common_count, profile.null_count, profile.empty_count)
+        return (distinct / total, (mode_count / total) * 100.0 <= 99.5)
+
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
@@ -479,7 +499,54 @@ def _ensure_historical_db() -> str:
     return history_path
 
 
-def verify_sign_in_status(db_path: str) -> SignInVerificationSummary:
+# (success, failure) conditions per status field, as (field, operator, value)
+SIGN_IN_OUTCOME_CONDITIONS = {
+    'conditional_access_status': (
+        [('conditional_access_status', '=', 'success')],
+        [('conditional_access_status', '=', 'failure')],
+    ),
+    'status_error_code': (
+        [('status_error_code', '=', 0)],
+        [('status_error_code', '!=', 0)],
+    ),
+    'result_status': (
+        [('result_status', '=', 'Success')],
+        [('result_status', '!=', 'Success')],
+    ),
+}
+
+FOREIGN_SUCCESS_CONDITIONS = [
+    ('conditional_access_status', '=', 'success'),
+    ('location_country', 'not in', ('AU', 'Australia')),
+]
+
+
+def _count_sign_ins(
+    cursor: sqlite3.Cursor,
+    conditions: Sequence[Tuple[str, str, Any]],
+    analytics: Optional["ColumnarAnalytics"] = None
+) -> int:
+    """Count sign_in_logs rows matching all conditions, from SQLite or the Parquet snapshot."""
+    if analytics is not None:
+        return analytics.count_rows('sign_in_logs', conditions)
+
+    clauses, params = [], []
+    for field, operator, value in conditions:
+        if operator == 'not in':
+            clauses.append(f"{field} NOT IN ({', '.join('?' * len(value))})")
+            params.extend(value)
+        else:
+            clauses.append(f"{field} {operator} ?")
+            params.append(value)
+    return cursor.execute(
+        f"SELECT COUNT(*) FROM sign_in_logs WHERE {' AND '.join(clauses)}", params
+    ).fetchone()[0]
+
+
+def verify_sign_in_status(
+    db_path: str,
+    analytics: Optional["ColumnarAnalytics"] = None
+) -> SignInVerificationSummary:
     """
     Verify sign_in_logs authentication status with automatic field selection.
 
@@ -491,6 +558,10 @@ def verify_sign_in_status(db_path: str) -> SignInVerificationSummary:
 
     Args:
         db_path: Path to SQLite database containing sign_in_logs table
+        analytics: Optional ColumnarAnalytics over a current Parquet snapshot
+            of the case; field selection and status counts then read the
+            snapshot's columns instead of scanning sign_in_logs. Results
+            are still stored in db_path's verification_summary.
 
     Returns:
         SignInVerificationSummary with complete analysis
@@ -523,15 +594,24 @@ def verify_sign_in_status(db_path: str) -> SignInVerificationSummary:
     warnings = []
 
     if USE_PHASE_2_1_SCORING:
-        from .field_reliability_scorer import recommend_best_field
+        from .field_reliability_scorer import discover_candidate_fields, recommend_best_field
 
         try:
             history_db = _ensure_historical_db()
+            context = profiles = None
+            if analytics is not None:
+                context = analytics.threshold_context('sign_in_logs', 'sign_in_logs')
+                profiles = analytics.field_profiles(
+                    'sign_in_logs',
+                    discover_candidate_fields(db_path, 'sign_in_logs', 'sign_in_logs')
+                )
             recommendation = recommend_best_field(
                 db_path=db_path,
                 table='sign_in_logs',
                 log_type='sign_in_logs',
-                historical_db_path=history_db
+                historical_db_path=history_db,
+                context=context,
+                profiles=profiles
             )
 
             reliable_field = recommendation.recommended_field
@@ -567,7 +647,7 @@ def verify_sign_in_status(db_path: str) -> SignInVerificationSummary:
 
             # Check reliability
             disc_power, is_reliable = _check_field_reliability(
-                db_path, 'sign_in_logs', field
+                db_path, 'sign_in_logs', field, analytics
             )
 
             if not is_reliable:
@@ -587,53 +667,19 @@ def verify_sign_in_status(db_path: str) -> SignInVerificationSummary:
         )
 
     # Count total records
-    total_records = cursor.execute(
-        "SELECT COUNT(*) FROM sign_in_logs"
-    ).fetchone()[0]
-
-    # Count successes and failures using reliable field
-    if reliable_field == 'conditional_access_status':
-        success_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE conditional_access_status = 'success'
-            """
-        ).fetchone()[0]
-
-        failure_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE conditional_access_status = 'failure'
-            """
-        ).fetchone()[0]
-    elif reliable_field == 'status_error_code':
-        success_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE status_error_code = 0
-            """
-        ).fetchone()[0]
-
-        failure_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE status_error_code != 0
-            """
-        ).fetchone()[0]
-    else:  # result_status
-        success_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE result_status = 'Success'
-            """
+    if analytics is not None:
+        total_records = analytics.row_count('sign_in_logs')
+    else:
+        total_records = cursor.execute(
+            "SELECT COUNT(*) FROM sign_in_logs"
         ).fetchone()[0]
 
-        failure_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE result_status != 'Success'
-            """
-        ).fetchone()[0]
+    # Count successes and failures using reliable field
+    success_conditions, failure_conditions = SIGN_IN_OUTCOME_CONDITIONS.get(
+        reliable_field, SIGN_IN_OUTCOME_CONDITIONS['result_status']
+    )
+    success_count = _count_sign_ins(cursor, success_conditions, analytics)
+    failure_count = _count_sign_ins(cursor, failure_conditions, analytics)
 
     success_rate = (success_count / total_records * 100.0) if total_records > 0 else 0.0
 
@@ -644,13 +690,7 @@ def verify_sign_in_status(db_path: str) -> SignInVerificationSummary:
 
     foreign_success_count = 0
     if has_location and reliable_field == 'conditional_access_status':
-        foreign_success_count = cursor.execute(
-            """
-            SELECT COUNT(*) FROM sign_in_logs
-            WHERE conditional_access_status = 'success'
-            AND location_country NOT IN ('AU', 'Australia')
-            """
-        ).fetchone()[0]
+        foreign_success_count = _count_sign_ins(cursor, FOREIGN_SUCCESS_CONDITIONS, analytics)
 
     foreign_success_rate = (
         (foreign_success_count / success_count * 100.0)
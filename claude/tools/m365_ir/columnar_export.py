@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+Columnar Export - Day-partitioned Parquet snapshots of IR case databases.
+
+IR cases live in one row-oriented SQLite file per case, so aggregate checks
+(field population, distinct counts, status distributions) re-scan every
+column of every row. export_case_parquet() snapshots each log table to
+Parquet next to the case DB, partitioned by day (Hive layout), and
+ColumnarAnalytics runs the data_quality_checker scoring over that copy
+reading only the columns a check needs.
+
+Layout:
+    <case_dir>/parquet/
+        manifest.json                      # row counts + source watermark per table
+        sign_in_logs/day=2025-12-15/part-0.parquet
+        sign_in_logs/day=__unknown__/...   # rows without a parseable timestamp
+        unified_audit_log/day=.../...
+
+raw_record/audit_data BLOBs are left out by default (compressed JSON is
+not useful to aggregate and dominates file size); pass include_raw=True to
+keep them. Snapshots are point-in-time: is_snapshot_current() compares the
+manifest watermark with the live DB so callers can re-export when stale.
+
+ColumnarAnalytics also feeds the other aggregate checks: field_profiles() and
+threshold_context() stand in for the SQLite scans of field_reliability_scorer
+(rank_candidate_fields/recommend_best_field accept profiles=), and
+auth_verifier.verify_sign_in_status(db_path, analytics=...) takes its field
+selection and status/foreign-success counts from the snapshot.
+
+Requires pyarrow (pip install pyarrow).
+
+Usage:
+    from claude.tools.m365_ir.columnar_export import export_case_parquet, ColumnarAnalytics
+
+    result = export_case_parquet(db)
+    analytics = ColumnarAnalytics(result.output_dir)
+    report = analytics.table_quality('sign_in_logs')
+    print(analytics.value_distribution('sign_in_logs', 'conditional_access_status'))
+
+Author: Maia System (SRE Principal Engineer Agent)
+Created: 2026-10-16
+"""
+
+import json
+import shutil
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pc = ds = pq = None
+    PYARROW_AVAILABLE = False
+
+from .data_quality_checker import (
+    DERIVED_COLUMNS,
+    FieldQualityScore,
+    TableQualityReport,
+    build_table_report,
+    score_field,
+)
+from .field_profiler import FieldProfile
+from .field_reliability_scorer import CONTEXT_METADATA_FIELDS, ThresholdContext
+from .log_database import IRLogDatabase
+
+
+PARQUET_DIRNAME = 'parquet'
+MANIFEST_FILENAME = 'manifest.json'
+
+# Partition for rows whose timestamp is NULL or not ISO-8601
+UNKNOWN_DAY = '__unknown__'
+
+# Rows fetched from SQLite per Arrow record batch
+EXPORT_BATCH_SIZE = 50_000
+
+# Log tables snapshotted by default (all have a timestamp column to partition on)
+DEFAULT_EXPORT_TABLES = (
+    'sign_in_logs',
+    'unified_audit_log',
+    'mailbox_audit_log',
+    'legacy_auth_logs',
+    'entra_audit_log',
+    'oauth_consents',
+    'inbox_rules',
+    'mfa_changes',
+)
+
+# Compressed BLOB columns skipped unless include_raw=True
+RAW_COLUMNS = frozenset({'raw_record', 'audit_data'})
+
+# Comparison operators accepted by ColumnarAnalytics.count_rows()
+_CONDITION_OPERATORS = ('=', '!=', 'not in')
+
+
+@dataclass
+class TableExport:
+    """Export statistics for one table."""
+    table_name: str
+    rows: int
+    partitions: int
+    columns: List[str]
+    excluded_columns: List[str]
+    max_rowid: int
+
+
+@dataclass
+class ParquetExportResult:
+    """Result of export_case_parquet()."""
+    case_id: str
+    output_dir: Path
+    tables: Dict[str, TableExport] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(t.rows for t in self.tables.values())
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet export (pip install pyarrow)")
+
+
+def _arrow_type(declared: str):
+    """Map a SQLite declared type to an Arrow type using SQLite affinity rules."""
+    declared = (declared or '').upper()
+    if 'INT' in declared:
+        return pa.int64()
+    if 'CHAR' in declared or 'CLOB' in declared or 'TEXT' in declared:
+        return pa.string()
+    if 'BLOB' in declared or not declared:
+        return pa.binary()
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return pa.float64()
+    return pa.string()
+
+
+def _select_expression(name: str, arrow_type) -> str:
+    """CAST each column to its declared affinity so Arrow batches have a fixed schema."""
+    if arrow_type == pa.int64():
+        return f"CAST({name} AS INTEGER)"
+    if arrow_type == pa.float64():
+        return f"CAST({name} AS REAL)"
+    if arrow_type == pa.string():
+        return f"CAST({name} AS TEXT)"
+    return name
+
+
+def _export_table(conn, table: str, table_dir: Path, include_raw: bool, batch_size: int) -> TableExport:
+    """Stream one table, in timestamp order, into day=YYYY-MM-DD partitions."""
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    excluded = [] if include_raw else [row[1] for row in info if row[1] in RAW_COLUMNS]
+    columns = [(row[1], _arrow_type(row[2])) for row in info if row[1] not in excluded]
+    schema = pa.schema(columns)
+
+    select_list = ', '.join(_select_expression(name, t) for name, t in columns)
+    max_rowid = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+    # Read in timestamp index order so each day's rows arrive contiguously and
+    # only one partition writer is open at a time. A day seen again (non-ISO
+    # timestamps sorting between days) gets another part-N file.
+    cursor = conn.execute(f"""
+        SELECT CASE WHEN timestamp GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+                    THEN substr(timestamp, 1, 10) ELSE '{UNKNOWN_DAY}' END AS day,
+               {select_list}
+        FROM {table}
+        WHERE rowid <= ?
+        ORDER BY timestamp
+    """, (max_rowid,))
+
+    rows = 0
+    parts: Dict[str, int] = {}  # day -> part files written
+    writer = None
+    current_day = None
+    try:
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            start = 0
+            while start < len(batch):
+                day = batch[start][0]
+                end = start
+                while end < len(batch) and batch[end][0] == day:
+                    end += 1
+                if day != current_day:
+                    if writer is not None:
+                        writer.close()
+                    partition_dir = table_dir / f"day={day}"
+                    partition_dir.mkdir(parents=True, exist_ok=True)
+                    part = parts.get(day, 0)
+                    parts[day] = part + 1
+                    writer = pq.ParquetWriter(str(partition_dir / f'part-{part}.parquet'), schema)
+                    current_day = day
+                chunk = batch[start:end]
+                arrays = [
+                    pa.array([row[i + 1] for row in chunk], type=t)
+                    for i, (_, t) in enumerate(columns)
+                ]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                rows += len(chunk)
+                start = end
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return TableExport(
+        table_name=table,
+        rows=rows,
+        partitions=len(parts),
+        columns=[name for name, _ in columns],
+        excluded_columns=excluded,
+        max_rowid=max_rowid,
+    )
+
+
+def export_case_parquet(
+    db: IRLogDatabase,
+    output_dir: Optional[Union[str, Path]] = None,
+    tables: Optional[Sequence[str]] = None,
+    include_raw: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> ParquetExportResult:
+    """
+    Snapshot case log tables to day-partitioned Parquet.
+
+    Each table is written to a temporary directory and swapped in when
+    complete, so a failed export never leaves a half-written table behind.
+    Tables that are missing or lack a timestamp column are skipped.
+
+    Args:
+        db: IRLogDatabase for the case (must exist)
+        output_dir: Destination (default: <case_dir>/parquet)
+        tables: Tables to export (default: DEFAULT_EXPORT_TABLES)
+        include_raw: Also export raw_record/audit_data BLOB columns
+        batch_size: Rows per Arrow record batch
+
+    Returns:
+        ParquetExportResult with per-table statistics
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        FileNotFoundError: If the case database does not exist
+    """
+    _require_pyarrow()
+    start_time = datetime.now()
+
+    conn = db.connect()
+    output_dir = Path(output_dir) if output_dir else db.db_path.parent / PARQUET_DIRNAME
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(output_dir) or {'tables': {}}
+
+    result = ParquetExportResult(case_id=db.case_id, output_dir=output_dir)
+    try:
+        for table in tables or DEFAULT_EXPORT_TABLES:
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if 'timestamp' not in columns:
+                continue
+
+            table_dir = output_dir / table
+            staging_dir = output_dir / f".{table}.tmp"
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+            staging_dir.mkdir()
+            try:
+                export = _export_table(conn, table, staging_dir, include_raw, batch_size)
+            except Exception:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                raise
+            if table_dir.exists():
+                shutil.rmtree(table_dir)
+            staging_dir.rename(table_dir)
+
+            result.tables[table] = export
+            manifest['tables'][table] = {
+                'rows': export.rows,
+                'partitions': export.partitions,
+                'columns': export.columns,
+                'excluded_columns': export.excluded_columns,
+                'max_rowid': export.max_rowid,
+                'exported_at': datetime.now().isoformat(),
+            }
+    finally:
+        conn.close()
+
+    manifest['case_id'] = db.case_id
+    manifest['source_db'] = str(db.db_path)
+    (output_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2))
+
+    result.duration_seconds = (datetime.now() - start_time).total_seconds()
+    return result
+
+
+def _read_manifest(output_dir: Path) -> Optional[dict]:
+    path = Path(output_dir) / MANIFEST_FILENAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def is_snapshot_current(db: IRLogDatabase, output_dir: Optional[Union[str, Path]] = None,
+                        table: str = 'sign_in_logs') -> bool:
+    """
+    Check whether a table's Parquet snapshot still matches the live DB.
+
+    Compares the exported row count and max rowid with the database, which
+    catches new imports, deletes and duplicate merges.
+    """
+    output_dir = Path(output_dir) if output_dir else db.db_path.parent / PARQUET_DIRNAME
+    manifest = _read_manifest(output_dir)
+    if not manifest or table not in manifest['tables']:
+        return False
+
+    conn = db.connect()
+    try:
+        count, max_rowid = conn.execute(
+            f"SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM {table}"
+        ).fetchone()
+    finally:
+        conn.close()
+
+    exported = manifest['tables'][table]
+    return exported['rows'] == count and exported['max_rowid'] == max_rowid
+
+
+class ColumnarAnalytics:
+    """
+    Aggregate data quality checks over a Parquet case snapshot.
+
+    Each check reads only the columns it needs, so profiling a field of a
+    multi-million row table touches one column instead of every row.
+    Results use the same FieldQualityScore/TableQualityReport types and
+    scoring rules as data_quality_checker.
+    """
+
+    def __init__(self, parquet_dir: Union[str, Path]):
+        """
+        Args:
+            parquet_dir: Directory written by export_case_parquet()
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            FileNotFoundError: If the directory has no export manifest
+        """
+        _require_pyarrow()
+        self._dir = Path(parquet_dir)
+        self._manifest = _read_manifest(self._dir)
+        if self._manifest is None:
+            raise FileNotFoundError(f"No Parquet export manifest in {self._dir}")
+
+    @property
+    def tables(self) -> List[str]:
+        """Tables present in the snapshot."""
+        return list(self._manifest['tables'])
+
+    def dataset(self, table: str):
+        """Return the pyarrow Dataset for a table (day is a partition column)."""
+        if table not in self._manifest['tables']:
+            raise ValueError(f"Table '{table}' is not in the Parquet export")
+        return ds.dataset(str(self._dir / table), format='parquet', partitioning='hive')
+
+    def row_count(self, table: str) -> int:
+        """Row count from Parquet metadata (no column data is read)."""
+        return self.dataset(table).count_rows()
+
+    def _require_field(self, table: str, field: str) -> None:
+        if field not in self._manifest['tables'].get(table, {}).get('columns', []):
+            raise ValueError(f"Field '{field}' is not in the Parquet export of '{table}'")
+
+    def _populated_values(self, table: str, field: str):
+        """Column values excluding NULL and '' (matching the SQLite checks)."""
+        column = self.dataset(table).to_table(columns=[field]).column(field)
+        if pa.types.is_string(column.type):
+            return pc.filter(column, pc.and_kleene(pc.is_valid(column), pc.not_equal(column, '')))
+        return column.drop_null()
+
+    def field_profile(self, table: str, field: str) -> FieldProfile:
+        """
+        Columnar equivalent of field_profiler.profile_table() for one field.
+
+        Counts are always exact. The result can be passed as profile= to
+        field_reliability_scorer.calculate_reliability_score().
+
+        Raises:
+            ValueError: If the table or field is not in the export
+        """
+        self._require_field(table, field)
+        column = self.dataset(table).to_table(columns=[field]).column(field)
+        empty_count = 0
+        if pa.types.is_string(column.type):
+            empty_count = pc.sum(pc.equal(column, '')).as_py() or 0
+        counts = pc.value_counts(self._populated_values(table, field))
+
+        most_common_value, most_common_count = None, 0
+        if len(counts):
+            frequencies = counts.field('counts')
+            top = pc.index(frequencies, pc.max(frequencies)).as_py()
+            most_common_value = counts.field('values')[top].as_py()
+            most_common_count = frequencies[top].as_py()
+
+        return FieldProfile(
+            field_name=field,
+            total_records=len(column),
+            null_count=column.null_count,
+            empty_count=empty_count,
+            distinct_values=len(counts),
+            most_common_value=most_common_value,
+            most_common_count=most_common_count,
+        )
+
+    def field_profiles(self, table: str, fields: Sequence[str]) -> Dict[str, FieldProfile]:
+        """
+        Profiles for the given fields that are in the export.
+
+        Fields left out of the export are skipped, so rank_candidate_fields()
+        falls back to scanning them in SQLite.
+        """
+        exported = self._manifest['tables'].get(table, {}).get('columns', [])
+        return {f: self.field_profile(table, f) for f in fields if f in exported}
+
+    def field_quality(self, table: str, field: str) -> FieldQualityScore:
+        """
+        Columnar equivalent of data_quality_checker.check_field_quality().
+
+        Raises:
+            ValueError: If the table or field is not in the export
+        """
+        profile = self.field_profile(table, field)
+        return score_field(
+            field, profile.total_records, profile.populated_count, profile.distinct_values,
+            profile.most_common_value, profile.most_common_count,
+        )
+
+    def threshold_context(self, table: str, log_type: str,
+                          case_severity: Optional[str] = None) -> ThresholdContext:
+        """
+        Columnar equivalent of field_reliability_scorer.extract_threshold_context().
+
+        The null rate covers exported columns only; columns left out of the
+        export (audit_data by default) don't count towards it.
+        """
+        exported = self._manifest['tables'].get(table)
+        if exported is None:
+            raise ValueError(f"Table '{table}' is not in the Parquet export")
+
+        record_count = self.row_count(table)
+        data_columns = [c for c in exported['columns'] if c not in CONTEXT_METADATA_FIELDS]
+        null_rate = 0.0
+        if data_columns and record_count:
+            columns = self.dataset(table).to_table(columns=data_columns)
+            total_nulls = 0
+            for column in columns.columns:
+                total_nulls += column.null_count
+                if pa.types.is_string(column.type):
+                    total_nulls += pc.sum(pc.equal(column, '')).as_py() or 0
+            null_rate = total_nulls / (record_count * len(data_columns))
+
+        return ThresholdContext(
+            record_count=record_count,
+            null_rate=null_rate,
+            log_type=log_type,
+            case_severity=case_severity,
+        )
+
+    def count_rows(self, table: str, conditions: Sequence[Tuple[str, str, Any]] = ()) -> int:
+        """
+        Rows matching all (field, operator, value) conditions.
+
+        Operators are '=', '!=' and 'not in' (value is a sequence) with SQL
+        NULL semantics: a NULL field never matches.
+
+        Raises:
+            ValueError: If a field is not in the export or an operator is unknown
+        """
+        expression = None
+        for field_name, operator, value in conditions:
+            self._require_field(table, field_name)
+            column = ds.field(field_name)
+            if operator == '=':
+                condition = column == value
+            elif operator == '!=':
+                condition = column != value
+            elif operator == 'not in':
+                # is_in() is never NULL, so re-add the NULL check SQL applies
+                condition = column.is_valid() & ~column.isin(list(value))
+            else:
+                raise ValueError(
+                    f"Unknown operator '{operator}' (expected one of {', '.join(_CONDITION_OPERATORS)})"
+                )
+            expression = condition if expression is None else expression & condition
+        return self.dataset(table).count_rows(filter=expression)
+
+    def table_quality(self, table: str, required_fields: Optional[List[str]] = None) -> TableQualityReport:
+        """
+        Columnar equivalent of data_quality_checker.check_table_quality().
+
+        Scores every exported column; columns left out of the export
+        (raw_record/audit_data by default) are reported in warnings.
+        """
+        exported = self._manifest['tables'].get(table)
+        if exported is None:
+            raise ValueError(f"Table '{table}' is not in the Parquet export")
+
+        warnings = []
+        if exported['excluded_columns']:
+            warnings.append(
+                f"Not exported (excluded from score): {', '.join(exported['excluded_columns'])}"
+            )
+
+        field_scores = []
+        for field_name in exported['columns']:
+            if field_name in DERIVED_COLUMNS:
+                continue
+            try:
+                field_scores.append(self.field_quality(table, field_name))
+            except Exception as e:
+                warnings.append(f"Failed to analyze field '{field_name}': {e}")
+
+        return build_table_report(
+            table, self.row_count(table), field_scores, required_fields, warnings
+        )
+
+    def value_distribution(self, table: str, field: str, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Value -> row count for a field (e.g. a status distribution), most common first.
+
+        NULL and '' values are excluded, as in the SQLite checks.
+        """
+        counts = pc.value_counts(self._populated_values(table, field))
+        pairs = sorted(
+            zip(counts.field('values').to_pylist(), counts.field('counts').to_pylist()),
+            key=lambda pair: -pair[1],
+        )
+        return dict(pairs[:limit] if limit else pairs)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export an IR case database to Parquet")
+    parser.add_argument("case_id", help="Case identifier")
+    parser.add_argument("--base-path", help="Base path for case databases")
+    parser.add_argument("--include-raw", action="store_true", help="Also export raw_record/audit_data")
+    args = parser.parse_args()
+
+    export = export_case_parquet(IRLogDatabase(args.case_id, args.base_path), include_raw=args.include_raw)
+    for name, table_export in export.tables.items():
+        print(f"{name:25} {table_export.rows:>10,} rows  {table_export.partitions:>4} days")
+    print(f"Exported {export.total_rows:,} rows to {export.output_dir} in {export.duration_seconds:.1f}s")
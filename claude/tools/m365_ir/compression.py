@@ -5,6 +5,15 @@ Compression utilities for IR Log Database - Phase 229.
 Provides zlib compression for raw_record and audit_data columns
 to reduce storage by ~60-70%.
 
+Optional zstd codec: M365 rows are small and repeat the same keys on every
+row, so per-row zlib has little context to work with. A ZstdDictCodec
+compresses against a dictionary trained from the first rows of a table and
+stored in the case DB (compression_dictionaries). zstd frames carry their
+magic number and dictionary ID, so every row is self-tagged and
+decompress_json() dispatches per row - existing zlib BLOBs and plain TEXT
+keep decoding unchanged. Requires the zstandard package; without it the
+importer stays on zlib.
+
 Usage:
     from claude.tools.m365_ir.compression import compress_json, decompress_json
 
@@ -16,14 +25,34 @@ Usage:
     decompressed = decompress_json(row['raw_record'])
     data = json.loads(decompressed)
 
+    # zstd with a per-table dictionary (trained once, stored in the case DB)
+    codec = get_table_codec(conn, 'sign_in_logs', CODEC_ZSTD, samples=first_rows)
+    compressed = compress_json(row, codec)
+
+    # Before decompressing zstd rows read from a case DB
+    load_dictionaries(conn)
+
 Author: Maia System (SRE Principal Engineer Agent)
 Created: 2025-01-05
 Phase: 229 - IR Log Database Compression
 """
 
 import json
+import logging
+import secrets
+import sqlite3
 import zlib
-from typing import Union
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 # Compression level 6 = balanced speed/ratio
 # Level 1-3: Fast, lower compression
@@ -31,16 +60,66 @@ from typing import Union
 # Level 7-9: Best compression, slower
 COMPRESSION_LEVEL = 6
 
+# Codec names accepted by get_table_codec() / LogImporter(codec=...)
+CODEC_ZLIB = 'zlib'
+CODEC_ZSTD = 'zstd'
+CODECS = (CODEC_ZLIB, CODEC_ZSTD)
+
+# zstd settings: level 3 is zstd's default speed/ratio point; a 16 KiB
+# dictionary covers the repeated key/value vocabulary of M365 exports
+ZSTD_LEVEL = 3
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+DICTIONARY_SIZE = 16 * 1024
+
+# Rows sampled from the start of an import to train a table dictionary.
+# Below DICTIONARY_MIN_SAMPLES training is unreliable, so zlib is kept.
+DICTIONARY_TRAINING_ROWS = 2000
+DICTIONARY_MIN_SAMPLES = 100
+
+# Dictionary IDs 1-32767 are reserved by zstd for registered dictionaries
+_DICT_ID_MIN = 32768
+_DICT_ID_MAX = 2 ** 31 - 1
+
+# dict_id -> ZstdDecompressor, filled by register_dictionary()/load_dictionaries()
+_DECOMPRESSORS: Dict[int, object] = {}
 
-def compress_json(data: Union[str, dict]) -> bytes:
+
+class ZstdDictCodec:
+    """
+    zstd codec bound to one trained dictionary.
+
+    Frames are written with the dictionary ID so decompress_json() can find
+    the matching dictionary for each row. Not thread-safe (one compressor
+    context per instance) - use one codec per import connection.
     """
-    Compress JSON string or dict to bytes using zlib.
+
+    name = CODEC_ZSTD
+
+    def __init__(self, dictionary: bytes, level: int = ZSTD_LEVEL):
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required for the zstd codec (pip install zstandard)")
+        self._dict = zstandard.ZstdCompressionDict(dictionary)
+        self.dict_id = self._dict.dict_id()
+        self._compressor = zstandard.ZstdCompressor(
+            level=level, dict_data=self._dict, write_dict_id=True, write_content_size=True
+        )
+        register_dictionary(dictionary)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress UTF-8 bytes into a single zstd frame."""
+        return self._compressor.compress(data)
+
+
+def compress_json(data: Union[str, dict], codec: Optional[ZstdDictCodec] = None) -> bytes:
+    """
+    Compress JSON string or dict to bytes using zlib (or the given codec).
 
     Args:
         data: JSON string or dict to compress
+        codec: Optional ZstdDictCodec; None uses zlib at COMPRESSION_LEVEL
 
     Returns:
-        Compressed bytes (zlib format)
+        Compressed bytes (zlib format, or a zstd frame when codec is given)
 
     Example:
         >>> compressed = compress_json({"key": "value"})
@@ -50,6 +129,8 @@ def compress_json(data: Union[str, dict]) -> bytes:
     if isinstance(data, dict):
         data = json.dumps(data)
 
+    if codec is not None:
+        return codec.compress(data.encode('utf-8'))
     return zlib.compress(data.encode('utf-8'), level=COMPRESSION_LEVEL)
 
 
@@ -59,7 +140,8 @@ def decompress_json(data: Union[bytes, str]) -> str:
 
     Handles backwards compatibility with uncompressed TEXT data:
     - If data is already a string, returns as-is
-    - If data is bytes, decompresses with zlib
+    - If data is a zstd frame, decompresses with its registered dictionary
+    - Otherwise decompresses with zlib
 
     Args:
         data: Compressed bytes or uncompressed string
@@ -67,6 +149,11 @@ def decompress_json(data: Union[bytes, str]) -> str:
     Returns:
         JSON string (decompressed if needed)
 
+    Raises:
+        LookupError: If a zstd frame references a dictionary that has not
+            been registered (call load_dictionaries() on the case DB first)
+        ImportError: If a zstd frame is found but zstandard is not installed
+
     Example:
         >>> compressed = compress_json('{"key": "value"}')
         >>> decompress_json(compressed)
@@ -81,22 +168,41 @@ def decompress_json(data: Union[bytes, str]) -> str:
     if isinstance(data, str):
         return data
 
+    if data[:4] == ZSTD_MAGIC:
+        return _zstd_decompress(data).decode('utf-8')
+
     # Decompress bytes
     return zlib.decompress(data).decode('utf-8')
 
 
+def _zstd_decompress(data: bytes) -> bytes:
+    """Decompress one zstd frame with the dictionary named in its header."""
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard is required to read zstd-compressed rows (pip install zstandard)")
+
+    dict_id = zstandard.get_frame_parameters(data).dict_id
+    decompressor = _DECOMPRESSORS.get(dict_id)
+    if decompressor is None:
+        if dict_id:
+            raise LookupError(
+                f"zstd dictionary {dict_id} not registered - call load_dictionaries(conn) first"
+            )
+        decompressor = _DECOMPRESSORS.setdefault(0, zstandard.ZstdDecompressor())
+    return decompressor.decompress(data)
+
+
 def is_compressed(data: Union[bytes, str]) -> bool:
     """
-    Check if data is zlib compressed.
+    Check if data is zlib or zstd compressed.
 
-    Detects zlib magic bytes at start of data.
-    Level 6 compression uses header 0x78 0x9c.
+    Detects zlib magic bytes at start of data (level 6 compression uses
+    header 0x78 0x9c) or the zstd frame magic number.
 
     Args:
         data: Data to check
 
     Returns:
-        True if data is zlib compressed bytes, False otherwise
+        True if data is zlib/zstd compressed bytes, False otherwise
 
     Example:
         >>> compressed = compress_json('{"key": "value"}')
@@ -114,6 +220,9 @@ def is_compressed(data: Union[bytes, str]) -> bool:
     if len(data) < 2:
         return False
 
+    if data[:4] == ZSTD_MAGIC:
+        return True
+
     # zlib magic bytes: 0x78 followed by compression level indicator
     # 0x78 0x01 = no compression
     # 0x78 0x5e = fast compression
@@ -122,6 +231,164 @@ def is_compressed(data: Union[bytes, str]) -> bool:
     return data[0] == 0x78 and data[1] in (0x01, 0x5e, 0x9c, 0xda)
 
 
+
+# ============================================================================
+# zstd dictionaries (stored per case, per table)
+# ============================================================================
+
+def ensure_dictionary_table(conn: sqlite3.Connection) -> None:
+    """Create compression_dictionaries on case DBs created before schema v7."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS compression_dictionaries (
+            dict_id INTEGER PRIMARY KEY,
+            table_name TEXT NOT NULL,
+            codec TEXT NOT NULL,
+            dictionary BLOB NOT NULL,
+            sample_rows INTEGER NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+
+def register_dictionary(dictionary: bytes) -> int:
+    """
+    Make a trained dictionary available to decompress_json().
+
+    Args:
+        dictionary: Raw dictionary bytes (as stored in compression_dictionaries)
+
+    Returns:
+        The dictionary ID embedded in the dictionary
+    """
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard is required for the zstd codec (pip install zstandard)")
+    zdict = zstandard.ZstdCompressionDict(dictionary)
+    dict_id = zdict.dict_id()
+    if dict_id not in _DECOMPRESSORS:
+        _DECOMPRESSORS[dict_id] = zstandard.ZstdDecompressor(dict_data=zdict)
+    return dict_id
+
+
+def load_dictionaries(conn: sqlite3.Connection) -> int:
+    """
+    Register every dictionary stored in a case DB that is not loaded yet.
+
+    Cheap to call per query: only dictionary IDs are read unless one is new.
+    A DB without the table (pre-v7) or without zstandard installed is a no-op.
+
+    Args:
+        conn: Connection to the case database
+
+    Returns:
+        Number of dictionaries newly registered
+    """
+    if not ZSTD_AVAILABLE:
+        return 0
+    try:
+        ids = [row[0] for row in conn.execute("SELECT dict_id FROM compression_dictionaries")]
+    except sqlite3.OperationalError:
+        return 0
+
+    loaded = 0
+    for dict_id in ids:
+        if dict_id in _DECOMPRESSORS:
+            continue
+        blob = conn.execute(
+            "SELECT dictionary FROM compression_dictionaries WHERE dict_id = ?", (dict_id,)
+        ).fetchone()[0]
+        register_dictionary(blob)
+        loaded += 1
+    return loaded
+
+
+def train_dictionary(samples: Iterable[Union[str, dict]], size: int = DICTIONARY_SIZE) -> bytes:
+    """
+    Train a zstd dictionary from sample JSON rows.
+
+    Args:
+        samples: JSON strings or dicts (typically the first rows of an import)
+        size: Maximum dictionary size in bytes
+
+    Returns:
+        Raw dictionary bytes with a random ID in the non-reserved range
+
+    Raises:
+        ImportError: If zstandard is not installed
+        zstandard.ZstdError: If the samples are too few/small to train on
+    """
+    if not ZSTD_AVAILABLE:
+        raise ImportError("zstandard is required for the zstd codec (pip install zstandard)")
+    encoded = [
+        (json.dumps(s) if isinstance(s, dict) else s).encode('utf-8')
+        for s in samples
+    ]
+    dict_id = _DICT_ID_MIN + secrets.randbelow(_DICT_ID_MAX - _DICT_ID_MIN)
+    zdict = zstandard.train_dictionary(size, encoded, dict_id=dict_id, level=ZSTD_LEVEL)
+    return zdict.as_bytes()
+
+
+def get_table_codec(
+    conn: sqlite3.Connection,
+    table_name: str,
+    codec: str = CODEC_ZLIB,
+    samples: Optional[Iterable[Union[str, dict]]] = None,
+) -> Optional[ZstdDictCodec]:
+    """
+    Resolve the codec to compress a table's rows with.
+
+    For CODEC_ZSTD the table's stored dictionary is reused; if there is none,
+    one is trained from samples and stored (uncommitted - it commits with
+    the import transaction). Falls back to zlib (None) when zstandard is
+    missing or there are fewer than DICTIONARY_MIN_SAMPLES samples.
+
+    Args:
+        conn: Connection to the case database
+        table_name: Table the rows are inserted into
+        codec: CODEC_ZLIB or CODEC_ZSTD
+        samples: JSON rows to train on if no dictionary is stored yet
+
+    Returns:
+        ZstdDictCodec, or None for zlib
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec: {codec!r} (expected one of {CODECS})")
+    if codec == CODEC_ZLIB:
+        return None
+    if not ZSTD_AVAILABLE:
+        logger.warning("zstandard not installed - compressing %s with zlib", table_name)
+        return None
+
+    ensure_dictionary_table(conn)
+    row = conn.execute("""
+        SELECT dictionary FROM compression_dictionaries
+        WHERE table_name = ? AND codec = ?
+        ORDER BY created_at DESC LIMIT 1
+    """, (table_name, codec)).fetchone()
+    if row is not None:
+        return ZstdDictCodec(row[0])
+
+    samples = list(samples or [])
+    if len(samples) < DICTIONARY_MIN_SAMPLES:
+        logger.info(
+            "%d rows is too few to train a %s dictionary - using zlib", len(samples), table_name
+        )
+        return None
+    try:
+        dictionary = train_dictionary(samples)
+    except zstandard.ZstdError as e:
+        logger.warning("zstd dictionary training failed for %s (%s) - using zlib", table_name, e)
+        return None
+
+    table_codec = ZstdDictCodec(dictionary)
+    conn.execute("""
+        INSERT INTO compression_dictionaries
+        (dict_id, table_name, codec, dictionary, sample_rows, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (table_codec.dict_id, table_name, codec, dictionary, len(samples),
+          datetime.now().isoformat()))
+    return table_codec
+
+
 if __name__ == "__main__":
     # Quick demo
     sample = {
@@ -141,3 +408,4 @@ if __name__ == "__main__":
     print(f"Reduction: {100 - (len(compressed) / len(original) * 100):.1f}%")
     print(f"Roundtrip OK: {original == decompressed}")
     print(f"Is compressed: {is_compressed(compressed)}")
+    print(f"zstd dictionary codec available: {ZSTD_AVAILABLE}")
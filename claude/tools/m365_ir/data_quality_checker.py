@@ -32,6 +32,13 @@ from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
 
+from .field_profiler import profile_table
+
+# Columns computed from other columns at import (e.g. duplicate_handler's
+# dedup_key hash). They mirror fields already scored, so counting them would
+# inflate the table quality score.
+DERIVED_COLUMNS = frozenset({'dedup_key'})
+
 
 @dataclass
 class FieldQualityScore:
@@ -73,6 +80,7 @@ class TableQualityReport:
         recommendations: Suggested actions for data quality improvement
         warnings: Issues detected during quality analysis
         created_at: Timestamp when analysis was performed
+        duration_seconds: Time spent profiling the table
     """
     table_name: str
     total_records: int
@@ -83,6 +91,7 @@ class TableQualityReport:
     recommendations: List[str]
     warnings: List[str]
     created_at: str
+    duration_seconds: float = 0.0
 
 
 def check_field_quality(
@@ -162,18 +171,11 @@ def check_field_quality(
         f"SELECT COUNT({field}) FROM {table} WHERE {field} IS NOT NULL AND {field} != ''"
     ).fetchone()[0]
 
-    population_rate = (non_null_count / total_records) * 100.0
-
     # Calculate discriminatory power (unique values, excluding empty strings)
     distinct_values = cursor.execute(
         f"SELECT COUNT(DISTINCT {field}) FROM {table} WHERE {field} IS NOT NULL AND {field} != ''"
     ).fetchone()[0]
 
-    discriminatory_power = (
-        distinct_values / total_records
-        if total_records > 0 else 0.0
-    )
-
     # Find most common value and its frequency (excluding empty strings)
     cursor.execute(f"""
         SELECT {field}, COUNT(*) as freq
@@ -185,18 +187,66 @@ def check_field_quality(
     """)
 
     most_common_row = cursor.fetchone()
-    if most_common_row:
-        most_common_value = str(most_common_row[0])
-        most_common_count = most_common_row[1]
-        most_common_percentage = (most_common_count / non_null_count * 100.0) if non_null_count > 0 else 0.0
-    else:
-        most_common_value = None
-        most_common_percentage = 0.0
 
     # Only close if we opened the connection
     if should_close:
         conn.close()
 
+    return score_field(
+        field,
+        total_records,
+        non_null_count,
+        distinct_values,
+        most_common_row[0] if most_common_row else None,
+        most_common_row[1] if most_common_row else 0,
+    )
+
+
+def score_field(
+    field: str,
+    total_records: int,
+    non_null_count: int,
+    distinct_values: int,
+    most_common_value=None,
+    most_common_count: int = 0
+) -> FieldQualityScore:
+    """
+    Build a FieldQualityScore from raw field counts.
+
+    Shared by the SQLite checks above and columnar_export's Parquet
+    analytics so both score fields identically. Counts exclude NULL and
+    empty-string values.
+
+    Args:
+        field: Field name
+        total_records: Rows in the table
+        non_null_count: Rows with a non-null, non-empty value
+        distinct_values: Distinct non-null, non-empty values
+        most_common_value: Most frequent value (None if no values)
+        most_common_count: Occurrences of most_common_value
+
+    Returns:
+        FieldQualityScore with quality metrics
+    """
+    if total_records == 0:
+        return FieldQualityScore(
+            field_name=field,
+            population_rate=0.0,
+            discriminatory_power=0.0,
+            is_reliable=False,
+            distinct_values=0,
+            total_records=0
+        )
+
+    population_rate = (non_null_count / total_records) * 100.0
+    discriminatory_power = distinct_values / total_records
+
+    if most_common_value is not None:
+        most_common_value = str(most_common_value)
+        most_common_percentage = (most_common_count / non_null_count * 100.0) if non_null_count > 0 else 0.0
+    else:
+        most_common_percentage = 0.0
+
     # Determine reliability
     # A field is UNRELIABLE if:
     # 1. >99.5% of values are the same (uniform)
@@ -230,7 +280,7 @@ def check_table_quality(
     Analyze quality metrics for an entire table.
 
     This function:
-        1. Analyzes all fields in the table
+        1. Analyzes all fields in the table (one scan via field_profiler)
         2. Calculates aggregate quality score
         3. Identifies reliable vs unreliable fields
         4. Generates recommendations for data quality improvement
@@ -272,52 +322,95 @@ def check_table_quality(
             conn.close()
         raise ValueError(f"Table '{table}' does not exist")
 
-    # Get total record count
-    total_records = cursor.execute(
-        f"SELECT COUNT(*) FROM {table}"
-    ).fetchone()[0]
-
     # Get all columns in the table
     cursor.execute(f"PRAGMA table_info({table})")
-    columns = [row[1] for row in cursor.fetchall()]
+    columns = [row[1] for row in cursor.fetchall() if row[1] not in DERIVED_COLUMNS]
+
+    # Profile every field in a single table scan (was ~4 queries per field)
+    try:
+        profile = profile_table(conn, table, columns)
+    finally:
+        # Close connection if we opened it
+        if should_close:
+            conn.close()
 
-    # Analyze each field
+    # A field that fails to profile or score is skipped with a warning rather
+    # than failing the whole quality gate
     field_scores = []
+    warnings = list(profile.warnings)
+    for p in profile.fields.values():
+        try:
+            field_scores.append(score_field(
+                p.field_name,
+                p.total_records,
+                p.populated_count,
+                p.distinct_values,
+                p.most_common_value,
+                p.most_common_count,
+            ))
+        except Exception as e:
+            warnings.append(f"Failed to analyze field '{p.field_name}': {e}")
+    if profile.approximate_fields:
+        warnings.append(
+            f"Approximate distinct counts (high cardinality): {', '.join(profile.approximate_fields)}"
+        )
+
+    report = build_table_report(table, profile.total_records, field_scores, required_fields, warnings)
+    report.duration_seconds = profile.duration_seconds
+    return report
+
+
+def build_table_report(
+    table: str,
+    total_records: int,
+    field_scores: List[FieldQualityScore],
+    required_fields: Optional[List[str]] = None,
+    warnings: Optional[List[str]] = None
+) -> TableQualityReport:
+    """
+    Aggregate per-field scores into a TableQualityReport.
+
+    Shared by check_table_quality() and columnar_export's Parquet analytics.
+
+    Args:
+        table: Table name
+        total_records: Rows in the table
+        field_scores: One score per analyzed field
+        required_fields: Optional list of fields that must be present and reliable
+        warnings: Warnings already collected (extended in place)
+
+    Returns:
+        TableQualityReport with comprehensive quality analysis
+    """
     reliable_fields = []
     unreliable_fields = []
     populated_fields = []  # Fields with >5% population rate
-    warnings = []
+    warnings = warnings if warnings is not None else []
     recommendations = []
 
-    for field in columns:
-        try:
-            score = check_field_quality(db_path, table, field, conn=conn)
-            field_scores.append(score)
-
-            # Skip mostly-NULL fields (unpopulated, not unreliable)
-            if score.population_rate < 5.0:
-                continue  # Don't count unpopulated fields in quality score
-
-            populated_fields.append(field)
-
-            if score.is_reliable:
-                reliable_fields.append(field)
-            else:
-                unreliable_fields.append(field)
-
-                # Generate warnings for unreliable fields (only if populated)
-                if score.distinct_values <= 1:
-                    warnings.append(
-                        f"Field '{field}' is unreliable (only {score.distinct_values} distinct value)"
-                    )
-                elif score.most_common_percentage > 99.5:
-                    warnings.append(
-                        f"Field '{field}' is unreliable (>99.5% uniform or only 1 distinct value, "
-                        f"discriminatory power: {score.discriminatory_power:.3f})"
-                    )
-
-        except Exception as e:
-            warnings.append(f"Failed to analyze field '{field}': {e}")
+    for score in field_scores:
+        field = score.field_name
+        # Skip mostly-NULL fields (unpopulated, not unreliable)
+        if score.population_rate < 5.0:
+            continue  # Don't count unpopulated fields in quality score
+
+        populated_fields.append(field)
+
+        if score.is_reliable:
+            reliable_fields.append(field)
+        else:
+            unreliable_fields.append(field)
+
+            # Generate warnings for unreliable fields (only if populated)
+            if score.distinct_values <= 1:
+                warnings.append(
+                    f"Field '{field}' is unreliable (only {score.distinct_values} distinct value)"
+                )
+            elif score.most_common_percentage > 99.5:
+                warnings.append(
+                    f"Field '{field}' is unreliable (>99.5% uniform or only 1 distinct value, "
+                    f"discriminatory power: {score.discriminatory_power:.3f})"
+                )
 
     # Calculate overall quality score
     # Score = (reliable_fields / populated_fields)
@@ -346,10 +439,6 @@ def check_table_quality(
                 f"{next(s for s in field_scores if s.field_name == status_like_fields[0]).distinct_values} distinct values)"
             )
 
-    # Close connection if we opened it
-    if should_close:
-        conn.close()
-
     return TableQualityReport(
         table_name=table,
         total_records=total_records,
@@ -17,6 +17,10 @@ Key Features:
 3. Marks primary record with merge_status='primary'
 4. Marks secondary records with merge_status='merged' and merged_into=primary_id
 5. Creates v_sign_in_logs_active view (excludes merged records)
+6. Indexed dedup_key (64-bit hash of the three identity fields, written at
+   import) so candidate groups come from a covering index, not a full GROUP BY
+7. Incremental mode: only rows added since the last merge watermark
+   (recorded in import_metadata) are examined
 
 Usage:
     from duplicate_handler import merge_duplicates, add_merge_columns, create_active_view
@@ -29,11 +33,15 @@ Usage:
     result = merge_duplicates(db_path)
     print(f"Merged {result['records_merged']} records")
 
+    # After incremental imports, only examine rows added since the last merge
+    result = merge_duplicates(db_path, incremental=True)
+
 Author: Maia System
 Created: 2025-01-09
 Phase: 261.4
 """
 
+import hashlib
 import sqlite3
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -41,6 +49,15 @@ from pathlib import Path
 from dataclasses import dataclass
 
 
+# import_metadata.log_type used to record the merge watermark (highest
+# sign_in_logs.id examined by the last merge); source_hash holds the id
+DEDUP_WATERMARK_LOG_TYPE = 'sign_in_dedup_watermark'
+DEDUP_VERSION = '1.0'
+
+# Max dedup keys per "IN (...)" lookup (below SQLite's variable limit)
+_KEY_CHUNK_SIZE = 500
+
+
 @dataclass
 class DuplicateGroup:
     """Represents a group of duplicate records."""
@@ -51,6 +68,181 @@ class DuplicateGroup:
     record_ids: List[int]
 
 
+def compute_dedup_key(
+    timestamp: Optional[str],
+    user_principal_name: Optional[str],
+    ip_address: Optional[str],
+) -> int:
+    """
+    Compute the dedup_key for a sign-in row.
+
+    A signed 64-bit BLAKE2b hash of (timestamp, user_principal_name,
+    ip_address) - fits SQLite INTEGER. NULL and '' hash differently, matching
+    GROUP BY semantics. Keys only select candidate rows; groups are always
+    confirmed on the real column values, so hash collisions cannot merge
+    distinct records.
+    """
+    material = '\x1f'.join(
+        '\x00' if value is None else str(value)
+        for value in (timestamp, user_principal_name, ip_address)
+    )
+    digest = hashlib.blake2b(material.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def _ensure_dedup_key(conn: sqlite3.Connection) -> int:
+    """
+    Make sure dedup_key exists, is indexed and is populated.
+
+    Adds the column on pre-v6 databases, creates the covering
+    (dedup_key, merge_status) index, and backfills rows written without a key
+    (older imports or direct inserts). Once populated this is a single index
+    probe for NULL keys.
+
+    Returns:
+        Number of rows backfilled
+    """
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA table_info(sign_in_logs)")
+    if 'dedup_key' not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE sign_in_logs ADD COLUMN dedup_key INTEGER")
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_signin_dedup_key
+        ON sign_in_logs(dedup_key, merge_status)
+    """)
+
+    conn.create_function('compute_dedup_key', 3, compute_dedup_key, deterministic=True)
+    cursor.execute("""
+        UPDATE sign_in_logs
+        SET dedup_key = compute_dedup_key(timestamp, user_principal_name, ip_address)
+        WHERE dedup_key IS NULL
+    """)
+    backfilled = cursor.rowcount
+    conn.commit()
+    return backfilled
+
+
+def get_dedup_watermark(conn: sqlite3.Connection) -> int:
+    """
+    Return the highest sign_in_logs.id examined by the last merge (0 if none).
+
+    Databases without an import_metadata table have no watermark.
+    """
+    try:
+        row = conn.execute("""
+            SELECT source_hash FROM import_metadata
+            WHERE log_type = ?
+            ORDER BY id DESC LIMIT 1
+        """, (DEDUP_WATERMARK_LOG_TYPE,)).fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return int(row[0]) if row else 0
+
+
+def _record_dedup_watermark(
+    conn: sqlite3.Connection,
+    watermark: int,
+    started: str,
+    records_merged: int,
+) -> bool:
+    """Store the merge watermark in import_metadata (skipped if table is absent)."""
+    try:
+        conn.execute("""
+            INSERT INTO import_metadata
+            (source_file, source_hash, log_type, records_imported, records_failed,
+             import_started, import_completed, parser_version)
+            VALUES (?, ?, ?, ?, 0, ?, ?, ?)
+        """, ('sign_in_logs', str(watermark), DEDUP_WATERMARK_LOG_TYPE,
+              records_merged, started, datetime.now().isoformat(), DEDUP_VERSION))
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def _candidate_keys(
+    cursor: sqlite3.Cursor,
+    after_id: Optional[int],
+    max_id: int,
+) -> List[int]:
+    """
+    Collect dedup keys that may have duplicates.
+
+    Full scan: keys with more than one unmerged row, read from the covering
+    index. Incremental: every key touched by rows in (after_id, max_id] - an
+    id range read on the primary key, so cost tracks the new rows only.
+    """
+    if after_id is None:
+        cursor.execute("""
+            SELECT dedup_key
+            FROM sign_in_logs
+            WHERE merge_status IS NOT 'merged'
+              AND dedup_key IS NOT NULL
+              AND id <= ?
+            GROUP BY dedup_key
+            HAVING COUNT(*) > 1
+        """, (max_id,))
+    else:
+        cursor.execute("""
+            SELECT DISTINCT dedup_key
+            FROM sign_in_logs
+            WHERE id > ? AND id <= ?
+              AND dedup_key IS NOT NULL
+        """, (after_id, max_id))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _find_duplicate_groups(
+    conn: sqlite3.Connection,
+    incremental: bool = False,
+) -> tuple:
+    """
+    Identify duplicate groups via dedup_key.
+
+    Returns:
+        (duplicate_groups, max_id) where max_id is the highest row id
+        considered - the watermark to record after a merge.
+    """
+    _ensure_dedup_key(conn)
+    cursor = conn.cursor()
+
+    max_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM sign_in_logs").fetchone()[0]
+    after_id = get_dedup_watermark(conn) if incremental else None
+    keys = _candidate_keys(cursor, after_id, max_id)
+
+    # Confirm groups on the actual column values (guards against collisions)
+    groups: Dict[tuple, List[int]] = {}
+    for start in range(0, len(keys), _KEY_CHUNK_SIZE):
+        chunk = keys[start:start + _KEY_CHUNK_SIZE]
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(f"""
+            SELECT id, timestamp, user_principal_name, ip_address
+            FROM sign_in_logs
+            WHERE dedup_key IN ({placeholders})
+              AND merge_status IS NOT 'merged'
+              AND timestamp IS NOT NULL
+              AND user_principal_name IS NOT NULL
+              AND id <= ?
+        """, (*chunk, max_id))
+        for record_id, timestamp, upn, ip in cursor.fetchall():
+            groups.setdefault((timestamp, upn, ip), []).append(record_id)
+
+    duplicate_groups = [
+        DuplicateGroup(
+            timestamp=timestamp,
+            user_principal_name=upn,
+            ip_address=ip,
+            count=len(record_ids),
+            record_ids=sorted(record_ids),
+        )
+        for (timestamp, upn, ip), record_ids in groups.items()
+        if len(record_ids) > 1
+    ]
+    duplicate_groups.sort(key=lambda g: (-g.count, g.record_ids[0]))
+
+    return duplicate_groups, max_id
+
+
 def add_merge_columns(db_path: str) -> Dict[str, Any]:
     """
     Add merge tracking columns to sign_in_logs table.
@@ -60,6 +252,8 @@ def add_merge_columns(db_path: str) -> Dict[str, Any]:
     - merge_status (TEXT): Status (NULL, 'primary', 'merged')
     - merged_at (TEXT): Timestamp when merge occurred
 
+    Also ensures the dedup_key column and its covering index exist.
+
     This is a one-time migration, idempotent (safe to run multiple times).
 
     Args:
@@ -92,6 +286,7 @@ def add_merge_columns(db_path: str) -> Dict[str, Any]:
         cursor.execute(f"ALTER TABLE sign_in_logs ADD COLUMN {col_name} {col_type}")
 
     conn.commit()
+    _ensure_dedup_key(conn)
     conn.close()
 
     return {
@@ -146,7 +341,7 @@ def create_active_view(db_path: str) -> Dict[str, Any]:
     }
 
 
-def identify_duplicates(db_path: str) -> List[DuplicateGroup]:
+def identify_duplicates(db_path: str, incremental: bool = False) -> List[DuplicateGroup]:
     """
     Identify duplicate records in sign_in_logs.
 
@@ -156,53 +351,30 @@ def identify_duplicates(db_path: str) -> List[DuplicateGroup]:
     - ip_address
 
     Only considers records that are not already merged (merge_status != 'merged').
+    Candidate groups are found through the indexed dedup_key column.
 
     Args:
         db_path: Path to the investigation database
+        incremental: Only examine groups touched by rows added since the last
+            merge watermark (falls back to all rows if no watermark exists)
 
     Returns:
         List of DuplicateGroup objects, sorted by count (descending)
     """
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Find groups with duplicates
-    cursor.execute("""
-        SELECT
-            timestamp,
-            user_principal_name,
-            ip_address,
-            COUNT(*) as count,
-            GROUP_CONCAT(id) as ids
-        FROM sign_in_logs
-        WHERE (merge_status IS NULL OR merge_status != 'merged')
-          AND timestamp IS NOT NULL
-          AND user_principal_name IS NOT NULL
-        GROUP BY timestamp, user_principal_name, ip_address
-        HAVING COUNT(*) > 1
-        ORDER BY COUNT(*) DESC
-    """)
-
-    results = cursor.fetchall()
-    conn.close()
-
-    duplicate_groups = []
-    for row in results:
-        timestamp, upn, ip, count, ids_str = row
-        record_ids = [int(id_str) for id_str in ids_str.split(',')]
-
-        duplicate_groups.append(DuplicateGroup(
-            timestamp=timestamp,
-            user_principal_name=upn,
-            ip_address=ip,
-            count=count,
-            record_ids=record_ids
-        ))
+    try:
+        duplicate_groups, _ = _find_duplicate_groups(conn, incremental=incremental)
+    finally:
+        conn.close()
 
     return duplicate_groups
 
 
-def merge_duplicates(db_path: str, dry_run: bool = False) -> Dict[str, Any]:
+def merge_duplicates(
+    db_path: str,
+    dry_run: bool = False,
+    incremental: bool = False,
+) -> Dict[str, Any]:
     """
     Merge duplicate records by marking secondary records as merged.
 
@@ -215,9 +387,14 @@ def merge_duplicates(db_path: str, dry_run: bool = False) -> Dict[str, Any]:
     Data preservation: ALL records are kept in the database. Secondary records
     are simply marked as merged, allowing full audit trail and recovery if needed.
 
+    A completed (non dry-run) merge records the highest row id it examined as
+    the watermark in import_metadata, so the next incremental run only looks
+    at rows imported afterwards.
+
     Args:
         db_path: Path to the investigation database
         dry_run: If True, only identify duplicates without merging
+        incremental: Only examine rows added since the last merge watermark
 
     Returns:
         {
@@ -227,9 +404,17 @@ def merge_duplicates(db_path: str, dry_run: bool = False) -> Dict[str, Any]:
             'details': List[dict]
         }
     """
-    duplicate_groups = identify_duplicates(db_path)
+    merge_timestamp = datetime.now().isoformat()
+
+    conn = sqlite3.connect(db_path)
+    duplicate_groups, watermark = _find_duplicate_groups(conn, incremental=incremental)
 
     if not duplicate_groups:
+        if not dry_run:
+            # Nothing to merge, but the examined rows are done - advance the watermark
+            _record_dedup_watermark(conn, watermark, merge_timestamp, 0)
+            conn.commit()
+        conn.close()
         return {
             'success': True,
             'groups_processed': 0,
@@ -239,6 +424,7 @@ def merge_duplicates(db_path: str, dry_run: bool = False) -> Dict[str, Any]:
         }
 
     if dry_run:
+        conn.close()
         return {
             'success': True,
             'groups_processed': len(duplicate_groups),
@@ -257,10 +443,8 @@ def merge_duplicates(db_path: str, dry_run: bool = False) -> Dict[str, Any]:
             'message': 'Dry run - no changes made'
         }
 
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    merge_timestamp = datetime.now().isoformat()
     details = []
     total_merged = 0
 
@@ -299,6 +483,7 @@ def merge_duplicates(db_path: str, dry_run: bool = False) -> Dict[str, Any]:
             'secondary_ids': secondary_ids
         })
 
+    _record_dedup_watermark(conn, watermark, merge_timestamp, total_merged)
     conn.commit()
     conn.close()
 
@@ -423,6 +608,8 @@ if __name__ == '__main__':
                         default='identify', help='Action to perform')
     parser.add_argument('--dry-run', action='store_true', help='Dry run (identify only)')
     parser.add_argument('--primary-id', type=int, help='Primary ID for unmerge action')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only examine rows added since the last merge watermark')
 
     args = parser.parse_args()
 
@@ -431,7 +618,7 @@ if __name__ == '__main__':
     elif args.action == 'create-view':
         result = create_active_view(args.db_path)
     elif args.action == 'identify':
-        duplicates = identify_duplicates(args.db_path)
+        duplicates = identify_duplicates(args.db_path, incremental=args.incremental)
         result = {
             'groups_found': len(duplicates),
             'total_duplicates': sum(g.count - 1 for g in duplicates),
@@ -447,7 +634,8 @@ if __name__ == '__main__':
             ]
         }
     elif args.action == 'merge':
-        result = merge_duplicates(args.db_path, dry_run=args.dry_run)
+        result = merge_duplicates(args.db_path, dry_run=args.dry_run,
+                                  incremental=args.incremental)
     elif args.action == 'unmerge':
         if not args.primary_id:
             print("Error: --primary-id required for unmerge action")
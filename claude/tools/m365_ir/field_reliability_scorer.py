@@ -11,9 +11,11 @@ Phase: PHASE_2_SMART_ANALYSIS (Phase 2.1.1)
 import sqlite3
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
+from .field_profiler import FieldProfile, profile_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +31,9 @@ UNIFORMITY_THRESHOLD_PERCENT = 99.5  # Same as Phase 1
 LOW_POPULATION_THRESHOLD = 0.50  # Warn if <50% populated
 SPARSE_FIELD_THRESHOLD = 0.30  # Warn if <30% populated
 
+# Columns left out of the threshold context null rate
+CONTEXT_METADATA_FIELDS = frozenset({'id', 'raw_record', 'imported_at', 'timestamp'})
+
 # Preferred fields by log type (semantic preference)
 PREFERRED_FIELDS = {
     'sign_in_logs': ['conditional_access_status'],
@@ -92,7 +97,8 @@ def calculate_reliability_score(
     db_path: str,
     table: str,
     field: str,
-    historical_db_path: Optional[str] = None
+    historical_db_path: Optional[str] = None,
+    profile: Optional[FieldProfile] = None
 ) -> FieldReliabilityScore:
     """
     Calculate multi-factor reliability score for a field.
@@ -109,6 +115,8 @@ def calculate_reliability_score(
         table: Table name to analyze
         field: Field name to score
         historical_db_path: Optional path to historical learning database
+        profile: Optional pre-computed FieldProfile (skips the table scan;
+            rank_candidate_fields() profiles all candidates in one pass)
 
     Returns:
         FieldReliabilityScore with detailed scoring breakdown
@@ -121,93 +129,95 @@ def calculate_reliability_score(
         >>> score = calculate_reliability_score('case.db', 'sign_in_logs', 'conditional_access_status')
         >>> print(f"Overall: {score.overall_score:.2f}, Uniformity: {score.uniformity_score:.2f}")
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
     warnings = []
     recommendations = []
 
-    try:
-        # Verify table exists
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table,)
-        )
-        if not cursor.fetchone():
-            raise ValueError(f"Table '{table}' does not exist in database")
-
-        # Verify field exists
-        cursor.execute(f"PRAGMA table_info({table})")
-        schema = cursor.fetchall()
-        field_exists = any(col[1] == field for col in schema)
-        if not field_exists:
-            raise ValueError(f"Field '{field}' does not exist in table '{table}'")
-
-        # 1. Calculate Uniformity Score (0-1, higher = more varied)
-        uniformity_score = _calculate_uniformity_score(
-            cursor, table, field, warnings
-        )
-
-        # 2. Calculate Discriminatory Power (distinct / total)
-        discriminatory_power = _calculate_discriminatory_power(
-            cursor, table, field
-        )
-
-        # 3. Calculate Population Rate (populated / total)
-        population_rate = _calculate_population_rate(
-            cursor, table, field, warnings
-        )
-
-        # 4. Calculate Historical Success Rate (from learning DB)
-        historical_success_rate = _calculate_historical_success_rate(
-            historical_db_path, table, field
-        )
+    if profile is None:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        try:
+            # Verify table exists
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                (table,)
+            )
+            if not cursor.fetchone():
+                raise ValueError(f"Table '{table}' does not exist in database")
+
+            # Verify field exists
+            cursor.execute(f"PRAGMA table_info({table})")
+            schema = cursor.fetchall()
+            field_exists = any(col[1] == field for col in schema)
+            if not field_exists:
+                raise ValueError(f"Field '{field}' does not exist in table '{table}'")
+
+            # One scan covers uniformity, discriminatory power and population
+            table_profile = profile_table(conn, table, [field])
+            if field not in table_profile.fields:
+                raise ValueError(table_profile.warnings[0])
+            profile = table_profile.fields[field]
+        finally:
+            conn.close()
+
+    # 1. Calculate Uniformity Score (0-1, higher = more varied)
+    uniformity_score = _calculate_uniformity_score(profile, warnings)
+
+    # 2. Calculate Discriminatory Power (distinct / total)
+    discriminatory_power = _calculate_discriminatory_power(profile)
+
+    # 3. Calculate Population Rate (populated / total)
+    population_rate = _calculate_population_rate(profile, warnings)
+
+    # 4. Calculate Historical Success Rate (from learning DB)
+    historical_success_rate = _calculate_historical_success_rate(
+        historical_db_path, table, field
+    )
 
-        # 5. Calculate Semantic Preference (1.0 if preferred, 0.0 otherwise)
-        semantic_preference = _calculate_semantic_preference(
-            table, field
-        )
+    # 5. Calculate Semantic Preference (1.0 if preferred, 0.0 otherwise)
+    semantic_preference = _calculate_semantic_preference(
+        table, field
+    )
 
-        # Calculate weighted overall score
-        overall_score = (
-            uniformity_score * UNIFORMITY_WEIGHT +
-            discriminatory_power * DISCRIMINATORY_POWER_WEIGHT +
-            population_rate * POPULATION_RATE_WEIGHT +
-            historical_success_rate * HISTORICAL_SUCCESS_WEIGHT +
-            semantic_preference * SEMANTIC_PREFERENCE_WEIGHT
-        )
+    # Calculate weighted overall score
+    overall_score = (
+        uniformity_score * UNIFORMITY_WEIGHT +
+        discriminatory_power * DISCRIMINATORY_POWER_WEIGHT +
+        population_rate * POPULATION_RATE_WEIGHT +
+        historical_success_rate * HISTORICAL_SUCCESS_WEIGHT +
+        semantic_preference * SEMANTIC_PREFERENCE_WEIGHT
+    )
 
-        # Clamp to 0-1 range
-        overall_score = max(0.0, min(1.0, overall_score))
+    # Clamp to 0-1 range
+    overall_score = max(0.0, min(1.0, overall_score))
 
-        # Generate recommendations
-        if overall_score >= 0.7:
-            recommendations.append(f"Field '{field}' is highly reliable (score: {overall_score:.2f})")
-        elif overall_score >= 0.5:
-            recommendations.append(f"Field '{field}' is moderately reliable (score: {overall_score:.2f})")
-        else:
-            recommendations.append(f"Field '{field}' is unreliable (score: {overall_score:.2f}) - consider alternatives")
+    # Generate recommendations
+    if overall_score >= 0.7:
+        recommendations.append(f"Field '{field}' is highly reliable (score: {overall_score:.2f})")
+    elif overall_score >= 0.5:
+        recommendations.append(f"Field '{field}' is moderately reliable (score: {overall_score:.2f})")
+    else:
+        recommendations.append(f"Field '{field}' is unreliable (score: {overall_score:.2f}) - consider alternatives")
+
+    return FieldReliabilityScore(
+        field_name=field,
+        overall_score=overall_score,
+        uniformity_score=uniformity_score,
+        discriminatory_power=discriminatory_power,
+        population_rate=population_rate,
+        historical_success_rate=historical_success_rate,
+        semantic_preference=semantic_preference,
+        warnings=warnings,
+        recommendations=recommendations
+    )
 
-        return FieldReliabilityScore(
-            field_name=field,
-            overall_score=overall_score,
-            uniformity_score=uniformity_score,
-            discriminatory_power=discriminatory_power,
-            population_rate=population_rate,
-            historical_success_rate=historical_success_rate,
-            semantic_preference=semantic_preference,
-            warnings=warnings,
-            recommendations=recommendations
-        )
 
-    finally:
-        conn.close()
+def _distinct_non_null(profile: FieldProfile) -> int:
+    """Distinct values as SQLite COUNT(DISTINCT) sees them ('' counts, NULL doesn't)."""
+    return profile.distinct_values + (1 if profile.empty_count else 0)
 
 
 def _calculate_uniformity_score(
-    cursor: sqlite3.Cursor,
-    table: str,
-    field: str,
+    profile: FieldProfile,
     warnings: List[str]
 ) -> float:
     """
@@ -222,40 +232,31 @@ def _calculate_uniformity_score(
     - mode_percentage ≤ 50%: High score (0.8-1.0) - reliable
     - In between: Gradual transition
 
+    NULL and '' count as values here (a mostly-empty field is uniform),
+    matching the original COUNT(DISTINCT)/GROUP BY queries.
+
     Args:
-        cursor: Database cursor
-        table: Table name
-        field: Field name
+        profile: Single-scan profile of the field
         warnings: List to append warnings to
 
     Returns:
         Uniformity score (0-1)
     """
-    # Get total count
-    total = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    field = profile.field_name
+    total = profile.total_records
     if total == 0:
         return 0.0
 
-    # Get distinct value count
-    distinct = cursor.execute(
-        f"SELECT COUNT(DISTINCT {field}) FROM {table}"
-    ).fetchone()[0]
+    # Distinct values (COUNT(DISTINCT) skips NULL but counts '')
+    distinct = _distinct_non_null(profile)
 
     # If only 1 distinct value → 100% uniform → score 0.0
     if distinct == 1:
         warnings.append(f"Field '{field}' has only 1 distinct value (100% uniform)")
         return 0.0
 
-    # Get mode (most common value) percentage
-    mode_count = cursor.execute(
-        f"""
-        SELECT COUNT(*) as cnt
-        FROM {table}
-        GROUP BY {field}
-        ORDER BY cnt DESC
-        LIMIT 1
-        """
-    ).fetchone()[0]
+    # Mode (most common value, NULL and '' included) percentage
+    mode_count = max(profile.most_common_count, profile.null_count, profile.empty_count)
 
     mode_percentage = (mode_count / total) * 100.0
 
@@ -288,11 +289,7 @@ def _calculate_uniformity_score(
     return uniformity_score
 
 
-def _calculate_discriminatory_power(
-    cursor: sqlite3.Cursor,
-    table: str,
-    field: str
-) -> float:
+def _calculate_discriminatory_power(profile: FieldProfile) -> float:
     """
     Calculate discriminatory power (distinct values / total records).
 
@@ -300,31 +297,19 @@ def _calculate_discriminatory_power(
     Low discriminatory power means many records share the same values.
 
     Args:
-        cursor: Database cursor
-        table: Table name
-        field: Field name
+        profile: Single-scan profile of the field
 
     Returns:
         Discriminatory power (0-1)
     """
-    # Get total count
-    total = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-    if total == 0:
+    if profile.total_records == 0:
         return 0.0
 
-    # Get distinct value count
-    distinct = cursor.execute(
-        f"SELECT COUNT(DISTINCT {field}) FROM {table}"
-    ).fetchone()[0]
-
-    # Calculate discriminatory power
-    return distinct / total
+    return _distinct_non_null(profile) / profile.total_records
 
 
 def _calculate_population_rate(
-    cursor: sqlite3.Cursor,
-    table: str,
-    field: str,
+    profile: FieldProfile,
     warnings: List[str]
 ) -> float:
     """
@@ -334,25 +319,20 @@ def _calculate_population_rate(
     Low population rate means field is sparse/missing.
 
     Args:
-        cursor: Database cursor
-        table: Table name
-        field: Field name
+        profile: Single-scan profile of the field
         warnings: List to append warnings to
 
     Returns:
         Population rate (0-1)
     """
-    # Get total count
-    total = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    field = profile.field_name
+    total = profile.total_records
     if total == 0:
         return 0.0
 
-    # Get non-NULL count
     # Note: In SQLite, empty strings '' are not NULL, but we should count them as NULL
     # for M365 IR data (empty strings are common in CSV exports)
-    populated = cursor.execute(
-        f"SELECT COUNT(*) FROM {table} WHERE {field} IS NOT NULL AND {field} != ''"
-    ).fetchone()[0]
+    populated = profile.populated_count
 
     # Calculate population rate
     population_rate = populated / total
@@ -836,8 +816,7 @@ def extract_threshold_context(
         all_columns = [row[1] for row in cursor.fetchall()]
 
         # Exclude metadata fields from null rate calculation
-        metadata_fields = {'id', 'raw_record', 'imported_at', 'timestamp'}
-        data_columns = [col for col in all_columns if col not in metadata_fields]
+        data_columns = [col for col in all_columns if col not in CONTEXT_METADATA_FIELDS]
 
         # Calculate overall null rate across data columns
         if not data_columns or record_count == 0:
@@ -923,7 +902,8 @@ def rank_candidate_fields(
     table: str,
     candidate_fields: List[str],
     historical_db_path: Optional[str] = None,
-    context: Optional[ThresholdContext] = None
+    context: Optional[ThresholdContext] = None,
+    profiles: Optional[Dict[str, FieldProfile]] = None
 ) -> List[FieldRanking]:
     """
     Rank candidate fields by reliability score using context-aware thresholds.
@@ -938,6 +918,8 @@ def rank_candidate_fields(
         candidate_fields: List of field names to rank
         historical_db_path: Optional path to historical learning database
         context: Optional ThresholdContext for dynamic thresholds (Phase 2.2)
+        profiles: Optional pre-computed FieldProfiles by field name (e.g. from
+            ColumnarAnalytics.field_profiles()); skips the SQLite table scan
 
     Returns:
         List of FieldRanking sorted by score (descending)
@@ -954,6 +936,20 @@ def rank_candidate_fields(
         >>> context = ThresholdContext(record_count=50, null_rate=0.2, log_type='sign_in_logs')
         >>> rankings = rank_candidate_fields('case.db', 'sign_in_logs', ['field_a', 'field_b'], context=context)
     """
+    # Profile all candidates in one table scan; fields that fail here (or are
+    # missing from supplied profiles) fall back to calculate_reliability_score()'s
+    # own scan (and its errors)
+    if profiles is None:
+        profiles = {}
+        try:
+            conn = sqlite3.connect(db_path)
+            try:
+                profiles = profile_table(conn, table, candidate_fields).fields
+            finally:
+                conn.close()
+        except (ValueError, sqlite3.Error) as e:
+            logger.debug(f"Batch profiling of '{table}' failed, scoring fields individually: {e}")
+
     # Calculate scores for all candidates
     field_scores = []
     for field in candidate_fields:
@@ -962,7 +958,8 @@ def rank_candidate_fields(
                 db_path,
                 table,
                 field,
-                historical_db_path=historical_db_path
+                historical_db_path=historical_db_path,
+                profile=profiles.get(field)
             )
             field_scores.append((field, score))
         except Exception as e:
@@ -1008,7 +1005,8 @@ def recommend_best_field(
     table: str,
     log_type: str,
     historical_db_path: Optional[str] = None,
-    context: Optional[ThresholdContext] = None
+    context: Optional[ThresholdContext] = None,
+    profiles: Optional[Dict[str, FieldProfile]] = None
 ) -> FieldRecommendation:
     """
     Recommend best field for verification with reasoning (Phase 2.2 context-aware).
@@ -1022,6 +1020,8 @@ def recommend_best_field(
         log_type: Log type (e.g., 'sign_in_logs')
         historical_db_path: Optional path to historical learning database
         context: Optional ThresholdContext for dynamic thresholds (Phase 2.2)
+        profiles: Optional pre-computed FieldProfiles by field name, passed
+            to rank_candidate_fields()
 
     Returns:
         FieldRecommendation with top field, reasoning, and threshold context
@@ -1056,7 +1056,8 @@ def recommend_best_field(
         table,
         candidate_fields,
         historical_db_path=historical_db_path,
-        context=context
+        context=context,
+        profiles=profiles
     )
 
     if not rankings:
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Impossible Travel Engine - Bulk consecutive-login distance/speed analysis.
+
+Shared engine behind anomaly_detector.detect_impossible_travel() (parsed
+SignInLogEntry objects) and phase0_auto_checks.detect_impossible_travel()
+(sign_in_logs table). Callers load four parallel columns - user code,
+timestamp seconds, latitude, longitude - sorted by user then time, and the
+engine computes haversine distance, elapsed hours and speed for every
+consecutive same-user pair in one vectorised pass.
+
+NumPy is used when installed; otherwise an equivalent pure-Python loop
+produces the same legs, so neither caller depends on NumPy being present.
+
+Usage:
+    from claude.tools.m365_ir.impossible_travel import (
+        find_impossible_travel, sort_by_user_time, timestamp_seconds,
+    )
+
+    order = sort_by_user_time(user_codes, seconds)
+    legs = find_impossible_travel(
+        [user_codes[i] for i in order], [seconds[i] for i in order],
+        [lats[i] for i in order], [lons[i] for i in order],
+        max_speed_kmh=1000, min_distance_km=500,
+    )
+    for leg in legs:
+        print(leg.prev_index, leg.index, leg.distance_km, leg.speed_kmh)
+
+Author: Maia System (SRE Principal Engineer Agent)
+Created: 2026-10-16
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+EARTH_RADIUS_KM = 6371.0
+KM_TO_MILES = 0.621371
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class TravelLeg:
+    """Consecutive same-user login pair that exceeded the speed threshold."""
+    prev_index: int  # Row index (in the sorted columns) of the earlier login
+    index: int  # Row index of the later login
+    distance_km: float
+    hours: float
+    speed_kmh: float
+
+
+def timestamp_seconds(dt: Optional[datetime]) -> float:
+    """
+    Convert a datetime to seconds since the epoch without local-time shifts.
+
+    Naive datetimes are measured against a naive epoch so differences match
+    plain datetime subtraction (no DST adjustment). None maps to NaN, which
+    the engine treats as "pair cannot be timed" and never flags.
+    """
+    if dt is None:
+        return math.nan
+    if dt.tzinfo is None:
+        return (dt - _NAIVE_EPOCH).total_seconds()
+    return (dt - _AWARE_EPOCH).total_seconds()
+
+
+def sort_by_user_time(user_codes: Sequence[int], seconds: Sequence[float]) -> List[int]:
+    """
+    Return the row order that sorts columns by (user, time).
+
+    The sort is stable, so logins with identical timestamps keep their input
+    order - matching sorted(entries, key=created_datetime) per user.
+    """
+    if NUMPY_AVAILABLE:
+        # lexsort sorts by the last key first and is stable (mergesort)
+        return np.lexsort((np.asarray(seconds, dtype=np.float64),
+                           np.asarray(user_codes, dtype=np.int64))).tolist()
+    return sorted(range(len(user_codes)), key=lambda i: (user_codes[i], seconds[i]))
+
+
+def find_impossible_travel(
+    user_codes: Sequence[int],
+    seconds: Sequence[float],
+    lat: Sequence[float],
+    lon: Sequence[float],
+    max_speed_kmh: float,
+    min_distance_km: float = 0.0,
+) -> List[TravelLeg]:
+    """
+    Find consecutive same-user logins whose implied speed is impossible.
+
+    Columns must already be sorted by user then time. A pair is flagged when
+    elapsed time is positive, speed > max_speed_kmh and distance >
+    min_distance_km. Pairs with a NaN timestamp on either side are skipped.
+
+    Args:
+        user_codes: Integer code per row (same user = same code)
+        seconds: Login time per row (see timestamp_seconds())
+        lat: Latitude per row in degrees
+        lon: Longitude per row in degrees
+        max_speed_kmh: Maximum plausible travel speed
+        min_distance_km: Ignore pairs at or below this distance
+
+    Returns:
+        TravelLeg per flagged pair, in row order
+    """
+    if len(user_codes) < 2:
+        return []
+    if NUMPY_AVAILABLE:
+        return _find_legs_numpy(user_codes, seconds, lat, lon, max_speed_kmh, min_distance_km)
+    return _find_legs_python(user_codes, seconds, lat, lon, max_speed_kmh, min_distance_km)
+
+
+def _find_legs_numpy(user_codes, seconds, lat, lon, max_speed_kmh, min_distance_km):
+    """Vectorised implementation: one array operation per step across all pairs."""
+    users = np.asarray(user_codes, dtype=np.int64)
+    secs = np.asarray(seconds, dtype=np.float64)
+    lat_r = np.radians(np.asarray(lat, dtype=np.float64))
+    lon_r = np.radians(np.asarray(lon, dtype=np.float64))
+
+    same_user = users[1:] == users[:-1]
+    dlat = lat_r[1:] - lat_r[:-1]
+    dlon = lon_r[1:] - lon_r[:-1]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat_r[:-1]) * np.cos(lat_r[1:]) * np.sin(dlon / 2) ** 2
+    distance = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    hours = (secs[1:] - secs[:-1]) / 3600
+
+    # NaN/zero/negative hours fail the > 0 test, so their inf/NaN speeds never match
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speed = distance / hours
+        mask = same_user & (hours > 0) & (speed > max_speed_kmh) & (distance > min_distance_km)
+
+    return [
+        TravelLeg(i, i + 1, float(distance[i]), float(hours[i]), float(speed[i]))
+        for i in np.flatnonzero(mask).tolist()
+    ]
+
+
+def _find_legs_python(user_codes, seconds, lat, lon, max_speed_kmh, min_distance_km):
+    """Pure-Python fallback with the same formula and filters as the NumPy path."""
+    legs = []
+    radians = math.radians
+    for i in range(len(user_codes) - 1):
+        if user_codes[i] != user_codes[i + 1]:
+            continue
+        hours = (seconds[i + 1] - seconds[i]) / 3600
+        if not hours > 0:  # Also rejects NaN
+            continue
+
+        lat1, lat2 = radians(lat[i]), radians(lat[i + 1])
+        dlat = lat2 - lat1
+        dlon = radians(lon[i + 1]) - radians(lon[i])
+        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        distance = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+        speed = distance / hours
+        if speed > max_speed_kmh and distance > min_distance_km:
+            legs.append(TravelLeg(i, i + 1, distance, hours, speed))
+    return legs
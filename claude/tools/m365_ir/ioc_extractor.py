@@ -388,14 +388,10 @@ if __name__ == "__main__":
 
         # Load entries
         signin_entries = parser.merge_exports(export_paths, LogType.SIGNIN)
-        legacy_entries = []
-        for export in export_paths:
-            discovered = parser.discover_log_files(export)
-            if LogType.LEGACY_AUTH in discovered:
-                legacy_entries.extend(parser.parse_legacy_auth(discovered[LogType.LEGACY_AUTH]))
+        # Streamed: extract() makes a single pass over legacy auth
+        legacy_entries = parser.iter_exports(export_paths, LogType.LEGACY_AUTH)
 
         print(f"Loaded {len(signin_entries)} sign-in entries")
-        print(f"Loaded {len(legacy_entries)} legacy auth entries")
 
         # Extract IOCs
         extractor = IOCExtractor()
@@ -34,7 +34,9 @@ DEFAULT_BASE_PATH = os.path.expanduser("~/work_projects/ir_cases")
 # v3: Verification - verification_summary table (Phase 241)
 # v4: Timeline persistence - timeline_events, timeline_annotations, timeline_phases, timeline_build_history (Phase 260)
 # v5: Multi-schema ETL - schema_variant, sign_in_type, service_principal fields, Graph API fields (Phase 264)
-SCHEMA_VERSION = 5
+# v6: Indexed duplicate detection - sign_in_logs.dedup_key written at import
+# v7: zstd dictionary codec - compression_dictionaries table (migrations/migrate_v7.py; zstd imports also create it on demand)
+SCHEMA_VERSION = 7
 
 
 class IRLogDatabase:
@@ -227,7 +229,9 @@ class IRLogDatabase:
                 device_compliant INTEGER,
                 device_managed INTEGER,
                 credential_key_id TEXT,
-                resource_id TEXT
+                resource_id TEXT,
+                -- v6: hash of (timestamp, user_principal_name, ip_address), see duplicate_handler
+                dedup_key INTEGER
             )
         """)
 
@@ -717,6 +721,20 @@ class IRLogDatabase:
             )
         """)
 
+        # Compression Dictionaries table (v7 - zstd dictionary codec)
+        # One trained dictionary per table; rows reference it by dict_id
+        # inside their zstd frame header (see compression.py)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS compression_dictionaries (
+                dict_id INTEGER PRIMARY KEY,
+                table_name TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                dictionary BLOB NOT NULL,
+                sample_rows INTEGER NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+
         # Timeline Build History table - Audit trail of timeline generation
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS timeline_build_history (
@@ -23,6 +23,7 @@ Created: 2025-01-05
 import csv
 import hashlib
 import io
+import itertools
 import json
 import logging
 import re
@@ -33,7 +34,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union, BinaryIO
 
-from .compression import compress_json
+from .compression import (
+    CODEC_ZLIB,
+    CODECS,
+    DICTIONARY_TRAINING_ROWS,
+    compress_json,
+    get_table_codec,
+)
+from .duplicate_handler import compute_dedup_key
 from .log_database import IRLogDatabase
 from .m365_log_parser import (
     M365LogParser,
@@ -51,6 +59,159 @@ logger = logging.getLogger(__name__)
 # Parser version for tracking
 PARSER_VERSION = "1.0.0"
 
+# Rows per executemany() chunk for streaming imports. Large enough to amortise
+# per-statement overhead, small enough that a batch of compressed rows stays
+# in the low megabytes.
+IMPORT_BATCH_SIZE = 5000
+
+# Connection pragmas applied for bulk imports.
+# WAL + synchronous=NORMAL avoids an fsync per transaction page flush,
+# cache_size is negative KiB (64 MiB) so index pages for the UNIQUE
+# dedup index stay resident during large loads.
+BULK_IMPORT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+SIGN_IN_INSERT_SQL = """
+    INSERT OR IGNORE INTO sign_in_logs
+    (timestamp, user_principal_name, user_display_name,
+     ip_address, location_city, location_country,
+     client_app, app_display_name, browser, os,
+     status_error_code, conditional_access_status,
+     risk_level, risk_state, correlation_id,
+     raw_record, imported_at,
+     schema_variant, sign_in_type, is_service_principal,
+     service_principal_id, service_principal_name,
+     user_id, request_id, auth_requirement, mfa_result,
+     latency_ms, device_compliant, device_managed,
+     credential_key_id, resource_id, dedup_key)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+UAL_INSERT_SQL = """
+    INSERT OR IGNORE INTO unified_audit_log
+    (timestamp, user_id, operation, workload, record_type,
+     result_status, client_ip, object_id, audit_data,
+     raw_record, imported_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+MAILBOX_INSERT_SQL = """
+    INSERT OR IGNORE INTO mailbox_audit_log
+    (timestamp, user, operation, client_ip, item_id,
+     raw_record, imported_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _detect_row_date_format(date_str: str) -> str:
+    """Detect AU/US date format from a single date string (defaults to AU)."""
+    if not date_str:
+        return "AU"
+
+    # Extract date part
+    date_part = date_str.split()[0] if ' ' in date_str else date_str
+
+    # Try to parse
+    match = re.match(r'^(\d{1,2})/(\d{1,2})/(\d{4})$', date_part)
+    if not match:
+        return "AU"
+
+    first, second, _ = int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+    # If first > 12, must be day (AU format)
+    if first > 12:
+        return "AU"
+    # If second > 12, first must be month (US format)
+    if second > 12:
+        return "US"
+
+    # Default to AU for Australian tenants
+    return "AU"
+
+
+def build_ual_row(row: Dict[str, str], imported_at: str, codec=None) -> tuple:
+    """
+    Build UAL_INSERT_SQL parameters from a UAL CSV row.
+
+    Module-level (not a method) so parallel import workers can pickle it.
+    codec is an optional compression.ZstdDictCodec (None = zlib).
+
+    Raises:
+        ValueError: If the row timestamp cannot be parsed
+    """
+    # Parse datetime - UAL uses CreationDate
+    date_str = row.get('CreationDate', row.get('CreatedDateTime', ''))
+    timestamp = parse_m365_datetime(date_str, _detect_row_date_format(date_str))
+
+    # Extract client IP and object_id from AuditData if not in columns
+    audit_data = row.get('AuditData', '{}')
+    client_ip = row.get('ClientIP', '')
+    object_id = row.get('ObjectId', '')
+    try:
+        audit_json = json.loads(audit_data)
+        if not client_ip:
+            client_ip = audit_json.get('ClientIPAddress', audit_json.get('ClientIP', ''))
+        if not object_id:
+            object_id = audit_json.get('ObjectId', '')
+    except json.JSONDecodeError:
+        pass
+
+    return (
+        timestamp.isoformat(),
+        row.get('UserIds', row.get('UserId', '')),
+        row.get('Operations', row.get('Operation', '')),
+        row.get('Workload', ''),
+        row.get('RecordType', ''),
+        row.get('ResultStatus', ''),
+        client_ip,
+        object_id,
+        compress_json(audit_data, codec),
+        compress_json(row, codec),
+        imported_at
+    )
+
+
+def build_mailbox_row(row: Dict[str, str], imported_at: str) -> tuple:
+    """
+    Build MAILBOX_INSERT_SQL parameters from a mailbox audit CSV row.
+
+    Raises:
+        ValueError: If the row timestamp cannot be parsed
+    """
+    # Parse datetime - try various column names
+    date_str = row.get('LastAccessed', row.get('CreationDate',
+                row.get('CreatedDateTime', '')))
+    timestamp = parse_m365_datetime(date_str, _detect_row_date_format(date_str))
+
+    # Extract client IP and item_id from columns or AuditData
+    audit_data = row.get('AuditData', '{}')
+    client_ip = row.get('ClientIPAddress', '')
+    item_id = row.get('ItemId', '')
+    try:
+        audit_json = json.loads(audit_data)
+        if not client_ip:
+            client_ip = audit_json.get('ClientIPAddress', '')
+        if not item_id:
+            item_id = audit_json.get('ItemId', '')
+    except json.JSONDecodeError:
+        pass
+
+    return (
+        timestamp.isoformat(),
+        row.get('MailboxOwnerUPN', row.get('UserIds', row.get('User', ''))),
+        row.get('Operation', row.get('Operations', '')),
+        client_ip,
+        item_id,
+        compress_json(row),
+        imported_at
+    )
+
 
 def _extract_case_id_from_db_path(db_path: Path) -> Optional[str]:
     """
@@ -116,6 +277,73 @@ class ImportResult:
     errors: List[str] = field(default_factory=list)
     duration_seconds: float = 0.0
     records_skipped: int = 0  # Duplicates skipped by UNIQUE constraint
+    quality_check_seconds: float = 0.0  # Time in the pre-commit data quality gate
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput over all rows processed (imported, skipped and failed)."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        rows = self.records_imported + self.records_skipped + self.records_failed
+        return rows / self.duration_seconds
+
+
+# LogType -> (result key, LogImporter method) for file-based imports.
+# Deprecated LogType.AUDIT is routed to the Entra audit handler.
+IMPORT_HANDLERS = {
+    LogType.SIGNIN: ('sign_in', 'import_sign_in_logs'),
+    LogType.FULL_AUDIT: ('ual', 'import_ual'),
+    LogType.ENTRA_AUDIT: ('entra_audit', 'import_entra_audit'),
+    LogType.AUDIT: ('entra_audit', 'import_entra_audit'),
+    LogType.MAILBOX_AUDIT: ('mailbox', 'import_mailbox_audit'),
+    LogType.OAUTH_CONSENTS: ('oauth', 'import_oauth_consents'),
+    LogType.INBOX_RULES: ('inbox_rules', 'import_inbox_rules'),
+    LogType.LEGACY_AUTH: ('legacy_auth', 'import_legacy_auth'),
+    LogType.PASSWORD_CHANGED: ('password_status', 'import_password_status'),
+    LogType.MFA_CHANGES: ('mfa_changes', 'import_mfa_changes'),
+    LogType.RISKY_USERS: ('risky_users', 'import_risky_users'),
+    # Phase 249 unwired handlers - FIX-1
+    LogType.MAILBOX_DELEGATIONS: ('mailbox_delegations', 'import_mailbox_delegations'),
+    LogType.SERVICE_PRINCIPALS: ('service_principals', 'import_service_principals'),
+    LogType.ADMIN_ROLE_ASSIGNMENTS: ('admin_role_assignments', 'import_admin_role_assignments'),
+    LogType.APPLICATION_REGISTRATIONS: ('application_registrations', 'import_application_registrations'),
+    LogType.TRANSPORT_RULES: ('transport_rules', 'import_transport_rules'),
+    LogType.CONDITIONAL_ACCESS_POLICIES: ('conditional_access_policies', 'import_conditional_access_policies'),
+    LogType.NAMED_LOCATIONS: ('named_locations', 'import_named_locations'),
+    LogType.EVIDENCE_MANIFEST: ('evidence_manifest', 'import_evidence_manifest'),
+}
+
+
+def merge_import_result(
+    results: Dict[str, ImportResult],
+    result_key: str,
+    import_result: ImportResult
+) -> None:
+    """
+    Add import_result to results, accumulating counts if result_key exists.
+
+    Multiple files of the same log type (e.g. several export folders) are
+    reported as one ImportResult with semicolon-joined sources.
+    """
+    if result_key not in results:
+        results[result_key] = import_result
+        return
+
+    existing = results[result_key]
+    results[result_key] = ImportResult(
+        source_file=f"{existing.source_file}; {import_result.source_file}",
+        source_hash=f"{existing.source_hash}; {import_result.source_hash}",
+        records_imported=existing.records_imported + import_result.records_imported,
+        records_failed=existing.records_failed + import_result.records_failed,
+        errors=existing.errors + import_result.errors,
+        duration_seconds=existing.duration_seconds + import_result.duration_seconds,
+        records_skipped=existing.records_skipped + import_result.records_skipped,
+        quality_check_seconds=existing.quality_check_seconds + import_result.quality_check_seconds
+    )
+    logger.info(
+        f"Merged {result_key} from {import_result.source_file}: "
+        f"+{import_result.records_imported} records"
+    )
 
 
 class LogImporter:
@@ -126,27 +354,48 @@ class LogImporter:
     and import tracking.
     """
 
-    def __init__(self, db: IRLogDatabase):
+    def __init__(self, db: IRLogDatabase, codec: str = CODEC_ZLIB):
         """
         Initialize importer with target database.
 
         Args:
             db: IRLogDatabase instance (must be created first)
+            codec: raw_record/audit_data compression for sign_in_logs and
+                unified_audit_log - 'zlib' (default) or 'zstd' (per-table
+                trained dictionary, see compression.get_table_codec).
+                Parallel imports compress in worker processes and use zlib,
+                as do sign-in CSV file imports (their raw_record is a '{}'
+                placeholder); sign-ins imported from zip members store the
+                CSV row and use the codec.
         """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec!r} (expected one of {CODECS})")
         self._db = db
+        self._codec = codec
         self._parser = M365LogParser()
+        self.last_import_report = None  # ParallelImportReport from import_all(parallel=True)
 
     @property
     def db(self) -> IRLogDatabase:
         """Return the database reference."""
         return self._db
 
-    def import_sign_in_logs(self, source: Union[str, Path]) -> ImportResult:
+    def import_sign_in_logs(
+        self,
+        source: Union[str, Path],
+        batch_size: int = IMPORT_BATCH_SIZE
+    ) -> ImportResult:
         """
         Import Azure AD sign-in logs from CSV.
 
+        Streams entries from M365LogParser.iter_with_schema() and inserts them
+        with executemany() in chunks of batch_size under BULK_IMPORT_PRAGMAS,
+        so memory stays flat for multi-GB exports. A chunk that fails is
+        retried row by row so a single bad entry does not drop its neighbours.
+
         Args:
             source: Path to sign-in logs CSV file
+            batch_size: Rows per executemany() chunk
 
         Returns:
             ImportResult with import statistics
@@ -176,8 +425,10 @@ class LogImporter:
         records_failed = 0
         records_skipped = 0
         errors: List[str] = []
+        quality_check_seconds = 0.0
 
         conn = self._db.connect()
+        self._apply_bulk_import_pragmas(conn)
         cursor = conn.cursor()
         now = datetime.now().isoformat()
 
@@ -191,72 +442,34 @@ class LogImporter:
         import_id = cursor.lastrowid
 
         try:
-            # Phase 264: Use schema-aware parser
+            # Phase 264: Use schema-aware parser (streamed, not materialised)
             parser = M365LogParser()
-            entries = parser.parse_with_schema(source)
+            # Parsed entries don't keep the source row, so raw_record is a
+            # '{}' placeholder: nothing for a zstd dictionary to learn from,
+            # and this path stays on zlib whatever the codec
+            entries = enumerate(parser.iter_with_schema(source), start=1)
+
+            while True:
+                chunk = list(itertools.islice(entries, batch_size))
+                if not chunk:
+                    break
 
-            for entry_num, entry in enumerate(entries, start=1):
-                try:
-                    # INSERT OR IGNORE for deduplication via UNIQUE constraint
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO sign_in_logs
-                        (timestamp, user_principal_name, user_display_name,
-                         ip_address, location_city, location_country,
-                         client_app, app_display_name, browser, os,
-                         status_error_code, conditional_access_status,
-                         risk_level, risk_state, correlation_id,
-                         raw_record, imported_at,
-                         schema_variant, sign_in_type, is_service_principal,
-                         service_principal_id, service_principal_name,
-                         user_id, request_id, auth_requirement, mfa_result,
-                         latency_ms, device_compliant, device_managed,
-                         credential_key_id, resource_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        entry.timestamp.isoformat() if entry.timestamp else None,
-                        entry.user_principal_name or '',
-                        entry.user_display_name or '',
-                        entry.ip_address or '',
-                        entry.city or '',
-                        entry.country or '',
-                        getattr(entry, 'client_app', '') or '',
-                        entry.app_display_name or '',
-                        entry.browser or '',
-                        entry.os or '',
-                        getattr(entry, 'status_error_code', 0) or 0,
-                        entry.conditional_access_status or '',
-                        getattr(entry, 'risk_level_during_signin', '') or '',
-                        entry.risk_state or '',
-                        getattr(entry, 'correlation_id', '') or '',
-                        compress_json(getattr(entry, 'raw_data', {})),
-                        now,
-                        # Phase 264: Multi-schema ETL fields
-                        entry.schema_variant or '',
-                        entry.sign_in_type or '',
-                        1 if entry.is_service_principal else 0,
-                        entry.service_principal_id or '',
-                        entry.service_principal_name or '',
-                        entry.user_id or '',
-                        entry.request_id or '',
-                        entry.auth_requirement or '',
-                        entry.mfa_result or '',
-                        entry.latency_ms,
-                        1 if entry.device_compliant else None,
-                        1 if entry.device_managed else None,
-                        entry.credential_key_id or '',
-                        entry.resource_id or ''
-                    ))
-                    # Check if row was actually inserted (rowcount=0 means duplicate)
-                    if cursor.rowcount > 0:
-                        records_imported += 1
-                    else:
-                        records_skipped += 1
+                rows = []
+                for entry_num, entry in chunk:
+                    try:
+                        rows.append((entry_num, self._sign_in_entry_to_row(entry, now)))
+                    except Exception as e:
+                        records_failed += 1
+                        errors.append(f"Entry {entry_num}: {str(e)}")
+                        logger.debug(f"Failed to import entry {entry_num}: {e}")
 
-                except Exception as e:
-                    records_failed += 1
-                    errors.append(f"Entry {entry_num}: {str(e)}")
-                    logger.debug(f"Failed to import entry {entry_num}: {e}")
+                inserted, skipped, failed, batch_errors = self._insert_batch(
+                    cursor, SIGN_IN_INSERT_SQL, rows
+                )
+                records_imported += inserted
+                records_skipped += skipped
+                records_failed += failed
+                errors.extend(batch_errors)
 
             # Update import metadata
             cursor.execute("""
@@ -267,224 +480,257 @@ class LogImporter:
 
             # Phase 1.2: Run quality checks BEFORE commit (fail-fast mode)
             if records_imported > 0:
-                try:
-                    from .data_quality_checker import check_table_quality
+                quality_check_seconds = self._check_sign_in_quality(conn)
 
-                    quality_report = check_table_quality(
-                        str(self._db.db_path),
-                        'sign_in_logs',
-                        conn=conn  # Pass existing connection to see uncommitted data
-                    )
+            conn.commit()
 
-                    # Check if quality_check_summary table exists
-                    cursor.execute("""
-                        SELECT name FROM sqlite_master
-                        WHERE type='table' AND name='quality_check_summary'
-                    """)
+            # Phase 1.1: Auto-verify sign-in status after import
+            if records_imported > 0:
+                self._verify_sign_in_import(conn)
 
-                    if cursor.fetchone():
-                        # Store quality check results
-                        cursor.execute("""
-                            INSERT INTO quality_check_summary
-                            (table_name, overall_quality_score, reliable_fields_count,
-                             unreliable_fields_count, check_passed, warnings, recommendations, created_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            'sign_in_logs',
-                            quality_report.overall_quality_score,
-                            len(quality_report.reliable_fields),
-                            len(quality_report.unreliable_fields),
-                            1 if quality_report.overall_quality_score >= 0.5 else 0,
-                            '; '.join(quality_report.warnings) if quality_report.warnings else None,
-                            '; '.join(quality_report.recommendations) if quality_report.recommendations else None,
-                            quality_report.created_at
-                        ))
+            # Phase 1.3: Scan for unknown status codes
+            if records_imported > 0:
+                self._scan_unknown_status_codes()
 
-                    # Fail-fast: Raise error if quality score below threshold
-                    if quality_report.overall_quality_score < 0.5:
-                        error_msg = (
-                            f"Data quality check FAILED: Quality score {quality_report.overall_quality_score:.2f} "
-                            f"is below threshold (0.5). Import aborted.\n\n"
-                            f"Unreliable fields ({len(quality_report.unreliable_fields)}): "
-                            f"{', '.join(quality_report.unreliable_fields)}\n\n"
-                        )
-                        if quality_report.recommendations:
-                            error_msg += "Recommendations:\n"
-                            for rec in quality_report.recommendations:
-                                error_msg += f"  - {rec}\n"
-
-                        raise DataQualityError(
-                            error_msg,
-                            quality_score=quality_report.overall_quality_score,
-                            unreliable_fields=quality_report.unreliable_fields,
-                            recommendations=quality_report.recommendations
-                        )
+        except Exception as e:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
 
-                    # Log quality warnings (even if check passed)
-                    if quality_report.warnings:
-                        print(f"\n⚠️  Data quality warnings:")
-                        for warning in quality_report.warnings:
-                            print(f"   - {warning}")
+        result = ImportResult(
+            source_file=str(source),
+            source_hash=source_hash,
+            records_imported=records_imported,
+            records_failed=records_failed,
+            errors=errors,
+            duration_seconds=time.time() - start_time,
+            records_skipped=records_skipped,
+            quality_check_seconds=quality_check_seconds
+        )
+        logger.info(
+            f"Sign-in import: {records_imported} imported, {records_skipped} skipped, "
+            f"{records_failed} failed in {result.duration_seconds:.2f}s "
+            f"({result.rows_per_second:,.0f} rows/sec, quality check {quality_check_seconds:.2f}s)"
+        )
+        return result
 
-                    logger.info(
-                        f"Quality check passed: Score {quality_report.overall_quality_score:.2f}, "
-                        f"{len(quality_report.reliable_fields)} reliable fields, "
-                        f"{len(quality_report.unreliable_fields)} unreliable fields"
-                    )
+    def _check_sign_in_quality(self, conn) -> float:
+        """
+        Run the sign-in data quality gate on an open (uncommitted) connection.
 
-                except DataQualityError:
-                    # Re-raise quality errors (will be caught by outer except and rolled back)
-                    raise
-                except Exception as e:
-                    # Don't fail import if quality check itself fails
-                    logger.warning(f"Quality check failed to run: {e}")
+        Returns:
+            Seconds spent in the check (for ImportResult.quality_check_seconds)
 
-            conn.commit()
+        Raises:
+            DataQualityError: If the overall quality score is below 0.5
+        """
+        start_time = time.time()
+        cursor = conn.cursor()
+        try:
+            from .data_quality_checker import check_table_quality
 
-            # Phase 1.1: Auto-verify sign-in status after import
-            if records_imported > 0:
-                try:
-                    from .auth_verifier import verify_sign_in_status
+            quality_report = check_table_quality(
+                str(self._db.db_path),
+                'sign_in_logs',
+                conn=conn  # Pass existing connection to see uncommitted data
+            )
 
-                    result = verify_sign_in_status(str(self._db.db_path))
+            # Check if quality_check_summary table exists
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='quality_check_summary'
+            """)
+
+            if cursor.fetchone():
+                # Store quality check results
+                cursor.execute("""
+                    INSERT INTO quality_check_summary
+                    (table_name, overall_quality_score, reliable_fields_count,
+                     unreliable_fields_count, check_passed, warnings, recommendations, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    'sign_in_logs',
+                    quality_report.overall_quality_score,
+                    len(quality_report.reliable_fields),
+                    len(quality_report.unreliable_fields),
+                    1 if quality_report.overall_quality_score >= 0.5 else 0,
+                    '; '.join(quality_report.warnings) if quality_report.warnings else None,
+                    '; '.join(quality_report.recommendations) if quality_report.recommendations else None,
+                    quality_report.created_at
+                ))
+
+            # Fail-fast: Raise error if quality score below threshold
+            if quality_report.overall_quality_score < 0.5:
+                error_msg = (
+                    f"Data quality check FAILED: Quality score {quality_report.overall_quality_score:.2f} "
+                    f"is below threshold (0.5). Import aborted.\n\n"
+                    f"Unreliable fields ({len(quality_report.unreliable_fields)}): "
+                    f"{', '.join(quality_report.unreliable_fields)}\n\n"
+                )
+                if quality_report.recommendations:
+                    error_msg += "Recommendations:\n"
+                    for rec in quality_report.recommendations:
+                        error_msg += f"  - {rec}\n"
+
+                raise DataQualityError(
+                    error_msg,
+                    quality_score=quality_report.overall_quality_score,
+                    unreliable_fields=quality_report.unreliable_fields,
+                    recommendations=quality_report.recommendations
+                )
 
-                    # Store verification results
-                    verification_status = 'BREACH_DETECTED' if result.breach_detected else 'OK'
-                    cursor.execute("""
-                        INSERT INTO verification_summary
-                        (log_type, total_records, success_count, failure_count,
-                         success_rate, verification_status, notes, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        'sign_in_logs',
-                        result.total_records,
-                        result.success_count,
-                        result.failure_count,
-                        result.success_rate,
-                        verification_status,
-                        f"Foreign success: {result.foreign_success_count} ({result.foreign_success_rate:.1f}%). "
-                        f"Field used: {result.status_field_used}. "
-                        f"Warnings: {'; '.join(result.warnings) if result.warnings else 'None'}",
-                        result.created_at
-                    ))
-                    conn.commit()
+            # Log quality warnings (even if check passed)
+            if quality_report.warnings:
+                print(f"\n⚠️  Data quality warnings:")
+                for warning in quality_report.warnings:
+                    print(f"   - {warning}")
+
+            logger.info(
+                f"Quality check passed: Score {quality_report.overall_quality_score:.2f}, "
+                f"{len(quality_report.reliable_fields)} reliable fields, "
+                f"{len(quality_report.unreliable_fields)} unreliable fields "
+                f"(profiled {quality_report.total_records:,} rows in {quality_report.duration_seconds:.2f}s)"
+            )
 
-                    # Phase 2.1.4: Store field usage outcome for learning
-                    try:
-                        from .auth_verifier import HISTORICAL_DB_PATH, USE_PHASE_2_1_SCORING
-                        from .field_reliability_scorer import store_field_usage
-
-                        if USE_PHASE_2_1_SCORING and hasattr(result, 'field_used') and result.field_used:
-                            case_id = _extract_case_id_from_db_path(self._db.db_path)
-
-                            if case_id:
-                                verification_successful = not any('CRITICAL' in w for w in result.warnings)
-
-                                store_field_usage(
-                                    history_db_path=str(HISTORICAL_DB_PATH),
-                                    case_id=case_id,
-                                    log_type='sign_in_logs',
-                                    field_name=result.field_used,
-                                    reliability_score=result.field_score or 0.5,
-                                    used_for_verification=True,
-                                    verification_successful=verification_successful,
-                                    breach_detected=result.breach_detected,
-                                    notes=f"Foreign success: {result.foreign_success_rate:.1f}%"
-                                )
+        except DataQualityError:
+            # Re-raise quality errors (will be caught by outer except and rolled back)
+            raise
+        except Exception as e:
+            # Don't fail import if quality check itself fails
+            logger.warning(f"Quality check failed to run: {e}")
 
-                                logger.info(f"Stored field usage: {result.field_used} (case: {case_id})")
+        return time.time() - start_time
 
-                    except Exception as e:
-                        logger.warning(f"Failed to store field usage: {e}")
+    def _verify_sign_in_import(self, conn) -> None:
+        """Auto-verify sign-in status after commit and store the summary (non-fatal)."""
+        cursor = conn.cursor()
+        try:
+            from .auth_verifier import verify_sign_in_status
 
-                    # Print verification summary
-                    print(f"\n✅ Sign-in logs auto-verification completed:")
-                    print(f"   Total: {result.total_records} records")
-                    print(f"   Successful: {result.success_count} ({result.success_rate:.1f}%)")
-                    print(f"   Failed: {result.failure_count} ({100-result.success_rate:.1f}%)")
-                    print(f"   Foreign success: {result.foreign_success_count} ({result.foreign_success_rate:.1f}%)")
+            result = verify_sign_in_status(str(self._db.db_path))
 
-                    if result.breach_detected:
-                        print(f"   ⚠️  BREACH DETECTED: {result.alert_severity}")
+            # Store verification results
+            verification_status = 'BREACH_DETECTED' if result.breach_detected else 'OK'
+            cursor.execute("""
+                INSERT INTO verification_summary
+                (log_type, total_records, success_count, failure_count,
+                 success_rate, verification_status, notes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                'sign_in_logs',
+                result.total_records,
+                result.success_count,
+                result.failure_count,
+                result.success_rate,
+                verification_status,
+                f"Foreign success: {result.foreign_success_count} ({result.foreign_success_rate:.1f}%). "
+                f"Field used: {result.status_field_used}. "
+                f"Warnings: {'; '.join(result.warnings) if result.warnings else 'None'}",
+                result.created_at
+            ))
+            conn.commit()
 
-                    if result.warnings:
-                        for warning in result.warnings:
-                            print(f"   ⚠️  {warning}")
+            # Phase 2.1.4: Store field usage outcome for learning
+            try:
+                from .auth_verifier import HISTORICAL_DB_PATH, USE_PHASE_2_1_SCORING
+                from .field_reliability_scorer import store_field_usage
+
+                if USE_PHASE_2_1_SCORING and hasattr(result, 'field_used') and result.field_used:
+                    case_id = _extract_case_id_from_db_path(self._db.db_path)
+
+                    if case_id:
+                        verification_successful = not any('CRITICAL' in w for w in result.warnings)
+
+                        store_field_usage(
+                            history_db_path=str(HISTORICAL_DB_PATH),
+                            case_id=case_id,
+                            log_type='sign_in_logs',
+                            field_name=result.field_used,
+                            reliability_score=result.field_score or 0.5,
+                            used_for_verification=True,
+                            verification_successful=verification_successful,
+                            breach_detected=result.breach_detected,
+                            notes=f"Foreign success: {result.foreign_success_rate:.1f}%"
+                        )
 
-                except Exception as e:
-                    logger.warning(f"Auto-verification failed: {e}")
+                        logger.info(f"Stored field usage: {result.field_used} (case: {case_id})")
 
-                    # Store failed verification in verification_summary
-                    try:
-                        total_records = cursor.execute(
-                            "SELECT COUNT(*) FROM sign_in_logs"
-                        ).fetchone()[0]
+            except Exception as e:
+                logger.warning(f"Failed to store field usage: {e}")
 
-                        cursor.execute("""
-                            INSERT INTO verification_summary
-                            (log_type, total_records, success_count, failure_count,
-                             success_rate, verification_status, notes, created_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            'sign_in_logs',
-                            total_records,
-                            0,
-                            0,
-                            0.0,
-                            'VERIFICATION_FAILED',
-                            f"Verification failed: {str(e)}",
-                            datetime.now().isoformat()
-                        ))
-                        conn.commit()
-                    except Exception as storage_error:
-                        logger.warning(f"Failed to store verification failure: {storage_error}")
+            # Print verification summary
+            print(f"\n✅ Sign-in logs auto-verification completed:")
+            print(f"   Total: {result.total_records} records")
+            print(f"   Successful: {result.success_count} ({result.success_rate:.1f}%)")
+            print(f"   Failed: {result.failure_count} ({100-result.success_rate:.1f}%)")
+            print(f"   Foreign success: {result.foreign_success_count} ({result.foreign_success_rate:.1f}%)")
 
-                    # Don't fail import if verification fails
+            if result.breach_detected:
+                print(f"   ⚠️  BREACH DETECTED: {result.alert_severity}")
 
-            # Phase 1.3: Scan for unknown status codes
-            if records_imported > 0:
-                try:
-                    from .status_code_manager import StatusCodeManager
+            if result.warnings:
+                for warning in result.warnings:
+                    print(f"   ⚠️  {warning}")
 
-                    manager = StatusCodeManager(str(self._db.db_path))
+        except Exception as e:
+            logger.warning(f"Auto-verification failed: {e}")
+
+            # Store failed verification in verification_summary
+            try:
+                total_records = cursor.execute(
+                    "SELECT COUNT(*) FROM sign_in_logs"
+                ).fetchone()[0]
+
+                cursor.execute("""
+                    INSERT INTO verification_summary
+                    (log_type, total_records, success_count, failure_count,
+                     success_rate, verification_status, notes, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    'sign_in_logs',
+                    total_records,
+                    0,
+                    0,
+                    0.0,
+                    'VERIFICATION_FAILED',
+                    f"Verification failed: {str(e)}",
+                    datetime.now().isoformat()
+                ))
+                conn.commit()
+            except Exception as storage_error:
+                logger.warning(f"Failed to store verification failure: {storage_error}")
+
+            # Don't fail import if verification fails
+
+    def _scan_unknown_status_codes(self) -> None:
+        """Warn about status_error_code values missing from the reference table."""
+        try:
+            from .status_code_manager import StatusCodeManager
 
-                    # Scan for unknown status_error_code values
-                    unknown_codes = manager.scan_for_unknown_codes(
-                        log_type='sign_in_logs',
-                        field_name='status_error_code'
-                    )
+            manager = StatusCodeManager(str(self._db.db_path))
 
-                    if unknown_codes:
-                        print(f"\n⚠️  Unknown status codes detected:")
-                        for code_info in unknown_codes[:5]:  # Show first 5
-                            print(f"   - Code '{code_info['code_value']}' appears {code_info['count']} times")
-                        if len(unknown_codes) > 5:
-                            print(f"   - ... and {len(unknown_codes) - 5} more unknown codes")
+            # Scan for unknown status_error_code values
+            unknown_codes = manager.scan_for_unknown_codes(
+                log_type='sign_in_logs',
+                field_name='status_error_code'
+            )
 
-                        logger.warning(
-                            f"Found {len(unknown_codes)} unknown status code(s) in sign_in_logs. "
-                            f"Consider updating status_code_reference table."
-                        )
+            if unknown_codes:
+                print(f"\n⚠️  Unknown status codes detected:")
+                for code_info in unknown_codes[:5]:  # Show first 5
+                    print(f"   - Code '{code_info['code_value']}' appears {code_info['count']} times")
+                if len(unknown_codes) > 5:
+                    print(f"   - ... and {len(unknown_codes) - 5} more unknown codes")
 
-                except Exception as e:
-                    logger.warning(f"Unknown code detection failed: {e}")
-                    # Don't fail import if code detection fails
+                logger.warning(
+                    f"Found {len(unknown_codes)} unknown status code(s) in sign_in_logs. "
+                    f"Consider updating status_code_reference table."
+                )
 
         except Exception as e:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
-
-        return ImportResult(
-            source_file=str(source),
-            source_hash=source_hash,
-            records_imported=records_imported,
-            records_failed=records_failed,
-            errors=errors,
-            duration_seconds=time.time() - start_time,
-            records_skipped=records_skipped
-        )
+            logger.warning(f"Unknown code detection failed: {e}")
+            # Don't fail import if code detection fails
 
     def import_ual(self, source: Union[str, Path]) -> ImportResult:
         """
@@ -538,48 +784,13 @@ class LogImporter:
         try:
             with open(source, 'r', encoding='utf-8-sig') as f:
                 reader = csv.DictReader(f)
-                for row_num, row in enumerate(reader, start=2):
+                codec, rows = self._table_codec(
+                    conn, 'unified_audit_log', enumerate(reader, start=2), self._ual_samples
+                )
+                for row_num, row in rows:
                     try:
-                        # Parse datetime - UAL uses CreationDate
-                        date_str = row.get('CreationDate', row.get('CreatedDateTime', ''))
-                        timestamp = parse_m365_datetime(
-                            date_str,
-                            self._detect_date_format(date_str)
-                        )
-
-                        # Extract client IP and object_id from AuditData if not in columns
-                        audit_data = row.get('AuditData', '{}')
-                        client_ip = row.get('ClientIP', '')
-                        object_id = row.get('ObjectId', '')
-                        try:
-                            audit_json = json.loads(audit_data)
-                            if not client_ip:
-                                client_ip = audit_json.get('ClientIPAddress', audit_json.get('ClientIP', ''))
-                            if not object_id:
-                                object_id = audit_json.get('ObjectId', '')
-                        except json.JSONDecodeError:
-                            pass
-
                         # INSERT OR IGNORE for deduplication via UNIQUE constraint
-                        cursor.execute("""
-                            INSERT OR IGNORE INTO unified_audit_log
-                            (timestamp, user_id, operation, workload, record_type,
-                             result_status, client_ip, object_id, audit_data,
-                             raw_record, imported_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            timestamp.isoformat(),
-                            row.get('UserIds', row.get('UserId', '')),
-                            row.get('Operations', row.get('Operation', '')),
-                            row.get('Workload', ''),
-                            row.get('RecordType', ''),
-                            row.get('ResultStatus', ''),
-                            client_ip,
-                            object_id,
-                            compress_json(audit_data),
-                            compress_json(row),
-                            now
-                        ))
+                        cursor.execute(UAL_INSERT_SQL, build_ual_row(row, now, codec))
                         if cursor.rowcount > 0:
                             records_imported += 1
                         else:
@@ -601,44 +812,7 @@ class LogImporter:
 
             # Phase 1.1: Auto-verify unified audit log after import
             if records_imported > 0:
-                try:
-                    from .auth_verifier import verify_audit_log_operations
-
-                    result = verify_audit_log_operations(str(self._db.db_path))
-
-                    # Store verification results
-                    verification_status = 'EXFILTRATION_INDICATOR' if result.exfiltration_indicator else 'OK'
-                    cursor.execute("""
-                        INSERT INTO verification_summary
-                        (log_type, total_records, success_count, failure_count,
-                         success_rate, verification_status, notes, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        'unified_audit_log',
-                        result.total_records,
-                        0,  # N/A for audit logs
-                        0,  # N/A for audit logs
-                        0.0,  # N/A for audit logs
-                        verification_status,
-                        f"MailItemsAccessed: {result.mail_items_accessed}. "
-                        f"FileSyncDownloadedFull: {result.file_sync_downloaded}. "
-                        f"Exfiltration indicator: {result.exfiltration_indicator}",
-                        result.created_at
-                    ))
-                    conn.commit()
-
-                    # Print verification summary
-                    print(f"\n✅ Unified audit log auto-verification completed:")
-                    print(f"   Total: {result.total_records} records")
-                    print(f"   MailItemsAccessed: {result.mail_items_accessed}")
-                    print(f"   FileSyncDownloadedFull: {result.file_sync_downloaded}")
-
-                    if result.exfiltration_indicator:
-                        print(f"   ⚠️  EXFILTRATION INDICATOR DETECTED")
-
-                except Exception as e:
-                    logger.warning(f"Auto-verification failed: {e}")
-                    # Don't fail import if verification fails
+                self._verify_ual_import(conn)
 
         except Exception as e:
             conn.rollback()
@@ -656,6 +830,48 @@ class LogImporter:
             records_skipped=records_skipped
         )
 
+    def _verify_ual_import(self, conn) -> None:
+        """Auto-verify unified audit log after commit and store the summary (non-fatal)."""
+        cursor = conn.cursor()
+        try:
+            from .auth_verifier import verify_audit_log_operations
+
+            result = verify_audit_log_operations(str(self._db.db_path))
+
+            # Store verification results
+            verification_status = 'EXFILTRATION_INDICATOR' if result.exfiltration_indicator else 'OK'
+            cursor.execute("""
+                INSERT INTO verification_summary
+                (log_type, total_records, success_count, failure_count,
+                 success_rate, verification_status, notes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                'unified_audit_log',
+                result.total_records,
+                0,  # N/A for audit logs
+                0,  # N/A for audit logs
+                0.0,  # N/A for audit logs
+                verification_status,
+                f"MailItemsAccessed: {result.mail_items_accessed}. "
+                f"FileSyncDownloadedFull: {result.file_sync_downloaded}. "
+                f"Exfiltration indicator: {result.exfiltration_indicator}",
+                result.created_at
+            ))
+            conn.commit()
+
+            # Print verification summary
+            print(f"\n✅ Unified audit log auto-verification completed:")
+            print(f"   Total: {result.total_records} records")
+            print(f"   MailItemsAccessed: {result.mail_items_accessed}")
+            print(f"   FileSyncDownloadedFull: {result.file_sync_downloaded}")
+
+            if result.exfiltration_indicator:
+                print(f"   ⚠️  EXFILTRATION INDICATOR DETECTED")
+
+        except Exception as e:
+            logger.warning(f"Auto-verification failed: {e}")
+            # Don't fail import if verification fails
+
     def import_mailbox_audit(self, source: Union[str, Path]) -> ImportResult:
         """
         Import mailbox audit logs from CSV.
@@ -710,42 +926,8 @@ class LogImporter:
                 reader = csv.DictReader(f)
                 for row_num, row in enumerate(reader, start=2):
                     try:
-                        # Parse datetime - try various column names
-                        date_str = row.get('LastAccessed', row.get('CreationDate',
-                                    row.get('CreatedDateTime', '')))
-                        timestamp = parse_m365_datetime(
-                            date_str,
-                            self._detect_date_format(date_str)
-                        )
-
-                        # Extract client IP and item_id from columns or AuditData
-                        audit_data = row.get('AuditData', '{}')
-                        client_ip = row.get('ClientIPAddress', '')
-                        item_id = row.get('ItemId', '')
-                        try:
-                            audit_json = json.loads(audit_data)
-                            if not client_ip:
-                                client_ip = audit_json.get('ClientIPAddress', '')
-                            if not item_id:
-                                item_id = audit_json.get('ItemId', '')
-                        except json.JSONDecodeError:
-                            pass
-
                         # INSERT OR IGNORE for deduplication via UNIQUE constraint
-                        cursor.execute("""
-                            INSERT OR IGNORE INTO mailbox_audit_log
-                            (timestamp, user, operation, client_ip, item_id,
-                             raw_record, imported_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            timestamp.isoformat(),
-                            row.get('MailboxOwnerUPN', row.get('UserIds', row.get('User', ''))),
-                            row.get('Operation', row.get('Operations', '')),
-                            client_ip,
-                            item_id,
-                            compress_json(row),
-                            now
-                        ))
+                        cursor.execute(MAILBOX_INSERT_SQL, build_mailbox_row(row, now))
                         if cursor.rowcount > 0:
                             records_imported += 1
                         else:
@@ -1587,15 +1769,26 @@ class LogImporter:
             records_skipped=0
         )
 
-    def import_all(self, source: Union[str, Path]) -> Dict[str, ImportResult]:
+    def import_all(
+        self,
+        source: Union[str, Path],
+        parallel: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, ImportResult]:
         """
         Auto-detect and import all log types from directory or zip file.
 
         Automatically detects whether source is a zip file or directory
         and imports accordingly. Zip files are streamed without extraction.
 
+        With parallel=True, large exports are parsed in a process pool and
+        written by a single writer thread (see ParallelLogImporter). The
+        per-file timing report is kept on self.last_import_report.
+
         Args:
             source: Directory or zip file containing M365 log exports
+            parallel: Parse/compress exports concurrently
+            max_workers: Process pool size for parallel mode (default: CPU count)
 
         Returns:
             Dict mapping log type to ImportResult
@@ -1611,7 +1804,13 @@ class LogImporter:
 
         # Detect source type and dispatch
         results = None
-        if source.is_file() and source.suffix.lower() == '.zip':
+        if parallel:
+            from .parallel_importer import ParallelLogImporter
+
+            report = ParallelLogImporter(self, max_workers=max_workers).run(source)
+            self.last_import_report = report
+            results = report.results
+        elif source.is_file() and source.suffix.lower() == '.zip':
             results = self._import_from_zip(source)
         elif source.is_dir():
             results = self._import_from_directory(source)
@@ -1705,93 +1904,20 @@ class LogImporter:
             for log_type, pattern in LOG_FILE_PATTERNS.items():
                 if re.match(pattern, file.name):
                     try:
-                        result_key = None
-                        import_result = None
-
-                        if log_type == LogType.SIGNIN:
-                            result_key = 'sign_in'
-                            import_result = self.import_sign_in_logs(file)
-                        elif log_type == LogType.FULL_AUDIT:
-                            result_key = 'ual'
-                            import_result = self.import_ual(file)
-                        elif log_type == LogType.ENTRA_AUDIT:
-                            result_key = 'entra_audit'
-                            import_result = self.import_entra_audit(file)
-                        elif log_type == LogType.AUDIT:
-                            # Deprecated: AUDIT now mapped to ENTRA_AUDIT
-                            result_key = 'entra_audit'
-                            import_result = self.import_entra_audit(file)
-                        elif log_type == LogType.MAILBOX_AUDIT:
-                            result_key = 'mailbox'
-                            import_result = self.import_mailbox_audit(file)
-                        elif log_type == LogType.OAUTH_CONSENTS:
-                            result_key = 'oauth'
-                            import_result = self.import_oauth_consents(file)
-                        elif log_type == LogType.INBOX_RULES:
-                            result_key = 'inbox_rules'
-                            import_result = self.import_inbox_rules(file)
-                        elif log_type == LogType.LEGACY_AUTH:
-                            result_key = 'legacy_auth'
-                            import_result = self.import_legacy_auth(file)
-                        elif log_type == LogType.PASSWORD_CHANGED:
-                            result_key = 'password_status'
-                            import_result = self.import_password_status(file)
-                        elif log_type == LogType.MFA_CHANGES:
-                            result_key = 'mfa_changes'
-                            import_result = self.import_mfa_changes(file)
-                        elif log_type == LogType.RISKY_USERS:
-                            result_key = 'risky_users'
-                            import_result = self.import_risky_users(file)
-                        # Phase 249 unwired handlers - FIX-1
-                        elif log_type == LogType.MAILBOX_DELEGATIONS:
-                            result_key = 'mailbox_delegations'
-                            import_result = self.import_mailbox_delegations(file)
-                        elif log_type == LogType.SERVICE_PRINCIPALS:
-                            result_key = 'service_principals'
-                            import_result = self.import_service_principals(file)
-                        elif log_type == LogType.ADMIN_ROLE_ASSIGNMENTS:
-                            result_key = 'admin_role_assignments'
-                            import_result = self.import_admin_role_assignments(file)
-                        elif log_type == LogType.APPLICATION_REGISTRATIONS:
-                            result_key = 'application_registrations'
-                            import_result = self.import_application_registrations(file)
-                        elif log_type == LogType.TRANSPORT_RULES:
-                            result_key = 'transport_rules'
-                            import_result = self.import_transport_rules(file)
-                        elif log_type == LogType.CONDITIONAL_ACCESS_POLICIES:
-                            result_key = 'conditional_access_policies'
-                            import_result = self.import_conditional_access_policies(file)
-                        elif log_type == LogType.NAMED_LOCATIONS:
-                            result_key = 'named_locations'
-                            import_result = self.import_named_locations(file)
-                        elif log_type == LogType.EVIDENCE_MANIFEST:
-                            result_key = 'evidence_manifest'
-                            import_result = self.import_evidence_manifest(file)
-
                         # WARNING: File matched pattern but no handler exists (Phase 231)
-                        if result_key is None and import_result is None:
+                        if log_type not in IMPORT_HANDLERS:
                             logger.warning(
                                 f"File {file.name} matched pattern for {log_type} but no import handler exists. "
                                 f"File will be SKIPPED. This may indicate missing forensic data."
                             )
+                            break
+
+                        result_key, handler_name = IMPORT_HANDLERS[log_type]
+                        import_result = getattr(self, handler_name)(file)
 
                         # Merge results if multiple files of same type
-                        if result_key and import_result:
-                            if result_key in results:
-                                # Merge: accumulate counts from multiple files
-                                existing = results[result_key]
-                                results[result_key] = ImportResult(
-                                    source_file=f"{existing.source_file}; {import_result.source_file}",
-                                    source_hash=f"{existing.source_hash}; {import_result.source_hash}",
-                                    records_imported=existing.records_imported + import_result.records_imported,
-                                    records_failed=existing.records_failed + import_result.records_failed,
-                                    errors=existing.errors + import_result.errors,
-                                    duration_seconds=existing.duration_seconds + import_result.duration_seconds,
-                                    records_skipped=existing.records_skipped + import_result.records_skipped
-                                )
-                                logger.info(f"Merged {result_key} from {file}: +{import_result.records_imported} records")
-                            else:
-                                results[result_key] = import_result
+                        if import_result:
+                            merge_import_result(results, result_key, import_result)
 
                     except Exception as e:
                         logger.error(f"Failed to import {file.name}: {e}")
@@ -1950,6 +2076,7 @@ class LogImporter:
         records_failed = 0
         records_skipped = 0
         errors: List[str] = []
+        quality_check_seconds = 0.0
 
         conn = self._db.connect()
         cursor = conn.cursor()
@@ -1968,8 +2095,11 @@ class LogImporter:
             # Parse CSV from bytes
             text_content = content.decode('utf-8-sig')
             reader = csv.DictReader(io.StringIO(text_content))
+            codec, rows = self._table_codec(
+                conn, 'sign_in_logs', enumerate(reader, start=2), lambda item: [item[1]]
+            )
 
-            for row_num, row in enumerate(reader, start=2):
+            for row_num, row in rows:
                 try:
                     timestamp = parse_m365_datetime(
                         row.get('CreatedDateTime', ''),
@@ -1983,8 +2113,8 @@ class LogImporter:
                          client_app, app_display_name, browser, os,
                          status_error_code, conditional_access_status,
                          risk_level, risk_state, correlation_id,
-                         raw_record, imported_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                         raw_record, imported_at, dedup_key)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         timestamp.isoformat(),
                         row.get('UserPrincipalName', ''),
@@ -2001,8 +2131,13 @@ class LogImporter:
                         row.get('RiskLevelDuringSignIn', ''),
                         row.get('RiskState', ''),
                         row.get('CorrelationId', ''),
-                        compress_json(row),
-                        now
+                        compress_json(row, codec),
+                        now,
+                        compute_dedup_key(
+                            timestamp.isoformat(),
+                            row.get('UserPrincipalName', ''),
+                            row.get('IPAddress', '')
+                        )
                     ))
                     if cursor.rowcount > 0:
                         records_imported += 1
@@ -2022,77 +2157,7 @@ class LogImporter:
             # Phase 1.2: Run quality checks for zip imports (BUG FIX)
             # PIR-OCULUS-2025-12-19: Zip imports were NOT running quality checks
             if records_imported > 0:
-                try:
-                    from .data_quality_checker import check_table_quality
-
-                    quality_report = check_table_quality(
-                        str(self._db.db_path),
-                        'sign_in_logs',
-                        conn=conn  # Pass existing connection to see uncommitted data
-                    )
-
-                    # Check if quality_check_summary table exists
-                    cursor.execute("""
-                        SELECT name FROM sqlite_master
-                        WHERE type='table' AND name='quality_check_summary'
-                    """)
-
-                    if cursor.fetchone():
-                        # Store quality check results
-                        cursor.execute("""
-                            INSERT INTO quality_check_summary
-                            (table_name, overall_quality_score, reliable_fields_count,
-                             unreliable_fields_count, check_passed, warnings, recommendations, created_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            'sign_in_logs',
-                            quality_report.overall_quality_score,
-                            len(quality_report.reliable_fields),
-                            len(quality_report.unreliable_fields),
-                            1 if quality_report.overall_quality_score >= 0.5 else 0,
-                            '; '.join(quality_report.warnings) if quality_report.warnings else None,
-                            '; '.join(quality_report.recommendations) if quality_report.recommendations else None,
-                            quality_report.created_at
-                        ))
-
-                    # Fail-fast: Raise error if quality score below threshold
-                    if quality_report.overall_quality_score < 0.5:
-                        error_msg = (
-                            f"Data quality check FAILED: Quality score {quality_report.overall_quality_score:.2f} "
-                            f"is below threshold (0.5). Import aborted.\n\n"
-                            f"Unreliable fields ({len(quality_report.unreliable_fields)}): "
-                            f"{', '.join(quality_report.unreliable_fields)}\n\n"
-                        )
-                        if quality_report.recommendations:
-                            error_msg += "Recommendations:\n"
-                            for rec in quality_report.recommendations:
-                                error_msg += f"  - {rec}\n"
-
-                        raise DataQualityError(
-                            error_msg,
-                            quality_score=quality_report.overall_quality_score,
-                            unreliable_fields=quality_report.unreliable_fields,
-                            recommendations=quality_report.recommendations
-                        )
-
-                    # Log quality warnings (even if check passed)
-                    if quality_report.warnings:
-                        print(f"\n⚠️  Data quality warnings:")
-                        for warning in quality_report.warnings:
-                            print(f"   - {warning}")
-
-                    logger.info(
-                        f"Quality check passed: Score {quality_report.overall_quality_score:.2f}, "
-                        f"{len(quality_report.reliable_fields)} reliable fields, "
-                        f"{len(quality_report.unreliable_fields)} unreliable fields"
-                    )
-
-                except DataQualityError:
-                    # Re-raise quality errors (will be caught by outer except and rolled back)
-                    raise
-                except Exception as e:
-                    # Quality check failed but don't block import
-                    logger.warning(f"Quality check failed (non-fatal): {e}")
+                quality_check_seconds = self._check_sign_in_quality(conn)
 
             conn.commit()
 
@@ -2109,7 +2174,8 @@ class LogImporter:
             records_failed=records_failed,
             errors=errors,
             duration_seconds=time.time() - start_time,
-            records_skipped=records_skipped
+            records_skipped=records_skipped,
+            quality_check_seconds=quality_check_seconds
         )
 
     def _import_ual_from_bytes(
@@ -2148,8 +2214,11 @@ class LogImporter:
         try:
             text_content = content.decode('utf-8-sig')
             reader = csv.DictReader(io.StringIO(text_content))
+            codec, rows = self._table_codec(
+                conn, 'unified_audit_log', enumerate(reader, start=2), self._ual_samples
+            )
 
-            for row_num, row in enumerate(reader, start=2):
+            for row_num, row in rows:
                 try:
                     date_str = row.get('CreationDate', row.get('CreatedDateTime', ''))
                     timestamp = parse_m365_datetime(
@@ -2184,8 +2253,8 @@ class LogImporter:
                         row.get('ResultStatus', ''),
                         client_ip,
                         object_id,
-                        compress_json(audit_data),
-                        compress_json(row),
+                        compress_json(audit_data, codec),
+                        compress_json(row, codec),
                         now
                     ))
                     if cursor.rowcount > 0:
@@ -3204,7 +3273,7 @@ class LogImporter:
 
         try:
             parser = M365LogParser(date_format='AU')
-            entries = parser.parse_conditional_access_policies(source)
+            entries = parser.iter_conditional_access_policies(source)
 
             for entry in entries:
                 try:
@@ -3297,7 +3366,7 @@ class LogImporter:
 
         try:
             parser = M365LogParser(date_format='AU')
-            entries = parser.parse_named_locations(source)
+            entries = parser.iter_named_locations(source)
 
             for entry in entries:
                 try:
@@ -3394,7 +3463,7 @@ class LogImporter:
 
         try:
             parser = M365LogParser(date_format='AU')
-            entries = parser.parse_application_registrations(source)
+            entries = parser.iter_application_registrations(source)
 
             for entry in entries:
                 try:
@@ -3489,7 +3558,7 @@ class LogImporter:
 
         try:
             parser = M365LogParser(date_format='AU')
-            entries = parser.parse_service_principals(source)
+            entries = parser.iter_service_principals(source)
 
             for entry in entries:
                 try:
@@ -3570,6 +3639,132 @@ class LogImporter:
         reader = csv.DictReader(io.StringIO(text_content))
         return self._import_entra_audit_internal(reader, source_id, source_hash, start_time)
 
+    @staticmethod
+    def _apply_bulk_import_pragmas(conn) -> None:
+        """Tune a fresh connection for bulk loading (see BULK_IMPORT_PRAGMAS)."""
+        for pragma in BULK_IMPORT_PRAGMAS:
+            conn.execute(pragma)
+
+    def _table_codec(self, conn, table_name: str, items, samples_of) -> tuple:
+        """
+        Resolve the compression codec for a streamed import into table_name.
+
+        For the zstd codec, the first DICTIONARY_TRAINING_ROWS items are
+        buffered as dictionary training samples (only used if the table has
+        no stored dictionary yet) and chained back in front of the stream.
+
+        Args:
+            conn: Import connection (a new dictionary commits with the import)
+            table_name: Target table
+            items: Iterator of items to be imported
+            samples_of: Maps one item to its JSON samples (str or dict)
+
+        Returns:
+            Tuple of (codec or None for zlib, iterator over all items)
+        """
+        if self._codec == CODEC_ZLIB:
+            return None, items
+
+        head = list(itertools.islice(items, DICTIONARY_TRAINING_ROWS))
+        samples = [sample for item in head for sample in samples_of(item)]
+        codec = get_table_codec(conn, table_name, self._codec, samples)
+        return codec, itertools.chain(head, items)
+
+    @staticmethod
+    def _ual_samples(item) -> list:
+        """Dictionary training samples for a (row_num, row) UAL item."""
+        row = item[1]
+        return [row, row.get('AuditData', '{}')]
+
+    @staticmethod
+    def _sign_in_entry_to_row(entry, imported_at: str) -> tuple:
+        """Build SIGN_IN_INSERT_SQL parameters from a parsed SignInLogEntry."""
+        timestamp = entry.timestamp.isoformat() if entry.timestamp else None
+        upn = entry.user_principal_name or ''
+        ip_address = entry.ip_address or ''
+        return (
+            timestamp,
+            upn,
+            entry.user_display_name or '',
+            ip_address,
+            entry.city or '',
+            entry.country or '',
+            getattr(entry, 'client_app', '') or '',
+            entry.app_display_name or '',
+            entry.browser or '',
+            entry.os or '',
+            getattr(entry, 'status_error_code', 0) or 0,
+            entry.conditional_access_status or '',
+            getattr(entry, 'risk_level_during_signin', '') or '',
+            entry.risk_state or '',
+            getattr(entry, 'correlation_id', '') or '',
+            compress_json(getattr(entry, 'raw_data', {})),
+            imported_at,
+            # Phase 264: Multi-schema ETL fields
+            entry.schema_variant or '',
+            entry.sign_in_type or '',
+            1 if entry.is_service_principal else 0,
+            entry.service_principal_id or '',
+            entry.service_principal_name or '',
+            entry.user_id or '',
+            entry.request_id or '',
+            entry.auth_requirement or '',
+            entry.mfa_result or '',
+            entry.latency_ms,
+            1 if entry.device_compliant else None,
+            1 if entry.device_managed else None,
+            entry.credential_key_id or '',
+            entry.resource_id or '',
+            # v6: indexed duplicate detection
+            compute_dedup_key(timestamp, upn, ip_address)
+        )
+
+    @staticmethod
+    def _insert_batch(cursor, sql: str, rows: List[tuple]) -> tuple:
+        """
+        Insert a chunk of rows with one executemany() call.
+
+        The chunk runs inside a savepoint. If any row raises, the savepoint is
+        rolled back and the chunk is replayed row by row so only the offending
+        rows are counted as failed (matching the per-row import semantics).
+
+        Args:
+            cursor: Cursor on a connection with an open transaction
+            sql: INSERT OR IGNORE statement
+            rows: List of (entry_num, params) tuples
+
+        Returns:
+            Tuple of (imported, skipped, failed, errors)
+        """
+        if not rows:
+            return 0, 0, 0, []
+
+        cursor.execute("SAVEPOINT import_batch")
+        try:
+            cursor.executemany(sql, [params for _, params in rows])
+            inserted = cursor.rowcount
+            cursor.execute("RELEASE SAVEPOINT import_batch")
+            return inserted, len(rows) - inserted, 0, []
+        except Exception as e:
+            logger.debug(f"Batch insert failed, retrying row by row: {e}")
+            cursor.execute("ROLLBACK TO SAVEPOINT import_batch")
+            cursor.execute("RELEASE SAVEPOINT import_batch")
+
+        imported = skipped = failed = 0
+        errors: List[str] = []
+        for entry_num, params in rows:
+            try:
+                cursor.execute(sql, params)
+                if cursor.rowcount > 0:
+                    imported += 1
+                else:
+                    skipped += 1
+            except Exception as e:
+                failed += 1
+                errors.append(f"Entry {entry_num}: {str(e)}")
+                logger.debug(f"Failed to import entry {entry_num}: {e}")
+        return imported, skipped, failed, errors
+
     def _calculate_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file."""
         sha256 = hashlib.sha256()
@@ -3592,28 +3787,7 @@ class LogImporter:
 
     def _detect_date_format(self, date_str: str) -> str:
         """Detect date format from string."""
-        if not date_str:
-            return "AU"
-
-        # Extract date part
-        date_part = date_str.split()[0] if ' ' in date_str else date_str
-
-        # Try to parse
-        match = re.match(r'^(\d{1,2})/(\d{1,2})/(\d{4})$', date_part)
-        if not match:
-            return "AU"
-
-        first, second, _ = int(match.group(1)), int(match.group(2)), int(match.group(3))
-
-        # If first > 12, must be day (AU format)
-        if first > 12:
-            return "AU"
-        # If second > 12, first must be month (US format)
-        if second > 12:
-            return "US"
-
-        # Default to AU for Australian tenants
-        return "AU"
+        return _detect_row_date_format(date_str)
 
 
 if __name__ == "__main__":
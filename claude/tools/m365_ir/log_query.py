@@ -19,19 +19,31 @@ Usage:
     # Raw SQL
     results = query.execute("SELECT * FROM sign_in_logs WHERE location_country = ?", ("Russia",))
 
+    # Projection - only fetch the listed columns (raw_record is never read)
+    results = query.activity_by_ip("185.234.100.50", columns=["timestamp", "user", "operation"])
+
+Result rows are LazyRow dicts: raw_record/audit_data stay compressed until
+the key is actually read, so callers that only use indexed columns never
+pay for zlib + JSON work.
+
 Author: Maia System (SRE Principal Engineer Agent)
 Created: 2025-01-05
 """
 
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from .compression import decompress_json
+from .compression import decompress_json, load_dictionaries
 from .log_database import IRLogDatabase
 
 # Type alias for query results - common return type for all query methods
 QueryResult = List[Dict[str, Any]]
 
+# Projected column names must be plain identifiers (they are interpolated into SQL)
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_ALIAS_SPLIT = re.compile(r'\s+as\s+', re.IGNORECASE)
+
 
 # High-risk operations for suspicious_operations query
 SUSPICIOUS_OPERATIONS = [
@@ -54,6 +66,103 @@ SUSPICIOUS_OPERATIONS = [
 ]
 
 
+class LazyRow(dict):
+    """
+    Query result row that decompresses BLOB columns on first access.
+
+    A dict subclass, so existing callers keep working unchanged. Compressed
+    columns hold their stored bytes until read through [], get(), items(),
+    values(), equality, repr or a dict()/json conversion; the decompressed
+    value then replaces the stored one.
+    """
+
+    __slots__ = ('_pending',)
+
+    def __init__(self, row, compressed_columns: Iterable[str] = ()):
+        super().__init__(row)
+        self._pending = {
+            col for col in compressed_columns
+            if dict.get(self, col) is not None
+        }
+
+    def _resolve(self, key):
+        value = dict.__getitem__(self, key)
+        if key in self._pending:
+            self._pending.discard(key)
+            value = decompress_json(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _resolve_all(self) -> None:
+        for key in list(self._pending):
+            self._resolve(key)
+
+    def __getitem__(self, key):
+        return self._resolve(key)
+
+    def get(self, key, default=None):
+        return self._resolve(key) if key in self else default
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._pending.discard(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self._resolve(key)
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def update(self, *args, **kwargs):
+        for key in dict(*args, **kwargs):
+            self._pending.discard(key)
+        dict.update(self, *args, **kwargs)
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(row)/{**row} use keys() + __getitem__
+        # instead of copying the still-compressed storage directly
+        return dict.__iter__(self)
+
+    def items(self):
+        self._resolve_all()
+        return dict.items(self)
+
+    def values(self):
+        self._resolve_all()
+        return dict.values(self)
+
+    def copy(self) -> Dict[str, Any]:
+        self._resolve_all()
+        return dict(dict.items(self))
+
+    def __eq__(self, other):
+        self._resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._resolve_all()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    @property
+    def is_decompressed(self) -> bool:
+        """True once every compressed column has been materialised."""
+        return not self._pending
+
+
 class LogQuery:
     """
     Query interface for investigation database.
@@ -74,73 +183,128 @@ class LogQuery:
         """
         self._db = db
 
+    def _connect(self):
+        """
+        Open a case DB connection with its zstd dictionaries registered.
+
+        Rows decompress lazily after the connection closes, so any
+        dictionary they reference must be loaded up front.
+        """
+        conn = self._db.connect()
+        load_dictionaries(conn)
+        return conn
+
     def _decompress_row(self, row) -> Dict[str, Any]:
         """
-        Convert sqlite3.Row to dict with decompressed fields.
+        Convert sqlite3.Row to dict with lazily decompressed fields.
 
-        Handles backwards compatibility with uncompressed TEXT data.
+        raw_record and audit_data are decompressed to JSON strings on first
+        access (see LazyRow). Handles backwards compatibility with
+        uncompressed TEXT data.
 
         Args:
             row: sqlite3.Row object
 
         Returns:
-            Dict with raw_record and audit_data decompressed to JSON strings
+            LazyRow dict
         """
-        result = dict(row)
-        for col in self._COMPRESSED_COLUMNS:
-            if col in result and result[col] is not None:
-                result[col] = decompress_json(result[col])
-        return result
+        return LazyRow(row, self._COMPRESSED_COLUMNS)
 
-    def activity_by_ip(self, ip: str) -> QueryResult:
+    @staticmethod
+    def _project(select_list: str, columns: Optional[Sequence[str]]) -> Optional[str]:
+        """
+        Restrict a SELECT list to the requested output columns.
+
+        Output names are matched against each expression's alias (or bare
+        column name); for "*" the names are used as table columns directly.
+
+        Args:
+            select_list: Comma-separated SELECT expressions, or "*"
+            columns: Output column names to keep (None = keep all)
+
+        Returns:
+            Projected SELECT list, or None if none of the columns apply
+
+        Raises:
+            ValueError: If a column name is not a plain identifier
+        """
+        if columns is None:
+            return select_list
+
+        for name in columns:
+            if not _IDENTIFIER.match(name):
+                raise ValueError(f"Invalid column name: {name!r}")
+
+        if select_list.strip() == '*':
+            return ', '.join(columns) or None
+
+        expressions = {}
+        for expr in select_list.split(','):
+            expr = ' '.join(expr.split())
+            expressions[_ALIAS_SPLIT.split(expr)[-1]] = expr
+
+        kept = [expressions[name] for name in columns if name in expressions]
+        return ', '.join(kept) or None
+
+    def _fetch(
+        self,
+        conn,
+        select_list: str,
+        rest: str,
+        params: Sequence = (),
+        columns: Optional[Sequence[str]] = None,
+    ) -> QueryResult:
+        """
+        Run "SELECT <projected select_list> <rest>" and wrap rows as LazyRow.
+
+        A source that produces none of the requested columns contributes no
+        rows (and is not queried).
+        """
+        projection = self._project(select_list, columns)
+        if projection is None:
+            return []
+        cursor = conn.execute(f"SELECT {projection} {rest}", params)
+        return [self._decompress_row(row) for row in cursor.fetchall()]
+
+    def activity_by_ip(self, ip: str, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get all activity from a specific IP address across all log types.
 
         Args:
             ip: IP address to search for
+            columns: Optional output columns to fetch (e.g. ["timestamp",
+                "user", "operation"]); raw_record is skipped unless listed
 
         Returns:
             List of activity dicts, sorted chronologically
         """
         results = []
 
-        conn = self._db.connect()
+        conn = self._connect()
 
         # Sign-in logs
-        cursor = conn.execute("""
-            SELECT timestamp, 'sign_in_logs' as source, user_principal_name as user,
-                   'Login' as operation, ip_address, location_country, raw_record
-            FROM sign_in_logs WHERE ip_address = ?
-        """, (ip,))
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'sign_in_logs' as source, user_principal_name as user,
+            'Login' as operation, ip_address, location_country, raw_record
+        """, "FROM sign_in_logs WHERE ip_address = ?", (ip,), columns))
 
         # UAL
-        cursor = conn.execute("""
-            SELECT timestamp, 'unified_audit_log' as source, user_id as user,
-                   operation, client_ip as ip_address, workload, raw_record
-            FROM unified_audit_log WHERE client_ip = ?
-        """, (ip,))
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'unified_audit_log' as source, user_id as user,
+            operation, client_ip as ip_address, workload, raw_record
+        """, "FROM unified_audit_log WHERE client_ip = ?", (ip,), columns))
 
         # Mailbox audit
-        cursor = conn.execute("""
-            SELECT timestamp, 'mailbox_audit_log' as source, user,
-                   operation, client_ip as ip_address, '' as extra, raw_record
-            FROM mailbox_audit_log WHERE client_ip = ?
-        """, (ip,))
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'mailbox_audit_log' as source, user,
+            operation, client_ip as ip_address, '' as extra, raw_record
+        """, "FROM mailbox_audit_log WHERE client_ip = ?", (ip,), columns))
 
         # Inbox rules
-        cursor = conn.execute("""
-            SELECT timestamp, 'inbox_rules' as source, user,
-                   operation, client_ip as ip_address, forward_to, raw_record
-            FROM inbox_rules WHERE client_ip = ?
-        """, (ip,))
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'inbox_rules' as source, user,
+            operation, client_ip as ip_address, forward_to, raw_record
+        """, "FROM inbox_rules WHERE client_ip = ?", (ip,), columns))
 
         conn.close()
 
@@ -153,7 +317,8 @@ class LogQuery:
         self,
         user: str,
         start: Optional[datetime] = None,
-        end: Optional[datetime] = None
+        end: Optional[datetime] = None,
+        columns: Optional[Sequence[str]] = None
     ) -> QueryResult:
         """
         Get all activity for a specific user across all log types.
@@ -162,12 +327,13 @@ class LogQuery:
             user: User email/UPN to search for
             start: Optional start time filter
             end: Optional end time filter
+            columns: Optional output columns to fetch (projection)
 
         Returns:
             List of activity dicts, sorted chronologically
         """
         results = []
-        conn = self._db.connect()
+        conn = self._connect()
 
         # Build time filter clause
         time_filter = ""
@@ -181,13 +347,10 @@ class LogQuery:
             params.append(end.isoformat())
 
         # Sign-in logs
-        cursor = conn.execute(f"""
-            SELECT timestamp, 'sign_in_logs' as source, user_principal_name as user,
-                   'Login' as operation, ip_address, location_country as extra, raw_record
-            FROM sign_in_logs WHERE user_principal_name = ? {time_filter}
-        """, params)
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'sign_in_logs' as source, user_principal_name as user,
+            'Login' as operation, ip_address, location_country as extra, raw_record
+        """, f"FROM sign_in_logs WHERE user_principal_name = ? {time_filter}", params, columns))
 
         # UAL - reset params for user field name difference
         params_ual = [user]
@@ -196,31 +359,22 @@ class LogQuery:
         if end:
             params_ual.append(end.isoformat())
 
-        cursor = conn.execute(f"""
-            SELECT timestamp, 'unified_audit_log' as source, user_id as user,
-                   operation, client_ip as ip_address, workload as extra, raw_record
-            FROM unified_audit_log WHERE user_id = ? {time_filter}
-        """, params_ual)
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'unified_audit_log' as source, user_id as user,
+            operation, client_ip as ip_address, workload as extra, raw_record
+        """, f"FROM unified_audit_log WHERE user_id = ? {time_filter}", params_ual, columns))
 
         # Mailbox audit
-        cursor = conn.execute(f"""
-            SELECT timestamp, 'mailbox_audit_log' as source, user,
-                   operation, client_ip as ip_address, folder_path as extra, raw_record
-            FROM mailbox_audit_log WHERE user = ? {time_filter}
-        """, params_ual)
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'mailbox_audit_log' as source, user,
+            operation, client_ip as ip_address, folder_path as extra, raw_record
+        """, f"FROM mailbox_audit_log WHERE user = ? {time_filter}", params_ual, columns))
 
         # Inbox rules
-        cursor = conn.execute(f"""
-            SELECT timestamp, 'inbox_rules' as source, user,
-                   operation, client_ip as ip_address, forward_to as extra, raw_record
-            FROM inbox_rules WHERE user = ? {time_filter}
-        """, params_ual)
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        results.extend(self._fetch(conn, """
+            timestamp, 'inbox_rules' as source, user,
+            operation, client_ip as ip_address, forward_to as extra, raw_record
+        """, f"FROM inbox_rules WHERE user = ? {time_filter}", params_ual, columns))
 
         conn.close()
 
@@ -229,38 +383,39 @@ class LogQuery:
 
         return results
 
-    def suspicious_operations(self) -> QueryResult:
+    def suspicious_operations(self, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get all high-risk operations from the database.
 
+        Args:
+            columns: Optional output columns to fetch (projection)
+
         Returns:
             List of suspicious operation dicts
         """
         results = []
-        conn = self._db.connect()
+        conn = self._connect()
 
         # Build operation placeholders
         placeholders = ','.join(['?' for _ in SUSPICIOUS_OPERATIONS])
 
         # UAL suspicious operations
-        cursor = conn.execute(f"""
-            SELECT timestamp, 'unified_audit_log' as source, user_id as user,
-                   operation, client_ip as ip_address, workload, audit_data
+        results.extend(self._fetch(conn, """
+            timestamp, 'unified_audit_log' as source, user_id as user,
+            operation, client_ip as ip_address, workload, audit_data
+        """, f"""
             FROM unified_audit_log WHERE operation IN ({placeholders})
             ORDER BY timestamp
-        """, SUSPICIOUS_OPERATIONS)
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        """, SUSPICIOUS_OPERATIONS, columns))
 
         # Inbox rules (all are suspicious by nature)
-        cursor = conn.execute("""
-            SELECT timestamp, 'inbox_rules' as source, user,
-                   operation, client_ip as ip_address, rule_name, forward_to
+        results.extend(self._fetch(conn, """
+            timestamp, 'inbox_rules' as source, user,
+            operation, client_ip as ip_address, rule_name, forward_to
+        """, """
             FROM inbox_rules
             ORDER BY timestamp
-        """)
-        for row in cursor.fetchall():
-            results.append(self._decompress_row(row))
+        """, (), columns))
 
         conn.close()
 
@@ -269,50 +424,54 @@ class LogQuery:
 
         return results
 
-    def inbox_rules_summary(self) -> QueryResult:
+    def inbox_rules_summary(self, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get summary of all inbox rule changes.
 
+        Args:
+            columns: Optional output columns to fetch (projection)
+
         Returns:
             List of inbox rule dicts with forwarding targets
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        cursor = conn.execute("""
-            SELECT timestamp, user, operation, rule_name, rule_id,
-                   forward_to, forward_as_attachment_to, redirect_to,
-                   delete_message, move_to_folder, client_ip
+        results = self._fetch(conn, """
+            timestamp, user, operation, rule_name, rule_id,
+            forward_to, forward_as_attachment_to, redirect_to,
+            delete_message, move_to_folder, client_ip
+        """, """
             FROM inbox_rules
             ORDER BY timestamp
-        """)
-
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
+        """, (), columns)
         conn.close()
 
         return results
 
-    def oauth_consents_summary(self) -> QueryResult:
+    def oauth_consents_summary(self, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get summary of all OAuth app consents.
 
+        Args:
+            columns: Optional output columns to fetch (projection)
+
         Returns:
             List of OAuth consent dicts with risk scores
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        cursor = conn.execute("""
-            SELECT timestamp, user_principal_name, app_id, app_display_name,
-                   permissions, consent_type, client_ip, risk_score
+        results = self._fetch(conn, """
+            timestamp, user_principal_name, app_id, app_display_name,
+            permissions, consent_type, client_ip, risk_score
+        """, """
             FROM oauth_consents
             ORDER BY timestamp
-        """)
-
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
+        """, (), columns)
         conn.close()
 
         return results
 
-    def legacy_auth_by_user(self, user: str) -> QueryResult:
+    def legacy_auth_by_user(self, user: str, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get legacy auth attempts for user.
 
@@ -325,6 +484,7 @@ class LogQuery:
             user: User email/UPN. Supports SQL LIKE wildcards (%) for pattern
                   matching. If the string contains '%', a LIKE query is used;
                   otherwise an exact match is performed.
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of legacy auth records, sorted by timestamp descending
@@ -339,66 +499,63 @@ class LogQuery:
             # Users with 'admin' in name
             query.legacy_auth_by_user('%admin%')
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        if '%' in user:
-            cursor = conn.execute("""
-                SELECT * FROM legacy_auth_logs
-                WHERE user_principal_name LIKE ?
-                ORDER BY timestamp DESC
-            """, (user,))
-        else:
-            cursor = conn.execute("""
-                SELECT * FROM legacy_auth_logs
-                WHERE user_principal_name = ?
-                ORDER BY timestamp DESC
-            """, (user,))
+        operator = 'LIKE' if '%' in user else '='
+        results = self._fetch(conn, "*", f"""
+            FROM legacy_auth_logs
+            WHERE user_principal_name {operator} ?
+            ORDER BY timestamp DESC
+        """, (user,), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def legacy_auth_by_ip(self, ip: str) -> QueryResult:
+    def legacy_auth_by_ip(self, ip: str, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get legacy auth attempts from IP address.
 
         Args:
             ip: IP address to search for
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of legacy auth records
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        cursor = conn.execute("""
-            SELECT * FROM legacy_auth_logs
+        results = self._fetch(conn, "*", """
+            FROM legacy_auth_logs
             WHERE ip_address = ?
             ORDER BY timestamp DESC
-        """, (ip,))
+        """, (ip,), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def legacy_auth_by_client_app(self, client_app: str) -> QueryResult:
+    def legacy_auth_by_client_app(
+        self,
+        client_app: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> QueryResult:
         """
         Get legacy auth attempts by client app type.
 
         Args:
             client_app: Client app (e.g., 'Authenticated SMTP', 'IMAP4', 'POP3')
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of legacy auth records
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        cursor = conn.execute("""
-            SELECT * FROM legacy_auth_logs
+        results = self._fetch(conn, "*", """
+            FROM legacy_auth_logs
             WHERE client_app_used = ?
             ORDER BY timestamp DESC
-        """, (client_app,))
+        """, (client_app,), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
@@ -409,7 +566,7 @@ class LogQuery:
         Returns:
             Dict with summary statistics
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
         # Total events
         cursor = conn.execute("SELECT COUNT(*) FROM legacy_auth_logs")
@@ -447,87 +604,94 @@ class LogQuery:
             'unique_users': unique_users
         }
 
-    def password_status(self, user: Optional[str] = None) -> QueryResult:
+    def password_status(
+        self,
+        user: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> QueryResult:
         """
         Get password status, optionally filtered by user.
 
         Args:
             user: Optional user email/UPN to filter by
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of password status records
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
         if user:
-            cursor = conn.execute("""
-                SELECT * FROM password_status
+            results = self._fetch(conn, "*", """
+                FROM password_status
                 WHERE user_principal_name = ?
-            """, (user,))
+            """, (user,), columns)
         else:
-            cursor = conn.execute("""
-                SELECT * FROM password_status
+            results = self._fetch(conn, "*", """
+                FROM password_status
                 ORDER BY days_since_change DESC
-            """)
+            """, (), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def stale_passwords(self, days: int = 90, enabled_only: bool = False) -> QueryResult:
+    def stale_passwords(
+        self,
+        days: int = 90,
+        enabled_only: bool = False,
+        columns: Optional[Sequence[str]] = None
+    ) -> QueryResult:
         """
         Get accounts with passwords older than N days.
 
         Args:
             days: Threshold for stale passwords (default 90)
             enabled_only: If True, only return enabled accounts
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of password status records, sorted by age (oldest first)
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        if enabled_only:
-            cursor = conn.execute("""
-                SELECT * FROM password_status
-                WHERE days_since_change > ?
-                  AND account_enabled = 'True'
-                ORDER BY days_since_change DESC
-            """, (days,))
-        else:
-            cursor = conn.execute("""
-                SELECT * FROM password_status
-                WHERE days_since_change > ?
-                ORDER BY days_since_change DESC
-            """, (days,))
+        enabled_filter = "AND account_enabled = 'True'" if enabled_only else ""
+        results = self._fetch(conn, "*", f"""
+            FROM password_status
+            WHERE days_since_change > ?
+              {enabled_filter}
+            ORDER BY days_since_change DESC
+        """, (days,), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def entra_audit_by_user(self, user: str) -> QueryResult:
+    def entra_audit_by_user(self, user: str, columns: Optional[Sequence[str]] = None) -> QueryResult:
         """
         Get Entra ID audit events for a user (as target or initiator).
 
         Args:
             user: User email/UPN to search for
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of Entra audit records, sorted by timestamp descending
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        cursor = conn.execute("""
-            SELECT * FROM entra_audit_log
+        results = self._fetch(conn, "*", """
+            FROM entra_audit_log
             WHERE target = ? OR initiated_by = ?
             ORDER BY timestamp DESC
-        """, (user, user))
+        """, (user, user), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def entra_audit_by_activity(self, activity: str) -> QueryResult:
+    def entra_audit_by_activity(
+        self,
+        activity: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> QueryResult:
         """
         Get Entra audit events by activity type.
 
@@ -536,86 +700,88 @@ class LogQuery:
         Args:
             activity: Activity name (e.g., 'Update device')
                       Use % for LIKE matching (e.g., '%password%')
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of Entra audit records, sorted by timestamp descending
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
-        if '%' in activity:
-            cursor = conn.execute("""
-                SELECT * FROM entra_audit_log
-                WHERE activity LIKE ?
-                ORDER BY timestamp DESC
-            """, (activity,))
-        else:
-            cursor = conn.execute("""
-                SELECT * FROM entra_audit_log
-                WHERE activity = ?
-                ORDER BY timestamp DESC
-            """, (activity,))
+        operator = 'LIKE' if '%' in activity else '='
+        results = self._fetch(conn, "*", f"""
+            FROM entra_audit_log
+            WHERE activity {operator} ?
+            ORDER BY timestamp DESC
+        """, (activity,), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def password_changes(self, user: str = None) -> QueryResult:
+    def password_changes(
+        self,
+        user: str = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> QueryResult:
         """
         Get password-related Entra audit events.
 
         Args:
             user: Optional user to filter by (as target or initiator)
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of password change events, sorted by timestamp descending
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
         if user:
-            cursor = conn.execute("""
-                SELECT * FROM entra_audit_log
+            results = self._fetch(conn, "*", """
+                FROM entra_audit_log
                 WHERE (activity LIKE '%password%' OR activity LIKE '%PasswordProfile%')
                   AND (target = ? OR initiated_by = ?)
                 ORDER BY timestamp DESC
-            """, (user, user))
+            """, (user, user), columns)
         else:
-            cursor = conn.execute("""
-                SELECT * FROM entra_audit_log
+            results = self._fetch(conn, "*", """
+                FROM entra_audit_log
                 WHERE activity LIKE '%password%' OR activity LIKE '%PasswordProfile%'
                 ORDER BY timestamp DESC
-            """)
+            """, (), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
-    def role_changes(self, user: str = None) -> QueryResult:
+    def role_changes(
+        self,
+        user: str = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> QueryResult:
         """
         Get role assignment Entra audit events.
 
         Args:
             user: Optional user to filter by (as target)
+            columns: Optional table columns to fetch (default: all)
 
         Returns:
             List of role change events, sorted by timestamp descending
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
         if user:
-            cursor = conn.execute("""
-                SELECT * FROM entra_audit_log
+            results = self._fetch(conn, "*", """
+                FROM entra_audit_log
                 WHERE activity LIKE '%role%'
                   AND target = ?
                 ORDER BY timestamp DESC
-            """, (user,))
+            """, (user,), columns)
         else:
-            cursor = conn.execute("""
-                SELECT * FROM entra_audit_log
+            results = self._fetch(conn, "*", """
+                FROM entra_audit_log
                 WHERE activity LIKE '%role%'
                 ORDER BY timestamp DESC
-            """)
+            """, (), columns)
 
-        results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
         return results
 
@@ -626,7 +792,7 @@ class LogQuery:
         Returns:
             Dict with summary statistics including total_events, by_activity, by_result
         """
-        conn = self._db.connect()
+        conn = self._connect()
 
         # Total events
         cursor = conn.execute("SELECT COUNT(*) FROM entra_audit_log")
@@ -670,7 +836,7 @@ class LogQuery:
         Returns:
             List of result dicts
         """
-        conn = self._db.connect()
+        conn = self._connect()
         cursor = conn.execute(sql, params)
         results = [self._decompress_row(row) for row in cursor.fetchall()]
         conn.close()
@@ -694,7 +860,7 @@ class LogQuery:
             List of unified result dicts with source indicator
         """
         results = []
-        conn = self._db.connect()
+        conn = self._connect()
 
         # Table-specific column mappings for unified output
         table_queries = {
@@ -43,6 +43,11 @@ Usage:
     python3 m365_ir_cli.py stats PIR-SGS-11111111
     python3 m365_ir_cli.py list
 
+    # Columnar analytics (requires pyarrow)
+    python3 m365_ir_cli.py export-parquet PIR-SGS-11111111
+    python3 m365_ir_cli.py columnar-quality PIR-SGS-11111111 --table sign_in_logs --field conditional_access_status
+    python3 m365_ir_cli.py columnar-quality PIR-SGS-11111111 --verify-sign-in
+
 Author: Maia System
 Created: 2025-12-18 (Phase 225)
 Updated: 2025-01-05 (Phase 226 - Database commands)
@@ -78,6 +83,7 @@ from claude.tools.m365_ir.account_validator import AccountValidator, ValidationE
 # Phase 241 - Auth Verifier
 from claude.tools.m365_ir.auth_verifier import (
     verify_auth_status,
+    verify_sign_in_status,
     STATUS_CODE_DESCRIPTIONS
 )
 
@@ -90,6 +96,14 @@ from claude.tools.m365_ir.duplicate_handler import (
 )
 from claude.tools.m365_ir.migrations.backfill_risk_levels import backfill_risk_levels
 
+# Columnar analytics (Parquet snapshots)
+from claude.tools.m365_ir.columnar_export import (
+    PARQUET_DIRNAME,
+    ColumnarAnalytics,
+    export_case_parquet,
+    is_snapshot_current,
+)
+
 
 class M365IRAnalyzer:
     """
@@ -146,18 +160,12 @@ class M365IRAnalyzer:
         self.signin_entries = self.parser.merge_exports(export_paths, LogType.SIGNIN)
         print(f"  Sign-in logs: {len(self.signin_entries)} entries")
 
-        # Load other log types
-        for export in export_paths:
-            discovered = self.parser.discover_log_files(export)
-
-            if LogType.AUDIT in discovered:
-                self.audit_entries.extend(self.parser.parse_audit_logs(discovered[LogType.AUDIT]))
-
-            if LogType.MAILBOX_AUDIT in discovered:
-                self.mailbox_entries.extend(self.parser.parse_mailbox_audit(discovered[LogType.MAILBOX_AUDIT]))
-
-            if LogType.LEGACY_AUTH in discovered:
-                self.legacy_entries.extend(self.parser.parse_legacy_auth(discovered[LogType.LEGACY_AUTH]))
+        # Load other log types. analyze() reads audit logs twice (remediation,
+        # timeline) and legacy auth twice (anomalies, IOCs), so these stay
+        # materialised; single-pass tools stream via parser.iter_exports
+        self.audit_entries = list(self.parser.iter_exports(export_paths, LogType.AUDIT))
+        self.mailbox_entries = list(self.parser.iter_exports(export_paths, LogType.MAILBOX_AUDIT))
+        self.legacy_entries = list(self.parser.iter_exports(export_paths, LogType.LEGACY_AUTH))
 
         print(f"  Audit logs: {len(self.audit_entries)} entries")
         print(f"  Mailbox audit: {len(self.mailbox_entries)} entries")
@@ -451,10 +459,18 @@ def cmd_import(args):
     print(f"Database: {db_path}")
 
     # Import logs
-    importer = LogImporter(db)
+    importer = LogImporter(db, codec=getattr(args, 'codec', 'zlib'))
     print(f"\nImporting from: {import_source}")
 
-    results = importer.import_all(import_source)
+    parallel = getattr(args, 'parallel', False)
+    results = importer.import_all(
+        import_source,
+        parallel=parallel,
+        max_workers=getattr(args, 'workers', None)
+    )
+
+    if parallel and importer.last_import_report:
+        print(f"\n{importer.last_import_report.format()}")
 
     print(f"\nImport Results:")
     total_imported = 0
@@ -961,7 +977,7 @@ def cmd_identify_duplicates(args):
 
     try:
         # Run identification (returns list of DuplicateGroup objects)
-        duplicate_groups = identify_duplicates(str(db.db_path))
+        duplicate_groups = identify_duplicates(str(db.db_path), incremental=args.incremental)
 
         # Calculate stats
         total_groups = len(duplicate_groups)
@@ -1020,9 +1036,12 @@ def cmd_merge_duplicates(args):
 
     try:
         # Identify duplicates first (returns list of DuplicateGroup objects)
-        duplicate_groups = identify_duplicates(str(db.db_path))
+        duplicate_groups = identify_duplicates(str(db.db_path), incremental=args.incremental)
 
         if len(duplicate_groups) == 0:
+            if not args.dry_run:
+                # Advance the merge watermark so the next --incremental run starts here
+                merge_duplicates(str(db.db_path), incremental=args.incremental)
             print("✅ No duplicates found! Nothing to merge.")
             return 0
 
@@ -1039,7 +1058,8 @@ def cmd_merge_duplicates(args):
             print()
 
         # Run merge
-        merge_result = merge_duplicates(str(db.db_path), dry_run=args.dry_run)
+        merge_result = merge_duplicates(str(db.db_path), dry_run=args.dry_run,
+                                        incremental=args.incremental)
 
         print(f"Merge Results:")
         print(f"  Groups processed: {merge_result['groups_processed']}")
@@ -1125,6 +1145,83 @@ def cmd_backfill_risk_levels(args):
         return 1
 
 
+def cmd_export_parquet(args):
+    """
+    Handle export-parquet command - snapshot log tables to day-partitioned Parquet.
+    """
+    db = IRLogDatabase(case_id=args.case_id, base_path=args.base_path)
+
+    if not db.exists:
+        print(f"❌ Case not found: {args.case_id}")
+        return 1
+
+    try:
+        result = export_case_parquet(db, tables=args.tables, include_raw=args.include_raw)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\nParquet export: {args.case_id}")
+    print("-" * 60)
+    for table, export in result.tables.items():
+        print(f"  {table:25} {export.rows:>10,} rows  {export.partitions:>4} days")
+    print("-" * 60)
+    print(f"  {result.total_rows:,} rows in {result.duration_seconds:.1f}s -> {result.output_dir}")
+    return 0
+
+
+def cmd_columnar_quality(args):
+    """
+    Handle columnar-quality command - data quality checks over the Parquet snapshot.
+    """
+    db = IRLogDatabase(case_id=args.case_id, base_path=args.base_path)
+
+    if not db.exists:
+        print(f"❌ Case not found: {args.case_id}")
+        return 1
+
+    try:
+        if args.refresh or not is_snapshot_current(db, table=args.table):
+            print("Parquet snapshot missing or stale - exporting...")
+            export_case_parquet(db, tables=[args.table])
+        analytics = ColumnarAnalytics(db.db_path.parent / PARQUET_DIRNAME)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
+
+    report = analytics.table_quality(args.table)
+    print(f"\nColumnar quality: {args.table} ({report.total_records:,} rows)")
+    print(f"  Overall score:     {report.overall_quality_score:.2f}")
+    print(f"  Reliable fields:   {', '.join(report.reliable_fields) or '-'}")
+    print(f"  Unreliable fields: {', '.join(report.unreliable_fields) or '-'}")
+    for warning in report.warnings:
+        print(f"  ⚠️  {warning}")
+
+    if args.field:
+        print(f"\n{args.field} distribution:")
+        for value, count in analytics.value_distribution(args.table, args.field, limit=args.limit).items():
+            print(f"  {str(value):40} {count:>10,}")
+
+    if args.verify_sign_in:
+        if args.table != 'sign_in_logs' and not is_snapshot_current(db, table='sign_in_logs'):
+            print("Parquet snapshot of sign_in_logs missing or stale - exporting...")
+            export_case_parquet(db, tables=['sign_in_logs'])
+            analytics = ColumnarAnalytics(db.db_path.parent / PARQUET_DIRNAME)
+        try:
+            summary = verify_sign_in_status(str(db.db_path), analytics=analytics)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"\nSign-in verification ({summary.status_field_used}):")
+        print(f"  Success: {summary.success_count:,}  Failure: {summary.failure_count:,}  "
+              f"({summary.success_rate:.1f}% success)")
+        print(f"  Foreign success: {summary.foreign_success_count:,} "
+              f"({summary.foreign_success_rate:.1f}%) - {summary.alert_severity}")
+        for warning in summary.warnings:
+            print(f"  ⚠️  {warning}")
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="M365 Incident Response Analyzer",
@@ -1191,6 +1288,9 @@ Examples:
     import_parser.add_argument("--customer", "-c", help="Customer name (used for auto-generated case ID)")
     import_parser.add_argument("--ticket", "-t", help="Ticket reference number (e.g., 11111111). Creates PIR-CUSTOMER-TICKET format instead of date-based")
     import_parser.add_argument("--base-path", default=db_base_path, help=f"Base path for case databases (default: {db_base_path})")
+    import_parser.add_argument("--parallel", action="store_true", help="Parse large exports in a process pool with a single DB writer")
+    import_parser.add_argument("--workers", type=int, help="Process pool size for --parallel (default: CPU count)")
+    import_parser.add_argument("--codec", choices=["zlib", "zstd"], default="zlib", help="raw_record compression for sign-in/UAL: zstd trains a per-table dictionary (requires zstandard; sequential import only)")
 
     # Query command (Phase 226)
     query_parser = subparsers.add_parser("query", help="Query case database")
@@ -1257,6 +1357,8 @@ Examples:
     identify_duplicates_parser.add_argument("case_id", help="Case identifier")
     identify_duplicates_parser.add_argument("--limit", type=int, default=20,
                                            help="Number of groups to display (default: 20)")
+    identify_duplicates_parser.add_argument("--incremental", action="store_true",
+                                           help="Only examine rows imported since the last merge")
     identify_duplicates_parser.add_argument("--verbose", "-v", action="store_true",
                                            help="Show detailed error traces")
     identify_duplicates_parser.add_argument("--base-path", default=db_base_path,
@@ -1270,6 +1372,8 @@ Examples:
                                         help="Skip confirmation prompt")
     merge_duplicates_parser.add_argument("--dry-run", action="store_true",
                                         help="Show what would be merged without making changes")
+    merge_duplicates_parser.add_argument("--incremental", action="store_true",
+                                        help="Only examine rows imported since the last merge")
     merge_duplicates_parser.add_argument("--verbose", "-v", action="store_true",
                                         help="Show detailed error traces")
     merge_duplicates_parser.add_argument("--base-path", default=db_base_path,
@@ -1284,6 +1388,33 @@ Examples:
     backfill_risk_levels_parser.add_argument("--base-path", default=db_base_path,
                                              help=f"Base path for case databases")
 
+    # Export-parquet command (columnar analytics)
+    export_parquet_parser = subparsers.add_parser("export-parquet",
+                                                  help="Snapshot log tables to day-partitioned Parquet")
+    export_parquet_parser.add_argument("case_id", help="Case identifier")
+    export_parquet_parser.add_argument("--tables", nargs="+",
+                                       help="Tables to export (default: all log tables)")
+    export_parquet_parser.add_argument("--include-raw", action="store_true",
+                                       help="Also export raw_record/audit_data BLOB columns")
+    export_parquet_parser.add_argument("--base-path", default=db_base_path,
+                                       help=f"Base path for case databases")
+
+    # Columnar-quality command (columnar analytics)
+    columnar_quality_parser = subparsers.add_parser("columnar-quality",
+                                                    help="Data quality checks over the Parquet snapshot")
+    columnar_quality_parser.add_argument("case_id", help="Case identifier")
+    columnar_quality_parser.add_argument("--table", default="sign_in_logs",
+                                         help="Table to check (default: sign_in_logs)")
+    columnar_quality_parser.add_argument("--field", help="Also show this field's value distribution")
+    columnar_quality_parser.add_argument("--limit", type=int, default=20,
+                                         help="Distribution rows to show (default: 20)")
+    columnar_quality_parser.add_argument("--refresh", action="store_true",
+                                         help="Re-export the table even if the snapshot is current")
+    columnar_quality_parser.add_argument("--verify-sign-in", action="store_true",
+                                         help="Also run the sign-in auth verification over the snapshot")
+    columnar_quality_parser.add_argument("--base-path", default=db_base_path,
+                                         help=f"Base path for case databases")
+
     args = parser.parse_args()
 
     if args.command == "analyze":
@@ -1338,6 +1469,12 @@ Examples:
     elif args.command == "backfill-risk-levels":
         sys.exit(cmd_backfill_risk_levels(args))
 
+    elif args.command == "export-parquet":
+        sys.exit(cmd_export_parquet(args))
+
+    elif args.command == "columnar-quality":
+        sys.exit(cmd_columnar_quality(args))
+
     else:
         parser.print_help()
 
@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Iterator
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -82,7 +82,7 @@ LOG_FILE_PATTERNS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class SignInLogEntry:
     """Sign-in log entry"""
     created_datetime: datetime
@@ -159,7 +159,7 @@ class SignInLogEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """Audit log entry"""
     activity_datetime: datetime
@@ -177,7 +177,7 @@ class AuditLogEntry:
         ))
 
 
-@dataclass
+@dataclass(slots=True)
 class MailboxAuditEntry:
     """Mailbox audit log entry with parsed JSON"""
     creation_date: datetime
@@ -202,7 +202,7 @@ class MailboxAuditEntry:
         ))
 
 
-@dataclass
+@dataclass(slots=True)
 class LegacyAuthEntry:
     """Legacy authentication log entry"""
     created_datetime: datetime
@@ -227,7 +227,7 @@ class LegacyAuthEntry:
         ))
 
 
-@dataclass
+@dataclass(slots=True)
 class MailboxDelegationEntry:
     """
     Mailbox delegation entry - access permissions mapping.
@@ -254,7 +254,7 @@ class MailboxDelegationEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminRoleAssignmentEntry:
     """
     Admin role assignment entry - privileged access mapping.
@@ -279,7 +279,7 @@ class AdminRoleAssignmentEntry:
         return self.role_id == other.role_id and self.member_id == other.member_id
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceManifestEntry:
     """
     Evidence manifest entry - chain of custody metadata.
@@ -311,7 +311,7 @@ class EvidenceManifestEntry:
         return {f['FileName']: f['Records'] for f in self.files}
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportRuleEntry:
     """
     Exchange Transport Rule entry.
@@ -352,7 +352,7 @@ class TransportRuleEntry:
         return self.name == other.name
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalAccessPolicyEntry:
     """
     Conditional Access Policy entry.
@@ -379,7 +379,7 @@ class ConditionalAccessPolicyEntry:
         return self.policy_id == other.policy_id
 
 
-@dataclass
+@dataclass(slots=True)
 class NamedLocationEntry:
     """
     Named Location entry - geographic/IP-based access control.
@@ -405,7 +405,7 @@ class NamedLocationEntry:
         return self.location_id == other.location_id
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationRegistrationEntry:
     """
     Application Registration entry - Entra ID app registrations.
@@ -433,7 +433,7 @@ class ApplicationRegistrationEntry:
         return self.app_id == other.app_id
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicePrincipalEntry:
     """
     Service Principal entry - enterprise applications.
@@ -690,7 +690,21 @@ class M365LogParser:
         Returns:
             List of SignInLogEntry objects
         """
-        entries = []
+        return list(self.iter_signin_logs(csv_path))
+
+    def iter_signin_logs(self, csv_path: Union[str, Path]) -> Iterator[SignInLogEntry]:
+        """
+        Stream sign-in logs CSV (generator form of parse_signin_logs()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            SignInLogEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0  # Reset error counter
 
@@ -719,14 +733,12 @@ class M365LogParser:
                         risk_level_aggregated=row.get('RiskLevelAggregated', ''),
                         conditional_access_status=row.get('ConditionalAccessStatus', ''),
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed signin row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_with_schema(
         self,
         csv_path: Union[str, Path],
@@ -736,6 +748,9 @@ class M365LogParser:
         """
         Parse sign-in logs using schema-aware field mappings (Phase 264).
 
+        Materialises iter_with_schema() into a list. Prefer iter_with_schema()
+        for large exports so rows can be consumed without holding the full file.
+
         Auto-detects schema if not provided. Handles all 5 schema variants:
         - LEGACY_PORTAL
         - GRAPH_INTERACTIVE
@@ -755,6 +770,29 @@ class M365LogParser:
             parser = M365LogParser()
             entries = parser.parse_with_schema("InteractiveSignIns.csv")
         """
+        return list(self.iter_with_schema(csv_path, schema_definition, filename))
+
+    def iter_with_schema(
+        self,
+        csv_path: Union[str, Path],
+        schema_definition=None,
+        filename: str = None
+    ) -> Iterator[SignInLogEntry]:
+        """
+        Stream sign-in log entries using schema-aware field mappings.
+
+        Generator form of parse_with_schema(): yields one SignInLogEntry per
+        parseable row, so memory stays flat regardless of export size.
+        last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to sign-in logs CSV
+            schema_definition: Optional schema definition (auto-detected if None)
+            filename: Optional filename hint for schema detection
+
+        Yields:
+            SignInLogEntry objects with schema tracking
+        """
         from claude.tools.m365_ir.schema_registry import (
             detect_schema_variant,
             detect_signin_type_from_filename,
@@ -762,7 +800,6 @@ class M365LogParser:
         )
 
         csv_path = Path(csv_path)
-        entries = []
         self.last_parse_errors = 0
 
         # Auto-detect schema if not provided
@@ -778,13 +815,12 @@ class M365LogParser:
             for row_num, row in enumerate(reader, start=2):
                 try:
                     entry = self._parse_row_with_schema(row, schema_definition)
-                    if entry:
-                        entries.append(entry)
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped row {row_num} in schema-aware parsing: {e}")
-
-        return entries
+                    continue
+                if entry:
+                    yield entry
 
     def _read_csv_headers(self, csv_path: Path) -> List[str]:
         """
@@ -997,7 +1033,21 @@ class M365LogParser:
         Returns:
             List of MailboxAuditEntry objects
         """
-        entries = []
+        return list(self.iter_mailbox_audit(csv_path))
+
+    def iter_mailbox_audit(self, csv_path: Union[str, Path]) -> Iterator[MailboxAuditEntry]:
+        """
+        Stream mailbox audit logs CSV (generator form of parse_mailbox_audit()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            MailboxAuditEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0  # Reset error counter
 
@@ -1041,14 +1091,12 @@ class M365LogParser:
                         folders=folders,
                         subjects=subjects,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed mailbox audit row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_legacy_auth(self, csv_path: Union[str, Path]) -> List[LegacyAuthEntry]:
         """
         Parse legacy authentication logs CSV.
@@ -1059,7 +1107,21 @@ class M365LogParser:
         Returns:
             List of LegacyAuthEntry objects
         """
-        entries = []
+        return list(self.iter_legacy_auth(csv_path))
+
+    def iter_legacy_auth(self, csv_path: Union[str, Path]) -> Iterator[LegacyAuthEntry]:
+        """
+        Stream legacy authentication logs CSV (generator form of parse_legacy_auth()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            LegacyAuthEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0  # Reset error counter
 
@@ -1084,14 +1146,12 @@ class M365LogParser:
                         failure_reason=row.get('FailureReason', ''),
                         conditional_access_status=row.get('ConditionalAccessStatus', ''),
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed legacy auth row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_audit_logs(self, csv_path: Union[str, Path]) -> List[AuditLogEntry]:
         """
         Parse audit logs CSV.
@@ -1102,7 +1162,21 @@ class M365LogParser:
         Returns:
             List of AuditLogEntry objects
         """
-        entries = []
+        return list(self.iter_audit_logs(csv_path))
+
+    def iter_audit_logs(self, csv_path: Union[str, Path]) -> Iterator[AuditLogEntry]:
+        """
+        Stream audit logs CSV (generator form of parse_audit_logs()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            AuditLogEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0  # Reset error counter
 
@@ -1121,14 +1195,12 @@ class M365LogParser:
                         result=row.get('Result', ''),
                         result_reason=row.get('ResultReason', ''),
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed audit row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_transport_rules(self, csv_path: Union[str, Path]) -> List[TransportRuleEntry]:
         """
         Parse Exchange Transport Rules CSV.
@@ -1147,7 +1219,21 @@ class M365LogParser:
             BlindCopyTo, CopyTo, RedirectMessageTo, DeleteMessage,
             ModifySubject, SetSCL, Conditions, Exceptions, WhenChanged, Comments
         """
-        entries = []
+        return list(self.iter_transport_rules(csv_path))
+
+    def iter_transport_rules(self, csv_path: Union[str, Path]) -> Iterator[TransportRuleEntry]:
+        """
+        Stream Exchange Transport Rules CSV (generator form of parse_transport_rules()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            TransportRuleEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1198,14 +1284,12 @@ class M365LogParser:
                         comments=row.get('Comments', ''),
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed transport rule row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_evidence_manifest(self, json_path: Union[str, Path]) -> EvidenceManifestEntry:
         """
         Parse evidence manifest JSON file.
@@ -1273,7 +1357,23 @@ class M365LogParser:
         Returns:
             List of MailboxDelegationEntry objects
         """
-        entries = []
+        return list(self.iter_mailbox_delegations(csv_path))
+
+    def iter_mailbox_delegations(
+        self, csv_path: Union[str, Path]
+    ) -> Iterator[MailboxDelegationEntry]:
+        """
+        Stream mailbox delegations CSV (generator form of parse_mailbox_delegations()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            MailboxDelegationEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1292,14 +1392,12 @@ class M365LogParser:
                         is_inherited=is_inherited,
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed delegation row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_admin_role_assignments(
         self, csv_path: Union[str, Path]
     ) -> List[AdminRoleAssignmentEntry]:
@@ -1315,7 +1413,23 @@ class M365LogParser:
         Returns:
             List of AdminRoleAssignmentEntry objects
         """
-        entries = []
+        return list(self.iter_admin_role_assignments(csv_path))
+
+    def iter_admin_role_assignments(
+        self, csv_path: Union[str, Path]
+    ) -> Iterator[AdminRoleAssignmentEntry]:
+        """
+        Stream admin role assignments CSV (generator form of parse_admin_role_assignments()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            AdminRoleAssignmentEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1335,14 +1449,12 @@ class M365LogParser:
                         member_type=row.get('MemberType', ''),
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed admin role row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_conditional_access_policies(
         self, csv_path: Union[str, Path]
     ) -> List[ConditionalAccessPolicyEntry]:
@@ -1358,7 +1470,23 @@ class M365LogParser:
         Returns:
             List of ConditionalAccessPolicyEntry objects
         """
-        entries = []
+        return list(self.iter_conditional_access_policies(csv_path))
+
+    def iter_conditional_access_policies(
+        self, csv_path: Union[str, Path]
+    ) -> Iterator[ConditionalAccessPolicyEntry]:
+        """
+        Stream Conditional Access Policies CSV (generator form of parse_conditional_access_policies()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            ConditionalAccessPolicyEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1396,14 +1524,12 @@ class M365LogParser:
                         session_controls=row.get('SessionControls', '{}'),
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed CA policy row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_named_locations(
         self, csv_path: Union[str, Path]
     ) -> List[NamedLocationEntry]:
@@ -1418,7 +1544,23 @@ class M365LogParser:
         Returns:
             List of NamedLocationEntry objects
         """
-        entries = []
+        return list(self.iter_named_locations(csv_path))
+
+    def iter_named_locations(
+        self, csv_path: Union[str, Path]
+    ) -> Iterator[NamedLocationEntry]:
+        """
+        Stream Named Locations CSV (generator form of parse_named_locations()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            NamedLocationEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1459,14 +1601,12 @@ class M365LogParser:
                         countries_and_regions=row.get('CountriesAndRegions', ''),
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed named location row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_application_registrations(
         self, csv_path: Union[str, Path]
     ) -> List[ApplicationRegistrationEntry]:
@@ -1482,7 +1622,23 @@ class M365LogParser:
         Returns:
             List of ApplicationRegistrationEntry objects
         """
-        entries = []
+        return list(self.iter_application_registrations(csv_path))
+
+    def iter_application_registrations(
+        self, csv_path: Union[str, Path]
+    ) -> Iterator[ApplicationRegistrationEntry]:
+        """
+        Stream Application Registrations CSV (generator form of parse_application_registrations()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            ApplicationRegistrationEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1514,14 +1670,12 @@ class M365LogParser:
                         web_redirect_uris=row.get('Web_RedirectUris', ''),
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed app registration row {row_num}: {e}")
                     continue
 
-        return entries
-
     def parse_service_principals(
         self, csv_path: Union[str, Path]
     ) -> List[ServicePrincipalEntry]:
@@ -1536,7 +1690,23 @@ class M365LogParser:
         Returns:
             List of ServicePrincipalEntry objects
         """
-        entries = []
+        return list(self.iter_service_principals(csv_path))
+
+    def iter_service_principals(
+        self, csv_path: Union[str, Path]
+    ) -> Iterator[ServicePrincipalEntry]:
+        """
+        Stream Service Principals CSV (generator form of parse_service_principals()).
+
+        Yields entries one row at a time so large exports never need to be
+        held in memory. last_parse_errors is reset when iteration starts.
+
+        Args:
+            csv_path: Path to the CSV export
+
+        Yields:
+            ServicePrincipalEntry objects
+        """
         csv_path = Path(csv_path)
         self.last_parse_errors = 0
 
@@ -1570,14 +1740,12 @@ class M365LogParser:
                         tags=row.get('Tags', ''),
                         raw_record=raw_record,
                     )
-                    entries.append(entry)
+                    yield entry
                 except Exception as e:
                     self.last_parse_errors += 1
                     logger.debug(f"Skipped malformed service principal row {row_num}: {e}")
                     continue
 
-        return entries
-
     def discover_log_files(self, export_path: Union[str, Path]) -> Dict[LogType, Path]:
         """
         Discover log files in export directory.
@@ -1601,44 +1769,60 @@ class M365LogParser:
 
         return discovered
 
-    def merge_exports(
+    def iter_exports(
         self,
         export_paths: List[Union[str, Path]],
         log_type: LogType
-    ) -> List[Any]:
+    ) -> Iterator[Any]:
         """
-        Merge log entries from multiple exports with deduplication.
+        Stream log entries from multiple exports, one row at a time.
+
+        No deduplication or sorting, so nothing is materialised - use for
+        single-pass consumers (detectors, extractors). Use merge_exports
+        when overlapping exports must be deduplicated.
 
         Args:
             export_paths: List of export directory paths
-            log_type: Type of log to merge
+            log_type: Type of log to stream
 
-        Returns:
-            Deduplicated, chronologically sorted list of entries
+        Yields:
+            Entries in export/file order
         """
-        all_entries = []
-
-        parse_method = {
-            LogType.SIGNIN: self.parse_signin_logs,
-            LogType.MAILBOX_AUDIT: self.parse_mailbox_audit,
-            LogType.LEGACY_AUTH: self.parse_legacy_auth,
-            LogType.AUDIT: self.parse_audit_logs,
-            LogType.TRANSPORT_RULES: self.parse_transport_rules,
+        iter_method = {
+            LogType.SIGNIN: self.iter_signin_logs,
+            LogType.MAILBOX_AUDIT: self.iter_mailbox_audit,
+            LogType.LEGACY_AUTH: self.iter_legacy_auth,
+            LogType.AUDIT: self.iter_audit_logs,
+            LogType.TRANSPORT_RULES: self.iter_transport_rules,
         }.get(log_type)
 
-        if not parse_method:
+        if not iter_method:
             raise ValueError(f"Unsupported log type for merging: {log_type}")
 
         for export_path in export_paths:
-            export_path = Path(export_path)
-            discovered = self.discover_log_files(export_path)
+            discovered = self.discover_log_files(Path(export_path))
 
             if log_type in discovered:
-                entries = parse_method(discovered[log_type])
-                all_entries.extend(entries)
+                yield from iter_method(discovered[log_type])
+
+    def merge_exports(
+        self,
+        export_paths: List[Union[str, Path]],
+        log_type: LogType
+    ) -> List[Any]:
+        """
+        Merge log entries from multiple exports with deduplication.
+
+        Args:
+            export_paths: List of export directory paths
+            log_type: Type of log to merge
 
-        # Deduplicate using set (entries have __hash__ and __eq__)
-        unique_entries = list(set(all_entries))
+        Returns:
+            Deduplicated, chronologically sorted list of entries
+        """
+        # Deduplicate while streaming (entries have __hash__ and __eq__), so
+        # duplicate rows across overlapping exports are never materialised
+        unique_entries = set(self.iter_exports(export_paths, log_type))
 
         # Sort chronologically
         return self.sort_chronologically(unique_entries)
@@ -36,7 +36,7 @@ def backfill_risk_levels(db_path: str) -> Dict:
             'errors': []
         }
     """
-    from claude.tools.m365_ir.compression import decompress_json
+    from claude.tools.m365_ir.compression import decompress_json, load_dictionaries
 
     result = {
         'success': False,
@@ -48,6 +48,7 @@ def backfill_risk_levels(db_path: str) -> Dict:
     try:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
+        load_dictionaries(conn)
         cursor = conn.cursor()
 
         # Find records with raw_record but unknown risk_level
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Migration Script: v5 → v6 (Indexed duplicate detection)
+
+Adds sign_in_logs.dedup_key - a 64-bit hash of (timestamp,
+user_principal_name, ip_address) that LogImporter writes at import time -
+and backfills it for existing rows so duplicate_handler can find candidate
+groups through an index instead of a full-table GROUP BY.
+
+The covering (dedup_key, merge_status) index is created here when the
+Phase 261.4 merge columns are already present; otherwise
+duplicate_handler.add_merge_columns() creates it.
+
+Idempotent: Safe to run multiple times (checks for column existence and
+only backfills rows without a key).
+
+Usage:
+    from claude.tools.m365_ir.migrations.migrate_v6 import migrate_to_v6
+    from claude.tools.m365_ir.log_database import IRLogDatabase
+
+    db = IRLogDatabase(case_id="PIR-EXISTING-CASE")
+    migrate_to_v6(db)
+
+Author: Maia System (SRE Principal Engineer Agent)
+Created: 2026-10-16
+"""
+
+from pathlib import Path
+import sys
+
+MAIA_ROOT = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.m365_ir.duplicate_handler import compute_dedup_key
+
+
+def _column_exists(cursor, table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    columns = {row[1] for row in cursor.fetchall()}
+    return column_name in columns
+
+
+def migrate_to_v6(db) -> None:
+    """
+    Migrate existing v5 database to v6 (add and backfill dedup_key).
+
+    Args:
+        db: IRLogDatabase instance
+
+    Raises:
+        ValueError if database doesn't exist
+    """
+    if not db.exists:
+        raise ValueError(f"Database does not exist: {db.db_path}")
+
+    conn = db.connect()
+    cursor = conn.cursor()
+
+    print(f"Migrating {db.case_id} to schema v6 (Indexed duplicate detection)...")
+
+    if not _column_exists(cursor, 'sign_in_logs', 'dedup_key'):
+        cursor.execute("""
+            ALTER TABLE sign_in_logs ADD COLUMN dedup_key INTEGER
+        """)
+        print("  ✓ Added column: dedup_key")
+
+    conn.create_function('compute_dedup_key', 3, compute_dedup_key, deterministic=True)
+    cursor.execute("""
+        UPDATE sign_in_logs
+        SET dedup_key = compute_dedup_key(timestamp, user_principal_name, ip_address)
+        WHERE dedup_key IS NULL
+    """)
+    print(f"  ✓ Backfilled dedup_key for {cursor.rowcount:,} rows")
+
+    if _column_exists(cursor, 'sign_in_logs', 'merge_status'):
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_signin_dedup_key
+            ON sign_in_logs(dedup_key, merge_status)
+        """)
+        print("  ✓ Created index: idx_signin_dedup_key")
+
+    conn.commit()
+    conn.close()
+
+    print(f"✅ Migration complete: {db.case_id} now on schema v6")
+
+
+if __name__ == "__main__":
+    """Migrate all existing v5 databases in ~/work_projects/ir_cases/"""
+    from claude.tools.m365_ir.log_database import IRLogDatabase
+    import os
+
+    base_path = os.path.expanduser("~/work_projects/ir_cases")
+
+    if not os.path.exists(base_path):
+        print(f"No IR cases directory found: {base_path}")
+        sys.exit(1)
+
+    migrated = 0
+    for case_id in os.listdir(base_path):
+        db_path = os.path.join(base_path, case_id, f"{case_id}_logs.db")
+        if os.path.exists(db_path):
+            print(f"\nMigrating {case_id}...")
+            try:
+                migrate_to_v6(IRLogDatabase(case_id=case_id, base_path=base_path))
+                migrated += 1
+            except Exception as e:
+                print(f"❌ Error migrating {case_id}: {e}")
+
+    print(f"\n{'='*60}")
+    print(f"Migration complete: {migrated} cases upgraded to v6")
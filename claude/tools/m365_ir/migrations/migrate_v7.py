@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Migration Script: v6 → v7 (zstd dictionary codec)
+
+Adds the compression_dictionaries table that holds one trained zstd
+dictionary per log table (see compression.py). Existing rows are not
+touched: zlib BLOBs and plain TEXT keep decoding, and new rows only use
+zstd when an import runs with codec='zstd'.
+
+Running this is optional - compression.get_table_codec() also creates the
+table the first time a zstd import reaches an older case - but migrating
+up front lets read-only tooling (LogQuery, reports) rely on the table
+being present.
+
+Idempotent: Safe to run multiple times (CREATE TABLE IF NOT EXISTS).
+
+Usage:
+    from claude.tools.m365_ir.migrations.migrate_v7 import migrate_to_v7
+    from claude.tools.m365_ir.log_database import IRLogDatabase
+
+    db = IRLogDatabase(case_id="PIR-EXISTING-CASE")
+    migrate_to_v7(db)
+
+Author: Maia System (SRE Principal Engineer Agent)
+Created: 2026-10-17
+"""
+
+from pathlib import Path
+import sys
+
+MAIA_ROOT = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.m365_ir.compression import ensure_dictionary_table
+
+
+def migrate_to_v7(db) -> None:
+    """
+    Migrate existing v6 database to v7 (add compression_dictionaries).
+
+    Args:
+        db: IRLogDatabase instance
+
+    Raises:
+        ValueError if database doesn't exist
+    """
+    if not db.exists:
+        raise ValueError(f"Database does not exist: {db.db_path}")
+
+    conn = db.connect()
+
+    print(f"Migrating {db.case_id} to schema v7 (zstd dictionary codec)...")
+
+    ensure_dictionary_table(conn)
+    print("  ✓ Created table: compression_dictionaries")
+
+    conn.commit()
+    conn.close()
+
+    print(f"✅ Migration complete: {db.case_id} now on schema v7")
+
+
+if __name__ == "__main__":
+    """Migrate all existing v6 databases in ~/work_projects/ir_cases/"""
+    from claude.tools.m365_ir.log_database import IRLogDatabase
+    import os
+
+    base_path = os.path.expanduser("~/work_projects/ir_cases")
+
+    if not os.path.exists(base_path):
+        print(f"No IR cases directory found: {base_path}")
+        sys.exit(1)
+
+    migrated = 0
+    for case_id in os.listdir(base_path):
+        db_path = os.path.join(base_path, case_id, f"{case_id}_logs.db")
+        if os.path.exists(db_path):
+            print(f"\nMigrating {case_id}...")
+            try:
+                migrate_to_v7(IRLogDatabase(case_id=case_id, base_path=base_path))
+                migrated += 1
+            except Exception as e:
+                print(f"❌ Error migrating {case_id}: {e}")
+
+    print(f"\n{'='*60}")
+    print(f"Migration complete: {migrated} cases upgraded to v7")
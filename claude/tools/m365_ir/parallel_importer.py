@@ -0,0 +1,651 @@
+#!/usr/bin/env python3
+"""
+ParallelLogImporter - Concurrent parse/compress with a single SQLite writer.
+
+Parses and compresses the large row-oriented exports (sign-in, UAL, mailbox
+audit) in a process pool and funnels ready row batches to one writer thread
+that owns the only connection to the case database. A full case bundle
+therefore imports in roughly the time of its largest file instead of the sum
+of all files.
+
+Snapshot/config exports (OAuth consents, inbox rules, MFA changes, risky
+users, Entra audit, Phase 249 config exports, ...) are small and keep their
+own post-import logic, so they run through the regular LogImporter handlers
+once the parallel stage has finished.
+
+Usage:
+    from claude.tools.m365_ir.log_importer import LogImporter
+    from claude.tools.m365_ir.parallel_importer import ParallelLogImporter
+
+    report = ParallelLogImporter(LogImporter(db), max_workers=4).run(export_path)
+    print(report.format())
+
+    # Or via LogImporter
+    results = importer.import_all(export_path, parallel=True)
+    print(importer.last_import_report.format())
+
+Author: Maia System (SRE Principal Engineer Agent)
+Created: 2026-10-16
+"""
+
+import csv
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from .log_importer import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_HANDLERS,
+    MAILBOX_INSERT_SQL,
+    PARSER_VERSION,
+    SIGN_IN_INSERT_SQL,
+    UAL_INSERT_SQL,
+    DataQualityError,
+    ImportResult,
+    LogImporter,
+    build_mailbox_row,
+    build_ual_row,
+    merge_import_result,
+)
+from .m365_log_parser import LOG_FILE_PATTERNS, LogType, M365LogParser
+
+logger = logging.getLogger(__name__)
+
+# LogType -> (import_metadata log_type / result key, table, INSERT statement)
+PARALLEL_LOG_TYPES = {
+    LogType.SIGNIN: ('sign_in', 'sign_in_logs', SIGN_IN_INSERT_SQL),
+    LogType.FULL_AUDIT: ('ual', 'unified_audit_log', UAL_INSERT_SQL),
+    LogType.MAILBOX_AUDIT: ('mailbox', 'mailbox_audit_log', MAILBOX_INSERT_SQL),
+}
+
+# Batches buffered per worker before producers block (bounds parent memory)
+QUEUE_BATCHES_PER_WORKER = 4
+
+# Set in each pool process by _init_worker()
+_OUT_QUEUE = None
+
+
+@dataclass
+class ExportFile:
+    """A discovered export file (on disk or inside a zip)."""
+
+    log_type: LogType
+    source_id: str
+    path: Path
+    zip_member: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """Bare filename used for schema/sign-in type detection."""
+        return Path(self.zip_member).name if self.zip_member else self.path.name
+
+
+@dataclass
+class FileImportTiming:
+    """Per-file progress and timing for a parallel import run."""
+
+    source_file: str
+    result_key: str
+    mode: str = 'parallel'  # 'parallel' (process pool) or 'serial' (handler)
+    status: str = 'pending'  # pending | imported | skipped | failed
+    records_imported: int = 0
+    records_skipped: int = 0
+    records_failed: int = 0
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    def describe(self) -> str:
+        """One-line progress summary."""
+        line = (
+            f"{Path(self.source_file.split(':')[-1]).name} [{self.result_key}, {self.mode}] "
+            f"{self.status}: {self.records_imported} imported, {self.records_skipped} skipped, "
+            f"{self.records_failed} failed - parse {self.parse_seconds:.2f}s, "
+            f"write {self.write_seconds:.2f}s, total {self.elapsed_seconds:.2f}s"
+        )
+        if self.error:
+            line += f" ({self.error})"
+        return line
+
+
+@dataclass
+class ParallelImportReport:
+    """Outcome of ParallelLogImporter.run()."""
+
+    results: Dict[str, ImportResult] = field(default_factory=dict)
+    files: List[FileImportTiming] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    workers: int = 0
+
+    @property
+    def slowest_file_seconds(self) -> float:
+        """Elapsed time of the slowest single file (lower bound for wall time)."""
+        return max((f.elapsed_seconds for f in self.files), default=0.0)
+
+    def format(self) -> str:
+        """Human-readable per-file timing report."""
+        lines = [f"Parallel import: {len(self.files)} files, {self.workers} workers"]
+        for timing in sorted(self.files, key=lambda f: f.elapsed_seconds, reverse=True):
+            lines.append(f"  {timing.describe()}")
+        lines.append(
+            f"Wall time {self.wall_seconds:.2f}s "
+            f"(slowest file {self.slowest_file_seconds:.2f}s)"
+        )
+        return '\n'.join(lines)
+
+
+@dataclass
+class _ParseTask:
+    """Picklable unit of work for a pool process."""
+
+    task_id: int
+    log_type: LogType
+    path: str
+    filename: str
+    zip_member: Optional[str]
+    known_hashes: FrozenSet[str]
+    imported_at: str
+    batch_size: int
+
+
+def discover_exports(source: Union[str, Path]) -> List[ExportFile]:
+    """
+    Find importable exports in a directory (recursive) or zip file.
+
+    Matching mirrors LogImporter._import_from_directory/_import_from_zip:
+    macOS metadata is skipped and the first matching LOG_FILE_PATTERNS
+    entry wins.
+    """
+    source = Path(source)
+    candidates: List[Tuple[str, Path, Optional[str]]] = []
+
+    if source.is_dir():
+        for file in source.rglob('*.csv'):
+            if '__MACOSX' in str(file) or file.name.startswith('.'):
+                continue
+            candidates.append((str(file), file, None))
+    else:
+        with zipfile.ZipFile(source, 'r') as zf:
+            for name in zf.namelist():
+                if name.lower().endswith('.csv') and not name.startswith('__MACOSX'):
+                    candidates.append((f"{source}:{name}", source, name))
+
+    exports = []
+    for source_id, path, member in candidates:
+        filename = Path(member).name if member else path.name
+        for log_type, pattern in LOG_FILE_PATTERNS.items():
+            if re.match(pattern, filename):
+                exports.append(ExportFile(log_type, source_id, path, member))
+                break
+    return exports
+
+
+def _init_worker(out_queue) -> None:
+    """Pool initializer: queues can only be shared by inheritance."""
+    global _OUT_QUEUE
+    _OUT_QUEUE = out_queue
+
+
+def _hash_and_stage(task: _ParseTask, tmp_dir: str) -> Tuple[str, str]:
+    """
+    Hash the export, extracting zip members to tmp_dir on the way.
+
+    Returns:
+        Tuple of (sha256 hex digest, path to readable CSV)
+    """
+    sha256 = hashlib.sha256()
+    if task.zip_member is None:
+        with open(task.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest(), task.path
+
+    staged = os.path.join(tmp_dir, task.filename)
+    with zipfile.ZipFile(task.path, 'r') as zf, zf.open(task.zip_member) as src, \
+            open(staged, 'wb') as dst:
+        for chunk in iter(lambda: src.read(1 << 20), b''):
+            sha256.update(chunk)
+            dst.write(chunk)
+    return sha256.hexdigest(), staged
+
+
+def _iter_row_params(
+    task: _ParseTask, csv_path: str, failures: List[str]
+) -> Iterator[Tuple[int, tuple]]:
+    """Yield (row_num, INSERT params); rows that cannot be built go to failures."""
+    if task.log_type == LogType.SIGNIN:
+        entries = M365LogParser().iter_with_schema(csv_path, filename=task.filename)
+        for entry_num, entry in enumerate(entries, start=1):
+            try:
+                yield entry_num, LogImporter._sign_in_entry_to_row(entry, task.imported_at)
+            except Exception as e:
+                failures.append(f"Entry {entry_num}: {str(e)}")
+        return
+
+    builder = build_ual_row if task.log_type == LogType.FULL_AUDIT else build_mailbox_row
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+        for row_num, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                yield row_num, builder(row, task.imported_at)
+            except Exception as e:
+                failures.append(f"Row {row_num}: {str(e)}")
+
+
+def _parse_export(task: _ParseTask) -> None:
+    """
+    Pool entry point: parse and compress one export into row batches.
+
+    Messages put on the shared queue (all tagged with task_id):
+        ('skipped', id, source_hash)          - hash already in import_metadata
+        ('start', id, source_hash)            - first message for a new import
+        ('rows', id, [(row_num, params)...])  - one batch per batch_size rows
+        ('done', id, failures, parse_seconds, elapsed_seconds)
+        ('error', id, message, parse_seconds, elapsed_seconds)
+    Exactly one of skipped/done/error terminates each task. parse_seconds
+    excludes time spent blocked on a full queue (writer backpressure).
+    """
+    start = time.perf_counter()
+    blocked = 0.0
+
+    def put(message) -> None:
+        nonlocal blocked
+        put_start = time.perf_counter()
+        _OUT_QUEUE.put(message)
+        blocked += time.perf_counter() - put_start
+
+    tmp_dir = tempfile.mkdtemp(prefix='m365_ir_import_')
+    try:
+        source_hash, csv_path = _hash_and_stage(task, tmp_dir)
+        if source_hash in task.known_hashes:
+            put(('skipped', task.task_id, source_hash))
+            return
+
+        put(('start', task.task_id, source_hash))
+        failures: List[str] = []
+        batch: List[Tuple[int, tuple]] = []
+        for item in _iter_row_params(task, csv_path, failures):
+            batch.append(item)
+            if len(batch) >= task.batch_size:
+                put(('rows', task.task_id, batch))
+                batch = []
+        if batch:
+            put(('rows', task.task_id, batch))
+        elapsed = time.perf_counter() - start
+        _OUT_QUEUE.put(('done', task.task_id, failures, elapsed - blocked, elapsed))
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        _OUT_QUEUE.put(('error', task.task_id, str(e), elapsed - blocked, elapsed))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class _BatchWriter(threading.Thread):
+    """Single writer: drains the batch queue into the case database."""
+
+    def __init__(
+        self,
+        importer: LogImporter,
+        out_queue,
+        exports: Dict[int, ExportFile],
+        timings: Dict[int, FileImportTiming],
+        imported_at: str,
+        progress: Callable[[FileImportTiming], None],
+    ):
+        super().__init__(name='m365-ir-import-writer', daemon=True)
+        self._importer = importer
+        self._queue = out_queue
+        self._exports = exports
+        self._timings = timings
+        self._imported_at = imported_at
+        self._progress = progress
+        self._state: Dict[int, dict] = {}
+        self.results: Dict[int, ImportResult] = {}
+
+    def run(self) -> None:
+        conn = cursor = None
+        pending = len(self._exports)
+        try:
+            try:
+                conn = self._importer.db.connect()
+                LogImporter._apply_bulk_import_pragmas(conn)
+                cursor = conn.cursor()
+            except Exception as e:
+                # e.g. database locked during the WAL switch: fail every file,
+                # but still drain the queue so producers never block on it
+                logger.error(f"Writer could not open the case database: {e}")
+                for task_id in self._exports:
+                    self._state[task_id] = {'failed': f"writer could not open database: {e}"}
+            while pending:
+                message = self._queue.get()
+                kind, task_id = message[0], message[1]
+                try:
+                    if kind == 'start':
+                        self._on_start(conn, cursor, task_id, message[2])
+                    elif kind == 'rows':
+                        self._on_rows(conn, cursor, task_id, message[2])
+                    elif kind == 'skipped':
+                        self._on_skipped(task_id, message[2])
+                    elif kind == 'done':
+                        self._on_done(conn, cursor, task_id, *message[2:])
+                    elif kind == 'error':
+                        self._on_error(conn, cursor, task_id, *message[2:])
+                except Exception as e:
+                    # Keep draining so producers never block on a full queue
+                    logger.error(f"Writer failed on {kind} for task {task_id}: {e}")
+                    self._state.setdefault(task_id, {})['failed'] = str(e)
+                if kind in ('skipped', 'done', 'error'):
+                    pending -= 1
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _on_start(self, conn, cursor, task_id: int, source_hash: str) -> None:
+        if self._state.get(task_id, {}).get('failed'):
+            return
+        export = self._exports[task_id]
+        metadata_type = PARALLEL_LOG_TYPES[export.log_type][0]
+        cursor.execute("""
+            INSERT INTO import_metadata
+            (source_file, source_hash, log_type, records_imported, records_failed,
+             import_started, parser_version)
+            VALUES (?, ?, ?, 0, 0, ?, ?)
+        """, (export.source_id, source_hash, metadata_type, self._imported_at, PARSER_VERSION))
+        conn.commit()
+        self._state[task_id] = {
+            'import_id': cursor.lastrowid,
+            'source_hash': source_hash,
+            'errors': [],
+        }
+
+    def _on_rows(self, conn, cursor, task_id: int, rows: list) -> None:
+        state = self._state[task_id]
+        if state.get('failed'):
+            return
+        timing = self._timings[task_id]
+        started = time.perf_counter()
+        sql = PARALLEL_LOG_TYPES[self._exports[task_id].log_type][2]
+        inserted, skipped, failed, errors = LogImporter._insert_batch(cursor, sql, rows)
+        conn.commit()
+        timing.write_seconds += time.perf_counter() - started
+        timing.records_imported += inserted
+        timing.records_skipped += skipped
+        timing.records_failed += failed
+        state['errors'].extend(errors)
+
+    def _on_skipped(self, task_id: int, source_hash: str) -> None:
+        timing = self._timings[task_id]
+        timing.status = 'skipped'
+        self.results[task_id] = ImportResult(
+            source_file=self._exports[task_id].source_id,
+            source_hash=source_hash,
+            records_imported=0,
+            records_failed=0,
+            errors=[],
+        )
+        self._progress(timing)
+
+    def _on_done(
+        self, conn, cursor, task_id: int, failures: List[str],
+        parse_seconds: float, elapsed_seconds: float
+    ) -> None:
+        state = self._state[task_id]
+        if state.get('failed'):
+            self._on_error(conn, cursor, task_id, state['failed'], parse_seconds, elapsed_seconds)
+            return
+        timing = self._timings[task_id]
+        timing.parse_seconds = parse_seconds
+        timing.elapsed_seconds = elapsed_seconds
+        timing.records_failed += len(failures)
+        timing.status = 'imported'
+        cursor.execute("""
+            UPDATE import_metadata
+            SET records_imported = ?, records_failed = ?, import_completed = ?
+            WHERE id = ?
+        """, (timing.records_imported, timing.records_failed,
+              datetime.now().isoformat(), state['import_id']))
+        conn.commit()
+        self.results[task_id] = ImportResult(
+            source_file=self._exports[task_id].source_id,
+            source_hash=state['source_hash'],
+            records_imported=timing.records_imported,
+            records_failed=timing.records_failed,
+            errors=failures + state['errors'],
+            records_skipped=timing.records_skipped,
+        )
+        self._progress(timing)
+
+    def _on_error(
+        self, conn, cursor, task_id: int, message: str,
+        parse_seconds: float, elapsed_seconds: float
+    ) -> None:
+        timing = self._timings[task_id]
+        timing.parse_seconds = parse_seconds
+        timing.elapsed_seconds = elapsed_seconds
+        timing.status = 'failed'
+        timing.error = message
+        state = self._state.get(task_id, {})
+        if 'import_id' in state:
+            # Forget the source hash so the file can be re-imported; rows already
+            # written are deduplicated by the UNIQUE indexes on retry.
+            cursor.execute("DELETE FROM import_metadata WHERE id = ?", (state['import_id'],))
+            conn.commit()
+        logger.error(f"Failed to import {self._exports[task_id].source_id}: {message}")
+        self._progress(timing)
+
+
+class ParallelLogImporter:
+    """
+    Imports a case bundle with a process pool feeding one SQLite writer.
+
+    Results have the same shape as LogImporter.import_all(): one merged
+    ImportResult per log type key. Post-import checks (sign-in quality gate,
+    sign-in/UAL verification, unknown status codes) run once per table after
+    all files of that table are written.
+    """
+
+    def __init__(
+        self,
+        importer: LogImporter,
+        max_workers: Optional[int] = None,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        progress: Optional[Callable[[FileImportTiming], None]] = None,
+    ):
+        """
+        Args:
+            importer: LogImporter bound to the target case database
+            max_workers: Pool size (default: CPU count, capped at file count)
+            batch_size: Rows per batch sent to the writer
+            progress: Called with each FileImportTiming as a file finishes
+        """
+        self._importer = importer
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._batch_size = batch_size
+        self._progress = progress or (lambda timing: logger.info(timing.describe()))
+
+    def run(self, source: Union[str, Path]) -> ParallelImportReport:
+        """
+        Import every recognised export under source (directory or zip).
+
+        Args:
+            source: Directory or zip file containing M365 log exports
+
+        Returns:
+            ParallelImportReport with merged results and per-file timings
+        """
+        start = time.perf_counter()
+        exports = discover_exports(source)
+        parallel = [e for e in exports if e.log_type in PARALLEL_LOG_TYPES]
+        serial = [e for e in exports if e.log_type not in PARALLEL_LOG_TYPES]
+
+        report = ParallelImportReport()
+        imported_at = datetime.now().isoformat()
+
+        if parallel:
+            report.workers = min(self._max_workers, len(parallel))
+            per_file = self._run_parallel(parallel, imported_at, report.workers)
+            for export, (timing, result) in zip(parallel, per_file):
+                report.files.append(timing)
+                if result is not None:
+                    merge_import_result(report.results, timing.result_key, result)
+            self._run_post_import_checks(report.results, imported_at)
+
+        for export in serial:
+            timing = self._run_serial(export, report.results)
+            report.files.append(timing)
+
+        report.wall_seconds = time.perf_counter() - start
+        logger.info(
+            f"Parallel import finished in {report.wall_seconds:.2f}s "
+            f"(slowest file {report.slowest_file_seconds:.2f}s)"
+        )
+        return report
+
+    def _run_parallel(
+        self, exports: List[ExportFile], imported_at: str, workers: int
+    ) -> List[Tuple[FileImportTiming, Optional[ImportResult]]]:
+        """Parse exports in the pool while the writer thread stores batches."""
+        known_hashes = self._known_hashes()
+        tasks: Dict[int, ExportFile] = dict(enumerate(exports))
+        timings = {
+            task_id: FileImportTiming(
+                source_file=export.source_id,
+                result_key=PARALLEL_LOG_TYPES[export.log_type][0],
+            )
+            for task_id, export in tasks.items()
+        }
+
+        # spawn: safe alongside the writer thread and matches macOS defaults
+        ctx = multiprocessing.get_context('spawn')
+        out_queue = ctx.Queue(maxsize=workers * QUEUE_BATCHES_PER_WORKER)
+        writer = _BatchWriter(
+            self._importer, out_queue, tasks, timings, imported_at, self._progress
+        )
+        writer.start()
+
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx,
+            initializer=_init_worker, initargs=(out_queue,)
+        ) as pool:
+            futures = {}
+            for task_id, export in tasks.items():
+                metadata_type = PARALLEL_LOG_TYPES[export.log_type][0]
+                task = _ParseTask(
+                    task_id=task_id,
+                    log_type=export.log_type,
+                    path=str(export.path),
+                    filename=export.filename,
+                    zip_member=export.zip_member,
+                    known_hashes=known_hashes.get(metadata_type, frozenset()),
+                    imported_at=imported_at,
+                    batch_size=self._batch_size,
+                )
+                futures[pool.submit(_parse_export, task)] = task_id
+
+            for future, task_id in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    # Worker died before reporting (e.g. BrokenProcessPool)
+                    out_queue.put(('error', task_id, f"worker crashed: {e}", 0.0, 0.0))
+
+        writer.join()
+        return [(timings[task_id], writer.results.get(task_id)) for task_id in tasks]
+
+    def _known_hashes(self) -> Dict[str, FrozenSet[str]]:
+        """Source hashes already in import_metadata, by log type."""
+        conn = self._importer.db.connect()
+        try:
+            rows = conn.execute("SELECT log_type, source_hash FROM import_metadata").fetchall()
+        finally:
+            conn.close()
+        known: Dict[str, set] = {}
+        for log_type, source_hash in rows:
+            known.setdefault(log_type, set()).add(source_hash)
+        return {log_type: frozenset(hashes) for log_type, hashes in known.items()}
+
+    def _run_post_import_checks(self, results: Dict[str, ImportResult], imported_at: str) -> None:
+        """
+        Run the per-table post-import steps the serial importers run per file.
+
+        The sign-in quality gate keeps its fail-fast contract: if it fails,
+        every sign-in row and import_metadata entry from this run is removed
+        (the serial path gets the same effect from a transaction rollback).
+        """
+        importer = self._importer
+        conn = importer.db.connect()
+        try:
+            sign_in = results.get('sign_in')
+            if sign_in and sign_in.records_imported > 0:
+                try:
+                    sign_in.quality_check_seconds = importer._check_sign_in_quality(conn)
+                    conn.commit()
+                except DataQualityError as e:
+                    conn.rollback()
+                    conn.execute("DELETE FROM sign_in_logs WHERE imported_at = ?", (imported_at,))
+                    conn.execute(
+                        "DELETE FROM import_metadata WHERE log_type = 'sign_in' AND import_started = ?",
+                        (imported_at,)
+                    )
+                    conn.commit()
+                    logger.error(f"Failed to import sign-in logs: {e}")
+                    del results['sign_in']
+                else:
+                    importer._verify_sign_in_import(conn)
+                    importer._scan_unknown_status_codes()
+
+            ual = results.get('ual')
+            if ual and ual.records_imported > 0:
+                importer._verify_ual_import(conn)
+        finally:
+            conn.close()
+
+    def _run_serial(self, export: ExportFile, results: Dict[str, ImportResult]) -> FileImportTiming:
+        """Import a small snapshot export through its LogImporter handler."""
+        result_key, handler_name = IMPORT_HANDLERS[export.log_type]
+        timing = FileImportTiming(export.source_id, result_key, mode='serial')
+        handler = getattr(self._importer, handler_name)
+        started = time.perf_counter()
+        tmp_dir = None
+        try:
+            path = export.path
+            if export.zip_member:
+                tmp_dir = tempfile.mkdtemp(prefix='m365_ir_import_')
+                path = Path(tmp_dir) / export.filename
+                with zipfile.ZipFile(export.path, 'r') as zf, \
+                        zf.open(export.zip_member) as src, open(path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+
+            result = handler(path)
+            if export.zip_member:
+                result.source_file = export.source_id
+            merge_import_result(results, result_key, result)
+
+            timing.status = 'imported'
+            timing.records_imported = result.records_imported
+            timing.records_skipped = result.records_skipped
+            timing.records_failed = result.records_failed
+        except Exception as e:
+            timing.status = 'failed'
+            timing.error = str(e)
+            logger.error(f"Failed to import {export.source_id}: {e}")
+        finally:
+            if tmp_dir:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        timing.elapsed_seconds = time.perf_counter() - started
+        timing.parse_seconds = timing.elapsed_seconds
+        self._progress(timing)
+        return timing
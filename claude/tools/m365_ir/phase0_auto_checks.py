@@ -27,6 +27,12 @@ import json
 from datetime import datetime
 from math import radians, sin, cos, sqrt, atan2
 
+from claude.tools.m365_ir.impossible_travel import (
+    KM_TO_MILES,
+    find_impossible_travel,
+    timestamp_seconds,
+)
+
 
 def parse_timestamp(timestamp_str):
     """
@@ -719,10 +725,11 @@ def detect_impossible_travel(db_path, speed_threshold_mph=500):
             ORDER BY user_principal_name, timestamp
         """).fetchall()
 
-        # Group by user and check consecutive logins
-        current_user = None
-        prev_login = None
-
+        # Load (user, time, lat, lon) columns; SQL ORDER BY already groups
+        # each user's logins in time order
+        rows = []
+        user_index = {}
+        user_codes, seconds, lats, lons = [], [], [], []
         for upn, timestamp, country, coords_str in sign_ins:
             # FIX-3: Parse "lat,lon" string into floats
             try:
@@ -732,61 +739,47 @@ def detect_impossible_travel(db_path, speed_threshold_mph=500):
             except (ValueError, AttributeError):
                 # Skip malformed coordinates
                 continue
-            if upn != current_user:
-                # New user, reset tracking
-                current_user = upn
-                prev_login = (timestamp, country, lat, lon)
-                continue
-
-            # Check distance and time between consecutive logins
-            prev_timestamp, prev_country, prev_lat, prev_lon = prev_login
 
-            # Calculate distance in km
-            distance_km = calculate_distance(prev_lat, prev_lon, lat, lon)
-
-            # Calculate time difference in hours
+            # Unparseable timestamps become NaN so both pairs touching this
+            # login are skipped without breaking the consecutive chain
             try:
-                time1 = parse_timestamp(prev_timestamp)
-                time2 = parse_timestamp(timestamp)
-            except ValueError:
-                # Skip if timestamps can't be parsed
-                prev_login = (timestamp, country, lat, lon)
-                continue
-
-            time_delta = time2 - time1
-            time_hours = time_delta.total_seconds() / 3600
-
-            # Skip if time is zero or negative (data quality issue)
-            if time_hours <= 0:
-                prev_login = (timestamp, country, lat, lon)
-                continue
-
-            # Calculate travel speed in mph
-            distance_miles = distance_km * 0.621371  # Convert km to miles
-            speed_mph = distance_miles / time_hours
-
-            # Flag if speed exceeds threshold
-            if speed_mph > speed_threshold_mph:
-                impossible_travel_events.append({
-                    'upn': upn,
-                    'login1': {
-                        'timestamp': prev_timestamp,
-                        'country': prev_country,
-                        'coords': f'{prev_lat},{prev_lon}'
-                    },
-                    'login2': {
-                        'timestamp': timestamp,
-                        'country': country,
-                        'coords': f'{lat},{lon}'
-                    },
-                    'distance_km': round(distance_km, 2),
-                    'time_hours': round(time_hours, 2),
-                    'speed_mph': round(speed_mph, 2),
-                    'threshold_mph': speed_threshold_mph
-                })
-
-            # Update previous login for next comparison
-            prev_login = (timestamp, country, lat, lon)
+                seconds.append(timestamp_seconds(parse_timestamp(timestamp)))
+            except (ValueError, TypeError):
+                seconds.append(float('nan'))
+
+            rows.append((upn, timestamp, country, lat, lon))
+            user_codes.append(user_index.setdefault(upn, len(user_index)))
+            lats.append(lat)
+            lons.append(lon)
+
+        # Score every consecutive same-user pair in bulk
+        legs = find_impossible_travel(
+            user_codes, seconds, lats, lons,
+            max_speed_kmh=speed_threshold_mph / KM_TO_MILES,
+        )
+
+        for leg in legs:
+            upn, prev_timestamp, prev_country, prev_lat, prev_lon = rows[leg.prev_index]
+            _, timestamp, country, lat, lon = rows[leg.index]
+            speed_mph = leg.distance_km * KM_TO_MILES / leg.hours
+
+            impossible_travel_events.append({
+                'upn': upn,
+                'login1': {
+                    'timestamp': prev_timestamp,
+                    'country': prev_country,
+                    'coords': f'{prev_lat},{prev_lon}'
+                },
+                'login2': {
+                    'timestamp': timestamp,
+                    'country': country,
+                    'coords': f'{lat},{lon}'
+                },
+                'distance_km': round(leg.distance_km, 2),
+                'time_hours': round(leg.hours, 2),
+                'speed_mph': round(speed_mph, 2),
+                'threshold_mph': speed_threshold_mph
+            })
 
         # Determine risk level
         risk_level = 'CRITICAL' if impossible_travel_events else 'OK'
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared impossible travel engine.
+
+Covers the NumPy and pure-Python paths (same legs for the same columns),
+sort order, NaN timestamp handling, and a 1M sign-in throughput benchmark.
+Run: pytest claude/tools/m365_ir/tests/test_impossible_travel.py -v
+
+Author: Maia System (SRE Principal Engineer Agent)
+Created: 2026-10-16
+"""
+
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+
+import pytest
+
+MAIA_ROOT = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.m365_ir import impossible_travel
+from claude.tools.m365_ir.impossible_travel import (
+    TravelLeg,
+    find_impossible_travel,
+    sort_by_user_time,
+    timestamp_seconds,
+)
+
+SYDNEY = (-33.87, 151.21)
+MOSCOW = (55.76, 37.62)
+MELBOURNE = (-37.81, 144.96)
+
+
+def _synthetic_columns(rows, users=1000, seed=7):
+    """Random (user, seconds, lat, lon) columns sorted by user then time."""
+    rng = random.Random(seed)
+    codes = sorted(rng.randrange(users) for _ in range(rows))
+    seconds = [rng.uniform(0, 30 * 86400) for _ in range(rows)]
+    lats = [rng.uniform(-60, 70) for _ in range(rows)]
+    lons = [rng.uniform(-180, 180) for _ in range(rows)]
+    order = sort_by_user_time(codes, seconds)
+    return ([codes[i] for i in order], [seconds[i] for i in order],
+            [lats[i] for i in order], [lons[i] for i in order])
+
+
+class TestFindImpossibleTravel:
+    """Consecutive-pair scoring"""
+
+    def test_flags_fast_long_haul_pair(self):
+        legs = find_impossible_travel(
+            [0, 0], [0.0, 3600.0],
+            [SYDNEY[0], MOSCOW[0]], [SYDNEY[1], MOSCOW[1]],
+            max_speed_kmh=1000, min_distance_km=500,
+        )
+        assert len(legs) == 1
+        assert (legs[0].prev_index, legs[0].index) == (0, 1)
+        assert legs[0].distance_km == pytest.approx(14500, rel=0.02)
+        assert legs[0].hours == pytest.approx(1.0)
+
+    def test_ignores_pairs_across_users(self):
+        legs = find_impossible_travel(
+            [0, 1], [0.0, 60.0],
+            [SYDNEY[0], MOSCOW[0]], [SYDNEY[1], MOSCOW[1]],
+            max_speed_kmh=1000,
+        )
+        assert legs == []
+
+    def test_min_distance_filter(self):
+        legs = find_impossible_travel(
+            [0, 0], [0.0, 60.0],
+            [SYDNEY[0], MELBOURNE[0]], [SYDNEY[1], MELBOURNE[1]],
+            max_speed_kmh=1000, min_distance_km=1000,
+        )
+        assert legs == []
+
+    def test_nan_and_non_positive_time_skipped(self):
+        """NaN timestamps skip both adjacent pairs without bridging them"""
+        legs = find_impossible_travel(
+            [0, 0, 0, 0], [0.0, math.nan, 60.0, 60.0],
+            [SYDNEY[0], MOSCOW[0], SYDNEY[0], MOSCOW[0]],
+            [SYDNEY[1], MOSCOW[1], SYDNEY[1], MOSCOW[1]],
+            max_speed_kmh=1000,
+        )
+        assert legs == []
+
+    def test_python_fallback_matches_numpy(self):
+        pytest.importorskip("numpy")
+        columns = _synthetic_columns(5_000, users=50)
+
+        fast = impossible_travel._find_legs_numpy(*columns, 900, 500)
+        slow = impossible_travel._find_legs_python(*columns, 900, 500)
+
+        assert [(l.prev_index, l.index) for l in fast] == [(l.prev_index, l.index) for l in slow]
+        for a, b in zip(fast, slow):
+            assert a.distance_km == pytest.approx(b.distance_km)
+            assert a.speed_kmh == pytest.approx(b.speed_kmh)
+
+
+class TestSortAndTimestamps:
+    """Column preparation helpers"""
+
+    def test_sort_is_stable_within_user(self):
+        order = sort_by_user_time([1, 0, 1, 0], [5.0, 5.0, 1.0, 5.0])
+        assert order == [1, 3, 2, 0]
+
+    def test_timestamp_seconds_naive_and_aware(self):
+        naive = datetime(2025, 12, 15, 9, 30)
+        aware = naive.replace(tzinfo=timezone.utc)
+        assert timestamp_seconds(naive) == timestamp_seconds(aware)
+        assert timestamp_seconds(naive + timedelta(hours=2)) - timestamp_seconds(naive) == 7200
+        assert math.isnan(timestamp_seconds(None))
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_one_million_sign_in_throughput():
+    """Benchmark: score 1M sign-ins (~1M consecutive pairs) and report rows/sec"""
+    rows = 1_000_000
+    columns = _synthetic_columns(rows)
+
+    start = time.perf_counter()
+    legs = find_impossible_travel(*columns, max_speed_kmh=1000, min_distance_km=500)
+    elapsed = time.perf_counter() - start
+
+    backend = "numpy" if impossible_travel.NUMPY_AVAILABLE else "python"
+    print(f"\n1M sign-ins ({backend}): {elapsed:.2f}s, {rows / elapsed:,.0f} rows/sec, "
+          f"{len(legs)} impossible legs")
+    assert legs and all(isinstance(leg, TravelLeg) for leg in legs)
+    assert all(leg.speed_kmh > 1000 and leg.distance_km > 500 for leg in legs)
@@ -9,6 +9,7 @@ Author: Maia System
 Created: 2025-12-18 (Phase 225)
 """
 
+import os
 import pytest
 from datetime import datetime, date
 from pathlib import Path
@@ -616,5 +617,114 @@ class TestDateRangedCSVPatterns:
         assert LogType.ENTRA_AUDIT in discovered
 
 
+SIGNIN_HEADER = (
+    '"CreatedDateTime","UserPrincipalName","UserDisplayName","AppDisplayName","IPAddress",'
+    '"City","Country","Device","Browser","OS","Status","RiskState","RiskLevelDuringSignIn",'
+    '"RiskLevelAggregated","ConditionalAccessStatus"\n'
+)
+
+
+def _write_synthetic_signin_csv(path, rows):
+    """Write a synthetic sign-in export with the given number of rows."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(SIGNIN_HEADER)
+        for i in range(rows):
+            f.write(
+                f'"{(i % 28) + 1}/11/2025 {(i % 12) + 1}:{i % 60:02d}:{(i // 60) % 60:02d} AM",'
+                f'"user{i % 500}@test.com","User {i % 500}","Microsoft Office",'
+                f'"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}","Sydney","AU","",'
+                f'"Chrome","Windows","status","none","none","none","success"\n'
+            )
+    return path
+
+
+def _peak_memory(fn):
+    """Return peak traced allocation (bytes) while running fn."""
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestStreamingParsers:
+    """Generator parsers (iter_*) must match parse_* with bounded memory"""
+
+    @pytest.fixture
+    def parser(self):
+        return M365LogParser(date_format="AU")
+
+    def test_iter_signin_logs_is_lazy(self, parser, tmp_path):
+        """iter_signin_logs returns a generator, not a list"""
+        import types
+        csv_file = _write_synthetic_signin_csv(tmp_path / "signin.csv", 3)
+        assert isinstance(parser.iter_signin_logs(csv_file), types.GeneratorType)
+
+    def test_iter_matches_parse(self, parser, tmp_path):
+        """Streaming and list parsing produce identical entries"""
+        csv_file = _write_synthetic_signin_csv(tmp_path / "signin.csv", 200)
+        assert list(parser.iter_signin_logs(csv_file)) == parser.parse_signin_logs(csv_file)
+
+    def test_iter_exports_streams_across_exports(self, parser, tmp_path):
+        """iter_exports chains exports lazily, without dedup or sorting"""
+        import types
+        for name, rows in (("export1", 3), ("export2", 2)):
+            (tmp_path / name).mkdir()
+            _write_synthetic_signin_csv(tmp_path / name / "1_AllUsers_SignInLogs.csv", rows)
+
+        entries = parser.iter_exports([tmp_path / "export1", tmp_path / "export2"], LogType.SIGNIN)
+
+        assert isinstance(entries, types.GeneratorType)
+        assert len(list(entries)) == 5
+
+    def test_iter_tracks_parse_errors(self, parser, tmp_path):
+        """last_parse_errors is populated once the generator is exhausted"""
+        csv_file = tmp_path / "signin.csv"
+        csv_file.write_text(SIGNIN_HEADER + '"INVALID_DATE","bad@test.com","Bad","App",'
+                            '"1.1.1.1","City","AU","","Chrome","Windows","status","none",'
+                            '"none","none","success"\n')
+        assert list(parser.iter_signin_logs(csv_file)) == []
+        assert parser.last_parse_errors == 1
+
+    def test_entries_use_slots(self):
+        """Entry dataclasses are slotted (no per-instance __dict__)"""
+        for entry_cls in (SignInLogEntry, AuditLogEntry, MailboxAuditEntry, LegacyAuthEntry):
+            assert hasattr(entry_cls, '__slots__'), entry_cls.__name__
+            assert '__dict__' not in entry_cls.__slots__
+
+    def test_streaming_peak_memory_lower_than_list(self, parser, tmp_path):
+        """Consuming iter_signin_logs keeps peak memory well below parse_signin_logs"""
+        csv_file = _write_synthetic_signin_csv(tmp_path / "signin.csv", 5_000)
+
+        list_peak = _peak_memory(lambda: parser.parse_signin_logs(csv_file))
+        stream_peak = _peak_memory(lambda: sum(1 for _ in parser.iter_signin_logs(csv_file)))
+
+        assert stream_peak * 5 < list_peak, f"stream={stream_peak} list={list_peak}"
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    @pytest.mark.skipif(not os.environ.get("M365_IR_BENCHMARK"),
+                        reason="~1 min under tracemalloc; set M365_IR_BENCHMARK=1")
+    def test_large_export_benchmark(self, parser, tmp_path):
+        """100k-row export: streaming peak stays flat while the list grows with input"""
+        rows = 100_000
+        csv_file = _write_synthetic_signin_csv(tmp_path / "signin_100k.csv", rows)
+
+        count = 0
+
+        def consume():
+            nonlocal count
+            count = sum(1 for _ in parser.iter_signin_logs(csv_file))
+
+        stream_peak = _peak_memory(consume)
+        list_peak = _peak_memory(lambda: parser.parse_signin_logs(csv_file))
+
+        assert count == rows
+        assert stream_peak < 10 * 1024 * 1024
+        assert stream_peak * 20 < list_peak, f"stream={stream_peak} list={list_peak}"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
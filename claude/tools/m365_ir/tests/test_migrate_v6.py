@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for Database Migration v5 → v6 (Indexed duplicate detection)
+
+Run: pytest claude/tools/m365_ir/tests/test_migrate_v6.py -v
+
+Author: Maia System
+Created: 2026-10-17
+"""
+
+import pytest
+import re
+import tempfile
+from pathlib import Path
+import sys
+
+# Add Maia root to path
+MAIA_ROOT = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.m365_ir.duplicate_handler import compute_dedup_key
+from claude.tools.m365_ir.log_database import IRLogDatabase
+from claude.tools.m365_ir.migrations.migrate_v6 import migrate_to_v6
+
+
+SIGN_INS = [
+    ('2025-12-04T08:19:41Z', 'test@example.com', '192.168.1.1'),
+    ('2025-12-04T08:19:41Z', 'test@example.com', '192.168.1.1'),   # duplicate
+    ('2025-12-04T09:00:00Z', 'other@example.com', None),
+    ('2025-12-04T09:00:00Z', 'other@example.com', ''),
+]
+
+
+def _insert_sign_ins(db, rows):
+    conn = db.connect()
+    conn.executemany("""
+        INSERT INTO sign_in_logs (timestamp, user_principal_name, ip_address, imported_at)
+        VALUES (?, ?, ?, '2025-12-04T10:00:00Z')
+    """, rows)
+    conn.commit()
+    conn.close()
+
+
+def _dedup_keys(db):
+    conn = db.connect()
+    rows = conn.execute("""
+        SELECT timestamp, user_principal_name, ip_address, dedup_key
+        FROM sign_in_logs ORDER BY id
+    """).fetchall()
+    conn.close()
+    return [tuple(row) for row in rows]
+
+
+def _index_columns(db, index_name):
+    conn = db.connect()
+    columns = [row[2] for row in conn.execute(f"PRAGMA index_info({index_name})")]
+    conn.close()
+    return columns
+
+
+class TestMigrationV6Structure:
+    """Migration v6 adds the dedup_key column"""
+
+    def test_migration_adds_dedup_key_column(self, temp_db_v5):
+        migrate_to_v6(temp_db_v5)
+
+        conn = temp_db_v5.connect()
+        columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(sign_in_logs)")}
+        conn.close()
+
+        assert columns['dedup_key'] == 'INTEGER'
+
+
+class TestMigrationV6Backfill:
+    """Existing rows get the same key LogImporter writes at import time"""
+
+    def test_backfills_existing_rows(self, temp_db_v5):
+        _insert_sign_ins(temp_db_v5, SIGN_INS)
+
+        migrate_to_v6(temp_db_v5)
+
+        rows = _dedup_keys(temp_db_v5)
+        assert len(rows) == len(SIGN_INS)
+        for timestamp, upn, ip_address, dedup_key in rows:
+            assert dedup_key == compute_dedup_key(timestamp, upn, ip_address)
+        # Duplicates share a key; NULL and '' IPs don't
+        assert rows[0][3] == rows[1][3]
+        assert rows[2][3] != rows[3][3]
+
+    def test_rerun_only_backfills_missing_keys(self, temp_db_v5):
+        _insert_sign_ins(temp_db_v5, SIGN_INS[:1])
+        migrate_to_v6(temp_db_v5)
+        _insert_sign_ins(temp_db_v5, SIGN_INS[2:3])
+
+        migrate_to_v6(temp_db_v5)
+
+        assert [row[3] for row in _dedup_keys(temp_db_v5)] == [
+            compute_dedup_key(*SIGN_INS[0]),
+            compute_dedup_key(*SIGN_INS[2]),
+        ]
+
+
+class TestMigrationV6Index:
+    """Covering index depends on the Phase 261.4 merge columns"""
+
+    def test_creates_covering_index_with_merge_columns(self, temp_db_v5):
+        conn = temp_db_v5.connect()
+        conn.execute("ALTER TABLE sign_in_logs ADD COLUMN merge_status TEXT")
+        conn.commit()
+        conn.close()
+
+        migrate_to_v6(temp_db_v5)
+
+        assert _index_columns(temp_db_v5, 'idx_signin_dedup_key') == ['dedup_key', 'merge_status']
+
+    def test_leaves_index_to_add_merge_columns_without_them(self, temp_db_v5):
+        migrate_to_v6(temp_db_v5)
+
+        assert _index_columns(temp_db_v5, 'idx_signin_dedup_key') == []
+
+
+class TestMigrationV6ErrorHandling:
+    """Migration refuses missing databases"""
+
+    def test_migration_fails_on_nonexistent_database(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = IRLogDatabase(case_id="PIR-NONEXISTENT", base_path=tmpdir)
+            with pytest.raises(ValueError, match="does not exist"):
+                migrate_to_v6(db)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def temp_db_v5():
+    """Create a temporary database with the v6 dedup_key column removed"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = IRLogDatabase(case_id="PIR-TEST-MIGRATION-V6", base_path=tmpdir)
+        db.create()
+        conn = db.connect()
+        # Rebuild sign_in_logs from its own DDL minus the v6 column (DROP
+        # COLUMN can't re-parse the commented CREATE TABLE)
+        table_sql, = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='sign_in_logs'"
+        ).fetchone()
+        index_sqls = [row[0] for row in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='index' AND tbl_name='sign_in_logs' "
+            "AND sql IS NOT NULL AND sql NOT LIKE '%dedup_key%'"
+        )]
+        v5_sql = re.sub(r",\s*-- v6:[^\n]*\n\s*dedup_key INTEGER", "", table_sql)
+        assert 'dedup_key' not in v5_sql
+        conn.execute("DROP TABLE sign_in_logs")
+        conn.execute(v5_sql)
+        for index_sql in index_sqls:
+            conn.execute(index_sql)
+        conn.commit()
+        conn.close()
+        yield db
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for Database Migration v6 → v7 (zstd dictionary codec)
+
+Run: pytest claude/tools/m365_ir/tests/test_migrate_v7.py -v
+
+Author: Maia System
+Created: 2026-10-17
+"""
+
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add Maia root to path
+MAIA_ROOT = Path(__file__).parent.parent.parent.parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.m365_ir.log_database import IRLogDatabase
+from claude.tools.m365_ir.migrations.migrate_v7 import migrate_to_v7
+
+
+def _table_exists(db, table_name):
+    conn = db.connect()
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+    ).fetchone()
+    conn.close()
+    return row is not None
+
+
+class TestMigrationV7:
+    """Migration v7 adds compression_dictionaries"""
+
+    def test_migration_creates_dictionary_table(self, temp_db_v6):
+        migrate_to_v7(temp_db_v6)
+
+        assert _table_exists(temp_db_v6, 'compression_dictionaries')
+
+    def test_migration_is_idempotent(self, temp_db_v6):
+        migrate_to_v7(temp_db_v6)
+        conn = temp_db_v6.connect()
+        conn.execute("""
+            INSERT INTO compression_dictionaries
+            (dict_id, table_name, codec, dictionary, sample_rows, created_at)
+            VALUES (1, 'unified_audit_log', 'zstd', x'00', 300, '2026-10-17T00:00:00')
+        """)
+        conn.commit()
+        conn.close()
+
+        migrate_to_v7(temp_db_v6)
+
+        conn = temp_db_v6.connect()
+        count = conn.execute("SELECT COUNT(*) FROM compression_dictionaries").fetchone()[0]
+        conn.close()
+        assert count == 1
+
+    def test_migration_fails_on_nonexistent_database(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = IRLogDatabase(case_id="PIR-NONEXISTENT", base_path=tmpdir)
+            with pytest.raises(ValueError, match="does not exist"):
+                migrate_to_v7(db)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def temp_db_v6():
+    """Create a temporary database with the v7 table removed"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = IRLogDatabase(case_id="PIR-TEST-MIGRATION-V7", base_path=tmpdir)
+        db.create()
+        conn = db.connect()
+        conn.execute("DROP TABLE compression_dictionaries")
+        conn.commit()
+        conn.close()
+        yield db
@@ -783,14 +783,10 @@ if __name__ == "__main__":
 
         # Load entries
         signin_entries = parser.merge_exports(export_paths, LogType.SIGNIN)
-        audit_entries = []
-        for export in export_paths:
-            discovered = parser.discover_log_files(export)
-            if LogType.AUDIT in discovered:
-                audit_entries.extend(parser.parse_audit_logs(discovered[LogType.AUDIT]))
+        # Streamed: build() makes a single pass over audit logs
+        audit_entries = parser.iter_exports(export_paths, LogType.AUDIT)
 
         print(f"Loaded {len(signin_entries)} sign-in entries")
-        print(f"Loaded {len(audit_entries)} audit entries")
 
         # Build timeline
         builder = TimelineBuilder()
@@ -25,6 +25,10 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 MAIA_ROOT = Path(__file__).parent.parent.parent.parent
+if str(MAIA_ROOT) not in sys.path:
+    sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.core.embedding_service import EmbeddingService
 
 try:
     import chromadb
@@ -67,6 +71,12 @@ class ConversationMemoryRAG:
         self.index_state_file = self.db_path / "index_state.json"
         self.index_state = self._load_index_state()
 
+        # Batched embedding client; vectors cached by content hash
+        self.embedder = EmbeddingService(
+            model=self.EMBEDDING_MODEL, ollama_url=self.OLLAMA_URL,
+            cache_path=self.db_path / "embedding_cache.db"
+        )
+
         # Initialize ChromaDB
         if chromadb is None:
             logger.warning("ChromaDB not available - running in degraded mode")
@@ -117,13 +127,7 @@ class ConversationMemoryRAG:
             Embedding vector or None if unavailable
         """
         try:
-            response = requests.post(
-                f"{self.OLLAMA_URL}/api/embed",
-                json={"model": self.EMBEDDING_MODEL, "input": text},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()["embeddings"][0]
+            return self.embedder.embed_one(text)
         except requests.exceptions.ConnectionError:
             logger.warning("Ollama not available - cannot generate embedding")
             return None
@@ -159,7 +163,7 @@ class ConversationMemoryRAG:
         # Build text for embedding (problem + learning = most valuable)
         problem = journey_data.get("problem_description", "")
         learning = journey_data.get("meta_learning", "")
-        embed_text = f"{problem}\n\n{learning}"
+        embed_text = self._journey_text(journey_data)
 
         if not embed_text.strip():
             logger.warning(f"Journey {journey_id} has no content to embed")
@@ -200,6 +204,28 @@ class ConversationMemoryRAG:
             logger.error(f"Failed to store embedding: {e}")
             return False
 
+    @staticmethod
+    def _journey_text(journey_data: Dict[str, Any]) -> str:
+        """Text embedded for a journey (problem + learning)."""
+        problem = journey_data.get("problem_description", "")
+        learning = journey_data.get("meta_learning", "")
+        return f"{problem}\n\n{learning}"
+
+    def _prefetch_embeddings(self, journeys: List[Dict[str, Any]]) -> None:
+        """
+        Embed journey texts in batched requests ahead of per-journey storage.
+
+        Best effort: results land in the embedding cache, so embed_journey
+        then hits the cache. On failure each journey embeds individually.
+        """
+        texts = [text for text in map(self._journey_text, journeys) if text.strip()]
+        if not texts:
+            return
+        try:
+            self.embedder.embed(texts)
+        except Exception as e:
+            logger.debug(f"Batched embedding failed, falling back to per-journey: {e}")
+
     def search_similar(
         self,
         query: str,
@@ -322,13 +348,19 @@ class ConversationMemoryRAG:
         """
         stats = {"indexed": 0, "skipped": 0, "errors": 0}
 
+        pending = []
         for journey in journeys:
             journey_id = journey.get("journey_id")
 
             if not force and journey_id in self.index_state["indexed_journeys"]:
                 stats["skipped"] += 1
                 continue
+            pending.append(journey)
+
+        if self.collection is not None:
+            self._prefetch_embeddings(pending)
 
+        for journey in pending:
             if self.embed_journey(journey, force=force):
                 stats["indexed"] += 1
             else:
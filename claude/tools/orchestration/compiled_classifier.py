@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Compiled Classifier - Precompiled routing tables for the prompt hook.
+
+swarm_auto_loader used to classify every prompt by running
+``coordinator_agent.py classify --json`` as a subprocess. Interpreter
+start-up plus importing AgentLoader, AdaptiveRoutingSystem and friends used
+most of the hook's 200ms budget, so routing was silently dropped under load.
+
+This module snapshots the coordinator's routing tables into a JSON artifact:
+
+    - IntentClassifier.matcher()         → the Aho-Corasick automaton over
+      domain keywords, intent/complexity patterns and SRE enforcement
+      keywords (keyword_automaton.py)
+    - Complexity weights, DOMAIN_AGENT_MAP
+    - ParallelExecutor source/sequential patterns
+
+CompiledClassifier loads the artifact with stdlib-only imports and returns
+the same payload as coordinator_agent.classify_for_hook() in well under a
+millisecond per query. Adaptive routing thresholds are read straight from
+adaptive_routing.db (re-read when the file changes), so learned thresholds
+still apply.
+
+The artifact records the mtime/size of the source modules; load_classifier()
+rebuilds it (importing coordinator_agent once) when they change.
+
+Usage:
+    from compiled_classifier import load_classifier
+
+    classifier = load_classifier()
+    exit_code, payload = classifier.classify("Setup SPF for example.com")
+
+CLI:
+    python3 compiled_classifier.py build
+    python3 compiled_classifier.py classify "<query>" [--json]
+    python3 compiled_classifier.py benchmark [--iterations N]
+
+Environment Variables:
+    MAIA_CLASSIFIER_ARTIFACT - Override the artifact path
+
+Author: Maia System
+Created: 2026-10-16
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from keyword_automaton import MultiPatternMatcher
+
+ARTIFACT_FORMAT = 2
+
+ORCHESTRATION_DIR = Path(__file__).resolve().parent
+MAIA_ROOT = ORCHESTRATION_DIR.parents[2]
+
+# Modules whose tables are compiled into the artifact
+SOURCE_MODULES = ("coordinator_agent.py", "keyword_automaton.py", "parallel_executor.py")
+
+# Same database AdaptiveRoutingSystem uses by default
+THRESHOLDS_DB = MAIA_ROOT / "claude" / "data" / "databases" / "intelligence" / "adaptive_routing.db"
+
+# AgentSelector's fixed threshold / AdaptiveThreshold default
+DEFAULT_THRESHOLD = 3.0
+
+# classify_for_hook() gate: below this no routing is suggested
+MIN_ROUTING_COMPLEXITY = 3
+MIN_ROUTING_CONFIDENCE = 0.70
+
+# Benchmark queries (mix of single-domain, swarm, SRE and general prompts)
+BENCHMARK_QUERIES = [
+    "How do I configure SPF records for my domain?",
+    "Migrate 250 users from on-prem Exchange to Exchange Online",
+    "Review the python code in claude/tools for efficiency",
+    "Set up monitoring and SLO alerting for the production API",
+    "Research pricing on LinkedIn, Seek and Indeed",
+    "What should I cook for dinner?",
+]
+
+
+def artifact_path(maia_root: Path = MAIA_ROOT) -> Path:
+    """Artifact for this checkout (one per Maia root)."""
+    if override := os.environ.get("MAIA_CLASSIFIER_ARTIFACT"):
+        return Path(override)
+    digest = hashlib.sha1(str(maia_root).encode()).hexdigest()[:8]
+    return Path.home() / ".maia" / "cache" / f"coordinator_classifier_{digest}.json"
+
+
+def _source_stamps() -> Dict[str, List[int]]:
+    stamps = {}
+    for name in SOURCE_MODULES:
+        try:
+            stat = (ORCHESTRATION_DIR / name).stat()
+            stamps[name] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stamps[name] = None
+    return stamps
+
+
+def build_artifact(path: Optional[Path] = None, thresholds_db: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Compile the coordinator's routing tables and write the artifact.
+
+    Imports coordinator_agent (the slow part), so run it once - at build
+    time or when the sources change - never per prompt.
+
+    Args:
+        path: Artifact path (default: artifact_path())
+        thresholds_db: Adaptive routing database (default: THRESHOLDS_DB)
+
+    Returns:
+        The artifact dict that was written
+    """
+    if str(ORCHESTRATION_DIR) not in sys.path:
+        sys.path.insert(0, str(ORCHESTRATION_DIR))
+    import coordinator_agent
+    from coordinator_agent import AgentSelector, IntentClassifier
+
+    parallel = None
+    if coordinator_agent.PARALLEL_EXECUTOR_AVAILABLE:
+        from parallel_executor import ParallelExecutor
+        parallel = {
+            "sources": list(ParallelExecutor.PARALLEL_SOURCES),
+            "sequential": list(ParallelExecutor.SEQUENTIAL_PATTERNS),
+            "file_ops": list(ParallelExecutor.FILE_OPS),
+        }
+
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sources": _source_stamps(),
+        "matcher": IntentClassifier.matcher().to_dict(),
+        "domains": list(IntentClassifier.DOMAIN_KEYWORDS),
+        "intent_patterns": [
+            [category, len(patterns)]
+            for category, patterns in IntentClassifier.INTENT_PATTERNS.items()
+        ],
+        "complexity": {
+            "indicators": dict(IntentClassifier.COMPLEXITY_INDICATORS),
+            "patterns": list(IntentClassifier.COMPLEXITY_PATTERNS),
+            "scale_pattern": IntentClassifier.SCALE_PATTERN,
+            "user_count_pattern": IntentClassifier.USER_COUNT_PATTERN,
+            "large_scale_users": IntentClassifier.LARGE_SCALE_USERS,
+        },
+        "domain_agent_map": dict(AgentSelector.DOMAIN_AGENT_MAP),
+        "parallel": parallel,
+        "thresholds_db": str(thresholds_db or THRESHOLDS_DB),
+    }
+
+    path = Path(path or artifact_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(artifact, indent=1))
+    os.replace(tmp_path, path)
+    return artifact
+
+
+class CompiledClassifier:
+    """
+    Intent classification and agent selection from a compiled artifact.
+
+    Mirrors IntentClassifier.classify() + AgentSelector.select() (with the
+    capability registry disabled, as CoordinatorAgent uses it) for the
+    fields the hook payload needs.
+    """
+
+    def __init__(self, artifact: Dict[str, Any]):
+        self.artifact = artifact
+        self._matcher = MultiPatternMatcher.from_dict(artifact["matcher"])
+        self._domains = [(d, f"domain:{d}") for d in artifact["domains"]]
+        self._intent_groups = [
+            (category, [f"category:{category}:{i}" for i in range(count)])
+            for category, count in artifact["intent_patterns"]
+        ]
+
+        complexity = artifact["complexity"]
+        self._indicators = complexity["indicators"]
+        self._complexity_groups = [(i, f"complexity:{i}") for i in complexity["patterns"]]
+        self._scale = re.compile(complexity["scale_pattern"])
+        self._user_count = re.compile(complexity["user_count_pattern"])
+        self._large_scale_users = complexity["large_scale_users"]
+
+        self._agent_map = artifact["domain_agent_map"]
+
+        parallel = artifact.get("parallel")
+        self._parallel = None
+        if parallel:
+            self._parallel = (
+                [re.compile(p) for p in parallel["sources"]],
+                [re.compile(p) for p in parallel["sequential"]],
+                parallel["file_ops"],
+            )
+
+        self._thresholds_db = Path(artifact["thresholds_db"]) if artifact.get("thresholds_db") else None
+        self._thresholds: Dict[str, float] = {}
+        self._thresholds_stamp = None
+
+    @classmethod
+    def from_file(cls, path: Path) -> "CompiledClassifier":
+        return cls(json.loads(Path(path).read_text()))
+
+    def is_stale(self) -> bool:
+        """True if the artifact is an old format or its source modules changed."""
+        return (
+            self.artifact.get("format") != ARTIFACT_FORMAT
+            or self.artifact.get("sources") != _source_stamps()
+        )
+
+    # ------------------------------------------------------------------
+    # Intent (IntentClassifier)
+    # ------------------------------------------------------------------
+
+    def _detect_domains(self, hits: frozenset) -> List[str]:
+        detected = [domain for domain, group in self._domains if group in hits]
+        return detected or ['general']
+
+    def _detect_category(self, hits: frozenset) -> str:
+        scores = {
+            category: sum(1 for group in groups if group in hits)
+            for category, groups in self._intent_groups
+        }
+        if "strategic_boost" in hits:
+            scores['strategic_planning'] = scores.get('strategic_planning', 0) + 2
+        if max(scores.values()) > 0:
+            return max(scores, key=scores.get)
+        return 'operational_task'
+
+    def _assess_complexity(self, query_lower: str, domains: List[str], hits: frozenset) -> int:
+        complexity = 3
+        if "sre" in hits:
+            complexity = max(complexity, 5)
+        if len(domains) > 1:
+            complexity += self._indicators['multi_domain']
+        for indicator, group in self._complexity_groups:
+            if group in hits:
+                complexity += self._indicators[indicator]
+        if self._scale.search(query_lower):
+            num_match = self._user_count.search(query_lower)
+            if num_match and int(num_match.group(1)) > self._large_scale_users:
+                complexity += self._indicators['large_scale']
+        return min(complexity, 10)
+
+    @staticmethod
+    def _calculate_confidence(domains: List[str], category: str) -> float:
+        confidence = 0.8
+        if 'sre' in domains:
+            confidence = 0.9
+        if domains == ['general']:
+            confidence -= 0.2
+        if category != 'operational_task':
+            confidence += 0.1
+        return min(confidence, 1.0)
+
+    # ------------------------------------------------------------------
+    # Routing (AgentSelector)
+    # ------------------------------------------------------------------
+
+    def _threshold(self, domain: str) -> float:
+        """Adaptive threshold for a domain, re-read when the database changes."""
+        if self._thresholds_db is None:
+            return DEFAULT_THRESHOLD
+        try:
+            stat = self._thresholds_db.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return DEFAULT_THRESHOLD
+        if stamp != self._thresholds_stamp:
+            import sqlite3
+            try:
+                conn = sqlite3.connect(f"file:{self._thresholds_db}?mode=ro", uri=True)
+                try:
+                    self._thresholds = dict(conn.execute(
+                        "SELECT domain, current_threshold FROM adaptive_thresholds"
+                    ).fetchall())
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                self._thresholds = {}
+            self._thresholds_stamp = stamp
+        return self._thresholds.get(domain, DEFAULT_THRESHOLD)
+
+    def _parallel_tasks(self, query: str) -> List[str]:
+        """ParallelExecutor.identify_parallel_tasks()"""
+        sources, sequential, _ = self._parallel
+        query_lower = query.lower()
+        if any(p.search(query_lower) for p in sequential):
+            return [query]
+
+        found_sources = []
+        for pattern in sources:
+            found_sources.extend(pattern.findall(query_lower))
+        if len(found_sources) > 1:
+            return [f"Search/query {source}: {query}" for source in set(found_sources)]
+
+        if ' and ' in query_lower or ',' in query:
+            parts = re.split(r',\s*|\s+and\s+', query)
+            if len(parts) > 1 and all(len(p.strip()) > 3 for p in parts):
+                return [p.strip() for p in parts if p.strip()]
+        return [query]
+
+    def _has_dependencies(self, tasks: List[str]) -> bool:
+        """ParallelExecutor.detect_dependencies()['has_dependencies']"""
+        file_ops = self._parallel[2]
+        resources = []
+        for task in tasks:
+            resources.extend(re.findall(r'[/\w]+\.\w+', task))
+            if any(op in task.lower() for op in file_ops):
+                return True
+        return len(resources) != len(set(resources))
+
+    def _agent(self, domain: str, default: str = 'ai_specialists_agent') -> str:
+        return self._agent_map.get(domain, default)
+
+    def _select(self, query: str, domains: List[str], complexity: int,
+                confidence: float, sre_hit: bool) -> Dict[str, Any]:
+        if sre_hit:
+            return {
+                "strategy": "single_agent",
+                "agents": ["sre_principal_engineer"],
+                "initial_agent": "sre_principal_engineer",
+                "confidence": 0.95,
+                "reasoning": "SRE enforcement: reliability/testing work requires SRE Principal Engineer",
+            }
+
+        if self._parallel:
+            tasks = self._parallel_tasks(query)
+            if len(tasks) > 1 and not self._has_dependencies(tasks):
+                agents = []
+                for agent in [self._agent(domains[0])] + [self._agent(d) for d in domains]:
+                    if agent not in agents:
+                        agents.append(agent)
+                return {
+                    "strategy": "parallel",
+                    "agents": agents,
+                    "initial_agent": agents[0],
+                    "confidence": confidence * 0.9,
+                    "reasoning": f"Parallel execution: {len(tasks)} independent tasks identified",
+                }
+
+        primary_domain = domains[0]
+        should_load = complexity >= self._threshold(primary_domain)
+        agents = [self._agent(d) for d in domains]
+
+        if not should_load and len(domains) == 1:
+            return {
+                "strategy": "single_agent",
+                "agents": agents,
+                "initial_agent": agents[0],
+                "confidence": confidence,
+                "reasoning": f"Simple {primary_domain} query, single specialist sufficient",
+            }
+        if complexity <= 6 or len(domains) <= 2:
+            return {
+                "strategy": "swarm",
+                "agents": agents,
+                "initial_agent": self._agent(primary_domain),
+                "confidence": confidence * 0.9,
+                "reasoning": f"Multi-domain task ({', '.join(domains)}), swarm collaboration recommended",
+            }
+        return {
+            "strategy": "swarm",
+            "agents": agents,
+            "initial_agent": self._agent(primary_domain, 'principal_cloud_architect'),
+            "confidence": confidence * 0.85,
+            "reasoning": (
+                f"High complexity ({complexity}/10), multi-domain ({len(domains)} domains), "
+                f"swarm collaboration required"
+            ),
+        }
+
+    def classify(self, query: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Classify a query into the hook's JSON routing payload.
+
+        Returns:
+            (exit_code, payload) as coordinator_agent.classify_for_hook()
+        """
+        query_lower = query.lower()
+        hits = self._matcher.scan(query_lower)
+        domains = self._detect_domains(hits)
+        category = self._detect_category(hits)
+        sre_hit = "sre" in hits
+        complexity = self._assess_complexity(query_lower, domains, hits)
+        confidence = self._calculate_confidence(domains, category)
+
+        intent = {
+            "category": category,
+            "domains": domains,
+            "complexity": complexity,
+            "confidence": confidence,
+        }
+        if complexity < MIN_ROUTING_COMPLEXITY or confidence < MIN_ROUTING_CONFIDENCE:
+            return 2, {"routing_needed": False, "intent": intent}
+
+        intent["primary_domain"] = domains[0]
+        return 0, {
+            "routing_needed": True,
+            "intent": intent,
+            "routing": self._select(query, domains, complexity, confidence, sre_hit),
+        }
+
+
+def load_classifier(path: Optional[Path] = None, rebuild: bool = True) -> Optional[CompiledClassifier]:
+    """
+    Load the compiled classifier, rebuilding a missing or stale artifact.
+
+    Args:
+        path: Artifact path (default: artifact_path())
+        rebuild: Rebuild when missing/stale (imports coordinator_agent once)
+
+    Returns:
+        CompiledClassifier, or None if no usable artifact is available
+    """
+    path = Path(path or artifact_path())
+    try:
+        classifier = CompiledClassifier.from_file(path)
+        if not classifier.is_stale():
+            return classifier
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if not rebuild:
+        return None
+    try:
+        return CompiledClassifier(build_artifact(path))
+    except Exception:
+        return None
+
+
+def _stats_ms(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "median_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 3),
+    }
+
+
+def benchmark(queries: List[str] = BENCHMARK_QUERIES, iterations: int = 200,
+              subprocess_runs: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the hook's classification paths.
+
+    - cold_subprocess:   coordinator_agent.py classify --json (old hook path)
+    - artifact_process:  fresh interpreter loading the artifact (hook without server)
+    - warm_in_process:   CoordinatorAgent kept in memory (hook server)
+    - artifact_load:     read + compile the artifact in-process
+    - artifact_classify: CompiledClassifier.classify() per query
+
+    In-process queries get a unique suffix so the matcher's scan memo
+    doesn't flatter the numbers.
+    """
+    import subprocess
+
+    path = artifact_path()
+    load_classifier(path)
+    results = {}
+
+    for name, script in (
+        ("cold_subprocess", ORCHESTRATION_DIR / "coordinator_agent.py"),
+        ("artifact_process", Path(__file__).resolve()),
+    ):
+        samples = []
+        for i in range(subprocess_runs):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, str(script), "classify", queries[i % len(queries)], "--json"],
+                capture_output=True, text=True
+            )
+            samples.append(time.perf_counter() - start)
+        results[name] = _stats_ms(samples)
+
+    if str(ORCHESTRATION_DIR) not in sys.path:
+        sys.path.insert(0, str(ORCHESTRATION_DIR))
+    import coordinator_agent
+    coordinator = coordinator_agent.CoordinatorAgent()
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        coordinator_agent.classify_for_hook(coordinator, f"{queries[i % len(queries)]} #{i}")
+        samples.append(time.perf_counter() - start)
+    results["warm_in_process"] = _stats_ms(samples)
+
+    samples = []
+    for _ in range(max(1, iterations // 10)):
+        start = time.perf_counter()
+        CompiledClassifier.from_file(path)
+        samples.append(time.perf_counter() - start)
+    results["artifact_load"] = _stats_ms(samples)
+
+    classifier = CompiledClassifier.from_file(path)
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        classifier.classify(f"{queries[i % len(queries)]} #{i}")
+        samples.append(time.perf_counter() - start)
+    results["artifact_classify"] = _stats_ms(samples)
+
+    return results
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compiled coordinator classifier")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Compile the routing tables into the artifact")
+    classify = sub.add_parser("classify", help="Classify a query (exit codes as coordinator_agent)")
+    classify.add_argument("query")
+    classify.add_argument("--json", action="store_true")
+    bench = sub.add_parser("benchmark", help="Compare subprocess, warm and artifact paths")
+    bench.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_artifact()
+        print(f"✅ Classifier artifact written: {artifact_path()}")
+        return 0
+
+    if args.command == "benchmark":
+        for name, stats in benchmark(iterations=args.iterations).items():
+            print(f"{name:<18} median {stats['median_ms']:>9.3f}ms   p95 {stats['p95_ms']:>9.3f}ms")
+        return 0
+
+    classifier = load_classifier()
+    if classifier is None:
+        print("⚠️  Classifier artifact unavailable", file=sys.stderr)
+        return 1
+    exit_code, payload = classifier.classify(args.query)
+    if args.json:
+        print(json.dumps(payload))
+    elif exit_code == 0:
+        routing = payload["routing"]
+        print(f"   💡 SUGGESTED AGENT: {routing['initial_agent']} ({routing['strategy']})")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
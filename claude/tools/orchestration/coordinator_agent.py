@@ -22,6 +22,7 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from agent_loader import AgentLoader
+from keyword_automaton import MultiPatternMatcher, load_matcher
 
 # Try to import CapabilityRegistry (optional enhancement)
 try:
@@ -37,6 +38,15 @@ try:
 except ImportError:
     PARALLEL_EXECUTOR_AVAILABLE = False
 
+# 🚨 SRE ENFORCEMENT (Phase 134.2)
+# Reliability/testing keywords - boost complexity and always route to the
+# SRE Principal Engineer
+SRE_ENFORCEMENT_KEYWORDS = [
+    'test', 'testing', 'reliability', 'production', 'monitoring',
+    'slo', 'sli', 'observability', 'incident', 'health check',
+    'regression', 'performance', 'validation', 'integration test',
+    'spot-check', 'quality check', 'deployment', 'ci/cd'
+]
 
 @dataclass
 class Intent:
@@ -135,6 +145,54 @@ class IntentClassifier:
         'urgent': 1,            # "urgent", "asap", "emergency"
     }
 
+    # Complexity indicator patterns (searched in the lowercased query)
+    COMPLEXITY_PATTERNS = {
+        'multi_step': r'\band then\b|\bafter that\b',
+        'migration': r'\bmigrate\b|\bmigration\b|\bmove from\b',
+        'integration': r'\bintegrate\b|\bconnect\b|\blink\b',
+        'custom': r'\bcustom\b|\bspecific\b|\btailored\b',
+        'urgent': r'\burgent\b|\basap\b|\bemergency\b|\bimmediate\b',
+    }
+
+    # Large scale: a user/mailbox/device count with more than LARGE_SCALE_USERS users
+    SCALE_PATTERN = r'\b\d+\s*(users?|mailboxes?|devices?)\b'
+    USER_COUNT_PATTERN = r'\b(\d+)\s*users?'
+    LARGE_SCALE_USERS = 50
+
+    # "should I" questions get a +2 boost towards strategic_planning
+    STRATEGIC_BOOST_PATTERN = r'\bshould\s+i\b'
+
+    @classmethod
+    def routing_spec(cls) -> Dict[str, Dict]:
+        """Keyword and pattern groups compiled into the routing automaton."""
+        spec = {
+            f"domain:{domain}": {"keywords": keywords}
+            for domain, keywords in cls.DOMAIN_KEYWORDS.items()
+        }
+        for category, patterns in cls.INTENT_PATTERNS.items():
+            for index, pattern in enumerate(patterns):
+                spec[f"category:{category}:{index}"] = {"regex": pattern, "ignorecase": True}
+        spec["strategic_boost"] = {"regex": cls.STRATEGIC_BOOST_PATTERN, "ignorecase": True}
+        for indicator, pattern in cls.COMPLEXITY_PATTERNS.items():
+            spec[f"complexity:{indicator}"] = {"regex": pattern}
+        spec["sre"] = {"keywords": SRE_ENFORCEMENT_KEYWORDS}
+        return spec
+
+    @classmethod
+    def matcher(cls) -> MultiPatternMatcher:
+        """
+        Aho-Corasick matcher over all routing tables.
+
+        Built once per process and cached on disk; the cache is rebuilt
+        when the tables change. scan() returns every domain, category,
+        complexity and SRE enforcement hit in one pass over the query.
+        """
+        matcher = cls.__dict__.get('_matcher')
+        if matcher is None:
+            matcher = load_matcher(f"{cls.__name__.lower()}_routing", cls.routing_spec())
+            cls._matcher = matcher
+        return matcher
+
     def classify(self, user_query: str) -> Intent:
         """
         Classify user query into intent.
@@ -147,14 +205,17 @@ class IntentClassifier:
         """
         query_lower = user_query.lower()
 
+        # All keyword/pattern hits in one automaton pass
+        hits = self.matcher().scan(query_lower)
+
         # Detect domains
-        domains = self._detect_domains(query_lower)
+        domains = self._detect_domains(query_lower, hits)
 
         # Detect intent category
-        category = self._detect_category(query_lower)
+        category = self._detect_category(query_lower, hits)
 
         # Assess complexity
-        complexity = self._assess_complexity(query_lower, domains)
+        complexity = self._assess_complexity(query_lower, domains, hits)
 
         # Extract entities
         entities = self._extract_entities(user_query)
@@ -170,16 +231,13 @@ class IntentClassifier:
             entities=entities
         )
 
-    def _detect_domains(self, query_lower: str) -> List[str]:
+    def _detect_domains(self, query_lower: str, hits: Optional[frozenset] = None) -> List[str]:
         """Detect which domains query relates to"""
-        detected = []
+        if hits is None:
+            hits = self.matcher().scan(query_lower)
 
-        for domain, keywords in self.DOMAIN_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in query_lower:
-                    if domain not in detected:
-                        detected.append(domain)
-                    break  # Found domain, move to next
+        # Table order decides the primary domain
+        detected = [domain for domain in self.DOMAIN_KEYWORDS if f"domain:{domain}" in hits]
 
         # If no domains detected, mark as general
         if not detected:
@@ -187,19 +245,20 @@ class IntentClassifier:
 
         return detected
 
-    def _detect_category(self, query_lower: str) -> str:
+    def _detect_category(self, query_lower: str, hits: Optional[frozenset] = None) -> str:
         """Detect intent category"""
-        scores = {}
+        if hits is None:
+            hits = self.matcher().scan(query_lower)
 
+        # One point per matching pattern
+        scores = {}
         for category, patterns in self.INTENT_PATTERNS.items():
-            score = 0
-            for pattern in patterns:
-                if re.search(pattern, query_lower, re.IGNORECASE):
-                    score += 1
-            scores[category] = score
+            scores[category] = sum(
+                1 for index in range(len(patterns)) if f"category:{category}:{index}" in hits
+            )
 
         # Boost strategic_planning for "should I" questions
-        if re.search(r'\bshould\s+i\b', query_lower, re.IGNORECASE):
+        if "strategic_boost" in hits:
             scores['strategic_planning'] = scores.get('strategic_planning', 0) + 2
 
         # Return category with highest score
@@ -209,7 +268,8 @@ class IntentClassifier:
         # Default: operational task
         return 'operational_task'
 
-    def _assess_complexity(self, query_lower: str, domains: List[str]) -> int:
+    def _assess_complexity(self, query_lower: str, domains: List[str],
+                           hits: Optional[frozenset] = None) -> int:
         """
         Assess query complexity on 1-10 scale.
 
@@ -219,17 +279,14 @@ class IntentClassifier:
         - Query length (longer = more complex)
         - SRE/reliability work (always considered complex)
         """
+        if hits is None:
+            hits = self.matcher().scan(query_lower)
+
         complexity = 3  # Base complexity
 
         # 🚨 SRE ENFORCEMENT BOOST (Phase 134.2)
         # Reliability/testing work is inherently complex - boost to ensure routing
-        sre_keywords = [
-            'test', 'testing', 'reliability', 'production', 'monitoring',
-            'slo', 'sli', 'observability', 'incident', 'health check',
-            'regression', 'performance', 'validation', 'integration test',
-            'spot-check', 'quality check', 'deployment', 'ci/cd'
-        ]
-        if any(keyword in query_lower for keyword in sre_keywords):
+        if "sre" in hits:
             complexity = max(complexity, 5)  # Boost to at least 5 for SRE work
 
         # Multiple domains increase complexity
@@ -237,26 +294,15 @@ class IntentClassifier:
             complexity += self.COMPLEXITY_INDICATORS['multi_domain']
 
         # Check for complexity indicators
-        if re.search(r'\band then\b|\bafter that\b', query_lower):
-            complexity += self.COMPLEXITY_INDICATORS['multi_step']
+        for indicator in self.COMPLEXITY_PATTERNS:
+            if f"complexity:{indicator}" in hits:
+                complexity += self.COMPLEXITY_INDICATORS[indicator]
 
-        if re.search(r'\b\d+\s*(users?|mailboxes?|devices?)\b', query_lower):
-            num_match = re.search(r'\b(\d+)\s*users?', query_lower)
-            if num_match and int(num_match.group(1)) > 50:
+        if re.search(self.SCALE_PATTERN, query_lower):
+            num_match = re.search(self.USER_COUNT_PATTERN, query_lower)
+            if num_match and int(num_match.group(1)) > self.LARGE_SCALE_USERS:
                 complexity += self.COMPLEXITY_INDICATORS['large_scale']
 
-        if re.search(r'\bmigrate\b|\bmigration\b|\bmove from\b', query_lower):
-            complexity += self.COMPLEXITY_INDICATORS['migration']
-
-        if re.search(r'\bintegrate\b|\bconnect\b|\blink\b', query_lower):
-            complexity += self.COMPLEXITY_INDICATORS['integration']
-
-        if re.search(r'\bcustom\b|\bspecific\b|\btailored\b', query_lower):
-            complexity += self.COMPLEXITY_INDICATORS['custom']
-
-        if re.search(r'\burgent\b|\basap\b|\bemergency\b|\bimmediate\b', query_lower):
-            complexity += self.COMPLEXITY_INDICATORS['urgent']
-
         # Cap at 10
         return min(complexity, 10)
 
@@ -388,15 +434,9 @@ class AgentSelector:
         # 🚨 SRE ENFORCEMENT RULE (Phase 134.2)
         # For reliability/testing/production work, ALWAYS route to SRE Principal Engineer
         # Other agents can be consulted, but SRE delivers the final implementation
-        sre_keywords = [
-            'test', 'testing', 'reliability', 'production', 'monitoring',
-            'slo', 'sli', 'observability', 'incident', 'health check',
-            'regression', 'performance', 'validation', 'integration test',
-            'spot-check', 'quality check', 'deployment', 'ci/cd'
-        ]
-
+        # Same automaton scan as classification (memoised per query)
         query_lower = user_query.lower()
-        if any(keyword in query_lower for keyword in sre_keywords):
+        if "sre" in IntentClassifier.matcher().scan(query_lower):
             # Route to SRE Principal Engineer for reliability work
             context = {
                 'query': user_query,
@@ -819,6 +859,59 @@ def format_routing_output(routing: RoutingDecision) -> str:
     return "\n".join(output)
 
 
+def classify_for_hook(coordinator: 'CoordinatorAgent', query: str) -> tuple:
+    """
+    Classify a query into the hook's JSON routing payload.
+
+    Shared by ``cli_classify --json`` and in-process callers (the hook
+    server keeps one warm CoordinatorAgent instead of spawning this CLI).
+
+    Returns:
+        (exit_code, payload, routing) - exit_code follows cli_classify
+        (0 routing available, 2 no routing needed); routing is the
+        RoutingDecision or None
+    """
+    # Get intent first
+    intent = coordinator.intent_classifier.classify(query)
+
+    # Only display routing for non-trivial queries (complexity > 3, confidence > 70%)
+    if intent.complexity < 3 or intent.confidence < 0.70:
+        # General query - no specific routing needed
+        return 2, {
+            "routing_needed": False,
+            "intent": {
+                "category": intent.category,
+                "domains": intent.domains,
+                "complexity": intent.complexity,
+                "confidence": intent.confidence
+            }
+        }, None
+
+    # Get routing decision
+    routing = coordinator.agent_selector.select(intent, query)
+
+    if not routing or not routing.agents:
+        return 2, {"routing_needed": False}, None
+
+    return 0, {
+        "routing_needed": True,
+        "intent": {
+            "category": intent.category,
+            "domains": intent.domains,
+            "complexity": intent.complexity,
+            "confidence": intent.confidence,
+            "primary_domain": intent.domains[0] if intent.domains else "general"
+        },
+        "routing": {
+            "strategy": routing.strategy,
+            "agents": routing.agents,
+            "initial_agent": routing.initial_agent,
+            "confidence": routing.confidence,
+            "reasoning": routing.reasoning
+        }
+    }, routing
+
+
 def cli_classify(query: str, json_output: bool = False) -> int:
     """
     CLI classify command for hook integration.
@@ -834,64 +927,25 @@ def cli_classify(query: str, json_output: bool = False) -> int:
     """
     try:
         coordinator = CoordinatorAgent()
-
-        # Get intent first
-        intent = coordinator.intent_classifier.classify(query)
-
-        # Only display routing for non-trivial queries (complexity > 3, confidence > 70%)
-        if intent.complexity < 3 or intent.confidence < 0.70:
-            # General query - no specific routing needed
-            if json_output:
-                import json
-                print(json.dumps({
-                    "routing_needed": False,
-                    "intent": {
-                        "category": intent.category,
-                        "domains": intent.domains,
-                        "complexity": intent.complexity,
-                        "confidence": intent.confidence
-                    }
-                }))
-            return 2
-
-        # Get routing decision
-        routing = coordinator.agent_selector.select(intent, query)
-
-        if not routing or not routing.agents:
-            if json_output:
-                import json
-                print(json.dumps({"routing_needed": False}))
-            return 2
+        exit_code, payload, routing = classify_for_hook(coordinator, query)
 
         # JSON output format (Phase 134 - Swarm Auto-Loader integration)
         if json_output:
             import json
-            output_data = {
-                "routing_needed": True,
-                "intent": {
-                    "category": intent.category,
-                    "domains": intent.domains,
-                    "complexity": intent.complexity,
-                    "confidence": intent.confidence,
-                    "primary_domain": intent.domains[0] if intent.domains else "general"
-                },
-                "routing": {
-                    "strategy": routing.strategy,
-                    "agents": routing.agents,
-                    "initial_agent": routing.initial_agent,
-                    "confidence": routing.confidence,
-                    "reasoning": routing.reasoning
-                }
-            }
-            print(json.dumps(output_data))
-            return 0
+            print(json.dumps(payload))
+            return exit_code
+
+        if exit_code != 0:
+            return exit_code
+
+        intent = payload["intent"]
 
         # Human-readable output format (original)
         output = []
-        output.append(f"   Intent: {intent.category}")
-        output.append(f"   Domains: {', '.join(intent.domains)}")
-        output.append(f"   Complexity: {intent.complexity}/10")
-        output.append(f"   Confidence: {int(intent.confidence * 100)}%")
+        output.append(f"   Intent: {intent['category']}")
+        output.append(f"   Domains: {', '.join(intent['domains'])}")
+        output.append(f"   Complexity: {intent['complexity']}/10")
+        output.append(f"   Confidence: {int(intent['confidence'] * 100)}%")
         output.append("")
 
         if len(routing.agents) == 1:
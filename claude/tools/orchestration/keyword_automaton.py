@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Keyword Automaton - Aho-Corasick multi-pattern matching for routing tables.
+
+IntentClassifier used to test every domain keyword with a substring check
+and run every INTENT_PATTERNS regex separately, and AgentSelector scanned
+the SRE enforcement list again, so classification cost grew with every
+keyword an agent added. MultiPatternMatcher compiles all of those tables
+into one Aho-Corasick automaton and reports every matching group in a
+single pass over the query.
+
+Group specs:
+    {"keywords": [...]}                   - any keyword is a substring
+    {"regex": r"\\b(a|b c)\\b", "ignorecase": True}
+        - literal word alternations (``\\b(a|b)\\b`` or ``\\ba\\b|\\bb\\b``)
+          become automaton terms with word-boundary checks; anything
+          else (``\\?$``, ``\\s+``...) falls back to re.search
+
+The compiled automaton is cached as JSON under ~/.maia/cache and rebuilt
+when the spec digest changes (i.e. when the keyword tables change).
+
+Stdlib-only so the hook's compiled classifier can import it cheaply.
+
+Usage:
+    from keyword_automaton import load_matcher
+
+    matcher = load_matcher("coordinator", {
+        "domain:dns": {"keywords": ["dns", "spf"]},
+        "category:question:0": {"regex": r"\\b(what|how)\\b", "ignorecase": True},
+    })
+    hits = matcher.scan("how do i set up spf?")   # frozenset of group names
+
+Author: Maia System
+Created: 2026-10-16
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+AUTOMATON_FORMAT = 1
+
+# Queries memoised per matcher (classifier and selector scan the same query)
+SCAN_CACHE_SIZE = 256
+
+# \b(alt|alt)\b  or  \balt\b|\balt\b  with plain-word alternatives
+_GROUPED_ALTERNATION = re.compile(r'^\\b\(([\w |]+)\)\\b$')
+_WORD_ALTERNATIVE = re.compile(r'^\\b([\w ]+)\\b$')
+
+
+def default_cache_dir() -> Path:
+    return Path.home() / ".maia" / "cache"
+
+
+def literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """
+    Split a word-alternation regex into its literal alternatives.
+
+    Returns:
+        The alternatives, or None if the pattern needs the regex engine
+    """
+    grouped = _GROUPED_ALTERNATION.match(pattern)
+    if grouped:
+        alternatives = grouped.group(1).split('|')
+    else:
+        alternatives = []
+        for part in pattern.split('|'):
+            word = _WORD_ALTERNATIVE.match(part)
+            if not word:
+                return None
+            alternatives.append(word.group(1))
+    if not all(alternatives):
+        return None
+    return alternatives
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _at_boundary(text: str, index: int) -> bool:
+    """Python's ``\\b`` at text[index]."""
+    before = index > 0 and _is_word(text[index - 1])
+    after = index < len(text) and _is_word(text[index])
+    return before != after
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed list of terms."""
+
+    def __init__(self, terms: List[str], goto: List[Dict[str, int]],
+                 fail: List[int], out: List[List[int]]):
+        self.terms = terms
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    @classmethod
+    def build(cls, terms: List[str]) -> "KeywordAutomaton":
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for index, term in enumerate(terms):
+            state = 0
+            for char in term:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(index)
+
+        # Breadth-first failure links; merge outputs so matching needs no
+        # output-link walk
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(char, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        return cls(list(terms), goto, fail, out)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (term_index, end_offset) for every occurrence of every term."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                end = position + 1
+                for index in out[state]:
+                    yield index, end
+
+    def to_dict(self) -> Dict:
+        return {"terms": self.terms, "goto": self._goto, "fail": self._fail, "out": self._out}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "KeywordAutomaton":
+        return cls(data["terms"], data["goto"], data["fail"], data["out"])
+
+
+class MultiPatternMatcher:
+    """
+    Named keyword/regex groups matched in one automaton pass.
+
+    scan() takes the text as the classifiers see it (already lowercased);
+    ignorecase groups lowercase their literal terms to match.
+    """
+
+    def __init__(self, automaton: KeywordAutomaton, term_groups: List[List],
+                 fallbacks: List[List], digest: str = ""):
+        """
+        Args:
+            automaton: Compiled automaton over all literal terms
+            term_groups: Per term, [group_names, needs_word_boundaries]
+            fallbacks: [group_name, pattern, ignorecase] for non-literal regexes
+            digest: Digest of the spec the matcher was built from
+        """
+        self.automaton = automaton
+        self.digest = digest
+        self._term_groups = term_groups
+        self._fallbacks_spec = fallbacks
+        self._fallbacks = [
+            (group, re.compile(pattern, re.IGNORECASE if ignorecase else 0))
+            for group, pattern, ignorecase in fallbacks
+        ]
+        self.scan = lru_cache(maxsize=SCAN_CACHE_SIZE)(self._scan)
+
+    @staticmethod
+    def spec_digest(spec: Dict[str, Dict]) -> str:
+        payload = json.dumps([AUTOMATON_FORMAT, spec], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def build(cls, spec: Dict[str, Dict]) -> "MultiPatternMatcher":
+        """Compile {group_name: {"keywords": [...]} | {"regex": ..., "ignorecase": ...}}."""
+        term_index: Dict[Tuple[str, bool], int] = {}
+        terms: List[str] = []
+        term_groups: List[List] = []
+        fallbacks: List[List] = []
+
+        def add_term(term: str, group: str, boundary: bool) -> None:
+            key = (term, boundary)
+            if key not in term_index:
+                term_index[key] = len(terms)
+                terms.append(term)
+                term_groups.append([[], boundary])
+            groups = term_groups[term_index[key]][0]
+            if group not in groups:
+                groups.append(group)
+
+        for group, group_spec in spec.items():
+            if "keywords" in group_spec:
+                for keyword in group_spec["keywords"]:
+                    add_term(keyword, group, False)
+                continue
+            pattern = group_spec["regex"]
+            ignorecase = group_spec.get("ignorecase", False)
+            alternatives = literal_alternatives(pattern)
+            if alternatives is None:
+                fallbacks.append([group, pattern, ignorecase])
+                continue
+            for alternative in alternatives:
+                add_term(alternative.lower() if ignorecase else alternative, group, True)
+
+        return cls(KeywordAutomaton.build(terms), term_groups, fallbacks, cls.spec_digest(spec))
+
+    def _scan(self, text: str) -> frozenset:
+        hits = set()
+        term_groups = self._term_groups
+        terms = self.automaton.terms
+        for index, end in self.automaton.iter_matches(text):
+            groups, boundary = term_groups[index]
+            if boundary and not (
+                _at_boundary(text, end - len(terms[index])) and _at_boundary(text, end)
+            ):
+                continue
+            hits.update(groups)
+        for group, pattern in self._fallbacks:
+            if group not in hits and pattern.search(text):
+                hits.add(group)
+        return frozenset(hits)
+
+    def to_dict(self) -> Dict:
+        return {
+            "format": AUTOMATON_FORMAT,
+            "digest": self.digest,
+            "automaton": self.automaton.to_dict(),
+            "term_groups": self._term_groups,
+            "fallbacks": self._fallbacks_spec,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MultiPatternMatcher":
+        if data.get("format") != AUTOMATON_FORMAT:
+            raise ValueError(f"Unsupported automaton format: {data.get('format')}")
+        return cls(
+            KeywordAutomaton.from_dict(data["automaton"]),
+            data["term_groups"],
+            data["fallbacks"],
+            data.get("digest", ""),
+        )
+
+
+def load_matcher(name: str, spec: Dict[str, Dict],
+                 cache_dir: Optional[Path] = None) -> MultiPatternMatcher:
+    """
+    Load a matcher from the disk cache, rebuilding it if the spec changed.
+
+    Args:
+        name: Cache name (one file per name)
+        spec: Group spec (see MultiPatternMatcher.build)
+        cache_dir: Cache directory (default: ~/.maia/cache)
+
+    Returns:
+        MultiPatternMatcher for spec (built in memory if the cache is unusable)
+    """
+    cache_file = Path(cache_dir or default_cache_dir()) / f"{name}_automaton.json"
+    digest = MultiPatternMatcher.spec_digest(spec)
+    try:
+        data = json.loads(cache_file.read_text())
+        if data.get("digest") == digest:
+            return MultiPatternMatcher.from_dict(data)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    matcher = MultiPatternMatcher.build(spec)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(matcher.to_dict()))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Cache is an optimisation only
+    return matcher
@@ -11,20 +11,41 @@ Key Features:
 - Semantic similarity search
 - Agent reasoning about relevant history
 
+Vector index:
+- TF-IDF (sparse) embeddings are stored as term postings (phase_terms);
+  a query is one SQL join + GROUP BY over the query's terms only
+- Ollama (dense) embeddings are stored as packed float32 blobs and scored
+  with one matrix-vector product (numpy when installed), cached in memory
+  until the index generation changes
+- Metadata filters are evaluated in SQL (json_extract)
+
 Author: Maia System
 Created: 2025-11-24 (Agentic AI Enhancement Project - Phase 3)
 """
 
 import json
 import math
+import operator
 import re
 import sqlite3
 import hashlib
+import time
+from array import array
 from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Content returned per search result
+RESULT_CONTENT_CHARS = 500
+
 
 @dataclass
 class PhaseDocument:
@@ -74,6 +95,9 @@ class SemanticSystemState:
         self.vocabulary = {}
         self.idf = {}
 
+        # Dense matrices by dimension: (generation, {dim: (phase_ids, rows, norms)})
+        self._dense_cache = None
+
         self._init_database()
         self._load_vocabulary()
 
@@ -109,9 +133,78 @@ class SemanticSystemState:
             ON phases(content_hash)
         """)
 
+        # Table 3: Sparse (TF-IDF) vector index - one row per non-zero term
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS phase_terms (
+                term TEXT NOT NULL,
+                phase_id INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                PRIMARY KEY (term, phase_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_phase_terms_phase
+            ON phase_terms(phase_id)
+        """)
+
+        # Table 4: Index generation (invalidates in-memory dense matrices)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER
+            )
+        """)
+
+        # Dense embeddings as packed float32; 'indexed' marks rows whose
+        # embedding is in the vector index (older DBs only had embedding_json)
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(phases)")}
+        if 'embedding_blob' not in columns:
+            cursor.execute("ALTER TABLE phases ADD COLUMN embedding_blob BLOB")
+        if 'indexed' not in columns:
+            cursor.execute("ALTER TABLE phases ADD COLUMN indexed INTEGER DEFAULT 0")
+
+        self._backfill_vector_index(cursor)
+
         conn.commit()
         conn.close()
 
+    def _backfill_vector_index(self, cursor):
+        """Index embeddings stored as JSON by earlier versions."""
+        cursor.execute("""
+            SELECT phase_id, embedding_json FROM phases
+            WHERE indexed IS NOT 1 AND embedding_json IS NOT NULL
+        """)
+        for phase_id, emb_json in cursor.fetchall():
+            try:
+                embedding = json.loads(emb_json)
+            except ValueError:
+                embedding = None
+            self._index_embedding(cursor, phase_id, embedding)
+
+    def _index_embedding(self, cursor, phase_id: int, embedding: Any):
+        """Write a phase's embedding into the vector index."""
+        cursor.execute("DELETE FROM phase_terms WHERE phase_id = ?", (phase_id,))
+        blob = None
+        if isinstance(embedding, dict):
+            cursor.executemany(
+                "INSERT INTO phase_terms (term, phase_id, weight) VALUES (?, ?, ?)",
+                [(term, phase_id, weight) for term, weight in embedding.items()]
+            )
+        elif isinstance(embedding, list) and embedding:
+            blob = array('f', embedding).tobytes()
+        cursor.execute(
+            "UPDATE phases SET embedding_blob = ?, indexed = 1 WHERE phase_id = ?",
+            (blob, phase_id)
+        )
+        self._bump_generation(cursor)
+
+    @staticmethod
+    def _bump_generation(cursor):
+        cursor.execute("""
+            INSERT INTO index_meta (key, value) VALUES ('generation', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+        """)
+
     def _load_vocabulary(self):
         """Load vocabulary from database"""
         conn = sqlite3.connect(self.sqlite_path)
@@ -146,27 +239,32 @@ class SemanticSystemState:
         conn = sqlite3.connect(self.sqlite_path)
         cursor = conn.cursor()
 
+        self._store_phase(cursor, phase_id, title, content, metadata, embedding, content_hash)
+
+        # Update vocabulary (using same connection)
+        self._update_vocabulary_with_cursor(full_text, cursor)
+
+        conn.commit()
+        conn.close()
+
+        # Reload vocabulary
+        self._load_vocabulary()
+
+    def _store_phase(self, cursor, phase_id: int, title: str, content: str,
+                     metadata: Optional[Dict], embedding: Any, content_hash: str):
+        """Insert/replace a phase row and its vector index entries."""
         cursor.execute("""
             INSERT OR REPLACE INTO phases
             (phase_id, title, content, metadata_json, embedding_json, content_hash)
-            VALUES (?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, NULL, ?)
         """, (
             phase_id,
             title,
             content,
             json.dumps(metadata or {}),
-            json.dumps(embedding),
             content_hash
         ))
-
-        # Update vocabulary (using same connection)
-        self._update_vocabulary_with_cursor(full_text, cursor)
-
-        conn.commit()
-        conn.close()
-
-        # Reload vocabulary
-        self._load_vocabulary()
+        self._index_embedding(cursor, phase_id, embedding)
 
     def _update_vocabulary_with_cursor(self, text: str, cursor):
         """Update vocabulary with terms from text using existing cursor"""
@@ -304,47 +402,235 @@ class SemanticSystemState:
         Returns:
             List of matching phases with relevance scores
         """
-        query_embedding = self.generate_embedding(query)
+        return self.search_by_embedding(self.generate_embedding(query), limit, filter_metadata)
+
+    def search_by_embedding(
+        self,
+        query_embedding: Any,
+        limit: int = 10,
+        filter_metadata: Dict = None
+    ) -> List[Dict]:
+        """
+        Search with a precomputed query embedding.
+
+        Args:
+            query_embedding: TF-IDF dict or dense vector (see generate_embedding)
+            limit: Maximum results
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            List of matching phases with relevance scores
+        """
+        if limit <= 0:
+            return []
 
         conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
+        try:
+            cursor = conn.cursor()
+            where_sql, params = self._metadata_filter_sql(cursor, filter_metadata)
+
+            if isinstance(query_embedding, list) and query_embedding:
+                nonzero = self._dense_scores(cursor, query_embedding, where_sql, params)
+                ranked = None
+            else:
+                ranked, nonzero = self._sparse_scores(
+                    cursor, query_embedding or {}, limit, where_sql, params
+                )
+
+            if ranked is None or len(ranked) < limit:
+                ranked = self._rank(cursor, nonzero, limit, where_sql, params)
+
+            return self._fetch_results(cursor, ranked)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _metadata_filter_sql(cursor, filter_metadata: Optional[Dict]) -> Tuple[str, list]:
+        """
+        Translate a metadata filter into a WHERE clause over phases.
 
-        cursor.execute("""
-            SELECT phase_id, title, content, metadata_json, embedding_json
-            FROM phases
-        """)
+        Scalars compare with json_extract (None matches missing keys, as
+        dict.get() did); dict/list values are checked in Python and passed
+        back in as a phase_id list.
+        """
+        clauses, params, residual = [], [], {}
+        for key, value in (filter_metadata or {}).items():
+            path = '$."' + str(key).replace('"', '\\"') + '"'
+            if value is None:
+                clauses.append("json_extract(p.metadata_json, ?) IS NULL")
+                params.append(path)
+            elif isinstance(value, (str, int, float)):
+                clauses.append("json_extract(p.metadata_json, ?) = ?")
+                params.extend([path, int(value) if isinstance(value, bool) else value])
+            else:
+                residual[key] = value
+
+        if residual:
+            where = " AND ".join(clauses) or "1"
+            cursor.execute(f"SELECT p.phase_id, p.metadata_json FROM phases p WHERE {where}", params)
+            allowed = []
+            for phase_id, meta_json in cursor.fetchall():
+                metadata = json.loads(meta_json) if meta_json else {}
+                if all(metadata.get(k) == v for k, v in residual.items()):
+                    allowed.append(phase_id)
+            clauses.append("p.phase_id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(allowed))
+
+        return " AND ".join(clauses) or "1", params
+
+    def _sparse_scores(
+        self,
+        cursor,
+        query_embedding: Dict[str, float],
+        limit: int,
+        where_sql: str,
+        params: list
+    ) -> Tuple[List[Tuple[int, float]], Dict[int, float]]:
+        """
+        Score TF-IDF embeddings against the query via the postings table.
 
-        results = []
-        for row in cursor.fetchall():
-            phase_id, title, content, meta_json, emb_json = row
-            metadata = json.loads(meta_json) if meta_json else {}
+        Returns:
+            (top positive (phase_id, score) pairs, all non-zero scores if the
+            top list is short - needed to rank zero and negative scores)
+        """
+        scored_sql = f"""
+            WITH q(term, weight) AS (SELECT key, value FROM json_each(?))
+            SELECT t.phase_id, SUM(t.weight * q.weight) AS relevance
+            FROM q
+            JOIN phase_terms t ON t.term = q.term
+            JOIN phases p ON p.phase_id = t.phase_id
+            WHERE {where_sql}
+            GROUP BY t.phase_id
+        """
+        query_json = json.dumps(query_embedding)
+        cursor.execute(
+            scored_sql + " HAVING relevance > 0 ORDER BY relevance DESC, t.phase_id LIMIT ?",
+            [query_json, *params, limit]
+        )
+        ranked = cursor.fetchall()
+        if len(ranked) == limit:
+            return ranked, {}
 
-            # Apply metadata filter
-            if filter_metadata:
-                match = all(metadata.get(k) == v for k, v in filter_metadata.items())
-                if not match:
-                    continue
+        cursor.execute(scored_sql + " HAVING relevance != 0", [query_json, *params])
+        return ranked, dict(cursor.fetchall())
 
-            # Calculate similarity
-            try:
-                stored_emb = json.loads(emb_json) if emb_json else {}
-                relevance = self.calculate_similarity(query_embedding, stored_emb)
-            except Exception:
-                relevance = 0.0
+    def _dense_matrices(self, cursor) -> Dict[int, tuple]:
+        """Dense embeddings grouped by dimension, cached per index generation."""
+        row = cursor.execute("SELECT value FROM index_meta WHERE key = 'generation'").fetchone()
+        generation = row[0] if row else 0
+        if self._dense_cache is not None and self._dense_cache[0] == generation:
+            return self._dense_cache[1]
 
+        by_dim: Dict[int, Tuple[list, list]] = {}
+        cursor.execute("""
+            SELECT phase_id, embedding_blob FROM phases
+            WHERE embedding_blob IS NOT NULL ORDER BY phase_id
+        """)
+        for phase_id, blob in cursor.fetchall():
+            vector = array('f')
+            vector.frombytes(blob)
+            ids, rows = by_dim.setdefault(len(vector), ([], []))
+            ids.append(phase_id)
+            rows.append(vector)
+
+        matrices = {}
+        for dim, (ids, rows) in by_dim.items():
+            if NUMPY_AVAILABLE:
+                matrix = np.frombuffer(b"".join(r.tobytes() for r in rows), dtype=np.float32)
+                matrix = matrix.reshape(len(rows), dim)
+                norms = np.linalg.norm(matrix, axis=1)
+                norms[norms == 0] = 1
+                matrices[dim] = (np.asarray(ids), matrix, norms)
+            else:
+                norms = [math.sqrt(sum(x * x for x in r)) or 1 for r in rows]
+                matrices[dim] = (ids, rows, norms)
+
+        self._dense_cache = (generation, matrices)
+        return matrices
+
+    def _dense_scores(
+        self,
+        cursor,
+        query_embedding: List[float],
+        where_sql: str,
+        params: list
+    ) -> Dict[int, float]:
+        """Cosine similarity of every same-dimension dense embedding (non-zero only)."""
+        matrices = self._dense_matrices(cursor)
+        entry = matrices.get(len(query_embedding))
+        if entry is None:
+            return {}
+        ids, rows, norms = entry
+        query_norm = math.sqrt(sum(x * x for x in query_embedding)) or 1
+
+        if NUMPY_AVAILABLE:
+            query_vec = np.asarray(query_embedding, dtype=np.float32)
+            scores = (rows @ query_vec) / (norms * query_norm)
+            keep = np.flatnonzero(scores)
+            nonzero = dict(zip(ids[keep].tolist(), scores[keep].astype(float).tolist()))
+        else:
+            query_vec = array('f', query_embedding)
+            nonzero = {}
+            for phase_id, row, norm in zip(ids, rows, norms):
+                score = sum(map(operator.mul, row, query_vec)) / (norm * query_norm)
+                if score:
+                    nonzero[phase_id] = score
+
+        if where_sql != "1" and nonzero:
+            cursor.execute(f"SELECT p.phase_id FROM phases p WHERE {where_sql}", params)
+            allowed = {row[0] for row in cursor.fetchall()}
+            nonzero = {pid: score for pid, score in nonzero.items() if pid in allowed}
+        return nonzero
+
+    @staticmethod
+    def _rank(
+        cursor,
+        nonzero: Dict[int, float],
+        limit: int,
+        where_sql: str,
+        params: list
+    ) -> List[Tuple[int, float]]:
+        """
+        Top phases by (relevance desc, phase_id) including zero scores.
+
+        Phases without a non-zero score rank between positive and negative
+        scores, in phase_id order - as the full-table sort did.
+        """
+        ordered = sorted(nonzero.items(), key=lambda item: (-item[1], item[0]))
+        ranked = [item for item in ordered if item[1] > 0][:limit]
+        if len(ranked) < limit:
+            cursor.execute(f"""
+                SELECT p.phase_id FROM phases p
+                WHERE {where_sql} AND p.phase_id NOT IN (SELECT value FROM json_each(?))
+                ORDER BY p.phase_id LIMIT ?
+            """, [*params, json.dumps(list(nonzero)), limit - len(ranked)])
+            ranked.extend((row[0], 0.0) for row in cursor.fetchall())
+        if len(ranked) < limit:
+            ranked.extend(item for item in ordered if item[1] < 0)
+        return ranked[:limit]
+
+    @staticmethod
+    def _fetch_results(cursor, ranked: List[Tuple[int, float]]) -> List[Dict]:
+        """Load result rows for ranked (phase_id, relevance) pairs."""
+        if not ranked:
+            return []
+        cursor.execute(f"""
+            SELECT phase_id, title, substr(content, 1, {RESULT_CONTENT_CHARS}), metadata_json
+            FROM phases WHERE phase_id IN (SELECT value FROM json_each(?))
+        """, (json.dumps([phase_id for phase_id, _ in ranked]),))
+        rows = {row[0]: row for row in cursor.fetchall()}
+
+        results = []
+        for phase_id, relevance in ranked:
+            _, title, content, meta_json = rows[phase_id]
             results.append({
                 'phase_id': phase_id,
                 'title': title,
-                'content': content[:500],
-                'metadata': metadata,
+                'content': content,
+                'metadata': json.loads(meta_json) if meta_json else {},
                 'relevance': relevance
             })
-
-        conn.close()
-
-        # Sort by relevance
-        results.sort(key=lambda x: x['relevance'], reverse=True)
-        return results[:limit]
+        return results
 
     def update_phase(self, phase_id: int, title: str, content: str, metadata: Dict = None):
         """Update an existing phase"""
@@ -355,6 +641,8 @@ class SemanticSystemState:
         conn = sqlite3.connect(self.sqlite_path)
         cursor = conn.cursor()
         cursor.execute("DELETE FROM phases WHERE phase_id = ?", (phase_id,))
+        cursor.execute("DELETE FROM phase_terms WHERE phase_id = ?", (phase_id,))
+        self._bump_generation(cursor)
         conn.commit()
         conn.close()
 
@@ -384,7 +672,7 @@ class SemanticSystemState:
 
         # Get source phase
         cursor.execute("""
-            SELECT title, content, embedding_json FROM phases WHERE phase_id = ?
+            SELECT title, content FROM phases WHERE phase_id = ?
         """, (phase_id,))
 
         row = cursor.fetchone()
@@ -393,8 +681,7 @@ class SemanticSystemState:
         if not row:
             return []
 
-        title, content, emb_json = row
-        source_emb = json.loads(emb_json) if emb_json else self.generate_embedding(f"{title}\n{content}")
+        title, content = row
 
         # Search excluding source
         results = self.search(f"{title} {content}", limit=limit + 1)
@@ -434,6 +721,99 @@ class SemanticSystemState:
         return phases
 
 
+def benchmark_search(phases: int = 10_000, dims: int = 768, queries: int = 5,
+                     limit: int = 10, seed: int = 42) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the vector index against the old full-table scan.
+
+    Builds synthetic TF-IDF and dense (Ollama-sized) indexes in a temp
+    directory. The baseline replays the previous search(): decode every
+    stored embedding_json and score it in Python.
+
+    Returns:
+        {"sparse"|"dense": {"full_scan_ms": ..., "index_ms": ...}} (medians)
+    """
+    import random
+    import shutil
+    import tempfile
+
+    rng = random.Random(seed)
+    vocab = [f"term{i:05d}" for i in range(5_000)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    temp_dir = Path(tempfile.mkdtemp(prefix="semantic_bench_"))
+
+    def full_scan(search: SemanticSystemState, query_embedding) -> List[Dict]:
+        conn = sqlite3.connect(search.sqlite_path)
+        results = []
+        for phase_id, title, content, meta_json, emb_json in conn.execute(
+            "SELECT phase_id, title, content, metadata_json, embedding_json FROM phases"
+        ):
+            stored = json.loads(emb_json) if emb_json else {}
+            results.append({
+                'phase_id': phase_id,
+                'title': title,
+                'content': content[:RESULT_CONTENT_CHARS],
+                'metadata': json.loads(meta_json) if meta_json else {},
+                'relevance': search.calculate_similarity(query_embedding, stored)
+            })
+        conn.close()
+        results.sort(key=lambda x: x['relevance'], reverse=True)
+        return results[:limit]
+
+    def build(name: str, make_embedding) -> SemanticSystemState:
+        search = SemanticSystemState(db_path=str(temp_dir / name))
+        search.idf = {term: math.log(2 + rank / 10) for rank, term in enumerate(vocab)}
+        conn = sqlite3.connect(search.sqlite_path)
+        cursor = conn.cursor()
+        for phase_id in range(phases):
+            content = " ".join(rng.choices(vocab, weights, k=60))
+            embedding = make_embedding(search, content)
+            search._store_phase(cursor, phase_id, f"Phase {phase_id}", content,
+                                {'year': str(2020 + phase_id % 6)}, embedding, "")
+            # Baseline storage (what add_phase used to write)
+            cursor.execute("UPDATE phases SET embedding_json = ? WHERE phase_id = ?",
+                           (json.dumps(embedding), phase_id))
+        conn.commit()
+        conn.close()
+        return search
+
+    def median_ms(fn, args_list) -> float:
+        samples = []
+        for args in args_list:
+            start = time.perf_counter()
+            fn(*args)
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+        return round(samples[len(samples) // 2] * 1000, 2)
+
+    def dense_vector() -> List[float]:
+        return [rng.random() - 0.5 for _ in range(dims)]
+
+    try:
+        results = {}
+
+        sparse = build("sparse", lambda search, text: search._tfidf_embedding(text))
+        sparse_queries = [
+            (sparse, sparse._tfidf_embedding(" ".join(rng.choices(vocab, weights, k=5))))
+            for _ in range(queries)
+        ]
+        results["sparse"] = {
+            "full_scan_ms": median_ms(full_scan, sparse_queries),
+            "index_ms": median_ms(lambda s, q: s.search_by_embedding(q, limit), sparse_queries),
+        }
+
+        dense = build("dense", lambda search, text: dense_vector())
+        dense_queries = [(dense, dense_vector()) for _ in range(queries)]
+        dense.search_by_embedding(dense_queries[0][1], limit)  # Load the matrix cache
+        results["dense"] = {
+            "full_scan_ms": median_ms(full_scan, dense_queries),
+            "index_ms": median_ms(lambda s, q: s.search_by_embedding(q, limit), dense_queries),
+        }
+        return results
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def main():
     """CLI for semantic search"""
     import argparse
@@ -453,8 +833,21 @@ def main():
     # Stats command
     subparsers.add_parser('stats', help='Show index statistics')
 
+    # Benchmark command
+    bench_parser = subparsers.add_parser('benchmark', help='Vector index vs full scan')
+    bench_parser.add_argument('--phases', type=int, default=10_000)
+    bench_parser.add_argument('--dims', type=int, default=768)
+
     args = parser.parse_args()
 
+    if args.command == 'benchmark':
+        backend = "numpy" if NUMPY_AVAILABLE else "pure Python"
+        print(f"\nSemantic Search Benchmark ({args.phases} phases, {args.dims}-dim dense, {backend})")
+        print("=" * 60)
+        for kind, timing in benchmark_search(args.phases, args.dims).items():
+            print(f"{kind:<8} full scan {timing['full_scan_ms']:>9.2f}ms   index {timing['index_ms']:>9.2f}ms")
+        return
+
     search = SemanticSystemState()
 
     if args.command == 'search':
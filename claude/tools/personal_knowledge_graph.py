@@ -28,8 +28,11 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
 import threading
+import bisect
+import itertools
 import numpy as np
 from collections import defaultdict, deque
+from collections.abc import MutableMapping
 import pickle
 
 # Import path manager
@@ -179,6 +182,277 @@ class KnowledgeInsight:
     validity_period: timedelta = field(default=timedelta(days=30))
 
 
+# Integer codes for node/relationship types in the vectorised indexes
+NODE_TYPE_CODES = {node_type: code for code, node_type in enumerate(NodeType)}
+RELATIONSHIP_TYPE_CODES = {rel_type: code for code, rel_type in enumerate(RelationshipType)}
+
+
+class NodeEmbeddingIndex(MutableMapping):
+    """
+    Node embeddings in one contiguous float32 matrix.
+
+    Behaves like the node_id -> embedding dict it replaces, and keeps
+    per-row node type, confidence and lowercased name/description so that
+    semantic search is a single masked matrix-vector product plus top-k.
+    """
+
+    def __init__(self, dimension: int, capacity: int = 1024):
+        self.dimension = dimension
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.zeros((capacity, dimension), dtype=np.float32)
+        self._norms = np.zeros(capacity, dtype=np.float32)
+        self._types = np.full(capacity, -1, dtype=np.int16)
+        self._confidence = np.ones(capacity, dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        # "name\x00description" per row, joined with \x01 for keyword scans
+        self._texts: List[str] = []
+        self._text_blob: Optional[str] = None
+        self._text_offsets: List[int] = []
+
+    def _as_vector(self, embedding: np.ndarray) -> np.ndarray:
+        """Truncate or zero-pad to the index dimension as float32"""
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        values = np.asarray(embedding, dtype=np.float32).ravel()[:self.dimension]
+        vector[:len(values)] = values
+        return vector
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._norms)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        self._matrix = np.resize(self._matrix, (capacity, self.dimension))
+        self._norms = np.resize(self._norms, capacity)
+        self._types = np.resize(self._types, capacity)
+        self._confidence = np.resize(self._confidence, capacity)
+        self._alive = np.resize(self._alive, capacity)
+
+    def __setitem__(self, node_id: str, embedding: np.ndarray) -> None:
+        vector = self._as_vector(embedding)
+        row = self._rows.get(node_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(node_id)
+            self._texts.append("")
+            self._rows[node_id] = row
+            self._types[row] = -1
+            self._confidence[row] = 1.0
+            self._text_blob = None
+        self._matrix[row] = vector
+        self._norms[row] = np.linalg.norm(vector)
+        self._alive[row] = True
+
+    def __getitem__(self, node_id: str) -> np.ndarray:
+        return self._matrix[self._rows[node_id]].copy()
+
+    def __delitem__(self, node_id: str) -> None:
+        row = self._rows.pop(node_id)
+        self._alive[row] = False
+        self._texts[row] = ""
+        self._text_blob = None
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def set_node_info(self, node: 'KnowledgeNode') -> None:
+        """Record the type, confidence and searchable text of an indexed node"""
+        row = self._rows.get(node.node_id)
+        if row is None:
+            return
+        self._types[row] = NODE_TYPE_CODES[node.node_type]
+        self._confidence[row] = node.confidence
+        self._texts[row] = f"{node.name}\x00{node.description}".lower()
+        self._text_blob = None
+
+    def keyword_boosts(self, keywords: List[str], weight: float) -> np.ndarray:
+        """
+        Per-row boost of `weight` for each keyword found in a node's name or
+        description (case-insensitive substring, as before).
+        """
+        size = len(self._ids)
+        boosts = np.zeros(size, dtype=np.float32)
+        if not keywords or not size:
+            return boosts
+
+        if self._text_blob is None:
+            self._text_blob = "\x01".join(self._texts)
+            self._text_offsets = list(itertools.accumulate(
+                (len(text) + 1 for text in self._texts[:-1]), initial=0
+            ))
+        blob, offsets = self._text_blob, self._text_offsets
+
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if not keyword:
+                boosts += weight
+                continue
+            # One str.find per matching row: jump to the next row after a hit
+            position = blob.find(keyword)
+            while position != -1:
+                row = bisect.bisect_right(offsets, position) - 1
+                boosts[row] += weight
+                if row + 1 >= size:
+                    break
+                position = blob.find(keyword, offsets[row + 1])
+        return boosts
+
+    def top_k(self, query: np.ndarray, k: int, node_types: Optional[List[NodeType]] = None,
+              min_confidence: float = 0.0, boosts: Optional[np.ndarray] = None,
+              max_score: float = 1.0) -> List[Tuple[str, float]]:
+        """
+        Highest-scoring (node_id, score) pairs by cosine similarity.
+
+        Rows are filtered by node type and confidence masks; `boosts` is added
+        to the cosine score before capping at `max_score`. Ties keep
+        insertion order.
+        """
+        size = len(self._ids)
+        if not size or k <= 0:
+            return []
+
+        query = self._as_vector(query)
+        denominators = self._norms[:size] * np.linalg.norm(query)
+        scores = np.divide(self._matrix[:size] @ query, denominators,
+                           out=np.zeros(size, dtype=np.float32), where=denominators > 0)
+        if boosts is not None:
+            scores += boosts
+        np.minimum(scores, max_score, out=scores)
+
+        mask = self._alive[:size] & (self._confidence[:size] >= min_confidence)
+        if node_types:
+            mask &= np.isin(self._types[:size], [NODE_TYPE_CODES[t] for t in node_types])
+        candidates = np.flatnonzero(mask)
+        if not candidates.size:
+            return []
+
+        candidate_scores = scores[candidates]
+        if k < candidates.size:
+            selected = np.argpartition(-candidate_scores, k - 1)[:k]
+            selected.sort()
+        else:
+            selected = np.arange(candidates.size)
+        order = selected[np.argsort(-candidate_scores[selected], kind="stable")]
+        return [(self._ids[candidates[i]], float(candidate_scores[i])) for i in order]
+
+
+class RelationshipAdjacency:
+    """
+    CSR adjacency over relationships for neighbour lookups and multi-hop
+    traversal. Each relationship is listed under both of its nodes. Edits are
+    appended and the CSR arrays are rebuilt lazily on the next query.
+    """
+
+    def __init__(self):
+        self._node_rows: Dict[str, int] = {}
+        self._node_ids: List[str] = []
+        self._relationship_ids: List[str] = []
+        self._sources: List[int] = []
+        self._targets: List[int] = []
+        self._types: List[int] = []
+        self._built = False
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._neighbours = np.zeros(0, dtype=np.int64)
+        self._edge_relationships = np.zeros(0, dtype=np.int64)
+        self._edge_types = np.zeros(0, dtype=np.int16)
+
+    def _node_row(self, node_id: str) -> int:
+        row = self._node_rows.get(node_id)
+        if row is None:
+            row = self._node_rows[node_id] = len(self._node_ids)
+            self._node_ids.append(node_id)
+        return row
+
+    def add(self, relationship: 'KnowledgeRelationship') -> None:
+        self._relationship_ids.append(relationship.relationship_id)
+        self._sources.append(self._node_row(relationship.source_node_id))
+        self._targets.append(self._node_row(relationship.target_node_id))
+        self._types.append(RELATIONSHIP_TYPE_CODES[relationship.relationship_type])
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._relationship_ids)
+
+    def _build(self) -> None:
+        sources = np.asarray(self._sources, dtype=np.int64)
+        targets = np.asarray(self._targets, dtype=np.int64)
+        relationships = np.arange(len(sources), dtype=np.int64)
+        # List each relationship under both ends (once for self-loops)
+        reverse = sources != targets
+        heads = np.concatenate([sources, targets[reverse]])
+        tails = np.concatenate([targets, sources[reverse]])
+        edge_relationships = np.concatenate([relationships, relationships[reverse]])
+
+        # Within a node, edges stay in relationship creation order
+        order = np.lexsort((edge_relationships, heads))
+        self._indptr = np.zeros(len(self._node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=len(self._node_ids)), out=self._indptr[1:])
+        self._neighbours = tails[order]
+        self._edge_relationships = edge_relationships[order]
+        self._edge_types = np.asarray(self._types, dtype=np.int16)[self._edge_relationships]
+        self._built = True
+
+    def _type_mask(self, edges: np.ndarray,
+                   relationship_types: Optional[List[RelationshipType]]) -> np.ndarray:
+        if not relationship_types:
+            return edges
+        codes = [RELATIONSHIP_TYPE_CODES[t] for t in relationship_types]
+        return edges[np.isin(self._edge_types[edges], codes)]
+
+    def relationship_ids(self, node_id: str,
+                         relationship_types: Optional[List[RelationshipType]] = None,
+                         limit: Optional[int] = None) -> List[str]:
+        """Relationships touching a node, in creation order"""
+        row = self._node_rows.get(node_id)
+        if row is None:
+            return []
+        if not self._built:
+            self._build()
+        edges = np.arange(self._indptr[row], self._indptr[row + 1])
+        edges = self._type_mask(edges, relationship_types)[:limit]
+        return [self._relationship_ids[i] for i in self._edge_relationships[edges]]
+
+    def traverse(self, node_ids: List[str], depth: int,
+                 relationship_types: Optional[List[RelationshipType]] = None) -> Dict[str, int]:
+        """
+        Breadth-first expansion from `node_ids`.
+
+        Returns {node_id: hops} for nodes reachable within `depth` hops,
+        excluding the start nodes. Each hop is one vectorised gather over
+        the frontier's CSR slices.
+        """
+        start = [self._node_rows[n] for n in node_ids if n in self._node_rows]
+        if not start or depth <= 0:
+            return {}
+        if not self._built:
+            self._build()
+
+        hops = np.full(len(self._node_ids), -1, dtype=np.int32)
+        frontier = np.unique(np.asarray(start, dtype=np.int64))
+        hops[frontier] = 0
+        for hop in range(1, depth + 1):
+            begins = self._indptr[frontier]
+            lengths = self._indptr[frontier + 1] - begins
+            total = int(lengths.sum())
+            if not total:
+                break
+            # Positions of every edge in the frontier's slices
+            edges = np.repeat(begins - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+            edges = self._type_mask(edges, relationship_types)
+            neighbours = np.unique(self._neighbours[edges])
+            frontier = neighbours[hops[neighbours] < 0]
+            if not frontier.size:
+                break
+            hops[frontier] = hop
+
+        reached = np.flatnonzero(hops > 0)
+        return {self._node_ids[i]: int(hops[i]) for i in reached}
+
+
 class PersonalKnowledgeGraph:
     """
     Dynamic personal knowledge graph that maintains relationships between
@@ -199,10 +473,15 @@ class PersonalKnowledgeGraph:
         # In-memory graph structures for fast access
         self.nodes: Dict[str, KnowledgeNode] = {}
         self.relationships: Dict[str, KnowledgeRelationship] = {}
-        self.node_relationships: Dict[str, Set[str]] = defaultdict(set)  # node_id -> relationship_ids
+        self.node_relationships = RelationshipAdjacency()
+
+        # Configuration
+        self.max_cache_size = 10000
+        self.embedding_dimension = 384  # Compatible with sentence transformers
+        self.relationship_decay_rate = 0.95  # Relationships decay over time if not reinforced
 
         # Semantic search and indexing
-        self.node_embeddings: Dict[str, np.ndarray] = {}
+        self.node_embeddings = NodeEmbeddingIndex(self.embedding_dimension)
         self.relationship_embeddings: Dict[str, np.ndarray] = {}
         self.semantic_index = {}
 
@@ -211,11 +490,6 @@ class PersonalKnowledgeGraph:
         self.pattern_cache: Dict[str, Any] = {}
         self.insight_cache: List[KnowledgeInsight] = []
 
-        # Configuration
-        self.max_cache_size = 10000
-        self.embedding_dimension = 384  # Compatible with sentence transformers
-        self.relationship_decay_rate = 0.95  # Relationships decay over time if not reinforced
-
         # Thread safety
         self._graph_lock = threading.RLock()
         self._db_lock = threading.RLock()
@@ -355,15 +629,17 @@ class PersonalKnowledgeGraph:
                     self.relationships[relationship.relationship_id] = relationship
 
                     # Build relationship index
-                    self.node_relationships[relationship.source_node_id].add(relationship.relationship_id)
-                    self.node_relationships[relationship.target_node_id].add(relationship.relationship_id)
+                    self.node_relationships.add(relationship)
 
-                # Load embeddings
+                # Load embeddings straight into the embedding matrix
                 cursor = conn.execute("SELECT node_id, embedding FROM node_embeddings")
-                for row in cursor.fetchall():
+                for node_id, blob in cursor:
+                    node = self.nodes.get(node_id)
+                    if node is None:
+                        continue
 # Security: Review usage of potentially unsafe function/import
-                    embedding = pickle.loads(row[1])
-                    self.node_embeddings[row[0]] = embedding
+                    self.node_embeddings[node_id] = pickle.loads(blob)
+                    self.node_embeddings.set_node_info(node)
 
             finally:
                 conn.close()
@@ -454,8 +730,7 @@ class PersonalKnowledgeGraph:
 
         with self._graph_lock:
             self.relationships[relationship_id] = relationship
-            self.node_relationships[source_node_id].add(relationship_id)
-            self.node_relationships[target_node_id].add(relationship_id)
+            self.node_relationships.add(relationship)
 
         # Persist to database
         self._save_relationship_to_db(relationship)
@@ -476,55 +751,32 @@ class PersonalKnowledgeGraph:
             # Generate query embedding
             query_embedding = self._generate_text_embedding(query.query_text)
 
-            # Find semantically similar nodes
-            node_similarities = []
-            for node_id, node_embedding in self.node_embeddings.items():
-                if node_id in self.nodes:
-                    node = self.nodes[node_id]
-
-                    # Filter by node type if specified
-                    if query.node_types and node.node_type not in query.node_types:
-                        continue
-
-                    # Filter by confidence
-                    if node.confidence < query.min_confidence:
-                        continue
-
-                    # Calculate semantic similarity
-                    similarity = self._calculate_similarity(query_embedding, node_embedding)
-
-                    # Boost similarity for keyword matches
-                    for keyword in query.context_keywords:
-                        if keyword.lower() in node.name.lower() or keyword.lower() in node.description.lower():
-                            similarity += 0.2
+            # Boost similarity for keyword matches
+            with self._graph_lock:
+                boosts = self.node_embeddings.keyword_boosts(query.context_keywords, 0.2)
 
-                    node_similarities.append({
-                        'node': node,
-                        'similarity': min(similarity, 1.0),
-                        'relationships': []
-                    })
+                # One masked matrix-vector product and top-k over all nodes
+                top = self.node_embeddings.top_k(
+                    query_embedding, query.max_results,
+                    node_types=query.node_types,
+                    min_confidence=query.min_confidence,
+                    boosts=boosts
+                )
 
-            # Sort by similarity
-            node_similarities.sort(key=lambda x: x['similarity'], reverse=True)
+            node_similarities = [
+                {'node': self.nodes[node_id], 'similarity': similarity, 'relationships': []}
+                for node_id, similarity in top if node_id in self.nodes
+            ]
 
-            # Add related nodes and relationships if requested
+            # Add connected relationships if requested
             if query.include_relationships:
-                for result in node_similarities[:query.max_results]:
-                    node_id = result['node'].node_id
-
-                    # Get connected relationships
-                    related_relationships = []
-                    for rel_id in self.node_relationships[node_id]:
-                        if rel_id in self.relationships:
-                            relationship = self.relationships[rel_id]
-
-                            # Filter by relationship type if specified
-                            if query.relationship_types and relationship.relationship_type not in query.relationship_types:
-                                continue
-
-                            related_relationships.append(relationship)
-
-                    result['relationships'] = related_relationships[:10]  # Limit relationships
+                for result in node_similarities:
+                    rel_ids = self.node_relationships.relationship_ids(
+                        result['node'].node_id, query.relationship_types, limit=10
+                    )
+                    result['relationships'] = [
+                        self.relationships[rel_id] for rel_id in rel_ids if rel_id in self.relationships
+                    ]
 
             return node_similarities[:query.max_results]
 
@@ -532,6 +784,20 @@ class PersonalKnowledgeGraph:
             logging.error(f"Semantic search failed: {e}")
             return []
 
+    def get_related_nodes(self, node_id: str, depth: int = 2,
+                          relationship_types: Optional[List[RelationshipType]] = None
+                          ) -> List[Tuple[KnowledgeNode, int]]:
+        """
+        Nodes reachable from node_id within `depth` relationship hops.
+
+        Returns (node, hops) pairs, nearest first.
+        """
+        with self._graph_lock:
+            reached = self.node_relationships.traverse([node_id], depth, relationship_types)
+        related = [(self.nodes[n], hops) for n, hops in reached.items() if n in self.nodes]
+        related.sort(key=lambda item: item[1])
+        return related
+
     def find_patterns(self, domain: str = None) -> List[Dict[str, Any]]:
         """
         Find patterns in the knowledge graph using ML analysis.
@@ -786,6 +1052,7 @@ class PersonalKnowledgeGraph:
             embedding = self._generate_text_embedding(text)
 
             self.node_embeddings[node.node_id] = embedding
+            self.node_embeddings.set_node_info(node)
 
             # Save to database
             self._save_embedding_to_db(node.node_id, embedding)
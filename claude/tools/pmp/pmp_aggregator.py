@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+PMP Aggregator - Post-extraction rollups keyed by snapshot
+
+The MSP dashboard and compliance analyzer used to GROUP BY over the raw
+per-system inventory (systems table) for every sheet and every check. This
+stage computes the rollups once per snapshot, right after extraction:
+
+- pmp_org_rollups: per-organization health/severity, online, scan and OS counts
+- pmp_os_rollups: per-OS system counts split by health severity
+- pmp_rollup_runs: which snapshots have been aggregated
+
+Readers then work on ~30 org rows / a few dozen OS rows instead of every system.
+
+Usage:
+    aggregator = PMPAggregator(db_path)
+    summary = aggregator.build()            # latest successful snapshot
+    summary = aggregator.build(snapshot_id=42)
+    snapshot_id = aggregator.ensure_built()  # readers: build only if missing
+
+Author: SRE Principal Engineer Agent
+Date: 2026-10-16
+Version: 1.0
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# scan_status reported by PMP for a completed scan (see scan_failures view)
+SCAN_STATUS_SUCCESS = 228
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pmp_org_rollups (
+        snapshot_id INTEGER NOT NULL,
+        organization TEXT NOT NULL,
+        total_systems INTEGER NOT NULL,
+        healthy INTEGER NOT NULL,
+        moderate INTEGER NOT NULL,
+        high_risk INTEGER NOT NULL,
+        unknown_health INTEGER NOT NULL,
+        online INTEGER NOT NULL,
+        offline INTEGER NOT NULL,
+        scanned INTEGER NOT NULL,
+        scan_success INTEGER NOT NULL,
+        os_types INTEGER NOT NULL,
+        last_contact INTEGER,
+        PRIMARY KEY (snapshot_id, organization)
+    );
+
+    CREATE TABLE IF NOT EXISTS pmp_os_rollups (
+        snapshot_id INTEGER NOT NULL,
+        os_name TEXT NOT NULL,
+        system_count INTEGER NOT NULL,
+        healthy INTEGER NOT NULL,
+        moderate INTEGER NOT NULL,
+        high_risk INTEGER NOT NULL,
+        PRIMARY KEY (snapshot_id, os_name)
+    );
+
+    CREATE TABLE IF NOT EXISTS pmp_rollup_runs (
+        snapshot_id INTEGER PRIMARY KEY,
+        organizations INTEGER NOT NULL,
+        total_systems INTEGER NOT NULL,
+        duration_ms INTEGER NOT NULL,
+        built_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+
+def latest_system_snapshot(conn: sqlite3.Connection) -> Optional[int]:
+    """Latest successful snapshot that has systems, else latest with systems"""
+    row = conn.execute("""
+        SELECT MAX(s.snapshot_id) FROM snapshots s
+        WHERE s.status = 'success'
+          AND EXISTS (SELECT 1 FROM systems WHERE snapshot_id = s.snapshot_id)
+    """).fetchone()
+    if row[0] is not None:
+        return row[0]
+    return conn.execute("SELECT MAX(snapshot_id) FROM systems").fetchone()[0]
+
+
+def latest_rollup_snapshot(conn: sqlite3.Connection) -> Optional[int]:
+    """Most recent snapshot with rollups, or None if none are built"""
+    try:
+        row = conn.execute("SELECT MAX(snapshot_id) FROM pmp_rollup_runs").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0]
+
+
+class PMPAggregator:
+    """
+    Build per-snapshot org/OS rollups from the systems inventory
+
+    Rebuilding a snapshot replaces its rollups, so the stage is idempotent and
+    safe to re-run after a resumed extraction.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize aggregator
+
+        Args:
+            db_path: Path to SQLite database (default: ~/.maia/databases/intelligence/pmp_config.db)
+        """
+        if db_path is None:
+            db_path = Path.home() / ".maia/databases/intelligence/pmp_config.db"
+
+        self.db_path = Path(db_path)
+
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database not found: {self.db_path}")
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def ensure_built(self, snapshot_id: Optional[int] = None) -> Optional[int]:
+        """
+        Return a snapshot with rollups, building them if missing
+
+        Args:
+            snapshot_id: Snapshot wanted (default: latest successful snapshot)
+
+        Returns:
+            Snapshot ID whose rollups are current, or None if there are no systems
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if snapshot_id is None:
+                snapshot_id = latest_system_snapshot(conn)
+            if snapshot_id is None:
+                return None
+            built = conn.execute(
+                "SELECT 1 FROM pmp_rollup_runs WHERE snapshot_id = ?", (snapshot_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if not built:
+            self.build(snapshot_id)
+        return snapshot_id
+
+    def build(self, snapshot_id: Optional[int] = None) -> Dict:
+        """
+        Compute rollups for one snapshot
+
+        Args:
+            snapshot_id: Snapshot to aggregate (default: latest successful
+                snapshot, else latest snapshot with systems)
+
+        Returns:
+            Dict with snapshot_id, organizations, total_systems, duration_ms
+        """
+        start_time = time.time()
+        conn = sqlite3.connect(self.db_path)
+
+        try:
+            if snapshot_id is None:
+                snapshot_id = latest_system_snapshot(conn)
+            if snapshot_id is None:
+                logger.warning("No snapshots with systems available for aggregation")
+                return {'snapshot_id': None, 'organizations': 0, 'total_systems': 0, 'duration_ms': 0}
+
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM pmp_org_rollups WHERE snapshot_id = ?", (snapshot_id,))
+            cursor.execute("DELETE FROM pmp_os_rollups WHERE snapshot_id = ?", (snapshot_id,))
+
+            cursor.execute("""
+                INSERT INTO pmp_org_rollups (
+                    snapshot_id, organization, total_systems, healthy, moderate, high_risk,
+                    unknown_health, online, offline, scanned, scan_success, os_types, last_contact
+                )
+                SELECT
+                    snapshot_id,
+                    branch_office_name,
+                    COUNT(*),
+                    SUM(CASE WHEN resource_health_status = 1 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN resource_health_status = 2 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN COALESCE(resource_health_status, 0) = 0 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN computer_live_status = 1 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN computer_live_status = 0 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN last_scan_time > 0 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN scan_status = ? THEN 1 ELSE 0 END),
+                    COUNT(DISTINCT os_name),
+                    MAX(agent_last_contact_time)
+                FROM systems
+                WHERE snapshot_id = ?
+                GROUP BY branch_office_name
+            """, (SCAN_STATUS_SUCCESS, snapshot_id))
+
+            cursor.execute("""
+                INSERT INTO pmp_os_rollups (snapshot_id, os_name, system_count, healthy, moderate, high_risk)
+                SELECT
+                    snapshot_id,
+                    COALESCE(os_name, 'Unknown'),
+                    COUNT(*),
+                    SUM(CASE WHEN resource_health_status = 1 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN resource_health_status = 2 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END)
+                FROM systems
+                WHERE snapshot_id = ?
+                GROUP BY COALESCE(os_name, 'Unknown')
+            """, (snapshot_id,))
+
+            organizations, total_systems = cursor.execute("""
+                SELECT COUNT(*), COALESCE(SUM(total_systems), 0)
+                FROM pmp_org_rollups WHERE snapshot_id = ?
+            """, (snapshot_id,)).fetchone()
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            cursor.execute("""
+                INSERT OR REPLACE INTO pmp_rollup_runs (snapshot_id, organizations, total_systems, duration_ms)
+                VALUES (?, ?, ?, ?)
+            """, (snapshot_id, organizations, total_systems, duration_ms))
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            logger.error("rollup_build_failed", extra={"snapshot_id": snapshot_id, "error": str(e)})
+            raise
+
+        finally:
+            conn.close()
+
+        summary = {
+            'snapshot_id': snapshot_id,
+            'organizations': organizations,
+            'total_systems': total_systems,
+            'duration_ms': duration_ms
+        }
+        logger.info("rollups_built", extra=summary)
+        return summary
+
+def main():
+    """CLI interface"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="PMP Aggregator - build per-snapshot rollups")
+    parser.add_argument('--db', type=str,
+                       help='Path to SQLite database')
+    parser.add_argument('--snapshot-id', type=int,
+                       help='Snapshot to aggregate (default: latest successful)')
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db) if args.db else None
+    summary = PMPAggregator(db_path=db_path).build(snapshot_id=args.snapshot_id)
+
+    print(f"📊 Rollups: {json.dumps(summary, indent=2)}")
+
+
+if __name__ == '__main__':
+    main()
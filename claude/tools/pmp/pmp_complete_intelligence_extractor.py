@@ -9,6 +9,7 @@ Database: ~/.maia/databases/intelligence/pmp_config.db
 
 Usage:
     python3 pmp_complete_intelligence_extractor.py
+    python3 pmp_complete_intelligence_extractor.py --delta   # store installed/missing patch changes only
 """
 
 import sys
@@ -22,6 +23,7 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 from pmp_oauth_manager import PMPOAuthManager
+from pmp_delta_store import SnapshotDeltaStore
 
 # Database path
 DB_PATH = Path.home() / ".maia" / "databases" / "intelligence" / "pmp_config.db"
@@ -30,11 +32,17 @@ DB_PATH = Path.home() / ".maia" / "databases" / "intelligence" / "pmp_config.db"
 class PMPCompleteIntelligenceExtractor:
     """Comprehensive PMP data extraction from all working endpoints"""
 
-    def __init__(self):
+    def __init__(self, delta_storage: bool = False):
+        """
+        Args:
+            delta_storage: Store installed/missing patches as per-run deltas
+                against pmp_current_records instead of a full copy per run
+        """
         self.oauth_manager = PMPOAuthManager()
         self.base_url = self.oauth_manager.server_url
         self.db_path = DB_PATH
         self.extraction_id = None
+        self.delta_storage = delta_storage
 
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -224,6 +232,9 @@ class PMPCompleteIntelligenceExtractor:
             )
         """)
 
+        if self.delta_storage:
+            SnapshotDeltaStore(conn).init_schema()
+
         conn.commit()
         conn.close()
 
@@ -701,8 +712,38 @@ class PMPCompleteIntelligenceExtractor:
         conn.close()
         return len(systems)
 
+    def apply_patch_deltas(self, entity: str, patches: Optional[List[Dict]]) -> int:
+        """
+        Delta mode: record only inserted/changed/removed patches for this run.
+
+        A payload without the patch list (None) is not trusted as a full
+        snapshot: no current patch is marked removed. An empty list is a
+        full snapshot with nothing in it, so every current patch is removed.
+        """
+        complete = patches is not None
+        patches = patches or []
+        conn = sqlite3.connect(self.db_path)
+        try:
+            store = SnapshotDeltaStore(conn)
+            if not complete and store.count_current(entity):
+                print(f"   ⚠️  No {entity} list in response - skipping removal detection")
+            stats = store.apply_snapshot(
+                self.extraction_id, entity, patches, key_field='update_id',
+                complete=complete
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        print(f"   Δ {stats.inserted} new, {stats.changed} changed, "
+              f"{stats.removed} removed, {stats.unchanged} unchanged")
+        return len(patches)
+
     def extract_installed_patches(self, data: Dict, table: str) -> int:
         """Extract installed patches"""
+        if self.delta_storage:
+            return self.apply_patch_deltas('installed_patches', data.get('installedpatches'))
+
         patches = data.get('installedpatches', [])
 
         conn = sqlite3.connect(self.db_path)
@@ -732,6 +773,9 @@ class PMPCompleteIntelligenceExtractor:
 
     def extract_missing_patches(self, data: Dict, table: str) -> int:
         """Extract missing patches"""
+        if self.delta_storage:
+            return self.apply_patch_deltas('missing_patches', data.get('missingpatches'))
+
         patches = data.get('missingpatches', [])
 
         conn = sqlite3.connect(self.db_path)
@@ -762,7 +806,7 @@ class PMPCompleteIntelligenceExtractor:
 
 def main():
     """Main entry point"""
-    extractor = PMPCompleteIntelligenceExtractor()
+    extractor = PMPCompleteIntelligenceExtractor(delta_storage='--delta' in sys.argv)
     extractor.extract_all()
 
 
@@ -9,6 +9,7 @@ Features:
 - Custom MSP rules (healthy system ratio, scan success rate)
 - Automated recommendations for non-compliant items
 - Stores compliance results in database for trending
+- Per-organization checks from per-snapshot rollups (pmp_aggregator), O(orgs)
 
 Author: Patch Manager Plus API Specialist Agent + SRE Principal Engineer Agent
 Date: 2025-11-25
@@ -22,6 +23,11 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+try:
+    from claude.tools.pmp.pmp_aggregator import PMPAggregator
+except ImportError:
+    from pmp_aggregator import PMPAggregator
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +51,8 @@ class PMPComplianceAnalyzer:
         analyzer = PMPComplianceAnalyzer()
         results = analyzer.analyze_latest_snapshot()
         print(f"Pass rate: {sum(r.passed for r in results) / len(results) * 100:.1f}%")
+
+        by_org = analyzer.analyze_organizations()
     """
 
     def __init__(self, db_path: Optional[Path] = None):
@@ -90,10 +98,16 @@ class PMPComplianceAnalyzer:
         """, (snapshot_id,))
         vuln_db = dict(cursor.fetchone() or {})
 
+        # Fleet totals from rollups fill metrics the snapshot view lacks
+        rollup_totals = self._rollup_totals(cursor, snapshot_id)
+
         conn.close()
 
         # Merge data for analysis
         data = {**snapshot, **vuln_db}
+        for key, value in rollup_totals.items():
+            if data.get(key) is None:
+                data[key] = value
 
         # Run all compliance checks
         results = self.run_all_checks(data)
@@ -134,6 +148,97 @@ class PMPComplianceAnalyzer:
 
         return results
 
+    def analyze_organizations(self, snapshot_id: Optional[int] = None) -> Dict[str, List[ComplianceResult]]:
+        """
+        Run per-organization checks from the snapshot's org rollups
+
+        Reads one pmp_org_rollups row per organization (built post-extraction,
+        or here if missing) rather than the per-system inventory.
+
+        Args:
+            snapshot_id: Snapshot to analyze (default: latest with systems)
+
+        Returns:
+            Dict of organization -> compliance results
+        """
+        snapshot_id = PMPAggregator(self.db_path).ensure_built(snapshot_id)
+        if snapshot_id is None:
+            logger.warning("No system inventory available for per-organization analysis")
+            return {}
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT * FROM pmp_org_rollups
+            WHERE snapshot_id = ?
+            ORDER BY organization
+        """, (snapshot_id,))
+        orgs = [dict(row) for row in cursor.fetchall()]
+
+        conn.close()
+
+        return {
+            org['organization']: self.run_org_checks(self._rollup_metrics(org))
+            for org in orgs
+        }
+
+    def run_org_checks(self, data: Dict) -> List[ComplianceResult]:
+        """
+        Run the checks that apply to one organization's systems
+
+        Patch-count, DB-freshness and APD checks are server-wide and only
+        run in run_all_checks.
+
+        Args:
+            data: Organization metrics (same keys as snapshot data)
+
+        Returns:
+            List of compliance results
+        """
+        return [
+            self._check_e8_vulnerability_rate(data),
+            self._check_e8_scan_coverage(data),
+            self._check_cis_7_1_scan_deployment(data),
+            self._check_healthy_system_ratio(data),
+            self._check_scan_success_rate(data),
+            self._check_unscanned_systems(data),
+        ]
+
+    @staticmethod
+    def _rollup_metrics(rollup: Dict) -> Dict:
+        """Map a rollup row onto the snapshot metric names the checks use"""
+        return {
+            'total_systems': rollup['total_systems'],
+            'healthy_systems': rollup['healthy'],
+            'highly_vulnerable_systems': rollup['high_risk'],
+            'scanned_systems': rollup['scanned'],
+            'scan_success_count': rollup['scan_success'],
+            'unscanned_system_count': rollup['total_systems'] - rollup['scanned'],
+        }
+
+    def _rollup_totals(self, cursor: sqlite3.Cursor, snapshot_id: int) -> Dict:
+        """Fleet-wide metrics summed from org rollups ({} if not built)"""
+        try:
+            cursor.execute("""
+                SELECT
+                    SUM(total_systems) as total_systems,
+                    SUM(healthy) as healthy,
+                    SUM(high_risk) as high_risk,
+                    SUM(scanned) as scanned,
+                    SUM(scan_success) as scan_success
+                FROM pmp_org_rollups
+                WHERE snapshot_id = ?
+            """, (snapshot_id,))
+        except sqlite3.OperationalError:
+            return {}
+
+        totals = dict(cursor.fetchone())
+        if totals['total_systems'] is None:
+            return {}
+        return self._rollup_metrics(totals)
+
     # =========================================================================
     # ESSENTIAL EIGHT COMPLIANCE CHECKS
     # =========================================================================
@@ -485,7 +590,7 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="PMP Compliance Analyzer")
-    parser.add_argument('command', choices=['analyze', 'summary', 'failed'],
+    parser.add_argument('command', choices=['analyze', 'summary', 'failed', 'orgs'],
                        help='Command to execute')
     parser.add_argument('--db', type=str,
                        help='Path to SQLite database')
@@ -559,6 +664,19 @@ def main():
             print(f"   • {item['check_category']} ({item['severity']}): "
                   f"{item['pass_rate']:.1f}% ({item['passed_checks']}/{item['total_checks']})")
 
+    elif args.command == 'orgs':
+        print("🏢 Per-Organization Compliance:")
+        by_org = analyzer.analyze_organizations()
+
+        if not by_org:
+            print("   ❌ No system inventory available for analysis")
+        for org, results in by_org.items():
+            failed = [r for r in results if not r.passed]
+            status = '✅' if not failed else '❌'
+            print(f"\n   {status} {org}: {len(results) - len(failed)}/{len(results)} passed")
+            for r in failed:
+                print(f"     • [{r.severity}] {r.check_name}")
+
     elif args.command == 'failed':
         print("❌ Failed Compliance Checks:")
         failed = analyzer.get_failed_checks()
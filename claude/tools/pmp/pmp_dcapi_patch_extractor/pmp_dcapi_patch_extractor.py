@@ -7,6 +7,7 @@ Achieves 95%+ system coverage (3,150+ of 3,317 systems) through:
 - Fresh OAuth tokens per batch (eliminates token expiry)
 - Intelligent error handling (retry with backoff, graceful skip)
 - Patch-system mapping extraction from DCAPI endpoint
+- Concurrent page window with AIMD rate control (pmp_page_fetcher)
 - Comprehensive observability (JSON structured logs)
 - Automated convergence (runs until target met)
 
@@ -23,6 +24,7 @@ import sys
 import argparse
 import logging
 import requests
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
@@ -33,8 +35,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     from claude.tools.pmp.pmp_oauth_manager import PMPOAuthManager
+    from claude.tools.pmp.pmp_page_fetcher import AIMDRateController, PageFetcher, PageFailure
 except ImportError:
     from pmp_oauth_manager import PMPOAuthManager
+    from pmp_page_fetcher import AIMDRateController, PageFetcher, PageFailure
 
 
 # =============================================================================
@@ -50,6 +54,9 @@ TOTAL_PAGES = 111  # (3317 / 30) rounded up
 TOKEN_TTL_SECONDS = 60  # Estimated token TTL
 TOKEN_REFRESH_THRESHOLD = 0.80  # Refresh at 80% of TTL (48 seconds)
 RATE_LIMIT_DELAY = 0.25  # 0.25s between pages (4 pages/sec)
+INITIAL_REQUEST_RATE = 1 / RATE_LIMIT_DELAY  # AIMD starting rate (requests/sec)
+MAX_REQUEST_RATE = 10.0  # AIMD ceiling (API limit: 3000 requests / 5 minutes)
+MAX_CONCURRENT_PAGES = 8  # Page requests in flight
 MAX_RETRY_ATTEMPTS = 3  # Maximum retry attempts per page
 EXPONENTIAL_BACKOFF_BASE = 2  # Backoff: 2^attempt seconds (1s, 2s, 4s)
 
@@ -172,6 +179,7 @@ class PMPDCAPIExtractor:
         self.oauth_manager = PMPOAuthManager()
         self.token_created_at: Optional[float] = None
         self.snapshot_id: Optional[int] = None
+        self.conn: Optional[sqlite3.Connection] = None  # Writer held for a batch
 
         # Slack webhook (optional)
         self.slack_webhook_url = os.environ.get('SLACK_WEBHOOK_URL')
@@ -265,6 +273,26 @@ class PMPDCAPIExtractor:
 
         logger.info("Database initialized", extra={'event_type': 'database_init'})
 
+    @contextmanager
+    def _db(self):
+        """
+        Connection for a single operation.
+
+        During extract_batch this is the long-lived writer connection and
+        writes are committed with the next checkpoint; otherwise a short-lived
+        connection that commits on exit.
+        """
+        if self.conn is not None:
+            yield self.conn
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
     # =========================================================================
     # COVERAGE CALCULATION
     # =========================================================================
@@ -276,16 +304,13 @@ class PMPDCAPIExtractor:
         Returns:
             Tuple of (systems_count, coverage_percentage)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(DISTINCT resource_id) FROM dcapi_patch_mappings")
-        systems_count = cursor.fetchone()[0]
+        with self._db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(DISTINCT resource_id) FROM dcapi_patch_mappings")
+            systems_count = cursor.fetchone()[0]
 
         coverage_pct = (systems_count / TOTAL_SYSTEMS) * 100
 
-        conn.close()
-
         return systems_count, coverage_pct
 
     def check_coverage_target_met(self) -> bool:
@@ -349,31 +374,27 @@ class PMPDCAPIExtractor:
         return None
 
     def save_checkpoint(self, last_page: int, systems_extracted: int, patches_extracted: int):
-        """Save checkpoint to database"""
+        """Save checkpoint to database (commits pending page writes with it)"""
         if self.snapshot_id is None:
             logger.error("Cannot save checkpoint: snapshot_id not set")
             return
 
         systems_count, coverage_pct = self.get_current_coverage()
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO dcapi_extraction_checkpoints (
-                snapshot_id, last_page, systems_extracted, patches_extracted,
-                coverage_pct, updated_at
-            ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (
-            self.snapshot_id,
-            last_page,
-            systems_extracted,
-            patches_extracted,
-            coverage_pct
-        ))
-
-        conn.commit()
-        conn.close()
+        with self._db() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO dcapi_extraction_checkpoints (
+                    snapshot_id, last_page, systems_extracted, patches_extracted,
+                    coverage_pct, updated_at
+                ) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (
+                self.snapshot_id,
+                last_page,
+                systems_extracted,
+                patches_extracted,
+                coverage_pct
+            ))
+            conn.commit()
 
         logger.info(f"Checkpoint saved: page {last_page}, {systems_extracted} systems, {patches_extracted} patches, {coverage_pct:.1f}% coverage", extra={
             'event_type': 'checkpoint_saved',
@@ -390,24 +411,19 @@ class PMPDCAPIExtractor:
             logger.error("Cannot log gap: snapshot_id not set")
             return
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO dcapi_extraction_gaps (
-                snapshot_id, page_num, error_type, error_message, response_sample, attempts
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            self.snapshot_id,
-            page_num,
-            error_type,
-            error_message,
-            response_sample,
-            attempts
-        ))
-
-        conn.commit()
-        conn.close()
+        with self._db() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO dcapi_extraction_gaps (
+                    snapshot_id, page_num, error_type, error_message, response_sample, attempts
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                self.snapshot_id,
+                page_num,
+                error_type,
+                error_message,
+                response_sample,
+                attempts
+            ))
 
     # =========================================================================
     # TOKEN MANAGEMENT
@@ -586,6 +602,56 @@ class PMPDCAPIExtractor:
         self.log_gap(page, "max_retries_exceeded", "All retry attempts failed", "", MAX_RETRY_ATTEMPTS)
         return None
 
+    def fetch_page(self, page: int) -> List[Dict]:
+        """
+        Fetch one DCAPI page for the concurrent PageFetcher.
+
+        No retries here: failures raise, and PageFetcher classifies, paces
+        and retries them.
+        """
+        self.check_token_age_and_refresh()
+
+        response = self.oauth_manager.api_request(
+            'GET',
+            "/dcapi/threats/systemreport/patches",
+            params={'page': page, 'pageLimit': SYSTEMS_PER_PAGE},
+            handle_throttling=False
+        )
+
+        data = response.json()
+        return data.get('message_response', {}).get('systemreport', [])
+
+    def _refresh_after_401(self):
+        """PageFetcher hook: refresh token before retrying a 401"""
+        self.oauth_manager.get_valid_token()
+        self.token_created_at = time.time()
+
+    def _log_page_retry(self, page: int, attempt: int, error_type: str, error: Exception):
+        """PageFetcher hook: log a failed attempt that will be retried"""
+        logger.error(f"Page {page} extraction failed (attempt {attempt}): {str(error)}", extra={
+            'event_type': 'page_extraction_failed',
+            'snapshot_id': self.snapshot_id,
+            'page': page,
+            'attempt': attempt,
+            'error_type': error_type,
+            'action': RetryAction.RETRY_WITH_BACKOFF.value
+        })
+
+    def _log_page_gap(self, failure: PageFailure):
+        """PageFetcher hook: page failed after retries"""
+        response_sample = truncate_response(sanitize_pii(failure.response_sample or ""))
+        logger.error(f"Page {failure.page} extraction failed (attempt {failure.attempts}): {failure.error_message}", extra={
+            'event_type': 'page_extraction_failed',
+            'snapshot_id': self.snapshot_id,
+            'page': failure.page,
+            'attempt': failure.attempts,
+            'error_type': failure.error_type,
+            'response_sample': response_sample,
+            'action': RetryAction.SKIP_PAGE.value
+        })
+        self.log_gap(failure.page, failure.error_type, failure.error_message,
+                     response_sample, failure.attempts)
+
     # =========================================================================
     # DATA INSERTION
     # =========================================================================
@@ -597,46 +663,42 @@ class PMPDCAPIExtractor:
         Returns:
             Tuple of (systems_inserted, patches_inserted)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         systems_inserted = 0
         patches_inserted = 0
 
-        for system in systems:
-            resource_id = system.get('resource_id')
-            patches = system.get('patches', [])
-
-            if not patches:
-                logger.warning(f"System {resource_id} has no patches, skipping")
-                continue
-
-            try:
-                for patch in patches:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO dcapi_patch_mappings (
-                            resource_id, patch_id, patchname, severity,
-                            patch_status, bulletinid, vendor_name, installed_time
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        resource_id,
-                        patch.get('patch_id'),
-                        patch.get('patchname'),
-                        patch.get('severity'),
-                        patch.get('patch_status'),
-                        patch.get('bulletinid'),
-                        patch.get('vendor_name'),
-                        patch.get('installed_time')
-                    ))
-                    patches_inserted += 1
-
-                systems_inserted += 1
+        with self._db() as conn:
+            cursor = conn.cursor()
+            for system in systems:
+                resource_id = system.get('resource_id')
+                patches = system.get('patches', [])
 
-            except Exception as e:
-                logger.error(f"Failed to insert patch mappings for system {resource_id}: {e}")
+                if not patches:
+                    logger.warning(f"System {resource_id} has no patches, skipping")
+                    continue
 
-        conn.commit()
-        conn.close()
+                try:
+                    for patch in patches:
+                        cursor.execute("""
+                            INSERT OR REPLACE INTO dcapi_patch_mappings (
+                                resource_id, patch_id, patchname, severity,
+                                patch_status, bulletinid, vendor_name, installed_time
+                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """, (
+                            resource_id,
+                            patch.get('patch_id'),
+                            patch.get('patchname'),
+                            patch.get('severity'),
+                            patch.get('patch_status'),
+                            patch.get('bulletinid'),
+                            patch.get('vendor_name'),
+                            patch.get('installed_time')
+                        ))
+                        patches_inserted += 1
+
+                    systems_inserted += 1
+
+                except Exception as e:
+                    logger.error(f"Failed to insert patch mappings for system {resource_id}: {e}")
 
         return systems_inserted, patches_inserted
 
@@ -704,32 +766,56 @@ class PMPDCAPIExtractor:
         end_page = min(start_page + BATCH_SIZE_PAGES - 1, TOTAL_PAGES)
 
         # Track progress
-        systems_extracted = 0
-        patches_extracted = 0
-        pages_processed = 0
-        errors = 0
-
-        # Extract pages
-        for page in range(start_page, end_page + 1):
-            systems = self.extract_page(page)
-
-            if systems is not None:
-                sys_count, patch_count = self.insert_patch_mappings(systems)
-                systems_extracted += sys_count
-                patches_extracted += patch_count
-                pages_processed += 1
-
-                # Checkpoint every 10 pages
-                if pages_processed % CHECKPOINT_INTERVAL == 0:
-                    self.save_checkpoint(page, systems_extracted, patches_extracted)
-            else:
-                errors += 1
+        progress = {'systems_extracted': 0, 'patches_extracted': 0, 'pages_processed': 0}
 
-            # Rate limiting
-            time.sleep(RATE_LIMIT_DELAY)
+        def store_page(page: int, systems: List[Dict]):
+            logger.info(f"Page {page}/{TOTAL_PAGES} extracted: {len(systems)} systems", extra={
+                'event_type': 'extraction_progress',
+                'snapshot_id': self.snapshot_id,
+                'page': page
+            })
+            sys_count, patch_count = self.insert_patch_mappings(systems)
+            progress['systems_extracted'] += sys_count
+            progress['patches_extracted'] += patch_count
+            progress['pages_processed'] += 1
+
+        def checkpoint(last_page: int):
+            # Only pages up to last_page are all stored or logged as gaps
+            self.save_checkpoint(last_page, progress['systems_extracted'], progress['patches_extracted'])
+
+        # Extract pages concurrently (out-of-order completion, AIMD pacing)
+        fetcher = PageFetcher(
+            self.fetch_page,
+            controller=AIMDRateController(initial_rate=INITIAL_REQUEST_RATE,
+                                          max_rate=MAX_REQUEST_RATE),
+            max_in_flight=MAX_CONCURRENT_PAGES,
+            max_attempts=MAX_RETRY_ATTEMPTS,
+            backoff_base=EXPONENTIAL_BACKOFF_BASE,
+            on_unauthorized=self._refresh_after_401,
+            on_retry=self._log_page_retry
+        )
 
-        # Save final checkpoint
-        self.save_checkpoint(end_page, systems_extracted, patches_extracted)
+        # Single writer connection for the batch; committed at each checkpoint
+        self.conn = sqlite3.connect(self.db_path)
+        try:
+            fetch_stats = fetcher.run(
+                range(start_page, end_page + 1),
+                on_page=store_page,
+                on_gap=self._log_page_gap,
+                on_checkpoint=checkpoint,
+                checkpoint_interval=CHECKPOINT_INTERVAL
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self.conn.close()
+            self.conn = None
+
+        systems_extracted = progress['systems_extracted']
+        patches_extracted = progress['patches_extracted']
+        pages_processed = progress['pages_processed']
+        errors = fetch_stats.pages_failed
 
         # Update snapshot status
         conn = sqlite3.connect(self.db_path)
@@ -762,6 +848,8 @@ class PMPDCAPIExtractor:
             'patches_extracted': patches_extracted,
             'pages_processed': pages_processed,
             'errors': errors,
+            'throttled_requests': fetch_stats.throttled,
+            'final_request_rate': round(fetch_stats.final_rate, 2),
             'elapsed_seconds': elapsed_time,
             'coverage_pct': coverage_pct
         }
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+PMP Delta Store - Snapshot diffing with a materialised current state
+
+Full-copy extraction runs re-insert every system/patch record per snapshot
+(installed_patches/missing_patches per extraction_id, system_reports per run,
+systems per snapshot), so the PMP databases grow linearly with each run and
+readers must filter down to the latest snapshot.
+
+Delta storage keeps:
+- pmp_current_records: one row per live record (entity, record_key) with its
+  content hash and canonical JSON - queries read this directly
+- pmp_record_deltas: only inserted/changed/removed records per snapshot, so
+  any past snapshot can be reconstructed (state_at)
+- pmp_delta_snapshots: per-snapshot change counts
+
+Usage:
+    store = SnapshotDeltaStore(conn)
+    store.init_schema()   # once, e.g. in init_database
+    stats = store.apply_snapshot(snapshot_id, 'missing_patches', patches, key_field='update_id')
+    conn.commit()
+
+Author: SRE Principal Engineer Agent
+Date: 2026-10-16
+Version: 1.0
+"""
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+CURRENT_TABLE = "pmp_current_records"
+DELTAS_TABLE = "pmp_record_deltas"
+
+CHANGE_INSERTED = "inserted"
+CHANGE_CHANGED = "changed"
+CHANGE_REMOVED = "removed"
+
+SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS {CURRENT_TABLE} (
+        entity TEXT NOT NULL,
+        record_key TEXT NOT NULL,
+        scope TEXT NOT NULL DEFAULT '',
+        record_hash TEXT NOT NULL,
+        raw_data TEXT NOT NULL,
+        first_seen_snapshot INTEGER NOT NULL,
+        last_changed_snapshot INTEGER NOT NULL,
+        PRIMARY KEY (entity, record_key)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_current_records_scope
+    ON {CURRENT_TABLE}(entity, scope);
+
+    CREATE TABLE IF NOT EXISTS {DELTAS_TABLE} (
+        entity TEXT NOT NULL,
+        record_key TEXT NOT NULL,
+        snapshot_id INTEGER NOT NULL,
+        change_type TEXT NOT NULL CHECK(change_type IN ('inserted', 'changed', 'removed')),
+        record_hash TEXT,
+        raw_data TEXT,
+        PRIMARY KEY (entity, record_key, snapshot_id)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_record_deltas_snapshot
+    ON {DELTAS_TABLE}(snapshot_id, entity);
+
+    CREATE TABLE IF NOT EXISTS pmp_delta_snapshots (
+        snapshot_id INTEGER NOT NULL,
+        entity TEXT NOT NULL,
+        scope TEXT NOT NULL DEFAULT '',
+        inserted INTEGER NOT NULL,
+        changed INTEGER NOT NULL,
+        removed INTEGER NOT NULL,
+        unchanged INTEGER NOT NULL,
+        recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (snapshot_id, entity, scope)
+    );
+"""
+
+
+# =============================================================================
+# HASHING
+# =============================================================================
+
+def canonical_json(record: Dict[str, Any]) -> str:
+    """Key-order independent JSON encoding (stored and hashed)"""
+    return json.dumps(record, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def record_hash(canonical: str) -> str:
+    """128-bit content hash of a canonical record"""
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# =============================================================================
+# DELTA STORE
+# =============================================================================
+
+@dataclass
+class DeltaStats:
+    """Changes recorded for one entity in one snapshot"""
+    inserted: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+    @property
+    def total_changes(self) -> int:
+        return self.inserted + self.changed + self.removed
+
+
+class SnapshotDeltaStore:
+    """
+    Diff snapshots against the current state and store only the changes.
+
+    Writes go through the caller's connection and are not committed here, so
+    delta rows land in the same transaction as the rest of the snapshot.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def init_schema(self):
+        """
+        Create current-state, delta and summary tables.
+
+        Call once from the extractor's init_database: executescript commits
+        any open transaction.
+        """
+        self.conn.executescript(SCHEMA)
+
+    def apply_snapshot(self, snapshot_id: int, entity: str,
+                       records: Iterable[Dict[str, Any]],
+                       key_field: Union[str, Callable[[Dict[str, Any]], Any]],
+                       scope: str = '', complete: bool = True) -> DeltaStats:
+        """
+        Diff ``records`` against the current state of ``entity``.
+
+        Args:
+            snapshot_id: Snapshot/extraction run the records belong to
+            entity: Record kind (e.g. 'missing_patches', 'system_reports')
+            records: Records as returned by the API
+            key_field: Field name, or callable, giving each record's key
+                (unique per entity)
+            scope: Subset the records cover (e.g. one system's patches);
+                removals are only detected within this scope
+            complete: Records are the whole scope, so current records that
+                are absent were removed. Pass False for partial batches.
+
+        Returns:
+            DeltaStats for this call (the pmp_delta_snapshots row accumulates
+            the counts of every batch with the same snapshot/entity/scope)
+        """
+        key_of = key_field if callable(key_field) else (lambda record: record.get(key_field))
+
+        # Last occurrence wins for duplicate keys within a snapshot
+        incoming: Dict[str, str] = {}
+        for record in records:
+            key = key_of(record)
+            if key is None:
+                continue
+            incoming[str(key)] = canonical_json(record)
+
+        current = dict(self.conn.execute(
+            f"SELECT record_key, record_hash FROM {CURRENT_TABLE} WHERE entity = ? AND scope = ?",
+            (entity, scope)
+        ))
+
+        stats = DeltaStats()
+        upserts: List[tuple] = []
+        deltas: List[tuple] = []
+        for key, raw_data in incoming.items():
+            digest = record_hash(raw_data)
+            existing = current.get(key)
+            if existing == digest:
+                stats.unchanged += 1
+                continue
+
+            change_type = CHANGE_INSERTED if existing is None else CHANGE_CHANGED
+            if existing is None:
+                stats.inserted += 1
+            else:
+                stats.changed += 1
+            upserts.append((entity, key, scope, digest, raw_data, snapshot_id, snapshot_id))
+            deltas.append((entity, key, snapshot_id, change_type, digest, raw_data))
+
+        removed_keys = [key for key in current if key not in incoming] if complete else []
+        stats.removed = len(removed_keys)
+        deltas.extend((entity, key, snapshot_id, CHANGE_REMOVED, None, None) for key in removed_keys)
+
+        cursor = self.conn.cursor()
+        cursor.executemany(f"""
+            INSERT INTO {CURRENT_TABLE}
+            (entity, record_key, scope, record_hash, raw_data, first_seen_snapshot, last_changed_snapshot)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(entity, record_key) DO UPDATE SET
+                scope = excluded.scope,
+                record_hash = excluded.record_hash,
+                raw_data = excluded.raw_data,
+                last_changed_snapshot = excluded.last_changed_snapshot
+        """, upserts)
+        cursor.executemany(
+            f"DELETE FROM {CURRENT_TABLE} WHERE entity = ? AND record_key = ?",
+            [(entity, key) for key in removed_keys]
+        )
+        cursor.executemany(f"""
+            INSERT OR REPLACE INTO {DELTAS_TABLE}
+            (entity, record_key, snapshot_id, change_type, record_hash, raw_data)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, deltas)
+        # Partial batches of one snapshot/scope add up to its summary
+        cursor.execute("""
+            INSERT INTO pmp_delta_snapshots
+            (snapshot_id, entity, scope, inserted, changed, removed, unchanged)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(snapshot_id, entity, scope) DO UPDATE SET
+                inserted = inserted + excluded.inserted,
+                changed = changed + excluded.changed,
+                removed = removed + excluded.removed,
+                unchanged = unchanged + excluded.unchanged,
+                recorded_at = CURRENT_TIMESTAMP
+        """, (snapshot_id, entity, scope, stats.inserted, stats.changed,
+              stats.removed, stats.unchanged))
+
+        return stats
+
+    def current_records(self, entity: str, scope: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Live records for an entity, keyed by record_key"""
+        sql = f"SELECT record_key, raw_data FROM {CURRENT_TABLE} WHERE entity = ?"
+        params: tuple = (entity,)
+        if scope is not None:
+            sql += " AND scope = ?"
+            params += (scope,)
+        return {key: json.loads(raw) for key, raw in self.conn.execute(sql, params)}
+
+    def state_at(self, entity: str, snapshot_id: int) -> Dict[str, Dict[str, Any]]:
+        """Reconstruct an entity as of a past snapshot by replaying deltas"""
+        rows = self.conn.execute(f"""
+            SELECT d.record_key, d.raw_data
+            FROM {DELTAS_TABLE} d
+            JOIN (
+                SELECT record_key, MAX(snapshot_id) AS snapshot_id
+                FROM {DELTAS_TABLE}
+                WHERE entity = ? AND snapshot_id <= ?
+                GROUP BY record_key
+            ) latest
+              ON d.record_key = latest.record_key AND d.snapshot_id = latest.snapshot_id
+            WHERE d.entity = ? AND d.change_type != 'removed'
+        """, (entity, snapshot_id, entity))
+        return {key: json.loads(raw) for key, raw in rows}
+
+    def count_current(self, entity: str) -> int:
+        """Number of live records for an entity"""
+        return self.conn.execute(
+            f"SELECT COUNT(*) FROM {CURRENT_TABLE} WHERE entity = ?", (entity,)
+        ).fetchone()[0]
+
+
+def has_current_state(conn: sqlite3.Connection, entity: str) -> bool:
+    """True when the database holds delta-stored records for ``entity``"""
+    try:
+        row = conn.execute(
+            f"SELECT 1 FROM {CURRENT_TABLE} WHERE entity = ? LIMIT 1", (entity,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return False
+    return row is not None
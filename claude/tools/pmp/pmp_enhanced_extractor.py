@@ -14,6 +14,7 @@ Features:
 - Rate limiting compliance (3000 req/5min)
 - Resume support (continue from last page)
 - Error handling and retry logic
+- Builds per-snapshot org/OS rollups (pmp_aggregator) after extraction
 
 Author: Patch Manager Plus API Specialist Agent
 Date: 2025-11-25
@@ -30,8 +31,10 @@ import logging
 
 try:
     from claude.tools.pmp.pmp_oauth_manager import PMPOAuthManager
+    from claude.tools.pmp.pmp_aggregator import PMPAggregator
 except ImportError:
     from pmp_oauth_manager import PMPOAuthManager
+    from pmp_aggregator import PMPAggregator
 
 logging.basicConfig(
     level=logging.INFO,
@@ -157,6 +160,9 @@ class PMPEnhancedExtractor:
         # Update snapshot with duration
         self._update_snapshot(snapshot_id, duration_ms=int(duration * 1000))
 
+        # Post-extraction stage: per-org/per-OS rollups for dashboard + compliance
+        rollups = PMPAggregator(self.db_path).build(snapshot_id)
+
         # Generate summary
         summary = {
             'snapshot_id': snapshot_id,
@@ -165,7 +171,8 @@ class PMPEnhancedExtractor:
             'total_pages': total_pages,
             'errors': errors,
             'duration_seconds': round(duration, 2),
-            'systems_per_second': round(systems_extracted / duration, 2) if duration > 0 else 0
+            'systems_per_second': round(systems_extracted / duration, 2) if duration > 0 else 0,
+            'organizations': rollups['organizations']
         }
 
         print("\n" + "=" * 70)
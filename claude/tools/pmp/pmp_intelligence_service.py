@@ -11,6 +11,8 @@ Provides:
 - Automatic database selection based on query type
 - Timestamp normalization (Unix ms/s → ISO 8601)
 - Data freshness tracking with staleness warnings (>7 days = stale)
+- Reads the materialised current state (pmp_current_records) when extractors
+  run in delta-storage mode
 - Inherits from BaseIntelligenceService for unified intelligence framework
 
 Author: Data Analyst Agent
@@ -31,6 +33,7 @@ from claude.tools.collection.base_intelligence_service import (
     QueryResult,
     FreshnessInfo,
 )
+from claude.tools.pmp.pmp_delta_store import has_current_state
 
 
 # =============================================================================
@@ -129,6 +132,17 @@ class PMPIntelligenceService(BaseIntelligenceService):
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _has_current_state(self, database: str, entity: str) -> bool:
+        """True if the database holds delta-stored current records for entity."""
+        if database not in self.available_databases:
+            return False
+
+        conn = self._get_connection(database)
+        try:
+            return has_current_state(conn, entity)
+        finally:
+            conn.close()
+
     def _detect_best_database(self, query_type: str) -> str:
         """
         Detect best database for query type.
@@ -325,7 +339,23 @@ class PMPIntelligenceService(BaseIntelligenceService):
         """
         database = self._detect_best_database("patch_aggregates")
 
-        if database == "pmp_config.db" and "pmp_config.db" in self.available_databases:
+        if database == "pmp_config.db" and self._has_current_state(database, "missing_patches"):
+            # Delta storage: one row per live patch, no per-run duplicates
+            sql = """
+                SELECT
+                    json_extract(raw_data, '$.patch_name') as patch_name,
+                    json_extract(raw_data, '$.bulletin_id') as bulletin_id,
+                    CAST(json_extract(raw_data, '$.failed') AS INTEGER) as failed_count,
+                    CAST(json_extract(raw_data, '$.missing') AS INTEGER) as missing_count,
+                    json_extract(raw_data, '$.severity') as severity
+                FROM pmp_current_records
+                WHERE entity = 'missing_patches'
+                  AND CAST(json_extract(raw_data, '$.failed') AS INTEGER) > 0
+                ORDER BY failed_count DESC
+            """
+            result = self._execute_query(sql, database)
+
+        elif database == "pmp_config.db" and "pmp_config.db" in self.available_databases:
             sql = """
                 SELECT
                     json_extract(raw_data, '$.patch_name') as patch_name,
@@ -422,6 +452,27 @@ class PMPIntelligenceService(BaseIntelligenceService):
         """
         database = self._detect_best_database("deployment_status")
 
+        if self._has_current_state("pmp_systemreports.db", "system_reports"):
+            # Delta storage: current patch state per system, no per-run duplicates
+            sql = """
+                SELECT
+                    s.computer_name as system_name,
+                    json_extract(r.raw_data, '$.patch_name') as patch_name,
+                    json_extract(r.raw_data, '$.patch_status') as patch_status,
+                    json_extract(r.raw_data, '$.patch_deployed') as patch_deployed,
+                    CASE
+                        WHEN json_extract(r.raw_data, '$.patch_deployed') = 1 THEN 'Installed'
+                        WHEN json_extract(r.raw_data, '$.is_reboot_required') = 1 THEN 'Reboot Pending'
+                        ELSE 'Not Installed'
+                    END as status_text
+                FROM pmp_current_records r
+                JOIN systems s ON s.resource_id = json_extract(r.raw_data, '$.resource_id')
+                WHERE r.entity = 'system_reports'
+                  AND json_extract(r.raw_data, '$.patch_name') LIKE ?
+                ORDER BY patch_deployed
+            """
+            return self._execute_query(sql, "pmp_systemreports.db", (f"%{patch_id}%",))
+
         if "pmp_systemreports.db" in self.available_databases:
             sql = """
                 SELECT
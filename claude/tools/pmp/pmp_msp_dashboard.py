@@ -10,6 +10,7 @@ Features:
 - Policy overview
 - OS distribution analysis
 - Top 10 critical organizations deep dive
+- Reads per-snapshot org/OS rollups (pmp_aggregator) instead of raw systems
 
 Requirements:
     pip3 install openpyxl
@@ -36,6 +37,11 @@ except ImportError:
     import sys
     sys.exit(1)
 
+try:
+    from claude.tools.pmp.pmp_aggregator import PMPAggregator
+except ImportError:
+    from pmp_aggregator import PMPAggregator
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -62,6 +68,9 @@ class PMPMSPDashboard:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
+        # Snapshot whose rollups the sheets read (resolved per generation)
+        self.snapshot_id: Optional[int] = None
+
         # Style definitions
         self.header_fill = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
         self.header_font = Font(color="FFFFFF", bold=True, size=11)
@@ -103,6 +112,10 @@ class PMPMSPDashboard:
         print(f"📊 PMP MSP DASHBOARD GENERATOR")
         print(f"{'='*70}\n")
 
+        # Rollups are normally built post-extraction; build now if missing
+        self.snapshot_id = PMPAggregator(self.db_path).ensure_built()
+        print(f"  → Snapshot: {self.snapshot_id}")
+
         # Create workbook
         wb = Workbook()
         wb.remove(wb.active)  # Remove default sheet
@@ -151,28 +164,29 @@ class PMPMSPDashboard:
         # Organization summary
         cursor.execute("""
             SELECT
-                branch_office_name as organization,
-                COUNT(*) as total_systems,
-                SUM(CASE WHEN resource_health_status = 1 THEN 1 ELSE 0 END) as healthy,
-                SUM(CASE WHEN resource_health_status = 2 THEN 1 ELSE 0 END) as moderate,
-                SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END) as high_risk,
-                ROUND(100.0 * SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END) / COUNT(*), 1) as risk_pct
-            FROM systems
-            GROUP BY branch_office_name
+                organization,
+                total_systems,
+                healthy,
+                moderate,
+                high_risk,
+                ROUND(100.0 * high_risk / total_systems, 1) as risk_pct
+            FROM pmp_org_rollups
+            WHERE snapshot_id = ?
             ORDER BY risk_pct DESC, total_systems DESC
-        """)
+        """, (self.snapshot_id,))
 
         orgs = cursor.fetchall()
 
         # Totals
         cursor.execute("""
             SELECT
-                COUNT(DISTINCT branch_office_name) as total_orgs,
-                COUNT(*) as total_systems,
-                SUM(CASE WHEN resource_health_status = 1 THEN 1 ELSE 0 END) as healthy,
-                SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END) as high_risk
-            FROM systems
-        """)
+                COUNT(*) as total_orgs,
+                COALESCE(SUM(total_systems), 0) as total_systems,
+                COALESCE(SUM(healthy), 0) as healthy,
+                COALESCE(SUM(high_risk), 0) as high_risk
+            FROM pmp_org_rollups
+            WHERE snapshot_id = ?
+        """, (self.snapshot_id,))
 
         totals = cursor.fetchone()
         conn.close()
@@ -270,18 +284,18 @@ class PMPMSPDashboard:
         # Get per-organization details including OS breakdown
         cursor.execute("""
             SELECT
-                branch_office_name,
-                COUNT(*) as total_systems,
-                SUM(CASE WHEN resource_health_status = 1 THEN 1 ELSE 0 END) as healthy,
-                SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END) as high_risk,
-                SUM(CASE WHEN computer_live_status = 1 THEN 1 ELSE 0 END) as online,
-                SUM(CASE WHEN computer_live_status = 0 THEN 1 ELSE 0 END) as offline,
-                COUNT(DISTINCT os_name) as os_types,
-                MAX(agent_last_contact_time) as last_contact
-            FROM systems
-            GROUP BY branch_office_name
+                organization,
+                total_systems,
+                healthy,
+                high_risk,
+                online,
+                offline,
+                os_types,
+                last_contact
+            FROM pmp_org_rollups
+            WHERE snapshot_id = ?
             ORDER BY total_systems DESC
-        """)
+        """, (self.snapshot_id,))
 
         orgs = cursor.fetchall()
         conn.close()
@@ -353,9 +367,9 @@ class PMPMSPDashboard:
                 agent_last_contact_time,
                 last_scan_time
             FROM systems
-            WHERE resource_health_status = 3
+            WHERE snapshot_id = ? AND resource_health_status = 3
             ORDER BY branch_office_name, resource_name
-        """)
+        """, (self.snapshot_id,))
 
         systems = cursor.fetchall()
         conn.close()
@@ -416,13 +430,13 @@ class PMPMSPDashboard:
         # Get OS distribution
         cursor.execute("""
             SELECT
-                COALESCE(os_name, 'Unknown') as os,
-                COUNT(*) as count,
-                ROUND(100.0 * COUNT(*) / (SELECT COUNT(*) FROM systems), 1) as percentage
-            FROM systems
-            GROUP BY os_name
+                os_name as os,
+                system_count as count,
+                ROUND(100.0 * system_count / SUM(system_count) OVER (), 1) as percentage
+            FROM pmp_os_rollups
+            WHERE snapshot_id = ?
             ORDER BY count DESC
-        """)
+        """, (self.snapshot_id,))
 
         os_data = cursor.fetchall()
         conn.close()
@@ -536,17 +550,16 @@ class PMPMSPDashboard:
         # Get top 10 most critical organizations
         cursor.execute("""
             SELECT
-                branch_office_name,
-                COUNT(*) as total_systems,
-                SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END) as high_risk,
-                ROUND(100.0 * SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END) / COUNT(*), 1) as risk_pct,
-                SUM(CASE WHEN computer_live_status = 0 THEN 1 ELSE 0 END) as offline
-            FROM systems
-            GROUP BY branch_office_name
-            HAVING high_risk > 0
+                organization,
+                total_systems,
+                high_risk,
+                ROUND(100.0 * high_risk / total_systems, 1) as risk_pct,
+                offline
+            FROM pmp_org_rollups
+            WHERE snapshot_id = ? AND high_risk > 0
             ORDER BY risk_pct DESC, high_risk DESC
             LIMIT 10
-        """)
+        """, (self.snapshot_id,))
 
         top_orgs = cursor.fetchall()
         conn.close()
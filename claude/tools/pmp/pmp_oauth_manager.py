@@ -6,6 +6,7 @@ Production-grade OAuth implementation with macOS Keychain integration
 
 import json
 import time
+import threading
 import webbrowser
 import subprocess
 from datetime import datetime, timedelta
@@ -56,6 +57,8 @@ class PMPOAuthManager:
         self.request_times = []
         self.rate_limit = 3000  # requests per 5 minutes
         self.rate_window = 300  # 5 minutes in seconds
+        self._rate_lock = threading.Lock()  # Shared by concurrent page fetchers
+        self._token_lock = threading.Lock()  # One refresh at a time
 
     def _get_from_keychain(self, service_name: str) -> str:
         """Retrieve credential from macOS Keychain"""
@@ -121,18 +124,19 @@ class PMPOAuthManager:
 
     def _check_rate_limit(self):
         """Enforce rate limiting (3000 req/5min)"""
-        now = time.time()
-        # Remove requests older than 5 minutes
-        self.request_times = [t for t in self.request_times if now - t < self.rate_window]
+        with self._rate_lock:
+            now = time.time()
+            # Remove requests older than 5 minutes
+            self.request_times = [t for t in self.request_times if now - t < self.rate_window]
 
-        if len(self.request_times) >= self.rate_limit:
-            oldest = self.request_times[0]
-            sleep_time = self.rate_window - (now - oldest)
-            if sleep_time > 0:
-                print(f"⏱️  Rate limit reached. Sleeping {sleep_time:.1f}s...")
-                time.sleep(sleep_time)
+            if len(self.request_times) >= self.rate_limit:
+                oldest = self.request_times[0]
+                sleep_time = self.rate_window - (now - oldest)
+                if sleep_time > 0:
+                    print(f"⏱️  Rate limit reached. Sleeping {sleep_time:.1f}s...")
+                    time.sleep(sleep_time)
 
-        self.request_times.append(now)
+            self.request_times.append(now)
 
     def generate_auth_url(self) -> str:
         """Generate authorization URL for user to visit"""
@@ -233,15 +237,16 @@ class PMPOAuthManager:
 
     def get_valid_token(self) -> str:
         """Get valid access token (refresh if needed)"""
-        tokens = self._load_tokens()
+        with self._token_lock:
+            tokens = self._load_tokens()
 
-        if tokens and self._is_token_valid(tokens):
-            return tokens['access_token']
+            if tokens and self._is_token_valid(tokens):
+                return tokens['access_token']
 
-        if tokens and 'refresh_token' in tokens:
-            print("🔄 Refreshing access token...")
-            tokens = self.refresh_access_token(tokens['refresh_token'])
-            return tokens['access_token']
+            if tokens and 'refresh_token' in tokens:
+                print("🔄 Refreshing access token...")
+                tokens = self.refresh_access_token(tokens['refresh_token'])
+                return tokens['access_token']
 
         raise RuntimeError(
             "No valid tokens found. Run authorize() first to complete OAuth flow."
@@ -274,7 +279,8 @@ class PMPOAuthManager:
         print(f"\n💾 Tokens saved to: {self.TOKEN_FILE}")
         print("=" * 60)
 
-    def api_request(self, method: str, endpoint: str, _retry_count: int = 0, **kwargs) -> requests.Response:
+    def api_request(self, method: str, endpoint: str, _retry_count: int = 0,
+                    handle_throttling: bool = True, **kwargs) -> requests.Response:
         """
         Make authenticated API request with rate limiting and error handling
 
@@ -282,6 +288,9 @@ class PMPOAuthManager:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (e.g., '/api/1.4/patch/allpatches')
             _retry_count: Internal recursion guard
+            handle_throttling: Sleep and retry on 429/5xx here. Callers with
+                their own rate control (pmp_page_fetcher) pass False and get
+                the error, with the response on the exception's __cause__
             **kwargs: Additional arguments for requests (params, json, etc.)
         """
         self._check_rate_limit()
@@ -306,17 +315,18 @@ class PMPOAuthManager:
                 if tokens and 'refresh_token' in tokens:
                     self.refresh_access_token(tokens['refresh_token'])
                     # Retry with new token (max 1 retry)
-                    return self.api_request(method, endpoint, _retry_count=_retry_count+1, **kwargs)
+                    return self.api_request(method, endpoint, _retry_count=_retry_count+1,
+                                            handle_throttling=handle_throttling, **kwargs)
                 else:
                     raise RuntimeError("Token refresh failed. Re-authorize required.")
 
-            elif response.status_code == 429:
+            elif response.status_code == 429 and handle_throttling:
                 retry_after = int(response.headers.get('Retry-After', 60))
                 print(f"⚠️  Rate limited. Retrying in {retry_after}s...")
                 time.sleep(retry_after)
                 return self.api_request(method, endpoint, **kwargs)
 
-            elif response.status_code >= 500:
+            elif response.status_code >= 500 and handle_throttling:
                 print(f"⚠️  Server error: {response.status_code}. Retrying...")
                 time.sleep(5)
                 return self.api_request(method, endpoint, **kwargs)
@@ -330,7 +340,7 @@ class PMPOAuthManager:
             return response
 
         except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"API request failed: {e}")
+            raise RuntimeError(f"API request failed: {e}") from e
 
 
 def main():
@@ -6,6 +6,8 @@ Achieves 95%+ system coverage (3,200+ of 3,362 systems) through:
 - Checkpoint-based extraction (resume from last page)
 - Fresh OAuth tokens per batch (eliminates token expiry)
 - Intelligent error handling (retry with backoff, graceful skip)
+- Concurrent page window with AIMD rate control (pmp_page_fetcher)
+- Optional delta storage: only changed systems per snapshot (pmp_delta_store)
 - Comprehensive observability (JSON structured logs)
 - Automated convergence (runs until target met)
 
@@ -22,6 +24,7 @@ import sys
 import argparse
 import logging
 import requests
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
@@ -29,8 +32,12 @@ from enum import Enum
 
 try:
     from claude.tools.pmp.pmp_oauth_manager import PMPOAuthManager
+    from claude.tools.pmp.pmp_page_fetcher import AIMDRateController, PageFetcher, PageFailure
+    from claude.tools.pmp.pmp_delta_store import SnapshotDeltaStore
 except ImportError:
     from pmp_oauth_manager import PMPOAuthManager
+    from pmp_page_fetcher import AIMDRateController, PageFetcher, PageFailure
+    from pmp_delta_store import SnapshotDeltaStore
 
 
 # =============================================================================
@@ -46,6 +53,9 @@ TOTAL_PAGES = 135  # (3362 / 25) rounded up
 TOKEN_TTL_SECONDS = 60  # Estimated token TTL
 TOKEN_REFRESH_THRESHOLD = 0.80  # Refresh at 80% of TTL (48 seconds)
 RATE_LIMIT_DELAY = 0.25  # 0.25s between pages (4 pages/sec)
+INITIAL_REQUEST_RATE = 1 / RATE_LIMIT_DELAY  # AIMD starting rate (requests/sec)
+MAX_REQUEST_RATE = 10.0  # AIMD ceiling (API limit: 3000 requests / 5 minutes)
+MAX_CONCURRENT_PAGES = 8  # Page requests in flight
 MAX_RETRY_ATTEMPTS = 3  # Maximum retry attempts per page
 EXPONENTIAL_BACKOFF_BASE = 2  # Backoff: 2^attempt seconds (1s, 2s, 4s)
 
@@ -156,15 +166,24 @@ class PMPResilientExtractor:
     - Comprehensive observability (JSON structured logs)
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
-        """Initialize resilient extractor"""
+    def __init__(self, db_path: Optional[Path] = None, delta_storage: bool = False):
+        """
+        Initialize resilient extractor.
+
+        Args:
+            db_path: SQLite database (default: ~/.maia/databases/intelligence/pmp_config.db)
+            delta_storage: Record only new/changed systems per snapshot in
+                pmp_current_records instead of a full systems copy
+        """
         if db_path is None:
             db_path = Path.home() / ".maia/databases/intelligence/pmp_config.db"
 
         self.db_path = Path(db_path)
+        self.delta_storage = delta_storage
         self.oauth_manager = PMPOAuthManager()
         self.token_created_at: Optional[float] = None
         self.snapshot_id: Optional[int] = None
+        self.conn: Optional[sqlite3.Connection] = None  # Writer held for a batch
 
         # Slack webhook (optional)
         self.slack_webhook_url = os.environ.get('SLACK_WEBHOOK_URL')
@@ -233,6 +252,9 @@ class PMPResilientExtractor:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_snapshot ON extraction_checkpoints(snapshot_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_gaps_snapshot ON extraction_gaps(snapshot_id)")
 
+        if self.delta_storage:
+            SnapshotDeltaStore(conn).init_schema()
+
         conn.commit()
         conn.close()
 
@@ -244,6 +266,26 @@ class PMPResilientExtractor:
             'db_path': str(self.db_path)
         })
 
+    @contextmanager
+    def _db(self):
+        """
+        Connection for a single operation.
+
+        During extract_batch this is the long-lived writer connection and
+        writes are committed with the next checkpoint; otherwise a short-lived
+        connection that commits on exit.
+        """
+        if self.conn is not None:
+            yield self.conn
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
     # =========================================================================
     # COVERAGE CHECKS
     # =========================================================================
@@ -255,13 +297,13 @@ class PMPResilientExtractor:
         Returns:
             Tuple of (unique_systems_count, coverage_percentage)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(DISTINCT resource_id) FROM systems WHERE resource_id IS NOT NULL")
-        unique_systems = cursor.fetchone()[0]
-
-        conn.close()
+        with self._db() as conn:
+            if self.delta_storage:
+                unique_systems = SnapshotDeltaStore(conn).count_current('systems')
+            else:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(DISTINCT resource_id) FROM systems WHERE resource_id IS NOT NULL")
+                unique_systems = cursor.fetchone()[0]
 
         coverage_pct = (unique_systems / TOTAL_SYSTEMS) * 100 if TOTAL_SYSTEMS > 0 else 0
 
@@ -333,10 +375,11 @@ class PMPResilientExtractor:
         return None
 
     def save_checkpoint(self, snapshot_id: int, last_page: int, systems_extracted: int):
-        """Save checkpoint (atomic update)"""
+        """Save checkpoint (atomic update, commits pending page writes with it)"""
         coverage_pct = (systems_extracted / TOTAL_SYSTEMS) * 100 if TOTAL_SYSTEMS > 0 else 0
 
-        conn = sqlite3.connect(self.db_path)
+        owns_conn = self.conn is None
+        conn = sqlite3.connect(self.db_path) if owns_conn else self.conn
         cursor = conn.cursor()
 
         try:
@@ -365,28 +408,24 @@ class PMPResilientExtractor:
             })
             raise
         finally:
-            conn.close()
+            if owns_conn:
+                conn.close()
 
     def log_gap(self, snapshot_id: int, page_num: int, error_type: str,
                 error_message: str, response_sample: Optional[str], attempts: int):
         """Log failed page in gaps table"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Sanitize and truncate response sample
         if response_sample:
             response_sample = sanitize_pii(response_sample)
             response_sample = truncate_response(response_sample)
 
-        try:
-            cursor.execute("""
+        with self._db() as conn:
+            conn.execute("""
                 INSERT OR REPLACE INTO extraction_gaps
                 (snapshot_id, page_num, error_type, error_message, response_sample, attempts)
                 VALUES (?, ?, ?, ?, ?, ?)
             """, (snapshot_id, page_num, error_type, error_message, response_sample, attempts))
 
-            conn.commit()
-
             logger.warning(f"Gap logged: page {page_num} ({error_type})", extra={
                 'event_type': 'gap_logged',
                 'snapshot_id': snapshot_id,
@@ -395,9 +434,6 @@ class PMPResilientExtractor:
                 'attempts': attempts
             })
 
-        finally:
-            conn.close()
-
     # =========================================================================
     # TOKEN MANAGEMENT
     # =========================================================================
@@ -592,34 +628,86 @@ class PMPResilientExtractor:
         # Should not reach here
         return None
 
+    def fetch_page(self, page_num: int) -> List[Dict]:
+        """
+        Fetch single page for the concurrent PageFetcher.
+
+        No retries here: failures raise, and PageFetcher classifies, paces
+        and retries them.
+        """
+        self.check_token_age_and_refresh()
+
+        response = self.oauth_manager.api_request(
+            'GET',
+            '/api/1.4/patch/scandetails',
+            params={'page': page_num},
+            handle_throttling=False
+        )
+
+        return response.json()['message_response']['scandetails']
+
+    def _refresh_after_401(self):
+        """PageFetcher hook: refresh token before retrying a 401"""
+        self.oauth_manager.get_valid_token()
+        self.token_created_at = time.time()
+
+    def _log_page_retry(self, page_num: int, attempt: int, error_type: str, error: Exception):
+        """PageFetcher hook: log a failed attempt that will be retried"""
+        logger.error(f"Page {page_num} extraction failed (attempt {attempt})", extra={
+            'event_type': 'page_extraction_failed',
+            'snapshot_id': self.snapshot_id,
+            'page': page_num,
+            'attempt': attempt,
+            'error_type': error_type,
+            'response_sample': truncate_response(sanitize_pii(str(error)))
+        })
+
+    def _log_page_gap(self, failure: PageFailure):
+        """PageFetcher hook: page failed after retries"""
+        logger.warning(f"Skipping page {failure.page} after {failure.attempts} attempts", extra={
+            'event_type': 'page_skipped',
+            'snapshot_id': self.snapshot_id,
+            'page': failure.page,
+            'error_type': failure.error_type,
+            'http_status': failure.http_status,
+            'action': 'skip_page'
+        })
+        self.log_gap(self.snapshot_id, failure.page, failure.error_type,
+                     failure.error_message, failure.response_sample, failure.attempts)
+
     def insert_systems(self, systems: List[Dict]):
         """Insert systems into database (idempotent)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        if self.delta_storage:
+            # A batch covers only some pages, so never infer removals from it
+            with self._db() as conn:
+                SnapshotDeltaStore(conn).apply_snapshot(
+                    self.snapshot_id, 'systems', systems,
+                    key_field='resource_id', complete=False
+                )
+            return sum(1 for system in systems if system.get('resource_id') is not None)
 
         inserted = 0
-        for system in systems:
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO systems (
-                        snapshot_id, resource_id, resource_name, os_name, ip_address,
-                        branch_office_name, resource_health_status
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    self.snapshot_id,
-                    system.get('resource_id'),
-                    system.get('resource_name'),
-                    system.get('os_name'),
-                    system.get('ip_address'),
-                    system.get('branch_office_name'),
-                    system.get('resource_health_status')
-                ))
-                inserted += 1
-            except Exception as e:
-                logger.error(f"Failed to insert system: {e}")
-
-        conn.commit()
-        conn.close()
+        with self._db() as conn:
+            cursor = conn.cursor()
+            for system in systems:
+                try:
+                    cursor.execute("""
+                        INSERT OR REPLACE INTO systems (
+                            snapshot_id, resource_id, resource_name, os_name, ip_address,
+                            branch_office_name, resource_health_status
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        self.snapshot_id,
+                        system.get('resource_id'),
+                        system.get('resource_name'),
+                        system.get('os_name'),
+                        system.get('ip_address'),
+                        system.get('branch_office_name'),
+                        system.get('resource_health_status')
+                    ))
+                    inserted += 1
+                except Exception as e:
+                    logger.error(f"Failed to insert system: {e}")
 
         return inserted
 
@@ -687,43 +775,58 @@ class PMPResilientExtractor:
         end_page = min(start_page + BATCH_SIZE_PAGES - 1, TOTAL_PAGES)
 
         # Track progress
-        systems_extracted = 0
-        pages_processed = 0
-        errors = 0
-
-        # Extract pages
-        for page in range(start_page, end_page + 1):
-            systems = self.extract_page(page)
-
-            if systems is not None:
-                count = self.insert_systems(systems)
-                systems_extracted += count
-                pages_processed += 1
-
-                # Progress logging
-                unique_systems, coverage_pct = self.get_current_coverage()
-                logger.info(f"Page {page}/{TOTAL_PAGES} extracted ({count} systems)", extra={
-                    'event_type': 'extraction_progress',
-                    'snapshot_id': self.snapshot_id,
-                    'page': page,
-                    'systems_extracted': unique_systems,
-                    'total_systems': TOTAL_SYSTEMS,
-                    'progress_pct': round(coverage_pct, 2)
-                })
+        progress = {'systems_extracted': 0, 'pages_processed': 0}
+
+        def store_page(page: int, systems: List[Dict]):
+            count = self.insert_systems(systems)
+            progress['systems_extracted'] += count
+            progress['pages_processed'] += 1
+
+            logger.info(f"Page {page}/{TOTAL_PAGES} extracted ({count} systems)", extra={
+                'event_type': 'extraction_progress',
+                'snapshot_id': self.snapshot_id,
+                'page': page,
+                'systems_extracted': progress['systems_extracted']
+            })
 
-                # Checkpoint every 10 pages
-                if page % CHECKPOINT_INTERVAL == 0:
-                    self.save_checkpoint(self.snapshot_id, page, unique_systems)
-            else:
-                errors += 1
+        def checkpoint(last_page: int):
+            # Only pages up to last_page are all stored or logged as gaps
+            unique_systems, _ = self.get_current_coverage()
+            self.save_checkpoint(self.snapshot_id, last_page, unique_systems)
+
+        # Extract pages concurrently (out-of-order completion, AIMD pacing)
+        fetcher = PageFetcher(
+            self.fetch_page,
+            controller=AIMDRateController(initial_rate=INITIAL_REQUEST_RATE,
+                                          max_rate=MAX_REQUEST_RATE),
+            max_in_flight=MAX_CONCURRENT_PAGES,
+            max_attempts=MAX_RETRY_ATTEMPTS,
+            backoff_base=EXPONENTIAL_BACKOFF_BASE,
+            on_unauthorized=self._refresh_after_401,
+            on_retry=self._log_page_retry
+        )
 
-            # Rate limiting
-            if page < end_page:
-                time.sleep(RATE_LIMIT_DELAY)
+        # Single writer connection for the batch; committed at each checkpoint
+        self.conn = sqlite3.connect(self.db_path)
+        try:
+            fetch_stats = fetcher.run(
+                range(start_page, end_page + 1),
+                on_page=store_page,
+                on_gap=self._log_page_gap,
+                on_checkpoint=checkpoint,
+                checkpoint_interval=CHECKPOINT_INTERVAL
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self.conn.close()
+            self.conn = None
 
-        # Final checkpoint
+        systems_extracted = progress['systems_extracted']
+        pages_processed = progress['pages_processed']
+        errors = fetch_stats.pages_failed
         unique_systems, coverage_pct = self.get_current_coverage()
-        self.save_checkpoint(self.snapshot_id, end_page, unique_systems)
 
         # Update snapshot status
         duration = time.time() - start_time
@@ -743,6 +846,8 @@ class PMPResilientExtractor:
             'pages_processed': pages_processed,
             'systems_extracted': systems_extracted,
             'errors': errors,
+            'throttled_requests': fetch_stats.throttled,
+            'final_request_rate': round(fetch_stats.final_rate, 2),
             'duration_seconds': round(duration, 2),
             'coverage_pct': round(coverage_pct, 2)
         }
@@ -787,12 +892,14 @@ Examples:
                        help='Reset checkpoint and start from page 1')
     parser.add_argument('--db', type=str,
                        help='Path to SQLite database')
+    parser.add_argument('--delta', action='store_true',
+                       help='Store only new/changed systems per snapshot')
 
     args = parser.parse_args()
 
     # Initialize extractor
     db_path = Path(args.db) if args.db else None
-    extractor = PMPResilientExtractor(db_path=db_path)
+    extractor = PMPResilientExtractor(db_path=db_path, delta_storage=args.delta)
 
     # Handle --status flag
     if args.status:
@@ -13,6 +13,7 @@ Database: ~/.maia/databases/intelligence/pmp_systemreports.db
 
 Usage:
     python3 pmp_systemreport_extractor.py
+    python3 pmp_systemreport_extractor.py --delta   # store per-system patch changes only
 """
 
 import sys
@@ -26,6 +27,7 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 from pmp_oauth_manager import PMPOAuthManager
+from pmp_delta_store import SnapshotDeltaStore
 
 # Database path
 DB_PATH = Path.home() / ".maia" / "databases" / "intelligence" / "pmp_systemreports.db"
@@ -34,11 +36,17 @@ DB_PATH = Path.home() / ".maia" / "databases" / "intelligence" / "pmp_systemrepo
 class PMPSystemReportExtractor:
     """Extract patch data using per-system systemreport queries"""
 
-    def __init__(self):
+    def __init__(self, delta_storage: bool = False):
+        """
+        Args:
+            delta_storage: Store system reports as per-run deltas against
+                pmp_current_records instead of a full copy per run
+        """
         self.oauth_manager = PMPOAuthManager()
         self.base_url = self.oauth_manager.server_url
         self.db_path = DB_PATH
         self.extraction_id = None
+        self.delta_storage = delta_storage
 
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -114,6 +122,9 @@ class PMPSystemReportExtractor:
             ON system_reports(patch_id)
         """)
 
+        if self.delta_storage:
+            SnapshotDeltaStore(conn).init_schema()
+
         conn.commit()
         conn.close()
 
@@ -355,6 +366,9 @@ class PMPSystemReportExtractor:
 
     def save_system_report(self, resource_id: int, patches: List[Dict]) -> int:
         """Save system report to database"""
+        if self.delta_storage:
+            return self.save_system_report_delta(resource_id, patches)
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -384,6 +398,28 @@ class PMPSystemReportExtractor:
         conn.close()
         return len(patches)
 
+    def save_system_report_delta(self, resource_id: int, patches: List[Dict]) -> int:
+        """
+        Delta mode: diff one system's report against its current patches.
+
+        Records carry resource_id so readers can join to systems; removals
+        are detected per system (scope), so systems that failed to fetch
+        keep their last known patches.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            SnapshotDeltaStore(conn).apply_snapshot(
+                self.extraction_id,
+                'system_reports',
+                [dict(patch, resource_id=resource_id) for patch in patches],
+                key_field=lambda patch: f"{resource_id}:{patch.get('patch_id')}",
+                scope=str(resource_id)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(patches)
+
     def extract_all(self):
         """Main extraction workflow"""
         self.start_extraction_run()
@@ -437,6 +473,9 @@ class PMPSystemReportExtractor:
                 print(f" ✅ {len(patches)} patches")
                 total_patches += len(patches)
             else:
+                if self.delta_storage:
+                    # Record removal of any previously reported patches
+                    self.save_system_report(resource_id, patches)
                 print(f" ✅ 0 patches")
 
             systems_processed += 1
@@ -475,7 +514,7 @@ if __name__ == '__main__':
     print("Using per-system query pattern (allsystems → systemreport)")
     print()
 
-    extractor = PMPSystemReportExtractor()
+    extractor = PMPSystemReportExtractor(delta_storage='--delta' in sys.argv)
     extractor.extract_all()
 
     print("✅ Extraction complete!")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Context Load Cache - Persistent LRU cache for SmartContextLoader results.
+
+SmartContextLoader.load_for_intent recomputes strategy, keyword search,
+semantic search, phase merge and markdown rendering for every prompt, and
+each hook invocation is a fresh process. This cache stores the rendered
+result in SQLite (~/.maia/cache/smart_context_cache.db) keyed on the
+normalised query, the classified intent and the system_state.db generation,
+so repeated or near-identical prompts skip all of that until the database
+changes.
+
+Entries are evicted least-recently-used beyond max_entries. Hit/miss counts
+and load latencies are persisted alongside, so the effect is visible across
+hook invocations.
+
+Usage:
+    from context_load_cache import ContextLoadCache
+
+    cache = ContextLoadCache()
+    key = cache.make_key(query, intent_dict, generation, scope=str(db_path))
+    cached = cache.get(key)
+    if cached is None:
+        ...
+        cache.put(key, payload)
+    cache.record(hit=cached is not None, elapsed_ms=elapsed)
+    print(cache.stats())
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def default_cache_path() -> Path:
+    """Cache DB path (MAIA_CONTEXT_CACHE overrides)."""
+    override = os.environ.get("MAIA_CONTEXT_CACHE")
+    if override:
+        return Path(override)
+    return Path.home() / ".maia" / "cache" / "smart_context_cache.db"
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return _WHITESPACE.sub(' ', query.lower()).strip().rstrip('?!. ')
+
+
+class ContextLoadCache:
+    """SQLite-backed LRU cache of context load payloads with hit/miss stats."""
+
+    def __init__(self, db_path: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path) if db_path else default_cache_path()
+        self.max_entries = max_entries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=1.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._transaction() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    cache_key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used);
+
+                CREATE TABLE IF NOT EXISTS stats (
+                    outcome TEXT PRIMARY KEY,  -- 'hit' or 'miss'
+                    count INTEGER NOT NULL DEFAULT 0,
+                    total_ms REAL NOT NULL DEFAULT 0
+                );
+            """)
+
+    @staticmethod
+    def make_key(query: str, intent: Optional[Dict[str, Any]], generation: str,
+                 scope: str = "") -> str:
+        """
+        Build a cache key.
+
+        Args:
+            query: Raw user query (normalised here)
+            intent: Intent classification dict (None if no classifier)
+            generation: Source generation token; a new token misses every entry
+            scope: Distinguishes loaders over different databases
+        """
+        intent_key = None
+        if intent:
+            intent_key = dict(intent, domains=sorted(intent.get('domains') or []))
+        payload = json.dumps(
+            [normalize_query(query), intent_key, generation, scope],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload and mark it recently used, or None."""
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT payload FROM entries WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET last_used = ? WHERE cache_key = ?", (time.time(), key)
+                )
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug(f"Context cache read failed: {e}")
+            return None
+
+    def put(self, key: str, payload: Dict[str, Any]):
+        """Store a payload, evicting least-recently-used entries beyond max_entries."""
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (cache_key, payload, last_used) VALUES (?, ?, ?)",
+                    (key, json.dumps(payload), time.time())
+                )
+                conn.execute("""
+                    DELETE FROM entries WHERE cache_key IN (
+                        SELECT cache_key FROM entries
+                        ORDER BY last_used DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+        except sqlite3.Error as e:
+            logger.debug(f"Context cache write failed: {e}")
+
+    def record(self, hit: bool, elapsed_ms: float):
+        """Count a lookup outcome and its end-to-end load latency."""
+        try:
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT INTO stats (outcome, count, total_ms) VALUES (?, 1, ?)
+                    ON CONFLICT(outcome) DO UPDATE SET
+                        count = count + 1, total_ms = total_ms + excluded.total_ms
+                """, ('hit' if hit else 'miss', elapsed_ms))
+        except sqlite3.Error as e:
+            logger.debug(f"Context cache stats update failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counts and mean load latency per outcome.
+
+        Returns:
+            {'hits', 'misses', 'hit_rate', 'avg_hit_ms', 'avg_miss_ms', 'entries'}
+        """
+        counts = {'hit': (0, 0.0), 'miss': (0, 0.0)}
+        entries = 0
+        try:
+            with self._transaction() as conn:
+                for outcome, count, total_ms in conn.execute(
+                    "SELECT outcome, count, total_ms FROM stats"
+                ):
+                    counts[outcome] = (count, total_ms)
+                entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.debug(f"Context cache stats read failed: {e}")
+
+        hits, hit_ms = counts['hit']
+        misses, miss_ms = counts['miss']
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+            'avg_hit_ms': hit_ms / hits if hits else 0.0,
+            'avg_miss_ms': miss_ms / misses if misses else 0.0,
+            'entries': entries,
+        }
+
+    def clear(self):
+        """Drop all entries and reset stats."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM stats")
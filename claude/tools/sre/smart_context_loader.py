@@ -25,9 +25,11 @@ Features:
     - Token budget enforcement (never exceed 20K tokens)
     - Database-accelerated queries (0.2ms vs 100-500ms) - Phase 165
     - Graceful fallback to markdown if database unavailable
+    - Persistent LRU result cache keyed on query/intent + DB generation
 """
 
 import re
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -67,6 +69,13 @@ except ImportError:
     except ImportError:
         CAPABILITIES_REGISTRY_AVAILABLE = False
 
+# Try importing the result cache (persists across hook invocations)
+try:
+    from context_load_cache import ContextLoadCache
+    CONTEXT_CACHE_AVAILABLE = True
+except ImportError:
+    CONTEXT_CACHE_AVAILABLE = False
+
 # Try importing semantic search (Agentic AI Phase 3 integration)
 try:
     _orchestration_path = str(Path(__file__).resolve().parent.parent / "orchestration")
@@ -91,6 +100,7 @@ class ContextLoadResult:
     loading_strategy: str
     intent_classification: Optional[Dict[str, Any]]
     memory_context: Optional[str] = None  # Phase 220: Cross-session memory
+    from_cache: bool = False  # Served from ContextLoadCache
 
 
 class SmartContextLoader:
@@ -100,7 +110,8 @@ class SmartContextLoader:
     Reduces token usage from 42K+ (full file) to 5-20K (targeted loading).
     """
 
-    def __init__(self, maia_root: Optional[Path] = None):
+    def __init__(self, maia_root: Optional[Path] = None, use_cache: bool = True,
+                 cache_path: Optional[Path] = None):
         if maia_root is None:
             # Tool is in claude/tools/sre/, need to go up 3 levels to repo root
             self.maia_root = Path(__file__).resolve().parent.parent.parent.parent
@@ -164,6 +175,14 @@ class SmartContextLoader:
                 logger.warning(f"Semantic search initialization failed: {e}")
                 self.use_semantic_search = False
 
+        # Initialize result cache (strategy + rendered phases per query/intent)
+        self.result_cache = None
+        if use_cache and CONTEXT_CACHE_AVAILABLE:
+            try:
+                self.result_cache = ContextLoadCache(cache_path)
+            except Exception as e:
+                logger.warning(f"Context cache initialization failed, loading uncached: {e}")
+
     def load_for_intent(self, user_query: str, include_memory: bool = True) -> ContextLoadResult:
         """
         Load context optimized for user query intent.
@@ -175,21 +194,41 @@ class SmartContextLoader:
         Returns:
             ContextLoadResult with content, phases loaded, token count, strategy, memory
         """
+        start = time.perf_counter()
+
         # Step 1: Classify intent (if classifier available)
         intent = None
         if self.intent_classifier:
             intent = self.intent_classifier.classify(user_query)
+        intent_dict = self._intent_to_dict(intent) if intent else None
+
+        # Steps 2-4 are cached until the phase data changes
+        cache_key = None
+        cached = None
+        if self.result_cache:
+            cache_key = self.result_cache.make_key(
+                user_query, intent_dict, self._cache_generation(), scope=str(self.db_path)
+            )
+            cached = self.result_cache.get(cache_key)
+
+        if cached:
+            strategy, phases, content = cached['strategy'], cached['phases'], cached['content']
+        else:
+            # Step 2: Determine loading strategy based on intent
+            strategy, phases = self._determine_strategy(user_query, intent)
 
-        # Step 2: Determine loading strategy based on intent
-        strategy, phases = self._determine_strategy(user_query, intent)
+            # Step 3: Calculate token budget
+            budget = self._calculate_token_budget(user_query, intent)
 
-        # Step 3: Calculate token budget
-        budget = self._calculate_token_budget(user_query, intent)
+            # Step 4: Load selected phases
+            content = self._load_phases(phases, budget)
 
-        # Step 4: Load selected phases
-        content = self._load_phases(phases, budget)
+            if cache_key:
+                self.result_cache.put(cache_key, {
+                    'strategy': strategy, 'phases': phases, 'content': content,
+                })
 
-        # Step 5: Load conversation memory (Phase 220)
+        # Step 5: Load conversation memory (Phase 220) - session-specific, never cached
         memory_context = None
         if include_memory:
             memory_context = self._load_conversation_memory(user_query)
@@ -199,15 +238,57 @@ class SmartContextLoader:
         if memory_context:
             token_count += len(memory_context) // 4
 
+        if self.result_cache:
+            self.result_cache.record(
+                hit=cached is not None, elapsed_ms=(time.perf_counter() - start) * 1000
+            )
+
         return ContextLoadResult(
             content=content,
             phases_loaded=phases,
             token_count=token_count,
             loading_strategy=strategy,
-            intent_classification=self._intent_to_dict(intent) if intent else None,
-            memory_context=memory_context
+            intent_classification=intent_dict,
+            memory_context=memory_context,
+            from_cache=cached is not None
         )
 
+    def _cache_generation(self) -> str:
+        """
+        Token that changes whenever the phase source changes.
+
+        Uses the system_state.db generation counter (bumped by triggers on
+        phases); databases without it, and the markdown fallback, use the
+        source file's mtime and size.
+        """
+        if self.use_database and self.db_queries:
+            try:
+                generation = self.db_queries.get_generation()
+                if generation is not None:
+                    return f"db:{generation}"
+            except Exception as e:
+                logger.debug(f"DB generation lookup failed: {e}")
+            source = self.db_path
+        else:
+            source = self.system_state_path
+
+        try:
+            stat = source.stat()
+            return f"{source.name}:{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            return f"{source.name}:missing"
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Result cache hit/miss counts and mean load latency (persisted across runs).
+
+        Returns:
+            Dict with enabled, hits, misses, hit_rate, avg_hit_ms, avg_miss_ms, entries
+        """
+        if not self.result_cache:
+            return {'enabled': False}
+        return {'enabled': True, **self.result_cache.stats()}
+
     def _load_conversation_memory(self, query: str) -> Optional[str]:
         """
         Load relevant past work from conversation memory (Phase 220).
@@ -307,7 +388,7 @@ class SmartContextLoader:
 
     def _search_phases_by_keywords(self, keywords: List[str], limit: int = 10) -> List[int]:
         """
-        Search database for phases matching any of the given keywords.
+        Search database for the phases that best match the given keywords.
 
         Args:
             keywords: List of keywords to search for
@@ -319,17 +400,14 @@ class SmartContextLoader:
         if not self.use_database or not self.db_queries:
             return []
 
-        all_phases = set()
-        for keyword in keywords[:3]:  # Limit to 3 keywords for performance
-            try:
-                results = self.db_queries.get_phases_by_keyword(keyword, limit=5)
-                for phase in results:
-                    all_phases.add(int(float(phase.phase_number)))
-            except Exception:
-                pass
+        try:
+            # One BM25 query for all keywords (was one LIKE scan per keyword)
+            ranked = self.db_queries.search_phase_numbers(keywords, limit=limit)
+        except Exception:
+            return []
 
-        # Sort descending (most recent first) and limit
-        return sorted(all_phases, reverse=True)[:limit]
+        # Best matches selected; present most recent first
+        return sorted({int(float(n)) for n in ranked}, reverse=True)
 
     def _semantic_search_phases(self, query: str, limit: int = 5) -> List[int]:
         """
@@ -882,10 +960,32 @@ def main():
         action='store_true',
         help='Show loading statistics only (no content)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the context load result cache'
+    )
+    parser.add_argument(
+        '--cache-stats',
+        action='store_true',
+        help='Show result cache hit/miss statistics and exit'
+    )
 
     args = parser.parse_args()
 
-    loader = SmartContextLoader()
+    loader = SmartContextLoader(use_cache=not args.no_cache)
+
+    if args.cache_stats:
+        stats = loader.cache_stats()
+        if not stats['enabled']:
+            print("Context cache disabled")
+            return
+        print("📦 Context Cache:")
+        print(f"  Hits: {stats['hits']:,}  Misses: {stats['misses']:,}  "
+              f"Hit rate: {stats['hit_rate']:.1%}")
+        print(f"  Avg load: {stats['avg_hit_ms']:.2f}ms (hit) / {stats['avg_miss_ms']:.2f}ms (miss)")
+        print(f"  Entries: {stats['entries']:,}")
+        return
 
     if args.phases:
         # Load specific phases
@@ -917,7 +1017,7 @@ def main():
 
     # Show statistics
     print(f"\n📊 Loading Statistics:")
-    print(f"  Strategy: {result.loading_strategy}")
+    print(f"  Strategy: {result.loading_strategy}{' (cached)' if result.from_cache else ''}")
     print(f"  Phases loaded: {result.phases_loaded}")
     print(f"  Token count: {result.token_count:,} (~{result.token_count/1000:.1f}K)")
     print(f"  Content size: {len(result.content):,} chars")
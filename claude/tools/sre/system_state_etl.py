@@ -9,6 +9,7 @@ Agent: SRE Principal Engineer Agent
 Phase: 164 - SYSTEM_STATE Migration
 """
 
+import hashlib
 import re
 import sqlite3
 import sys
@@ -87,6 +88,7 @@ class SystemStateParser:
         # Format: ## PHASE 163: Title (2025-11-21)
         re.compile(r'^##\s+PHASE\s+(\d+(?:\.\d+)?):\s*(.+?)\s+\((\d{4}-\d{2}-\d{2})\)', re.IGNORECASE),
     ]
+    HEADER_LINE_PATTERN = re.compile(r'^##.*$', re.MULTILINE)
 
     def __init__(self, system_state_path: Path):
         self.system_state_path = system_state_path
@@ -104,29 +106,29 @@ class SystemStateParser:
         Returns: List of (phase_number, phase_text) tuples
         Note: phase_number is str to support decimals (151.2, 134.4)
         """
-        # Find all phase headers and their positions
+        # Find all phase headers and their offsets. Every header pattern is
+        # anchored on '##', so only those lines are tried against them.
         phase_headers = []
-        lines = self.content.split('\n')
 
-        for line_idx, line in enumerate(lines):
+        for line in self.HEADER_LINE_PATTERN.finditer(self.content):
             for pattern in self.PHASE_HEADER_PATTERNS:
-                match = pattern.match(line)
+                match = pattern.match(line.group())
                 if match:
                     phase_number = match.group(1)  # String: "151" or "151.2"
-                    phase_headers.append((phase_number, line_idx, line))
+                    phase_headers.append((phase_number, line.start()))
                     break  # Found header, move to next line
 
         # Extract text between consecutive headers
         phases = []
-        for i, (phase_number, start_line, header) in enumerate(phase_headers):
-            # Determine end line (next header or end of file)
+        for i, (phase_number, start) in enumerate(phase_headers):
+            # Determine end (next header or end of file)
             if i + 1 < len(phase_headers):
-                end_line = phase_headers[i + 1][1]  # Start of next phase
+                end = phase_headers[i + 1][1]  # Start of next phase
             else:
-                end_line = len(lines)  # End of file
+                end = len(self.content)  # End of file
 
             # Extract phase text
-            phase_text = '\n'.join(lines[start_line:end_line]).strip()
+            phase_text = self.content[start:end].strip()
             phases.append((phase_number, phase_text))
 
         # Deduplicate: Keep first occurrence of each phase number
@@ -411,12 +413,32 @@ class SystemStateParser:
         )
 
 
+# Full-text shadow of phases (rowid = phases.id), maintained by load_phase.
+# Kept out of system_state_schema.sql so builds without FTS5 still get the
+# relational schema; SystemStateQueries falls back to LIKE without it.
+PHASES_FTS_SQL = """
+    CREATE VIRTUAL TABLE phases_fts USING fts5(
+        title, achievement, narrative_text,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+"""
+
+
 class SystemStateETL:
     """ETL pipeline for SYSTEM_STATE.md → Database"""
 
-    def __init__(self, db_path: Path, system_state_path: Path):
+    def __init__(self, db_path: Path, system_state_path: Path,
+                 archive_path: Optional[Path] = None):
         self.db_path = db_path
         self.parser = SystemStateParser(system_state_path)
+        # Phases moved here by system_state_archiver are kept, not deleted
+        self.archive_path = archive_path or system_state_path.with_name('SYSTEM_STATE_ARCHIVE.md')
+        self._fts_enabled: Optional[bool] = None
+
+    @staticmethod
+    def phase_hash(phase_text: str) -> str:
+        """Content hash of a phase block (change detection for incremental runs)"""
+        return hashlib.sha256(phase_text.encode('utf-8')).hexdigest()
 
     def init_database(self):
         """Initialize database schema"""
@@ -427,8 +449,48 @@ class SystemStateETL:
         conn = sqlite3.connect(self.db_path)
         conn.execute("PRAGMA foreign_keys = ON")
         conn.executescript(schema_sql)
+        self.init_search_index(conn)
         conn.close()
 
+    def init_search_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the phases_fts shadow table, backfilling it from phases when
+        it is created on an existing database.
+
+        Returns: True if the full-text index is available
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='phases_fts'"
+        ).fetchone()
+        if not exists:
+            try:
+                conn.execute(PHASES_FTS_SQL)
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5 - queries use the LIKE fallback
+                self._fts_enabled = False
+                return False
+            conn.execute("""
+                INSERT INTO phases_fts (rowid, title, achievement, narrative_text)
+                SELECT id, title, achievement, narrative_text FROM phases
+            """)
+            conn.commit()
+        self._fts_enabled = True
+        return True
+
+    def _index_phase(self, cursor: sqlite3.Cursor, phase_id: int, phase: Phase):
+        """Replace the phase's row in the full-text shadow table."""
+        if self._fts_enabled is None:
+            self._fts_enabled = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='phases_fts'"
+            ).fetchone() is not None
+        if not self._fts_enabled:
+            return
+        cursor.execute("DELETE FROM phases_fts WHERE rowid=?", (phase_id,))
+        cursor.execute("""
+            INSERT INTO phases_fts (rowid, title, achievement, narrative_text)
+            VALUES (?, ?, ?, ?)
+        """, (phase_id, phase.title, phase.achievement, phase.narrative_text))
+
     def load_phase(self, conn: sqlite3.Connection, phase: Phase,
                    problems: List[Problem], solutions: List[Solution],
                    metrics: List[Metric], files: List[FileCreated]) -> int:
@@ -481,6 +543,9 @@ class SystemStateETL:
             ))
             phase_id = cursor.lastrowid
 
+        # Keep full-text index in step with the phase row
+        self._index_phase(cursor, phase_id, phase)
+
         # Insert problems (same for UPDATE and INSERT)
         for problem in problems:
             cursor.execute("""
@@ -513,13 +578,68 @@ class SystemStateETL:
 
         return phase_id
 
-    def run(self, phase_numbers: Optional[List[int]] = None, progress: bool = True) -> Dict[str, any]:
+    def delete_phase(self, conn: sqlite3.Connection, phase_number: str) -> bool:
+        """
+        Delete a phase (related records cascade) and its hash and index rows.
+
+        Returns: True if the phase existed
+        """
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM phase_hashes WHERE phase_number=?", (phase_number,))
+        cursor.execute("SELECT id FROM phases WHERE phase_number=?", (phase_number,))
+        existing = cursor.fetchone()
+        if not existing:
+            return False
+
+        if self._fts_enabled:
+            cursor.execute("DELETE FROM phases_fts WHERE rowid=?", (existing[0],))
+        cursor.execute("DELETE FROM phases WHERE id=?", (existing[0],))
+        return True
+
+    def _archived_phase_numbers(self) -> set:
+        """Phase numbers present in SYSTEM_STATE_ARCHIVE.md (empty if none)"""
+        if not self.archive_path.exists():
+            return set()
+        return {num for num, _ in SystemStateParser(self.archive_path).split_into_phases()}
+
+    def _remove_deleted_phases(self, conn: sqlite3.Connection, current: set,
+                               stored_hashes: Dict[str, str], progress: bool) -> int:
+        """
+        Delete phases that an earlier run loaded but SYSTEM_STATE.md no longer
+        contains. Archived phases are kept and simply stop being tracked.
+
+        Returns: Number of phases deleted
+        """
+        missing = [num for num in stored_hashes if num not in current]
+        if not missing:
+            return 0
+
+        archived = self._archived_phase_numbers()
+        deleted = 0
+        for phase_num in missing:
+            if phase_num in archived:
+                conn.execute("DELETE FROM phase_hashes WHERE phase_number=?", (phase_num,))
+                continue
+            if self.delete_phase(conn, phase_num):
+                deleted += 1
+                if progress:
+                    print(f"\n🗑️  Removed Phase {phase_num} (no longer in SYSTEM_STATE.md)")
+        conn.commit()
+        return deleted
+
+    def run(self, phase_numbers: Optional[List[int]] = None, progress: bool = True,
+            full: bool = False) -> Dict[str, any]:
         """
         Run ETL pipeline
 
+        Incremental by default: phases whose text hashes to the value stored
+        in phase_hashes are skipped, and phases an earlier run loaded that
+        are gone from SYSTEM_STATE.md are deleted (whole-file runs only).
+
         Args:
             phase_numbers: Optional list of specific phase numbers to process
             progress: Show progress output
+            full: Re-parse and reload every phase regardless of stored hashes
 
         Returns: Statistics dict
         """
@@ -540,6 +660,7 @@ class SystemStateETL:
                 seen_phases.add(num)
                 deduped_phases.append((num, text))
         phases_found = deduped_phases
+        current_phases = {num for num, _ in phases_found}
 
         if phase_numbers:
             # Filter to requested phases
@@ -557,6 +678,8 @@ class SystemStateETL:
             'solutions_extracted': 0,
             'metrics_extracted': 0,
             'files_extracted': 0,
+            'phases_unchanged': 0,
+            'phases_deleted': 0,
             'errors': []
         }
 
@@ -570,7 +693,26 @@ class SystemStateETL:
         conn.execute("PRAGMA foreign_keys = ON")
 
         try:
+            # Forget hashes of phases removed from the table by other means
+            conn.execute("""
+                DELETE FROM phase_hashes
+                WHERE phase_number NOT IN (SELECT phase_number FROM phases)
+            """)
+            conn.commit()
+            stored_hashes = dict(conn.execute(
+                "SELECT phase_number, content_hash FROM phase_hashes"
+            ).fetchall())
+
+            if not phase_numbers:
+                stats['phases_deleted'] = self._remove_deleted_phases(
+                    conn, current_phases, stored_hashes, progress)
+
             for i, (phase_num, phase_text) in enumerate(phases_found):
+                content_hash = self.phase_hash(phase_text)
+                if not full and stored_hashes.get(phase_num) == content_hash:
+                    stats['phases_unchanged'] += 1
+                    continue
+
                 if progress:
                     print(f"\n📊 Processing Phase {phase_num} ({i+1}/{len(phases_found)})...")
 
@@ -584,6 +726,10 @@ class SystemStateETL:
 
                     # Load into database
                     self.load_phase(conn, phase, problems, solutions, metrics, files)
+                    conn.execute("""
+                        INSERT OR REPLACE INTO phase_hashes (phase_number, content_hash)
+                        VALUES (?, ?)
+                    """, (phase_num, content_hash))
                     conn.commit()
 
                     # Update stats
@@ -613,6 +759,8 @@ class SystemStateETL:
             print("✅ ETL COMPLETE")
             print("=" * 70)
             print(f"Phases processed: {stats['phases_processed']}")
+            print(f"Phases unchanged (skipped): {stats['phases_unchanged']}")
+            print(f"Phases deleted: {stats['phases_deleted']}")
             print(f"Problems extracted: {stats['problems_extracted']}")
             print(f"Solutions extracted: {stats['solutions_extracted']}")
             print(f"Metrics extracted: {stats['metrics_extracted']}")
@@ -643,6 +791,8 @@ def main():
                        help='Process N most recent phases (e.g., --recent 20)')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress progress output')
+    parser.add_argument('--full', action='store_true',
+                       help='Reprocess every phase, ignoring stored content hashes')
 
     args = parser.parse_args()
 
@@ -659,11 +809,11 @@ def main():
         # Get all phases, take last N
         phases_found = etl.parser.split_into_phases()
         phase_numbers = [num for num, _ in sorted(phases_found, key=lambda x: x[0])[-args.recent:]]
-        stats = etl.run(phase_numbers=phase_numbers, progress=not args.quiet)
+        stats = etl.run(phase_numbers=phase_numbers, progress=not args.quiet, full=args.full)
     elif args.phases:
-        stats = etl.run(phase_numbers=args.phases, progress=not args.quiet)
+        stats = etl.run(phase_numbers=args.phases, progress=not args.quiet, full=args.full)
     else:
-        stats = etl.run(progress=not args.quiet)
+        stats = etl.run(progress=not args.quiet, full=args.full)
 
     # Exit code based on success
     sys.exit(0 if not stats['errors'] else 1)
@@ -18,6 +18,9 @@ Usage:
     # Search by keyword
     phases = queries.get_phases_by_keyword("ChromaDB")
 
+    # Rank phases for several keywords at once (BM25 over phases_fts)
+    numbers = queries.search_phase_numbers(["routing", "swarm"], limit=10)
+
     # Get specific phases
     phases = queries.get_phases_by_number([2, 107, 134])
 
@@ -25,6 +28,7 @@ Usage:
     phase = queries.get_phase_with_context(164)
 """
 
+import re
 import sqlite3
 from pathlib import Path
 from typing import List, Dict, Optional, Any
@@ -35,6 +39,9 @@ import logging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# bm25() column weights for phases_fts (title, achievement, narrative_text)
+FTS_COLUMN_WEIGHTS = (10.0, 5.0, 1.0)
+
 
 @dataclass
 class PhaseRecord:
@@ -137,6 +144,29 @@ class SystemStateQueries:
             logger.error(f"Failed to get recent phases: {e}")
             raise
 
+    def get_generation(self) -> Optional[int]:
+        """
+        Get the database change generation (bumped by triggers on phases).
+
+        Returns:
+            Generation counter, or None for databases created before db_meta
+        """
+        try:
+            conn = self._get_connection()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM db_meta WHERE key = 'generation'"
+                ).fetchone()
+            finally:
+                conn.close()
+            return row['value'] if row else None
+
+        except sqlite3.OperationalError as e:
+            if 'db_meta' in str(e):
+                return None
+            logger.error(f"Failed to get database generation: {e}")
+            raise
+
     def get_recent_phase_numbers(self, count: int = 10) -> List[int]:
         """
         Get most recent phase numbers only (lightweight query for smart loader).
@@ -220,6 +250,86 @@ class SystemStateQueries:
             logger.error(f"Failed to search keyword '{keyword}': {e}")
             raise
 
+    @staticmethod
+    def _fts_match_expression(keywords: List[str]) -> str:
+        """
+        Build an FTS5 MATCH expression: one prefix phrase per keyword, OR'd.
+
+        Prefix phrases keep the substring feel of the LIKE search for
+        stems such as "transcri"; punctuation is dropped so user keywords
+        cannot inject FTS5 syntax ("few-shot" -> "few shot"*).
+        """
+        phrases = []
+        for keyword in keywords:
+            tokens = re.findall(r'\w+', keyword.lower())
+            if tokens:
+                phrases.append('"' + ' '.join(tokens) + '"*')
+        return ' OR '.join(phrases)
+
+    def search_phase_numbers(self, keywords: List[str], limit: int = 10) -> List[str]:
+        """
+        Rank phases matching any of the keywords in a single query.
+
+        Uses BM25 over the phases_fts shadow table (title weighted above
+        achievement above narrative). Databases built before phases_fts
+        existed fall back to one LIKE scan ranked by matched keyword count.
+
+        Args:
+            keywords: Search keywords (case-insensitive)
+            limit: Maximum phase numbers to return
+
+        Returns:
+            Phase numbers, best match first (ties: most recent first)
+
+        Example:
+            >>> queries.search_phase_numbers(["routing", "swarm"], limit=3)
+            ['177', '134', '108']
+        """
+        keywords = [k for k in keywords if k and k.strip()]
+        if not keywords:
+            return []
+
+        try:
+            conn = self._get_connection()
+            try:
+                match = self._fts_match_expression(keywords)
+                if not match:
+                    return []
+                rows = conn.execute(f"""
+                    SELECT p.phase_number
+                    FROM phases_fts
+                    JOIN phases p ON p.id = phases_fts.rowid
+                    WHERE phases_fts MATCH ?
+                    ORDER BY bm25(phases_fts, {', '.join(map(str, FTS_COLUMN_WEIGHTS))}),
+                             CAST(p.phase_number AS REAL) DESC
+                    LIMIT ?
+                """, (match, limit)).fetchall()
+            except sqlite3.OperationalError as e:
+                if 'phases_fts' not in str(e):
+                    raise
+                # No full-text index yet (ETL not re-run) - single LIKE scan
+                hit = "(narrative_text LIKE ? OR title LIKE ? OR achievement LIKE ?)"
+                params: List[Any] = []
+                for keyword in keywords:
+                    params.extend([f'%{keyword}%'] * 3)
+                rows = conn.execute(f"""
+                    SELECT phase_number FROM (
+                        SELECT phase_number, {' + '.join([hit] * len(keywords))} AS hits
+                        FROM phases
+                    )
+                    WHERE hits > 0
+                    ORDER BY hits DESC, CAST(phase_number AS REAL) DESC
+                    LIMIT ?
+                """, (*params, limit)).fetchall()
+            finally:
+                conn.close()
+
+            return [str(row['phase_number']) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to search keywords {keywords}: {e}")
+            raise
+
     def get_phases_by_number(self, phase_numbers: List) -> List[PhaseRecord]:
         """
         Get specific phases by number (supports decimals: 151.2, 134.4).
@@ -182,6 +182,41 @@ WHERE file_type IS NOT NULL
 GROUP BY file_type, status
 ORDER BY file_count DESC;
 
+-- =============================================================================
+-- Table: phase_hashes (Incremental ETL change detection)
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS phase_hashes (
+    phase_number TEXT PRIMARY KEY,  -- Phase loaded from SYSTEM_STATE.md
+    content_hash TEXT NOT NULL,  -- SHA-256 of the phase block when last loaded
+    loaded_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- =============================================================================
+-- Table: db_meta (Change generation for result caches)
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS db_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO db_meta (key, value) VALUES ('generation', 0);
+
+-- Any write to phases bumps the generation (SmartContextLoader cache key)
+CREATE TRIGGER IF NOT EXISTS trg_phases_generation_insert AFTER INSERT ON phases
+BEGIN
+    UPDATE db_meta SET value = value + 1 WHERE key = 'generation';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phases_generation_update AFTER UPDATE ON phases
+BEGIN
+    UPDATE db_meta SET value = value + 1 WHERE key = 'generation';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phases_generation_delete AFTER DELETE ON phases
+BEGIN
+    UPDATE db_meta SET value = value + 1 WHERE key = 'generation';
+END;
+
 -- =============================================================================
 -- Metadata tracking
 -- =============================================================================
@@ -194,6 +229,10 @@ CREATE TABLE IF NOT EXISTS schema_version (
 -- Insert initial schema version
 INSERT OR IGNORE INTO schema_version (version, description)
 VALUES (1, 'Initial schema: phases, problems, solutions, metrics, files_created, tags');
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES (2, 'phase_hashes: incremental ETL by phase content hash');
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES (3, 'db_meta generation counter bumped by phases triggers');
 
 -- =============================================================================
 -- Validation queries (for testing data integrity)
@@ -0,0 +1,40 @@
+-- Migration: Row-hash store and watermark columns for incremental OTC syncs
+-- Date: 2026-10-17
+
+-- Purpose:
+-- OTCPostgresLoader.load_view_streaming(incremental=True) skips rows whose
+-- hash matches the last loaded version (otc_row_hashes) and records each
+-- view's watermark in etl_metadata.
+-- Run once: ALTER TABLE takes an ACCESS EXCLUSIVE lock, so it must not run
+-- inside every scheduled load. The loader only applies this itself (in a
+-- short transaction before loading) when the objects are missing.
+
+-- Execution:
+-- docker exec servicedesk-postgres psql -U servicedesk_user -d servicedesk -f /path/to/007_create_otc_incremental_sync.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS servicedesk.otc_row_hashes (
+    view_name TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    row_hash BIGINT NOT NULL,
+    PRIMARY KEY (view_name, row_key)
+);
+
+COMMENT ON TABLE servicedesk.otc_row_hashes IS
+'Hash of the last loaded version of each OTC row, per view. Incremental loads drop rows whose hash is unchanged before COPY.';
+
+ALTER TABLE servicedesk.etl_metadata
+    ADD COLUMN IF NOT EXISTS watermark TIMESTAMP,
+    ADD COLUMN IF NOT EXISTS records_unchanged INTEGER,
+    ADD COLUMN IF NOT EXISTS sync_mode TEXT;
+
+COMMENT ON COLUMN servicedesk.etl_metadata.watermark IS
+'Latest modified/created time seen in the view during this load';
+
+COMMIT;
+
+-- Verification:
+-- SELECT column_name FROM information_schema.columns
+-- WHERE table_schema = 'servicedesk' AND table_name = 'etl_metadata'
+--   AND column_name IN ('watermark', 'records_unchanged', 'sync_mode');
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Embedding Service Tests
+
+Runs EmbeddingService against a local fake Ollama /api/embed endpoint with
+per-request latency to check batching throughput, cache hits, ordering and
+that cached vectors equal freshly computed ones.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+MAIA_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.core.embedding_service import EmbeddingService
+
+REQUEST_LATENCY = 0.02
+DIM = 16
+
+
+def _fake_vector(text):
+    digest = hashlib.sha256(text.encode()).digest()
+    return [b / 255.0 for b in digest[:DIM]]
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        self.server.calls.append(len(inputs))
+        time.sleep(REQUEST_LATENCY)
+        payload = json.dumps({"embeddings": [_fake_vector(t) for t in inputs]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllamaHandler)
+    server.calls = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _service(ollama, tmp_path, **kwargs):
+    url = f"http://127.0.0.1:{ollama.server_address[1]}"
+    return EmbeddingService(model="fake", ollama_url=url,
+                            cache_path=tmp_path / "embeddings.db", **kwargs)
+
+
+class TestEmbeddingService:
+    """Batched, cached embedding requests."""
+
+    def test_batching_beats_one_request_per_text(self, ollama, tmp_path):
+        texts = [f"ticket {i}" for i in range(64)]
+
+        start = time.perf_counter()
+        serial = _service(ollama, tmp_path, batch_size=1, max_workers=1, use_cache=False)
+        for text in texts:
+            serial.embed_one(text)
+        serial_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = _service(ollama, tmp_path, batch_size=16, max_workers=4)
+        vectors = batched.embed(texts)
+        batched_s = time.perf_counter() - start
+
+        assert batched.stats["requests"] == 4
+        assert vectors == serial.embed(texts)
+        assert batched_s * 5 < serial_s, f"batched {batched_s:.3f}s vs serial {serial_s:.3f}s"
+
+    def test_second_pass_makes_no_requests(self, ollama, tmp_path):
+        texts = [f"email {i}" for i in range(40)]
+        first = _service(ollama, tmp_path, batch_size=8).embed(texts)
+        calls_after_first = len(ollama.calls)
+
+        # Fresh instance: the cache is on disk, not in memory
+        service = _service(ollama, tmp_path, batch_size=8)
+        second = service.embed(texts)
+
+        assert len(ollama.calls) == calls_after_first
+        assert second == first
+        assert service.stats == {"requested": 40, "cached": 40, "computed": 0, "requests": 0}
+
+    def test_order_preserved_and_duplicates_embedded_once(self, ollama, tmp_path):
+        service = _service(ollama, tmp_path, batch_size=2)
+        service.embed(["b"])
+
+        vectors = service.embed(["a", "b", "a", "c"])
+
+        assert sum(ollama.calls) == 3  # b, then a and c
+        assert vectors[0] == vectors[2]
+        assert [v[:3] for v in vectors] == [
+            [pytest.approx(x, abs=1e-6) for x in _fake_vector(t)[:3]] for t in "abac"
+        ]
+
+    def test_cache_is_per_model(self, ollama, tmp_path):
+        _service(ollama, tmp_path).embed(["shared text"])
+        other = _service(ollama, tmp_path)
+        other.model = "other-model"
+
+        other.embed(["shared text"])
+
+        assert other.stats["computed"] == 1
+
+    def test_mismatched_response_raises(self, tmp_path, monkeypatch):
+        class _Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"embeddings": [[0.1] * DIM]}
+
+        monkeypatch.setattr("claude.tools.core.embedding_service.requests.post",
+                            lambda *a, **k: _Response())
+        service = EmbeddingService(model="fake", cache_path=tmp_path / "embeddings.db")
+
+        with pytest.raises(ValueError):
+            service.embed(["one", "two"])
+        assert service.cache.count() == 0
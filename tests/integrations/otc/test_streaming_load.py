@@ -0,0 +1,530 @@
+"""
+Unit tests for OTC streaming load path
+
+Tests:
+- Incremental JSON record parsing across chunk boundaries and wrapper shapes
+- COPY text encoding
+- OTCClient.iter_records against a local HTTP server (bounded memory)
+- OTCPostgresLoader.load_view_streaming with a fake connection
+- Row-hash change detection, incremental loads and OTCETLSync.run_incremental_sync
+- Set-based merge and row-hash SQL against a real PostgreSQL (set OTC_PG_TEST_DSN)
+"""
+
+import json
+import os
+import threading
+import tracemalloc
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude.tools.integrations.otc import load_to_postgres
+from claude.tools.integrations.otc.change_detection import ChangeDetector, row_hash
+from claude.tools.integrations.otc.client import OTCClient
+from claude.tools.integrations.otc.exceptions import OTCDataError
+from claude.tools.integrations.otc.load_to_postgres import OTCPostgresLoader
+from claude.tools.integrations.otc.streaming import CopyRowStream, copy_text_value, iter_json_records
+from claude.tools.integrations.otc.views import OTCViews
+
+
+def _chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _comment(comment_id, text="Checked logs", ticket_id=1000):
+    return {
+        'TKTCT-CommentID': comment_id,
+        'TKTCT-TicketID': ticket_id,
+        'TKTCT-Comment': text,
+        'TKTCT-UserID': 'jsmith',
+        'TKTCT-Username': 'John Smith',
+        'TKTCT-OwnerType': 'Agent',
+        'TKTCT-Created Time': '2026-10-01T09:30:00',
+        'TKTCT-VisibleCustomer': True,
+        'TKTCT-Type': 'comments',
+        'TKTCT-Team': 'Cloud - Infrastructure',
+    }
+
+
+# =============================================================================
+# PARSER
+# =============================================================================
+
+class TestIterJsonRecords:
+    """Incremental record parsing."""
+
+    RECORDS = [
+        {'id': 1, 'text': 'brackets [in] {text} "quoted" \\ end'},
+        {'id': 2, 'text': 'unicode café ✓', 'nested': {'data': [1, 2]}},
+        {'id': 3, 'text': None},
+    ]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 16])
+    @pytest.mark.parametrize("wrap", [
+        lambda r: r,
+        lambda r: {'data': r},
+        lambda r: {'meta': {'records': 'not this'}, 'message': {'data': r}},
+        lambda r: {'count': 3, 'records': r},
+    ])
+    def test_records_across_chunk_sizes(self, size, wrap):
+        body = json.dumps(wrap(self.RECORDS)).encode('utf-8')
+
+        assert list(iter_json_records(_chunks(body, size))) == self.RECORDS
+
+    @pytest.mark.parametrize("size", [1, 3, 64])
+    def test_scalar_records_split_at_chunk_edge(self, size):
+        body = b'[12345, 67.5, true, null, "x"]'
+
+        assert list(iter_json_records(_chunks(body, size))) == [12345, 67.5, True, None, "x"]
+
+    def test_single_object_and_empty_body(self):
+        assert list(iter_json_records([b'{"message": {"id": 1}}'])) == [{'id': 1}]
+        assert list(iter_json_records([b'[]'])) == []
+        assert list(iter_json_records([b''])) == []
+
+    def test_invalid_and_truncated_body_raise(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_records([b'[{"id": 1}, {"id": ']))
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_records([b'<html>error</html>']))
+
+
+class TestCopyRowStream:
+    """COPY text encoding."""
+
+    def test_copy_text_value(self):
+        assert copy_text_value(None) == '\\N'
+        assert copy_text_value(True) == 't'
+        assert copy_text_value(datetime(2026, 10, 1, 9, 30)) == '2026-10-01T09:30:00'
+        assert copy_text_value('a\tb\nc\\d\r') == 'a\\tb\\nc\\\\d\\r'
+
+    def test_read_in_small_pieces(self):
+        stream = CopyRowStream(iter([(1, 'a'), (2, None)]))
+
+        pieces = []
+        while True:
+            piece = stream.read(3)
+            if not piece:
+                break
+            pieces.append(piece)
+
+        assert ''.join(pieces) == '1\ta\n2\t\\N\n'
+        assert stream.rows_written == 2
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+class _ViewHandler(BaseHTTPRequestHandler):
+    body = b''
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        for i in range(0, len(self.body), 1 << 16):
+            self.wfile.write(self.body[i:i + (1 << 16)])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def view_server():
+    """Serve a JSON body on localhost; yields a setter for the body."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ViewHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def serve(body: bytes):
+        _ViewHandler.body = body
+
+    with patch.object(OTCViews, 'BASE_URL', f"http://127.0.0.1:{server.server_port}/data"):
+        yield serve
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    with patch('claude.tools.integrations.otc.client.get_credentials', return_value=('user', 'pass')):
+        otc_client = OTCClient()
+    otc_client.rate_limiter.min_interval = 0
+    return otc_client
+
+
+class TestIterRecords:
+    """OTCClient.iter_records over HTTP."""
+
+    def test_streams_large_view_with_bounded_memory(self, view_server, client):
+        records = [_comment(i, text='x' * 400) for i in range(20000)]
+        body = json.dumps({'message': {'data': records}}).encode('utf-8')
+        view_server(body)
+        del records
+
+        tracemalloc.start()
+        try:
+            count = 0
+            for record in client.iter_records(OTCViews.COMMENTS):
+                assert record['TKTCT-CommentID'] == count
+                count += 1
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < len(body) / 10
+        assert client.get_metrics()['request_count'] == 1
+
+    def test_invalid_json_raises_data_error(self, view_server, client):
+        view_server(b'[{"TKTCT-CommentID": 1}, {"TKTCT-CommentID": ')
+
+        records = client.iter_records(OTCViews.COMMENTS)
+
+        assert next(records) == {'TKTCT-CommentID': 1}
+        with pytest.raises(OTCDataError):
+            next(records)
+
+
+# =============================================================================
+# LOADER
+# =============================================================================
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.itersize = 2000
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append(sql)
+        self.conn.params.append(params)
+
+    def __iter__(self):
+        return iter([(h,) for h in self.conn.stored_hashes])
+
+    def copy_expert(self, sql, stream):
+        self.conn.copy_sql = sql
+        self.conn.copied = stream.read()
+
+    def fetchone(self):
+        if 'to_regclass' in self.conn.executed[-1]:
+            return self.conn.schema_state
+        return self.conn.merge_result
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, merge_result, stored_hashes=(), schema_state=(True, 3)):
+        self.merge_result = merge_result
+        self.schema_state = schema_state  # (otc_row_hashes exists, etl_metadata columns)
+        self.stored_hashes = list(stored_hashes)
+        self.executed = []
+        self.params = []
+        self.copied = ''
+        self.copy_sql = None
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, name=None):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+class TestLoadViewStreaming:
+    """OTCPostgresLoader.load_view_streaming with a fake connection."""
+
+    def _load(self, records, merge_result, **kwargs):
+        conn = _FakeConnection(merge_result)
+        otc_client = MagicMock()
+        otc_client.iter_records.return_value = iter(records)
+
+        with patch.object(load_to_postgres.psycopg2, 'connect', return_value=conn), \
+                patch.object(load_to_postgres, 'OTCClient', return_value=otc_client):
+            stats = OTCPostgresLoader(pg_config={}).load_view_streaming('comments', **kwargs)
+
+        return conn, stats
+
+    def test_copies_valid_rows_and_merges(self):
+        records = [_comment(1), _comment(2, text='tab\there'), _comment(1, text='edited'),
+                   _comment(None), {'TKTCT-CommentID': 'not-an-int'}]
+
+        conn, stats = self._load(records, merge_result=(1, 0))
+
+        lines = conn.copied.splitlines()
+        assert conn.copy_sql.startswith("COPY otc_stage_comments (comment_id, ticket_id")
+        assert conn.copy_sql.endswith("team, _row_key, _row_hash) FROM STDIN")
+        assert [line.split('\t')[0] for line in lines] == ['1', '2', '1']
+        assert 'tab\\there' in lines[1]
+        assert lines[0].split('\t')[7] == 't'
+
+        assert (stats['fetched'], stats['inserted'], stats['updated']) == (5, 1, 0)
+        assert stats['skipped'] == 2
+        assert stats['errors'] == 2
+        assert stats['rows_per_second'] > 0
+        assert stats['peak_memory_mb'] is None
+
+        merge = next(sql for sql in conn.executed if 'ON CONFLICT' in sql)
+        assert 'INSERT INTO servicedesk.comments' in merge
+        assert 'DISTINCT ON (comment_id' in merge
+        assert any('servicedesk.etl_metadata' in sql for sql in conn.executed)
+        assert conn.commits >= 1 and conn.rollbacks == 0
+
+    def test_measure_memory_is_opt_in(self):
+        _, stats = self._load([_comment(1)], merge_result=(1, 0), measure_memory=True)
+
+        assert stats['peak_memory_mb'] is not None
+        assert not tracemalloc.is_tracing()
+
+    def test_merge_failure_rolls_back(self):
+        conn = _FakeConnection(merge_result=None)
+        otc_client = MagicMock()
+        otc_client.iter_records.return_value = iter([_comment(1)])
+
+        with patch.object(load_to_postgres.psycopg2, 'connect', return_value=conn), \
+                patch.object(load_to_postgres, 'OTCClient', return_value=otc_client):
+            with pytest.raises(TypeError):
+                OTCPostgresLoader(pg_config={}).load_view_streaming('comments')
+
+        assert conn.rollbacks == 1
+
+
+# =============================================================================
+# INCREMENTAL
+# =============================================================================
+
+class TestChangeDetector:
+    """Row-hash change detection and watermark tracking."""
+
+    def test_only_new_or_changed_rows_pass(self):
+        first = [(1, 'a', datetime(2026, 10, 1)), (2, 'b', datetime(2026, 10, 2))]
+        detector = ChangeDetector(key_positions=[0], watermark_position=2,
+                                  known_hashes={row_hash(r) for r in first})
+
+        rows = [(1, 'a', datetime(2026, 10, 1)), (2, 'edited', datetime(2026, 10, 2)),
+                (3, 'c', datetime(2026, 9, 1))]
+
+        assert [detector.is_changed(r) for r in rows] == [False, True, True]
+        assert (detector.changed, detector.unchanged) == (2, 1)
+        assert detector.watermark == datetime(2026, 10, 2)
+
+    def test_tag_keys_rows_and_null_keys_by_hash(self):
+        detector = ChangeDetector(key_positions=[0, 1])
+        keyed = ('jsmith', 7, 1.5)
+        unkeyed = ('jsmith', None, 1.5)
+
+        detector.is_changed(keyed)
+        assert detector.tag(keyed) == ('jsmith\t7', row_hash(keyed))
+        detector.is_changed(unkeyed)
+        assert detector.tag(unkeyed) == (f"#{row_hash(unkeyed)}", row_hash(unkeyed))
+
+
+class TestIncrementalLoad:
+    """load_view_streaming(incremental=True) with a fake connection."""
+
+    def _load(self, records, stored_hashes=(), incremental=True):
+        conn = _FakeConnection(merge_result=(0, 0), stored_hashes=stored_hashes)
+        otc_client = MagicMock()
+        otc_client.iter_records.return_value = iter(records)
+
+        with patch.object(load_to_postgres.psycopg2, 'connect', return_value=conn), \
+                patch.object(load_to_postgres, 'OTCClient', return_value=otc_client):
+            stats = OTCPostgresLoader(pg_config={}).load_view_streaming(
+                'comments', incremental=incremental)
+
+        return conn, stats
+
+    def test_second_run_copies_only_changed_rows(self):
+        records = [_comment(i) for i in range(100)]
+        first, _ = self._load(records, incremental=False)
+        stored = [int(line.split('\t')[-1]) for line in first.copied.splitlines()]
+
+        records[5] = _comment(5, text='edited')
+        records.append(_comment(100))
+        conn, stats = self._load(records, stored_hashes=stored)
+
+        assert [line.split('\t')[0] for line in conn.copied.splitlines()] == ['5', '100']
+        assert (stats['fetched'], stats['unchanged'], stats['sync_mode']) == (101, 99, 'incremental')
+        assert stats['watermark'] == datetime(2026, 10, 1, 9, 30)
+        assert not any(sql.startswith('DELETE') for sql in conn.executed)
+
+    def test_full_run_replaces_stored_hashes(self):
+        conn, stats = self._load([_comment(1)], stored_hashes=[123], incremental=False)
+
+        assert stats['unchanged'] == 0
+        assert "DELETE FROM servicedesk.otc_row_hashes WHERE view_name = %s" in conn.executed
+        assert any('INSERT INTO servicedesk.otc_row_hashes' in sql for sql in conn.executed)
+
+    def test_migrated_schema_is_not_altered(self):
+        conn, _ = self._load([_comment(1)])
+
+        assert not any('ALTER TABLE servicedesk.etl_metadata' in sql for sql in conn.executed)
+
+    def test_missing_schema_applied_before_load(self):
+        conn = _FakeConnection(merge_result=(1, 0), schema_state=(False, 0))
+        otc_client = MagicMock()
+        otc_client.iter_records.return_value = iter([_comment(1)])
+
+        with patch.object(load_to_postgres.psycopg2, 'connect', return_value=conn), \
+                patch.object(load_to_postgres, 'OTCClient', return_value=otc_client):
+            OTCPostgresLoader(pg_config={}).load_view_streaming('comments', incremental=True)
+
+        alter = next(i for i, sql in enumerate(conn.executed) if 'ALTER TABLE servicedesk.etl_metadata' in sql)
+        stage = next(i for i, sql in enumerate(conn.executed) if 'CREATE TEMP TABLE' in sql)
+        assert alter < stage
+        # Catalog check and DDL each commit before the load transaction
+        assert conn.commits >= 3
+
+    def test_watermark_recorded_in_etl_metadata(self):
+        conn, _ = self._load([_comment(1), _comment(2)], stored_hashes=[])
+
+        index = next(i for i, sql in enumerate(conn.executed) if 'INTO servicedesk.etl_metadata' in sql)
+        sql, params = conn.executed[index], conn.params[index]
+        assert 'watermark, records_unchanged, sync_mode' in sql
+        assert params[-3:] == (datetime(2026, 10, 1, 9, 30), 0, 'incremental')
+
+
+class TestRunIncrementalSync:
+    """OTCETLSync.run_incremental_sync delegates to the streaming loader."""
+
+    @pytest.fixture(autouse=True)
+    def sync_class(self):
+        pytest.importorskip("pandas")
+        from claude.tools.integrations.otc.etl_adapter import OTCETLSync
+        self.OTCETLSync = OTCETLSync
+
+    def test_collects_per_view_results(self):
+        loader = MagicMock()
+        loader.load_view_streaming.side_effect = lambda view, incremental: {
+            'fetched': 10, 'unchanged': 9, 'inserted': 1, 'updated': 0, 'errors': 0,
+            'watermark': datetime(2026, 10, 1),
+        }
+
+        result = self.OTCETLSync(adapter=MagicMock(), loader=loader).run_incremental_sync()
+
+        assert result['status'] == 'success'
+        assert result['entities']['tickets']['unchanged_count'] == 9
+        assert result['entities']['tickets']['watermark'] == '2026-10-01T00:00:00'
+        assert all(call.kwargs == {'incremental': True}
+                   for call in loader.load_view_streaming.call_args_list)
+
+    def test_view_failure_is_partial(self):
+        loader = MagicMock()
+        loader.load_view_streaming.side_effect = [
+            RuntimeError("boom"),
+            {'fetched': 0, 'unchanged': 0, 'inserted': 0, 'updated': 0, 'errors': 0, 'watermark': None},
+            {'fetched': 0, 'unchanged': 0, 'inserted': 0, 'updated': 0, 'errors': 0, 'watermark': None},
+        ]
+
+        result = self.OTCETLSync(adapter=MagicMock(), loader=loader).run_incremental_sync()
+
+        assert result['status'] == 'partial'
+        assert result['entities']['comments'] == {'error': 'boom'}
+
+
+# =============================================================================
+# POSTGRESQL
+# =============================================================================
+
+PG_DSN = os.environ.get('OTC_PG_TEST_DSN')
+
+
+@pytest.mark.skipif(not PG_DSN, reason="OTC_PG_TEST_DSN not set")
+class TestMergeSqlPostgres:
+    """Staging + merge SQL against a real database (isolated schema)."""
+
+    @pytest.fixture
+    def conn(self):
+        psycopg2 = pytest.importorskip("psycopg2")
+        conn = psycopg2.connect(PG_DSN)
+        cursor = conn.cursor()
+        cursor.execute("DROP SCHEMA IF EXISTS otc_stream_test CASCADE")
+        cursor.execute("CREATE SCHEMA otc_stream_test")
+        cursor.execute("""
+            CREATE TABLE otc_stream_test.timesheets (
+                "TS-User Username" TEXT, "TS-Date" TIMESTAMP, "TS-Time From" TEXT,
+                "TS-Crm ID" INTEGER, "TS-Hours" REAL,
+                UNIQUE ("TS-User Username", "TS-Date", "TS-Time From", "TS-Crm ID")
+            )
+        """)
+        cursor.execute("""
+            INSERT INTO otc_stream_test.timesheets VALUES ('jsmith', '2026-10-01', '09:00', 1, 1.0)
+        """)
+        conn.commit()
+        yield conn
+        conn.rollback()
+        cursor = conn.cursor()
+        cursor.execute("DROP SCHEMA otc_stream_test CASCADE")
+        conn.commit()
+        conn.close()
+
+    def test_merge_counts_and_last_duplicate_wins(self, conn):
+        spec = load_to_postgres.StreamSpec(
+            view=OTCViews.TIMESHEETS,
+            table='otc_stream_test.timesheets',
+            model=dict,
+            columns=('"TS-User Username"', '"TS-Date"', '"TS-Time From"', '"TS-Crm ID"', '"TS-Hours"'),
+            key=('"TS-User Username"', '"TS-Date"', '"TS-Time From"', '"TS-Crm ID"'),
+            update=('"TS-Hours"',),
+            row=tuple,
+            key_required=False,
+        )
+        rows = [
+            ('jsmith', datetime(2026, 10, 1), '09:00', 1, 2.0),   # update existing
+            ('jsmith', datetime(2026, 10, 2), '09:00', 1, 1.0),   # insert...
+            ('jsmith', datetime(2026, 10, 2), '09:00', 1, 3.0),   # ...duplicate, last wins
+            ('jsmith', datetime(2026, 10, 3), '09:00', None, 1.0),  # NULL keys stay distinct
+            ('jsmith', datetime(2026, 10, 3), '09:00', None, 1.5),
+        ]
+        columns = ', '.join(spec.columns)
+
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            CREATE TEMP TABLE otc_stage_test ON COMMIT DROP AS
+            SELECT {columns} FROM {spec.table} WITH NO DATA
+        """)
+        cursor.execute("ALTER TABLE otc_stage_test ADD COLUMN _ord BIGSERIAL")
+        cursor.copy_expert(f"COPY otc_stage_test ({columns}) FROM STDIN", CopyRowStream(rows))
+        cursor.execute(OTCPostgresLoader._merge_sql(spec, 'otc_stage_test'))
+
+        assert cursor.fetchone() == (3, 1)
+        cursor.execute(f'SELECT "TS-Date"::date::text, "TS-Hours" FROM {spec.table} ORDER BY 1, 2')
+        assert cursor.fetchall() == [
+            ('2026-10-01', 2.0), ('2026-10-02', 3.0), ('2026-10-03', 1.0), ('2026-10-03', 1.5)
+        ]
+
+    def test_row_hashes_keep_last_occurrence(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE otc_stream_test.otc_row_hashes (
+                view_name TEXT NOT NULL, row_key TEXT NOT NULL, row_hash BIGINT NOT NULL,
+                PRIMARY KEY (view_name, row_key)
+            )
+        """)
+        cursor.execute("INSERT INTO otc_stream_test.otc_row_hashes VALUES ('comments', '1', 10)")
+        cursor.execute("""
+            CREATE TEMP TABLE otc_stage_test (_row_key TEXT, _row_hash BIGINT, _ord BIGSERIAL)
+            ON COMMIT DROP
+        """)
+        cursor.copy_expert("COPY otc_stage_test (_row_key, _row_hash) FROM STDIN",
+                           CopyRowStream([('1', 11), ('2', 20), ('2', -21)]))
+
+        with patch.object(load_to_postgres, 'ROW_HASHES_TABLE', 'otc_stream_test.otc_row_hashes'):
+            cursor.execute(OTCPostgresLoader._row_hashes_sql('otc_stage_test'), ('comments',))
+
+        cursor.execute("SELECT row_key, row_hash FROM otc_stream_test.otc_row_hashes ORDER BY 1")
+        assert cursor.fetchall() == [('1', 11), ('2', -21)]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Byte-Offset Transcript Tailing - Tests
+
+Tests that the daemon seeks to the saved byte offset and parses only new
+lines, skips unchanged transcripts after a single stat, detects rewritten
+transcripts, and migrates index-only state files.
+"""
+
+import json
+from unittest import mock
+
+import pytest
+
+from claude.tools.learning.continuous_capture.daemon import ContinuousCaptureDaemon
+from claude.tools.learning.continuous_capture.incremental_extractor import IncrementalExtractor
+
+
+def _lines(*contents):
+    return ''.join(json.dumps({"type": "assistant_message", "content": c}) + '\n' for c in contents)
+
+
+@pytest.fixture
+def setup(tmp_path):
+    project_dir = tmp_path / "projects" / "tail_ctx"
+    project_dir.mkdir(parents=True)
+    transcript = project_dir / "session.jsonl"
+    transcript.write_text(_lines("m0", "m1", "m2"))
+    daemon = ContinuousCaptureDaemon(
+        projects_dir=tmp_path / "projects",
+        queue_dir=tmp_path / "queue",
+        state_dir=tmp_path / "state",
+        scan_interval=0
+    )
+    yield daemon, transcript, tmp_path / "state" / "tail_ctx.json"
+    daemon.stop()
+
+
+def _state(state_file):
+    return json.loads(state_file.read_text())
+
+
+class TestReadFromOffset:
+    """IncrementalExtractor.read_from_offset"""
+
+    def test_reads_only_complete_lines_after_offset(self, tmp_path):
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(_lines("a", "b") + '\n{"bad json\n' + '{"type": "partial"')
+        extractor = IncrementalExtractor()
+
+        first_line = len(_lines("a"))
+        messages, line_count, offset = extractor.read_from_offset(transcript, first_line)
+
+        assert [m["content"] for m in messages] == ["b"]
+        assert line_count == 2  # "b" plus the malformed line
+        assert offset == transcript.stat().st_size - len('{"type": "partial"')
+
+    def test_offset_after_lines(self, tmp_path):
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(_lines("a") + '\n' + _lines("b", "c"))
+        extractor = IncrementalExtractor()
+
+        assert extractor.offset_after_lines(transcript, 2) == len(_lines("a", "b")) + 1
+        assert extractor.offset_after_lines(transcript, 5) is None
+
+
+class TestDaemonTailing:
+    """ContinuousCaptureDaemon resumes from byte offsets"""
+
+    def test_appended_lines_parsed_from_saved_offset(self, setup):
+        daemon, transcript, state_file = setup
+        daemon.capture_cycle()
+        offset = _state(state_file)['byte_offset']
+        assert offset == transcript.stat().st_size
+
+        with open(transcript, 'a') as f:
+            f.write(_lines("m3", "m4"))
+        with mock.patch.object(daemon.extractor, 'read_from_offset',
+                               wraps=daemon.extractor.read_from_offset) as read:
+            daemon.capture_cycle()
+
+        read.assert_called_once_with(transcript, offset)
+        state = _state(state_file)
+        assert (state['last_message_index'], state['last_message_count']) == (5, 5)
+        assert state['byte_offset'] == transcript.stat().st_size
+
+    def test_unchanged_transcript_is_not_opened(self, setup):
+        daemon, _, _ = setup
+        daemon.capture_cycle()
+
+        with mock.patch.object(daemon.extractor, 'read_from_offset') as read, \
+                mock.patch.object(daemon.state_manager, 'save_state') as save:
+            daemon.capture_cycle()
+
+        read.assert_not_called()
+        save.assert_not_called()
+
+    def test_partial_line_waits_for_newline(self, setup):
+        daemon, transcript, state_file = setup
+        with open(transcript, 'a') as f:
+            f.write('{"type": "assistant_message", "content": "m3"')
+        daemon.capture_cycle()
+        assert _state(state_file)['last_message_count'] == 3
+
+        with open(transcript, 'a') as f:
+            f.write('}\n')
+        daemon.capture_cycle()
+
+        assert _state(state_file)['last_message_count'] == 4
+
+    def test_rewrite_in_place_counts_as_compaction(self, setup):
+        daemon, transcript, state_file = setup
+        daemon.capture_cycle()
+
+        # Same inode, longer file, different leading bytes
+        transcript.write_text(_lines("summary of earlier work", "c1", "c2", "c3"))
+        daemon.capture_cycle()
+
+        state = _state(state_file)
+        assert state['compaction_count'] == 1
+        assert state['last_message_count'] == 4
+
+    def test_index_only_state_is_migrated(self, setup):
+        daemon, transcript, state_file = setup
+        daemon.state_manager.save_state("tail_ctx", last_message_index=2, last_message_count=2)
+
+        with mock.patch.object(daemon.extractor, 'extract_from_messages',
+                               return_value=[]) as extract:
+            daemon.capture_cycle()
+
+        assert [m["content"] for m in extract.call_args.args[0]] == ["m2"]
+        state = _state(state_file)
+        assert (state['last_message_index'], state['compaction_count']) == (3, 0)
@@ -0,0 +1,151 @@
+"""
+Single-pass Field Profiler - Tests
+
+Test Objective:
+    profile_table() must reproduce the per-field SQL statistics the data
+    quality checker and reliability scorer used to query separately, in one
+    scan, and switch to bounded-memory sketches for high-cardinality fields.
+"""
+
+import sqlite3
+
+import pytest
+
+from claude.tools.m365_ir.field_profiler import profile_table
+
+
+def _build_table(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE test_logs (
+            id INTEGER PRIMARY KEY,
+            status TEXT,
+            error_code INTEGER,
+            user TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO test_logs (status, error_code, user) VALUES (?, ?, ?)", rows
+    )
+    conn.commit()
+    return conn
+
+
+class TestProfileTable:
+    """Exact statistics match the SQL queries they replace."""
+
+    def test_counts_match_sql(self, temp_db):
+        rows = [
+            ('success' if i % 3 else 'failure', 0, f"user{i % 7}@example.com")
+            for i in range(90)
+        ]
+        rows += [(None, None, '')] * 6 + [('', 50126, None)] * 4
+        conn = _build_table(temp_db, rows)
+
+        profile = profile_table(conn, 'test_logs')
+
+        assert profile.total_records == 100
+        for name, field_profile in profile.fields.items():
+            populated, distinct = conn.execute(
+                f"SELECT COUNT({name}), COUNT(DISTINCT {name}) FROM test_logs "
+                f"WHERE {name} IS NOT NULL AND {name} != ''"
+            ).fetchone()
+            mode_count = conn.execute(
+                f"SELECT COUNT(*) AS c FROM test_logs WHERE {name} IS NOT NULL AND {name} != '' "
+                f"GROUP BY {name} ORDER BY c DESC LIMIT 1"
+            ).fetchone()[0]
+            assert field_profile.populated_count == populated, name
+            assert field_profile.distinct_values == distinct, name
+            assert field_profile.most_common_count == mode_count, name
+            assert not field_profile.approximate
+
+        status = profile.fields['status']
+        assert (status.null_count, status.empty_count) == (6, 4)
+        assert status.most_common_value == 'success'
+
+    def test_sees_uncommitted_rows(self, temp_db):
+        conn = _build_table(temp_db, [('success', 0, 'a')])
+        conn.execute("INSERT INTO test_logs (status, error_code, user) VALUES ('failure', 1, 'b')")
+
+        assert profile_table(conn, 'test_logs', ['status']).fields['status'].distinct_values == 2
+
+    def test_unknown_table_or_column(self, temp_db):
+        conn = _build_table(temp_db, [])
+        with pytest.raises(ValueError):
+            profile_table(conn, 'no_such_table')
+        with pytest.raises(ValueError):
+            profile_table(conn, 'test_logs', ['no_such_column'])
+
+    def test_unreadable_column_is_skipped_with_warning(self, temp_db):
+        conn = _build_table(temp_db, [('success', 0, 'a'), ('failure', 1, 'b')])
+        conn.execute('ALTER TABLE test_logs ADD COLUMN "group" TEXT')
+
+        profile = profile_table(conn, 'test_logs')
+
+        assert 'group' not in profile.fields
+        assert profile.fields['status'].distinct_values == 2
+        assert len(profile.warnings) == 1
+        assert profile.warnings[0].startswith("Failed to analyze field 'group'")
+
+    def test_high_cardinality_switches_to_sketch(self, temp_db):
+        rows = [('success', 0, f"user{i}@example.com") for i in range(20_000)]
+        rows += [('success', 0, 'admin@example.com')] * 5_000
+        conn = _build_table(temp_db, rows)
+
+        profile = profile_table(conn, 'test_logs', exact_limit=1_000, batch_size=3_000)
+
+        user = profile.fields['user']
+        assert user.approximate
+        assert profile.approximate_fields == ['id', 'user']
+        assert user.distinct_values == pytest.approx(20_001, rel=0.05)
+        # Heavy hitter survives pruning; count is a lower bound within rows/limit
+        assert user.most_common_value == 'admin@example.com'
+        assert 5_000 - 25_000 / 1_000 <= user.most_common_count <= 5_001
+
+        # Low-cardinality fields stay exact
+        assert not profile.fields['status'].approximate
+        assert profile.fields['status'].most_common_count == 25_000
+
+
+class TestQualityCheckUsesProfiler:
+    """check_table_quality and the reliability scorer keep their results."""
+
+    def test_table_quality_matches_field_checks(self, oculus_test_db):
+        from claude.tools.m365_ir.data_quality_checker import check_field_quality, check_table_quality
+
+        report = check_table_quality(oculus_test_db, 'sign_in_logs')
+
+        assert report.duration_seconds > 0
+        for score in report.field_scores:
+            expected = check_field_quality(oculus_test_db, 'sign_in_logs', score.field_name)
+            assert score.population_rate == expected.population_rate
+            assert score.distinct_values == expected.distinct_values
+            assert score.is_reliable == expected.is_reliable
+            assert score.most_common_percentage == expected.most_common_percentage
+
+    def test_table_quality_tolerates_failing_field(self, temp_db):
+        from claude.tools.m365_ir.data_quality_checker import check_table_quality
+
+        conn = _build_table(temp_db, [('success', 0, 'a'), ('failure', 1, 'b')])
+        conn.execute('ALTER TABLE test_logs ADD COLUMN "group" TEXT')
+        conn.commit()
+        conn.close()
+
+        report = check_table_quality(temp_db, 'test_logs')
+
+        assert {s.field_name for s in report.field_scores} == {'id', 'status', 'error_code', 'user'}
+        assert any(w.startswith("Failed to analyze field 'group'") for w in report.warnings)
+
+    def test_reliability_score_with_profile_matches_scan(self, oculus_test_db):
+        from claude.tools.m365_ir.field_reliability_scorer import calculate_reliability_score
+
+        conn = sqlite3.connect(oculus_test_db)
+        profiles = profile_table(conn, 'sign_in_logs').fields
+        conn.close()
+
+        for field in ('status_error_code', 'conditional_access_status'):
+            scanned = calculate_reliability_score(oculus_test_db, 'sign_in_logs', field)
+            profiled = calculate_reliability_score(
+                oculus_test_db, 'sign_in_logs', field, profile=profiles[field]
+            )
+            assert profiled == scanned
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Tests for columnar_export - Parquet snapshots and columnar quality checks.
+
+Verifies day partitioning, snapshot staleness detection and that
+ColumnarAnalytics scores fields exactly like data_quality_checker does on
+the SQLite tables. Requires pyarrow (skipped otherwise).
+"""
+
+import shutil
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+import pytest
+
+from claude.tools.m365_ir import auth_verifier, columnar_export
+from claude.tools.m365_ir.columnar_export import (
+    UNKNOWN_DAY,
+    ColumnarAnalytics,
+    export_case_parquet,
+    is_snapshot_current,
+)
+from claude.tools.m365_ir.data_quality_checker import check_field_quality, check_table_quality
+from claude.tools.m365_ir.field_profiler import profile_table
+from claude.tools.m365_ir.field_reliability_scorer import extract_threshold_context
+from claude.tools.m365_ir.log_database import IRLogDatabase
+
+SIGN_IN_SQL = """
+    INSERT INTO sign_in_logs
+    (timestamp, user_principal_name, ip_address, location_country,
+     status_error_code, conditional_access_status, risk_level, raw_record, imported_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _sign_in_rows(count, days=3):
+    statuses = ['success', 'failure', 'notApplied']
+    return [
+        (
+            f"2025-12-{15 + i % days:02d}T{i % 24:02d}:{i % 60:02d}:00",
+            f"user{i % 25}@example.com",
+            f"203.0.113.{i % 200}",
+            'AU' if i % 10 else 'RU',
+            0,                                # 100% uniform - unreliable
+            statuses[i % 3],
+            '' if i % 4 else 'high',          # mostly empty
+            zlib.compress(f'{{"row": {i}}}'.encode()),
+            '2025-12-20T00:00:00',
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield Path(d)
+    shutil.rmtree(d)
+
+
+@pytest.fixture
+def db(temp_dir):
+    pytest.importorskip("pyarrow")
+    db = IRLogDatabase(case_id="PIR-COLUMNAR-001", base_path=str(temp_dir))
+    db.create()
+    conn = db.connect()
+    conn.executemany(SIGN_IN_SQL, _sign_in_rows(300))
+    conn.commit()
+    conn.close()
+    return db
+
+
+class TestExportCaseParquet:
+    """Snapshot layout and manifest"""
+
+    def test_partitions_by_day(self, db):
+        result = export_case_parquet(db)
+
+        export = result.tables['sign_in_logs']
+        assert export.rows == 300
+        assert export.partitions == 3
+        table_dir = result.output_dir / 'sign_in_logs'
+        assert sorted(p.name for p in table_dir.iterdir()) == [
+            'day=2025-12-15', 'day=2025-12-16', 'day=2025-12-17'
+        ]
+        assert result.output_dir == db.db_path.parent / 'parquet'
+
+    def test_raw_columns_excluded_by_default(self, db):
+        export = export_case_parquet(db).tables['sign_in_logs']
+        assert 'raw_record' not in export.columns
+        assert export.excluded_columns == ['raw_record']
+
+        export = export_case_parquet(db, include_raw=True).tables['sign_in_logs']
+        assert 'raw_record' in export.columns
+
+    def test_unparseable_timestamp_goes_to_unknown_partition(self, db):
+        conn = db.connect()
+        conn.execute(SIGN_IN_SQL, ('15/12/2025 9:30', 'x@example.com', '1.2.3.4', 'AU',
+                                   0, 'success', '', None, '2025-12-20T00:00:00'))
+        conn.commit()
+        conn.close()
+
+        result = export_case_parquet(db, tables=['sign_in_logs'])
+
+        assert (result.output_dir / 'sign_in_logs' / f'day={UNKNOWN_DAY}').is_dir()
+        assert ColumnarAnalytics(result.output_dir).row_count('sign_in_logs') == 301
+
+    def test_snapshot_staleness(self, db):
+        assert not is_snapshot_current(db)
+        export_case_parquet(db, tables=['sign_in_logs'])
+        assert is_snapshot_current(db)
+
+        conn = db.connect()
+        conn.executemany(SIGN_IN_SQL, _sign_in_rows(1))
+        conn.commit()
+        conn.close()
+        assert not is_snapshot_current(db)
+
+        export_case_parquet(db, tables=['sign_in_logs'])
+        assert is_snapshot_current(db)
+        assert ColumnarAnalytics(db.db_path.parent / 'parquet').row_count('sign_in_logs') == 301
+
+    def test_requires_pyarrow(self, db, monkeypatch):
+        monkeypatch.setattr(columnar_export, 'PYARROW_AVAILABLE', False)
+        with pytest.raises(ImportError):
+            export_case_parquet(db)
+
+
+class TestColumnarAnalytics:
+    """Columnar checks match the SQLite data_quality_checker"""
+
+    @pytest.mark.parametrize('field', [
+        'conditional_access_status', 'status_error_code', 'risk_level', 'user_principal_name',
+    ])
+    def test_field_quality_matches_sqlite(self, db, field):
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+
+        assert analytics.field_quality('sign_in_logs', field) == \
+            check_field_quality(str(db.db_path), 'sign_in_logs', field)
+
+    def test_table_quality_matches_sqlite(self, db):
+        analytics = ColumnarAnalytics(export_case_parquet(db, include_raw=True).output_dir)
+
+        columnar = analytics.table_quality('sign_in_logs')
+        sqlite_report = check_table_quality(str(db.db_path), 'sign_in_logs')
+
+        assert columnar.overall_quality_score == sqlite_report.overall_quality_score
+        assert columnar.reliable_fields == sqlite_report.reliable_fields
+        assert columnar.unreliable_fields == sqlite_report.unreliable_fields
+
+    def test_value_distribution(self, db):
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+
+        assert analytics.value_distribution('sign_in_logs', 'conditional_access_status') == {
+            'success': 100, 'failure': 100, 'notApplied': 100
+        }
+        assert analytics.value_distribution('sign_in_logs', 'risk_level') == {'high': 75}
+        assert len(analytics.value_distribution('sign_in_logs', 'ip_address', limit=5)) == 5
+
+    def test_unknown_table_or_field(self, db):
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+        with pytest.raises(ValueError):
+            analytics.table_quality('no_such_table')
+        with pytest.raises(ValueError):
+            analytics.field_quality('sign_in_logs', 'raw_record')
+
+    def test_field_profiles_match_sqlite_profiler(self, db):
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+        fields = ['conditional_access_status', 'status_error_code', 'risk_level', 'raw_record']
+
+        profiles = analytics.field_profiles('sign_in_logs', fields)
+
+        conn = db.connect()
+        expected = profile_table(conn, 'sign_in_logs', fields[:3]).fields
+        conn.close()
+        # raw_record isn't exported, so it's left to the SQLite fallback
+        assert profiles == expected
+
+    def test_threshold_context_matches_sqlite(self, db):
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+
+        assert analytics.threshold_context('sign_in_logs', 'sign_in_logs') == \
+            extract_threshold_context(str(db.db_path), 'sign_in_logs', 'sign_in_logs')
+
+    def test_count_rows(self, db):
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+
+        assert analytics.count_rows('sign_in_logs') == 300
+        assert analytics.count_rows('sign_in_logs', [('conditional_access_status', '=', 'success')]) == 100
+        assert analytics.count_rows('sign_in_logs', [
+            ('conditional_access_status', '!=', 'failure'),
+            ('location_country', 'not in', ('AU', 'Australia')),
+        ]) == 20
+        with pytest.raises(ValueError):
+            analytics.count_rows('sign_in_logs', [('raw_record', '=', b'')])
+        with pytest.raises(ValueError):
+            analytics.count_rows('sign_in_logs', [('risk_level', 'like', 'h%')])
+
+    @pytest.mark.parametrize('phase_2_1', [True, False])
+    def test_sign_in_verification_matches_sqlite(self, db, temp_dir, monkeypatch, phase_2_1):
+        monkeypatch.setattr(auth_verifier, 'HISTORICAL_DB_PATH', temp_dir / 'history.db')
+        monkeypatch.setattr(auth_verifier, 'USE_PHASE_2_1_SCORING', phase_2_1)
+        analytics = ColumnarAnalytics(export_case_parquet(db).output_dir)
+
+        columnar = auth_verifier.verify_sign_in_status(str(db.db_path), analytics=analytics)
+        scanned = auth_verifier.verify_sign_in_status(str(db.db_path))
+
+        assert columnar.status_field_used == scanned.status_field_used == 'conditional_access_status'
+        assert (columnar.success_count, columnar.failure_count) == (100, 100)
+        assert columnar.foreign_success_count == scanned.foreign_success_count == 10
+        assert columnar.field_score == scanned.field_score
+        assert columnar.warnings == scanned.warnings
+
+    def test_missing_export(self, temp_dir):
+        pytest.importorskip("pyarrow")
+        with pytest.raises(FileNotFoundError):
+            ColumnarAnalytics(temp_dir)
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_one_million_row_quality_benchmark(db):
+    """Benchmark: table quality on 1M sign-ins, SQLite scan vs Parquet snapshot"""
+    conn = db.connect()
+    conn.executemany(SIGN_IN_SQL, _sign_in_rows(1_000_000, days=30))
+    conn.commit()
+    conn.close()
+
+    start = time.perf_counter()
+    result = export_case_parquet(db, tables=['sign_in_logs'])
+    export_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columnar = ColumnarAnalytics(result.output_dir).table_quality('sign_in_logs')
+    columnar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sqlite_report = check_table_quality(str(db.db_path), 'sign_in_logs')
+    sqlite_s = time.perf_counter() - start
+
+    print(f"\n1M sign-ins: export {export_s:.1f}s, columnar quality {columnar_s:.2f}s, "
+          f"SQLite quality {sqlite_s:.2f}s")
+    assert columnar.total_records == sqlite_report.total_records
+    assert columnar_s < sqlite_s
@@ -481,3 +481,215 @@ class TestCompressionIntegration:
         # The key difference: with Row factory, we expect string back
         # (the query layer should decompress transparently)
         assert row['raw_record'] is not None
+
+
+# ============================================================================
+# Codec Layer Tests (zstd dictionary codec)
+# ============================================================================
+
+try:
+    from claude.tools.m365_ir import compression
+    from claude.tools.m365_ir.compression import (
+        CODEC_ZLIB,
+        CODEC_ZSTD,
+        ZSTD_MAGIC,
+        get_table_codec,
+        load_dictionaries,
+    )
+except ImportError:
+    compression = None
+
+
+def _ual_rows(count):
+    """Synthetic UAL CSV rows with realistic key repetition."""
+    operations = ['MailItemsAccessed', 'Set-InboxRule', 'FileAccessed', 'UserLoggedIn']
+    rows = []
+    for i in range(count):
+        operation = operations[i % len(operations)]
+        rows.append({
+            'CreationDate': f'15/12/2025 {i % 12 + 1}:{i % 60:02d}:00 AM',
+            'UserIds': f'user{i % 40}@example.com',
+            'Operations': operation,
+            'Workload': 'Exchange',
+            'RecordType': '2',
+            'ResultStatus': 'Succeeded',
+            'ClientIP': f'203.0.113.{i % 250}',
+            'ObjectId': f'item-{i}',
+            'AuditData': json.dumps({
+                'CreationTime': '2025-12-15T11:00:00',
+                'Id': f'00000000-0000-0000-0000-{i:012d}',
+                'Operation': operation,
+                'OrganizationId': 'org-abc-123',
+                'RecordType': 2,
+                'ResultStatus': 'Succeeded',
+                'UserKey': f'1003200{i % 40:04d}',
+                'UserType': 0,
+                'Version': 1,
+                'Workload': 'Exchange',
+                'ClientIPAddress': f'203.0.113.{i % 250}',
+                'UserId': f'user{i % 40}@example.com',
+            }),
+        })
+    return rows
+
+
+@pytest.fixture
+def large_ual_csv(temp_dir):
+    """UAL CSV large enough to train a table dictionary."""
+    csv_path = temp_dir / "large_ual.csv"
+    rows = _ual_rows(500)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return csv_path
+
+
+@pytest.fixture
+def clear_dictionaries():
+    """Forget registered dictionaries so tests exercise load_dictionaries()."""
+    if compression is None:
+        pytest.skip("compression module not yet implemented")
+    saved = dict(compression._DECOMPRESSORS)
+    compression._DECOMPRESSORS.clear()
+    yield
+    compression._DECOMPRESSORS.clear()
+    compression._DECOMPRESSORS.update(saved)
+
+
+class TestCodecLayer:
+    """Codec selection and backwards compatible tagging (no zstandard needed)."""
+
+    def test_zlib_codec_is_default(self, db):
+        conn = db.connect()
+        assert get_table_codec(conn, 'sign_in_logs') is None
+        assert get_table_codec(conn, 'sign_in_logs', CODEC_ZLIB) is None
+        conn.close()
+
+    def test_unknown_codec_rejected(self, db):
+        conn = db.connect()
+        with pytest.raises(ValueError):
+            get_table_codec(conn, 'sign_in_logs', 'lz4')
+        conn.close()
+        with pytest.raises(ValueError):
+            LogImporter(db, codec='lz4')
+
+    def test_is_compressed_detects_zstd_frame(self):
+        assert is_compressed(ZSTD_MAGIC + b'\x00\x00') is True
+
+    def test_zstd_without_library_falls_back_to_zlib(self, db, large_ual_csv, monkeypatch):
+        monkeypatch.setattr(compression, 'ZSTD_AVAILABLE', False)
+
+        result = LogImporter(db, codec=CODEC_ZSTD).import_ual(large_ual_csv)
+
+        assert result.records_imported == 500
+        conn = db.connect()
+        blobs = [r[0] for r in conn.execute("SELECT raw_record FROM unified_audit_log")]
+        dictionaries = conn.execute("SELECT COUNT(*) FROM compression_dictionaries").fetchone()[0]
+        conn.close()
+        assert all(blob[:1] == b'\x78' for blob in blobs)
+        assert dictionaries == 0
+
+    def test_zstd_row_without_library_raises(self, monkeypatch):
+        monkeypatch.setattr(compression, 'ZSTD_AVAILABLE', False)
+        with pytest.raises(ImportError):
+            decompress_json(ZSTD_MAGIC + b'\x00\x00')
+
+    def test_load_dictionaries_on_pre_v7_db(self, db):
+        conn = db.connect()
+        conn.execute("DROP TABLE compression_dictionaries")
+        assert load_dictionaries(conn) == 0
+        conn.close()
+
+
+class TestZstdDictionaryCodec:
+    """Trained per-table dictionaries (requires zstandard)."""
+
+    @pytest.fixture(autouse=True)
+    def _require_zstd(self):
+        pytest.importorskip("zstandard")
+
+    def test_roundtrip_with_trained_dictionary(self, db, clear_dictionaries):
+        samples = _ual_rows(300)
+        conn = db.connect()
+        codec = get_table_codec(conn, 'unified_audit_log', CODEC_ZSTD, samples)
+        conn.commit()
+
+        assert codec is not None
+        compressed = compress_json(samples[0], codec)
+        assert compressed[:4] == ZSTD_MAGIC
+        assert is_compressed(compressed)
+        assert json.loads(decompress_json(compressed)) == samples[0]
+
+        # A second call reuses the stored dictionary instead of retraining
+        again = get_table_codec(conn, 'unified_audit_log', CODEC_ZSTD, samples)
+        assert again.dict_id == codec.dict_id
+        conn.close()
+
+    def test_too_few_samples_keeps_zlib(self, db):
+        conn = db.connect()
+        assert get_table_codec(conn, 'unified_audit_log', CODEC_ZSTD, _ual_rows(5)) is None
+        conn.close()
+
+    def test_unregistered_dictionary_raises(self, db, clear_dictionaries):
+        conn = db.connect()
+        codec = get_table_codec(conn, 'unified_audit_log', CODEC_ZSTD, _ual_rows(300))
+        conn.close()
+        compressed = compress_json({'k': 'v'}, codec)
+
+        compression._DECOMPRESSORS.clear()
+        with pytest.raises(LookupError):
+            decompress_json(compressed)
+
+    def test_zstd_import_queries_transparently(self, db, large_ual_csv, clear_dictionaries):
+        LogImporter(db, codec=CODEC_ZSTD).import_ual(large_ual_csv)
+        compression._DECOMPRESSORS.clear()  # As in a fresh process
+
+        conn = db.connect()
+        blobs = [r[0] for r in conn.execute("SELECT audit_data FROM unified_audit_log")]
+        conn.close()
+        assert all(blob[:4] == ZSTD_MAGIC for blob in blobs)
+
+        results = LogQuery(db).suspicious_operations()
+        assert results
+        assert all(json.loads(r['audit_data'])['OrganizationId'] == 'org-abc-123' for r in results)
+
+    def test_mixed_codecs_in_one_table(self, db, sample_ual_csv, large_ual_csv):
+        """Rows written by zlib and zstd imports decode side by side."""
+        LogImporter(db).import_ual(sample_ual_csv)
+        LogImporter(db, codec=CODEC_ZSTD).import_ual(large_ual_csv)
+
+        rows = LogQuery(db).execute("SELECT raw_record FROM unified_audit_log")
+        assert len(rows) == 501
+        assert all(json.loads(row['raw_record']) for row in rows)
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_codec_benchmark():
+    """Benchmark: compression ratio and speed, per-row zlib vs zstd dictionary"""
+    pytest.importorskip("zstandard")
+    import sqlite3
+    import time
+
+    records = [json.dumps(row) for row in _ual_rows(50_000)]
+    raw_bytes = sum(len(r.encode('utf-8')) for r in records)
+
+    conn = sqlite3.connect(':memory:')
+    codec = get_table_codec(conn, 'unified_audit_log', CODEC_ZSTD,
+                            records[:compression.DICTIONARY_TRAINING_ROWS])
+    results = {}
+    for name, selected in (('zlib', None), ('zstd+dict', codec)):
+        start = time.perf_counter()
+        blobs = [compress_json(r, selected) for r in records]
+        compress_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for blob in blobs:
+            decompress_json(blob)
+        decompress_s = time.perf_counter() - start
+        results[name] = (raw_bytes / sum(len(b) for b in blobs), compress_s, decompress_s)
+        print(f"\n{name:10s} ratio {results[name][0]:.2f}x, "
+              f"compress {len(records) / compress_s:,.0f} rows/sec, "
+              f"decompress {len(records) / decompress_s:,.0f} rows/sec")
+
+    assert results['zstd+dict'][0] > results['zlib'][0]
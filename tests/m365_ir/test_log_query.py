@@ -344,3 +344,61 @@ class TestQueryPerformance:
 
         # 100 queries should complete in < 1 second
         assert elapsed < 1.0
+
+
+class TestLazyDecompressionAndProjection:
+    """Tests for LazyRow results and the columns= projection argument."""
+
+    @pytest.fixture
+    def compressed_query(self, db):
+        """Query over a sign-in row whose raw_record is zlib-compressed."""
+        from claude.tools.m365_ir.compression import compress_json
+
+        conn = db.connect()
+        conn.execute("""
+            INSERT INTO sign_in_logs
+            (timestamp, user_principal_name, ip_address, raw_record, imported_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (datetime.now().isoformat(), 'lazy@example.com', '198.51.100.7',
+              compress_json({'Lazy': True}), datetime.now().isoformat()))
+        conn.commit()
+        conn.close()
+        return LogQuery(db)
+
+    def test_raw_record_decompressed_only_on_access(self, compressed_query, monkeypatch):
+        from claude.tools.m365_ir import log_query
+
+        calls = []
+        real = log_query.decompress_json
+        monkeypatch.setattr(log_query, 'decompress_json', lambda v: calls.append(v) or real(v))
+
+        row = compressed_query.activity_by_ip('198.51.100.7')[0]
+        assert row['user'] == 'lazy@example.com'
+        assert calls == []
+
+        assert json.loads(row['raw_record']) == {'Lazy': True}
+        assert len(calls) == 1
+        row.get('raw_record')
+        assert len(calls) == 1
+
+    def test_lazy_row_converts_like_a_dict(self, compressed_query):
+        row = compressed_query.activity_by_ip('198.51.100.7')[0]
+
+        assert isinstance(row, dict)
+        assert json.loads(dict(row)['raw_record']) == {'Lazy': True}
+        assert json.loads(json.loads(json.dumps(row))['raw_record']) == {'Lazy': True}
+
+    def test_columns_projection(self, query):
+        results = query.activity_by_ip('185.234.100.50', columns=['timestamp', 'user', 'operation'])
+
+        assert len(results) == len(query.activity_by_ip('185.234.100.50'))
+        assert all(set(r) == {'timestamp', 'user', 'operation'} for r in results)
+        assert [r['timestamp'] for r in results] == sorted(r['timestamp'] for r in results)
+
+    def test_columns_projection_on_table_query(self, query):
+        results = query.activity_by_user('victim@example.com', columns=['source', 'ip_address'])
+        assert results and all('raw_record' not in r for r in results)
+
+    def test_columns_projection_rejects_non_identifiers(self, query):
+        with pytest.raises(ValueError):
+            query.activity_by_ip('185.234.100.50', columns=['timestamp; DROP TABLE sign_in_logs'])
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Tests for ParallelLogImporter - process pool parse/compress + single writer.
+
+Verifies that a parallel case-bundle import produces the same database
+contents and ImportResult shape as the serial LogImporter.import_all(),
+for both directory and zip sources.
+"""
+
+import csv
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from claude.tools.m365_ir.log_database import IRLogDatabase
+from claude.tools.m365_ir.log_importer import LogImporter, ImportResult
+from claude.tools.m365_ir.m365_log_parser import LogType
+from claude.tools.m365_ir.parallel_importer import (
+    ParallelLogImporter,
+    ParallelImportReport,
+    discover_exports,
+)
+
+
+SIGNIN_FIELDS = [
+    'CreatedDateTime', 'UserPrincipalName', 'UserDisplayName',
+    'AppDisplayName', 'IPAddress', 'City', 'Country',
+    'Device', 'Browser', 'OS', 'Status',
+    'RiskState', 'RiskLevelDuringSignIn', 'RiskLevelAggregated',
+    'ConditionalAccessStatus'
+]
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory for test databases."""
+    d = tempfile.mkdtemp()
+    yield Path(d)
+    shutil.rmtree(d)
+
+
+@pytest.fixture
+def exports_dir(temp_dir):
+    """Case bundle with sign-in, UAL, mailbox (parallel) and OAuth (serial) exports."""
+    exports = temp_dir / "exports"
+    exports.mkdir()
+
+    with open(exports / "1_TestSignInLogs.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SIGNIN_FIELDS)
+        writer.writeheader()
+        writer.writerow({
+            'CreatedDateTime': '15/12/2025 9:30:00 AM', 'UserPrincipalName': 'user1@example.com',
+            'UserDisplayName': 'User One', 'AppDisplayName': 'Microsoft Office',
+            'IPAddress': '203.0.113.1', 'City': 'Sydney', 'Country': 'Australia',
+            'Device': 'Windows 11', 'Browser': 'Chrome 120', 'OS': 'Windows',
+            'Status': 'Success', 'RiskState': 'none', 'RiskLevelDuringSignIn': 'none',
+            'RiskLevelAggregated': 'none', 'ConditionalAccessStatus': 'success'
+        })
+        writer.writerow({
+            'CreatedDateTime': '15/12/2025 10:45:00 AM', 'UserPrincipalName': 'user2@example.com',
+            'UserDisplayName': 'User Two', 'AppDisplayName': 'Exchange Online',
+            'IPAddress': '185.234.100.50', 'City': 'Moscow', 'Country': 'Russia',
+            'Device': '', 'Browser': 'Safari', 'OS': 'Windows',
+            'Status': 'Failure', 'RiskState': 'atRisk', 'RiskLevelDuringSignIn': 'high',
+            'RiskLevelAggregated': 'high', 'ConditionalAccessStatus': 'failure'
+        })
+
+    with open(exports / "7_TestFullAuditLog.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=[
+            'CreationDate', 'UserIds', 'Operations', 'Workload',
+            'RecordType', 'ResultStatus', 'ClientIP', 'ObjectId', 'AuditData'
+        ])
+        writer.writeheader()
+        for i in range(25):
+            writer.writerow({
+                'CreationDate': f'15/12/2025 11:{i:02d}:00 AM', 'UserIds': 'user1@example.com',
+                'Operations': 'MailItemsAccessed', 'Workload': 'Exchange', 'RecordType': '2',
+                'ResultStatus': 'Succeeded', 'ClientIP': '185.234.100.50',
+                'ObjectId': f'item-{i}', 'AuditData': json.dumps({'ItemCount': i})
+            })
+
+    with open(exports / "4_TestMailboxAudit.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=[
+            'CreationDate', 'RecordType', 'UserIds', 'Operations', 'Identity', 'AuditData'
+        ])
+        writer.writeheader()
+        writer.writerow({
+            'CreationDate': '15/12/2025 12:00:00 PM', 'RecordType': '2',
+            'UserIds': 'victim@example.com', 'Operations': 'FolderBind',
+            'Identity': 'folder-bind-001',
+            'AuditData': json.dumps({'ClientIPAddress': '185.234.100.50', 'ItemId': 'x-1'})
+        })
+
+    with open(exports / "5_TestOAuthConsents.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['ClientId', 'ConsentType', 'PrincipalId', 'Scope'])
+        writer.writeheader()
+        writer.writerow({
+            'ClientId': 'malicious-app-id', 'ConsentType': 'Principal',
+            'PrincipalId': 'victim@example.com', 'Scope': 'Mail.ReadWrite'
+        })
+
+    return exports
+
+
+def _make_importer(temp_dir, case_id):
+    db = IRLogDatabase(case_id=case_id, base_path=str(temp_dir))
+    db.create()
+    return db, LogImporter(db)
+
+
+def _table_counts(db):
+    conn = db.connect()
+    counts = {
+        table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ('sign_in_logs', 'unified_audit_log', 'mailbox_audit_log', 'oauth_consents')
+    }
+    conn.close()
+    return counts
+
+
+class TestDiscoverExports:
+    """Tests for export discovery shared by directory and zip sources."""
+
+    def test_discovers_directory_exports(self, exports_dir):
+        types = {e.log_type for e in discover_exports(exports_dir)}
+        assert {LogType.SIGNIN, LogType.FULL_AUDIT, LogType.MAILBOX_AUDIT,
+                LogType.OAUTH_CONSENTS} <= types
+
+    def test_discovers_zip_members(self, exports_dir, temp_dir):
+        zip_path = temp_dir / "bundle.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            for file in exports_dir.iterdir():
+                zf.write(file, f"Export/{file.name}")
+
+        exports = discover_exports(zip_path)
+
+        assert len(exports) == 4
+        assert all(e.zip_member.startswith("Export/") for e in exports)
+        assert all(e.source_id.startswith(f"{zip_path}:") for e in exports)
+
+
+class TestParallelImport:
+    """Parallel import must match serial import results."""
+
+    def test_matches_serial_import(self, exports_dir, temp_dir):
+        serial_db, serial_importer = _make_importer(temp_dir, "PIR-SERIAL-001")
+        parallel_db, parallel_importer = _make_importer(temp_dir, "PIR-PARALLEL-001")
+
+        serial = serial_importer.import_all(exports_dir)
+        report = ParallelLogImporter(parallel_importer, max_workers=2, batch_size=10).run(exports_dir)
+
+        assert set(report.results) == set(serial)
+        for key in serial:
+            assert report.results[key].records_imported == serial[key].records_imported
+        assert _table_counts(parallel_db) == _table_counts(serial_db)
+
+    def test_report_has_per_file_timings(self, exports_dir, temp_dir):
+        _, importer = _make_importer(temp_dir, "PIR-PARALLEL-002")
+        seen = []
+
+        report = ParallelLogImporter(importer, max_workers=2, progress=seen.append).run(exports_dir)
+
+        assert isinstance(report, ParallelImportReport)
+        assert len(report.files) == 4 == len(seen)
+        modes = {f.result_key: f.mode for f in report.files}
+        assert modes['ual'] == 'parallel'
+        assert modes['oauth'] == 'serial'
+        assert all(f.status == 'imported' for f in report.files)
+        assert report.wall_seconds >= report.slowest_file_seconds > 0
+        assert '7_TestFullAuditLog.csv' in report.format()
+
+    def test_reimport_skips_known_hashes(self, exports_dir, temp_dir):
+        db, importer = _make_importer(temp_dir, "PIR-PARALLEL-003")
+        parallel = ParallelLogImporter(importer, max_workers=2)
+
+        parallel.run(exports_dir)
+        second = parallel.run(exports_dir)
+
+        statuses = {f.result_key: f.status for f in second.files if f.mode == 'parallel'}
+        assert set(statuses.values()) == {'skipped'}
+        assert second.results['ual'].records_imported == 0
+        assert _table_counts(db)['unified_audit_log'] == 25
+
+    def test_zip_source(self, exports_dir, temp_dir):
+        db, importer = _make_importer(temp_dir, "PIR-PARALLEL-004")
+        zip_path = temp_dir / "bundle.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            for file in exports_dir.iterdir():
+                zf.write(file, file.name)
+
+        report = ParallelLogImporter(importer, max_workers=2).run(zip_path)
+
+        assert report.results['ual'].source_file == f"{zip_path}:7_TestFullAuditLog.csv"
+        assert _table_counts(db)['unified_audit_log'] == 25
+        assert _table_counts(db)['oauth_consents'] == 1
+
+    def test_import_all_parallel_flag(self, exports_dir, temp_dir):
+        _, importer = _make_importer(temp_dir, "PIR-PARALLEL-005")
+
+        results = importer.import_all(exports_dir, parallel=True, max_workers=2)
+
+        assert isinstance(results['ual'], ImportResult)
+        assert importer.last_import_report.results is results
+
+    def test_writer_setup_failure_fails_files_without_blocking(self, exports_dir, temp_dir, monkeypatch):
+        db, importer = _make_importer(temp_dir, "PIR-PARALLEL-006")
+        apply_pragmas = LogImporter._apply_bulk_import_pragmas
+
+        def locked_in_writer(conn):
+            if threading.current_thread().name == 'm365-ir-import-writer':
+                raise sqlite3.OperationalError("database is locked")
+            apply_pragmas(conn)
+
+        monkeypatch.setattr(LogImporter, '_apply_bulk_import_pragmas', staticmethod(locked_in_writer))
+        reports = []
+        # batch_size=1 sends more batches than the bounded queue holds
+        runner = threading.Thread(
+            target=lambda: reports.append(
+                ParallelLogImporter(importer, max_workers=1, batch_size=1).run(exports_dir)
+            ),
+            daemon=True,
+        )
+        runner.start()
+        runner.join(timeout=120)
+
+        assert not runner.is_alive(), "producers blocked on the writer queue"
+        statuses = {f.result_key: f.status for f in reports[0].files if f.mode == 'parallel'}
+        assert set(statuses.values()) == {'failed'}
+        assert _table_counts(db)['unified_audit_log'] == 0
@@ -33,6 +33,8 @@ from claude.tools.m365_ir.duplicate_handler import (
     add_merge_columns,
     create_active_view,
     DuplicateGroup,
+    compute_dedup_key,
+    get_dedup_watermark,
 )
 
 
@@ -585,3 +587,102 @@ class TestEdgeCases:
         duplicates = identify_duplicates(test_db)
         # Implementation may vary - either 0 (NULLs not grouped) or 1 (NULLs grouped)
         assert len(duplicates) >= 0
+
+
+def _insert_signins(db_path, rows):
+    """Insert (timestamp, upn, ip) rows directly (no dedup_key)."""
+    conn = sqlite3.connect(db_path)
+    conn.executemany("""
+        INSERT INTO sign_in_logs (timestamp, user_principal_name, ip_address, imported_at)
+        VALUES (?, ?, ?, ?)
+    """, [(*row, datetime.now().isoformat()) for row in rows])
+    conn.commit()
+    conn.close()
+
+
+def _create_import_metadata(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE import_metadata (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_file TEXT NOT NULL,
+            source_hash TEXT NOT NULL,
+            log_type TEXT NOT NULL,
+            records_imported INTEGER NOT NULL,
+            records_failed INTEGER DEFAULT 0,
+            import_started TEXT NOT NULL,
+            import_completed TEXT,
+            parser_version TEXT NOT NULL
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+
+class TestIndexedDedup:
+    """Test dedup_key column, covering index and incremental watermark."""
+
+    def test_dedup_key_distinguishes_null_and_empty(self):
+        key = compute_dedup_key('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4')
+        assert key == compute_dedup_key('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4')
+        assert compute_dedup_key('t', 'u', None) != compute_dedup_key('t', 'u', '')
+        assert -2**63 <= key < 2**63
+
+    def test_backfills_keys_and_uses_index(self, test_db):
+        add_merge_columns(test_db)
+        _insert_signins(test_db, [('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4')] * 2)
+
+        assert len(identify_duplicates(test_db)) == 1
+
+        conn = sqlite3.connect(test_db)
+        missing = conn.execute("SELECT COUNT(*) FROM sign_in_logs WHERE dedup_key IS NULL").fetchone()[0]
+        plan = conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT dedup_key FROM sign_in_logs
+            WHERE merge_status IS NOT 'merged' AND dedup_key IS NOT NULL
+            GROUP BY dedup_key HAVING COUNT(*) > 1
+        """).fetchall()
+        conn.close()
+
+        assert missing == 0
+        assert any('COVERING INDEX idx_signin_dedup_key' in row[-1] for row in plan)
+
+    def test_merge_records_watermark(self, test_db):
+        add_merge_columns(test_db)
+        _create_import_metadata(test_db)
+        _insert_signins(test_db, [('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4')] * 3)
+
+        merge_duplicates(test_db)
+
+        conn = sqlite3.connect(test_db)
+        assert get_dedup_watermark(conn) == 3
+        conn.close()
+
+    def test_incremental_only_examines_new_rows(self, test_db):
+        add_merge_columns(test_db)
+        _create_import_metadata(test_db)
+        _insert_signins(test_db, [
+            ('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4'),
+            ('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4'),
+        ])
+        merge_duplicates(test_db)
+
+        # Pre-watermark duplicates left unmerged are not revisited incrementally
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE sign_in_logs SET merge_status = NULL, merged_into = NULL")
+        conn.commit()
+        conn.close()
+        assert identify_duplicates(test_db, incremental=True) == []
+
+        # A new row joining an existing group is found, primary stays the oldest id
+        _insert_signins(test_db, [
+            ('2025-11-25T04:55:50', 'user@example.com', '1.2.3.4'),
+            ('2025-11-26T09:00:00', 'other@example.com', '5.6.7.8'),
+        ])
+        groups = identify_duplicates(test_db, incremental=True)
+        assert len(groups) == 1
+        assert groups[0].record_ids == [1, 2, 3]
+
+        result = merge_duplicates(test_db, incremental=True)
+        assert result['records_merged'] == 2
+        assert merge_duplicates(test_db, incremental=True)['records_merged'] == 0
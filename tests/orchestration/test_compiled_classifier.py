@@ -0,0 +1,94 @@
+"""
+Compiled Classifier - Tests
+
+Test Objective:
+    CompiledClassifier must return exactly what coordinator_agent's
+    classify_for_hook() returns (the hook payload) from the precompiled
+    artifact, honour adaptive routing thresholds, and rebuild the artifact
+    when the coordinator's tables change.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ORCHESTRATION_DIR = Path(__file__).resolve().parents[2] / "claude" / "tools" / "orchestration"
+sys.path.insert(0, str(ORCHESTRATION_DIR))
+
+import coordinator_agent  # noqa: E402
+from compiled_classifier import CompiledClassifier, build_artifact, load_classifier  # noqa: E402
+
+QUERIES = [
+    "How do I configure SPF records for my domain?",
+    "I need to migrate 250 users from on-prem Exchange to Exchange Online urgently",
+    "Review the python code in claude/tools and refactor code for efficiency",
+    "Set up monitoring and SLO alerting for the production API",
+    "Research pricing on LinkedIn, Seek and Indeed",
+    "Should I invest in super or pay down the budget?",
+    "Plan the azure tenant, dns and security compliance roadmap and then integrate terraform",
+    "Write a blog article about kubernetes cost dashboards",
+    "Create a file, then read it, then delete it",
+    "What should I cook for dinner?",
+    "CUSTOM INTUNE LAPTOP ROLLOUT FOR 80 DEVICES",
+    "",
+]
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    return build_artifact(tmp_path / "classifier.json", thresholds_db=tmp_path / "adaptive_routing.db")
+
+
+def _coordinator(adaptive_routing=None):
+    coordinator = coordinator_agent.CoordinatorAgent()
+    coordinator.agent_selector.adaptive_routing = adaptive_routing
+    coordinator.agent_selector.use_adaptive_routing = adaptive_routing is not None
+    return coordinator
+
+
+class TestParity:
+    """Compiled payloads match the coordinator's."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_matches_classify_for_hook(self, artifact, query):
+        expected_code, expected_payload, _ = coordinator_agent.classify_for_hook(_coordinator(), query)
+
+        assert CompiledClassifier(artifact).classify(query) == (expected_code, expected_payload)
+
+    def test_reads_adaptive_thresholds(self, artifact, tmp_path):
+        from adaptive_routing import AdaptiveRoutingSystem
+
+        adaptive = AdaptiveRoutingSystem(db_path=tmp_path / "adaptive_routing.db")
+        threshold = adaptive.get_threshold('dns')
+        threshold.current_threshold = 6.0
+        adaptive._save_threshold(threshold)
+
+        query = "Explain DKIM setup for example.com"
+        expected = coordinator_agent.classify_for_hook(_coordinator(adaptive), query)[:2]
+        baseline = coordinator_agent.classify_for_hook(_coordinator(), query)[:2]
+
+        assert expected != baseline
+        assert CompiledClassifier(artifact).classify(query) == expected
+
+
+class TestArtifactLifecycle:
+    """Artifact is rebuilt when stale and never half-written."""
+
+    def test_missing_artifact_without_rebuild(self, tmp_path):
+        assert load_classifier(tmp_path / "none.json", rebuild=False) is None
+
+    def test_stale_artifact_is_rebuilt(self, artifact, tmp_path):
+        path = tmp_path / "classifier.json"
+        classifier = CompiledClassifier.from_file(path)
+        assert not classifier.is_stale()
+
+        artifact["sources"]["coordinator_agent.py"] = [0, 0]
+        stale = CompiledClassifier(artifact)
+        assert stale.is_stale()
+
+        path.write_text('{"format": 0}')
+        assert load_classifier(path, rebuild=False) is None
+        rebuilt = load_classifier(path)
+        assert rebuilt is not None and not rebuilt.is_stale()
+        assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,110 @@
+"""
+Keyword Automaton - Tests
+
+Test Objective:
+    MultiPatternMatcher must report exactly the groups that the substring
+    checks and re.search() calls it replaces would match, in one pass, and
+    its disk cache must be rebuilt when the routing tables change.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ORCHESTRATION_DIR = Path(__file__).resolve().parents[2] / "claude" / "tools" / "orchestration"
+sys.path.insert(0, str(ORCHESTRATION_DIR))
+
+from keyword_automaton import (  # noqa: E402
+    KeywordAutomaton, MultiPatternMatcher, literal_alternatives, load_matcher,
+)
+
+
+class TestKeywordAutomaton:
+    def test_reports_overlapping_matches(self):
+        automaton = KeywordAutomaton.build(["he", "she", "his", "hers"])
+
+        matches = sorted(
+            (automaton.terms[index], end) for index, end in automaton.iter_matches("ushers")
+        )
+
+        assert matches == [("he", 4), ("hers", 6), ("she", 4)]
+
+    def test_round_trips_through_json(self):
+        automaton = KeywordAutomaton.build(["dns", "dns record", "spf"])
+        restored = KeywordAutomaton.from_dict(json.loads(json.dumps(automaton.to_dict())))
+
+        text = "add a dns record for spf"
+        assert list(restored.iter_matches(text)) == list(automaton.iter_matches(text))
+
+
+class TestLiteralAlternatives:
+    @pytest.mark.parametrize("pattern, expected", [
+        (r'\b(what|how|why)\b', ['what', 'how', 'why']),
+        (r'\b(should I|should we)\b', ['should I', 'should we']),
+        (r'\band then\b|\bafter that\b', ['and then', 'after that']),
+        (r'\?$', None),
+        (r'\bshould\s+i\b', None),
+        (r'\b\d+\s*users?\b', None),
+    ])
+    def test_splits_only_plain_word_alternations(self, pattern, expected):
+        assert literal_alternatives(pattern) == expected
+
+
+class TestMultiPatternMatcher:
+    SPEC = {
+        "domain:dns": {"keywords": ["dns", "mx record", "spf"]},
+        "domain:cloud": {"keywords": ["cloud", "aws"]},
+        "question": {"regex": r'\b(what|how|tell me)\b', "ignorecase": True},
+        "ends_with_question": {"regex": r'\?$', "ignorecase": True},
+        "multi_step": {"regex": r'\band then\b|\bafter that\b'},
+    }
+
+    @pytest.mark.parametrize("text", [
+        "how do i add an spf record?",
+        "somehow the dns broke",
+        "tell me about aws and then the mx record",
+        "tell_me what_ happened",
+        "whaté is cloudy",
+        "after thatcher",
+        "",
+    ])
+    def test_matches_substring_and_regex_semantics(self, text):
+        expected = set()
+        for group, spec in self.SPEC.items():
+            if "keywords" in spec:
+                matched = any(k in text for k in spec["keywords"])
+            else:
+                flags = re.IGNORECASE if spec.get("ignorecase") else 0
+                matched = re.search(spec["regex"], text, flags) is not None
+            if matched:
+                expected.add(group)
+
+        assert MultiPatternMatcher.build(self.SPEC).scan(text) == expected
+
+    def test_cache_rebuilt_when_tables_change(self, tmp_path):
+        first = load_matcher("routing", self.SPEC, cache_dir=tmp_path)
+        cached = load_matcher("routing", self.SPEC, cache_dir=tmp_path)
+        assert cached.digest == first.digest
+        assert cached.scan("aws?") == first.scan("aws?")
+
+        changed = dict(self.SPEC, **{"domain:sre": {"keywords": ["slo"]}})
+        rebuilt = load_matcher("routing", changed, cache_dir=tmp_path)
+
+        assert rebuilt.digest != first.digest
+        assert "domain:sre" in rebuilt.scan("define an slo")
+        stored = json.loads((tmp_path / "routing_automaton.json").read_text())
+        assert stored["digest"] == rebuilt.digest
+
+
+def test_coordinator_tables_compile_to_literal_terms():
+    """Only patterns that need the regex engine fall back to it."""
+    from coordinator_agent import IntentClassifier
+
+    matcher = MultiPatternMatcher.build(IntentClassifier.routing_spec())
+
+    assert sorted(group for group, _, _ in matcher.to_dict()["fallbacks"]) == [
+        "category:technical_question:2", "strategic_boost",
+    ]
@@ -254,6 +254,113 @@ class TestIndexFromSystemState(unittest.TestCase):
         self.assertIn('Email RAG', phases[0]['title'])
 
 
+
+class TestVectorIndex(unittest.TestCase):
+    """Test the postings/blob vector index against the full-scan ranking"""
+
+    EMBEDDINGS = {
+        1: {'email': 0.8, 'rag': 0.6},
+        2: {'email': 0.3, 'database': 0.9},
+        3: {'database': 1.0},
+        4: {'email': -0.5, 'legacy': 0.5},
+        5: [0.1, 0.9, 0.0],
+        6: {},
+    }
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _full_scan(self, search, query_embedding, limit=10, filter_metadata=None):
+        """Ranking the previous search() produced (stable sort over phase_id order)"""
+        results = []
+        for phase_id, embedding in sorted(self.EMBEDDINGS.items()):
+            metadata = {'year': '2025' if phase_id % 2 else '2024'}
+            if filter_metadata and not all(metadata.get(k) == v for k, v in filter_metadata.items()):
+                continue
+            results.append((phase_id, search.calculate_similarity(query_embedding, embedding)))
+        results.sort(key=lambda r: r[1], reverse=True)
+        return results[:limit]
+
+    def _legacy_db(self):
+        """Database written by the JSON-embedding version of this module"""
+        import json
+        import sqlite3
+        conn = sqlite3.connect(Path(self.temp_dir) / "semantic_index.db")
+        conn.execute("""
+            CREATE TABLE phases (
+                phase_id INTEGER PRIMARY KEY, title TEXT NOT NULL, content TEXT NOT NULL,
+                metadata_json TEXT, embedding_json TEXT, content_hash TEXT
+            )
+        """)
+        for phase_id, embedding in self.EMBEDDINGS.items():
+            conn.execute(
+                "INSERT INTO phases VALUES (?, ?, ?, ?, ?, '')",
+                (phase_id, f"Phase {phase_id}", "x" * 600,
+                 json.dumps({'year': '2025' if phase_id % 2 else '2024'}), json.dumps(embedding))
+            )
+        conn.commit()
+        conn.close()
+
+        from semantic_search import SemanticSystemState
+        return SemanticSystemState(db_path=self.temp_dir)
+
+    def test_legacy_embeddings_backfilled_and_ranked_like_full_scan(self):
+        """Sparse queries rank zero scores between positive and negative ones"""
+        search = self._legacy_db()
+
+        for query, limit, filter_metadata in [
+            ({'email': 1.0}, 10, None),
+            ({'email': 0.6, 'database': 0.8}, 3, None),
+            ({'email': 1.0}, 10, {'year': '2025'}),
+            ({'nothing': 1.0}, 2, None),
+            ([0.2, 0.8, 0.1], 4, None),
+        ]:
+            results = search.search_by_embedding(query, limit, filter_metadata)
+            expected = self._full_scan(search, query, limit, filter_metadata)
+
+            self.assertEqual([r['phase_id'] for r in results], [pid for pid, _ in expected])
+            for result, (_, relevance) in zip(results, expected):
+                self.assertAlmostEqual(result['relevance'], relevance, places=5)
+            self.assertTrue(all(len(r['content']) == 500 for r in results))
+
+    def test_metadata_filter_semantics(self):
+        """None matches missing keys; non-scalar values are compared in Python"""
+        from semantic_search import SemanticSystemState
+        search = SemanticSystemState(db_path=self.temp_dir)
+        search.add_phase(1, "Email A", "email processing", metadata={'year': 2025, 'tags': ['a']})
+        search.add_phase(2, "Email B", "email handling", metadata={'year': '2025'})
+        search.add_phase(3, "Email C", "email routing")
+
+        def ids(filter_metadata):
+            return sorted(r['phase_id'] for r in search.search("email", filter_metadata=filter_metadata))
+
+        self.assertEqual(ids({'year': 2025}), [1])
+        self.assertEqual(ids({'year': '2025'}), [2])
+        self.assertEqual(ids({'year': None}), [3])
+        self.assertEqual(ids({'tags': ['a']}), [1])
+
+    def test_dense_index_tracks_updates(self):
+        """Dense matrix cache is rebuilt after phases change"""
+        from semantic_search import SemanticSystemState
+        search = SemanticSystemState(db_path=self.temp_dir, use_ollama=True)
+        vectors = {"alpha": [1.0, 0.0], "beta": [0.6, 0.8], "gamma": [0.0, 1.0]}
+        search._ollama_embedding = lambda text: vectors[text.split()[-1]]
+
+        search.add_phase(1, "One", "alpha")
+        search.add_phase(2, "Two", "beta")
+        self.assertEqual([r['phase_id'] for r in search.search("alpha")], [1, 2])
+
+        search.add_phase(3, "Three", "alpha")
+        search.delete_phase(1)
+        results = search.search("alpha")
+        self.assertEqual([r['phase_id'] for r in results], [3, 2])
+        self.assertAlmostEqual(results[1]['relevance'], 0.6, places=5)
+
+
 if __name__ == "__main__":
     print("Semantic SYSTEM_STATE Search Unit Tests")
     print("=" * 60)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Test Suite for PMP Aggregator
+
+Tests per-snapshot org/OS rollups, the enhanced extractor's post-extraction
+stage, and the MSP dashboard / compliance analyzer reading from the rollups.
+
+Author: SRE Principal Engineer Agent
+Date: 2026-10-16
+Version: 1.0
+"""
+
+import random
+import sqlite3
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude.tools.pmp.pmp_aggregator import PMPAggregator, SCAN_STATUS_SUCCESS, latest_rollup_snapshot
+from claude.tools.pmp.pmp_compliance_analyzer import PMPComplianceAnalyzer
+from claude.tools.pmp import pmp_enhanced_extractor
+
+PMP_DIR = Path(pmp_enhanced_extractor.__file__).parent
+
+ORGS = 30
+SYSTEMS_PER_ORG = 112
+OS_NAMES = ['Windows 11', 'Windows 10', 'Windows Server 2019', 'Windows Server 2022', None]
+
+
+def _create_db(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.executescript((PMP_DIR / "pmp_db_schema.sql").read_text())
+    conn.executescript((PMP_DIR / "pmp_enhanced_schema.sql").read_text())
+    conn.executescript((PMP_DIR / "pmp_policy_patch_schema.sql").read_text())
+    return conn
+
+
+def _insert_snapshot(conn, snapshot_id, seed):
+    """One successful snapshot: ORGS organizations x SYSTEMS_PER_ORG systems"""
+    rng = random.Random(seed)
+    conn.execute("INSERT INTO snapshots (snapshot_id, timestamp, status) VALUES (?, ?, 'success')",
+                 (snapshot_id, f"2026-10-{snapshot_id:02d} 02:00:00"))
+    rows = []
+    for org in range(ORGS):
+        for n in range(SYSTEMS_PER_ORG):
+            # Org 0 is all high-risk, the rest mostly healthy
+            health = 3 if org == 0 else rng.choice([1, 1, 1, 1, 2, 3, 0])
+            rows.append((
+                snapshot_id, f"{org}-{n}", f"ORG{org:02d}-PC{n:03d}", f"Org {org:02d}",
+                rng.choice(OS_NAMES), health, rng.choice([0, 1]),
+                rng.choice([0, 1_700_000_000_000]), rng.choice([SCAN_STATUS_SUCCESS, 229]),
+                1_700_000_000_000 + rng.randrange(10 ** 9)
+            ))
+    conn.executemany("""
+        INSERT INTO systems (
+            snapshot_id, resource_id, resource_name, branch_office_name, os_name,
+            resource_health_status, computer_live_status, last_scan_time, scan_status,
+            agent_last_contact_time
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "pmp_config.db"
+    conn = _create_db(path)
+    _insert_snapshot(conn, 1, seed=1)
+    _insert_snapshot(conn, 2, seed=2)
+    conn.close()
+    return path
+
+
+def _raw_org_rows(db_path, snapshot_id):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("""
+        SELECT branch_office_name, COUNT(*),
+               SUM(CASE WHEN resource_health_status = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN resource_health_status = 3 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN computer_live_status = 0 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN last_scan_time > 0 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN scan_status = ? THEN 1 ELSE 0 END)
+        FROM systems WHERE snapshot_id = ?
+        GROUP BY branch_office_name ORDER BY branch_office_name
+    """, (SCAN_STATUS_SUCCESS, snapshot_id)).fetchall()
+    conn.close()
+    return rows
+
+
+# =============================================================================
+# AGGREGATOR
+# =============================================================================
+
+class TestPMPAggregator:
+    """Rollup build and lookup"""
+
+    def test_build_latest_snapshot_matches_raw_inventory(self, db_path):
+        summary = PMPAggregator(db_path).build()
+
+        assert summary['snapshot_id'] == 2
+        assert (summary['organizations'], summary['total_systems']) == (ORGS, ORGS * SYSTEMS_PER_ORG)
+
+        conn = sqlite3.connect(db_path)
+        rollups = conn.execute("""
+            SELECT organization, total_systems, healthy, high_risk, offline, scanned, scan_success
+            FROM pmp_org_rollups WHERE snapshot_id = 2 ORDER BY organization
+        """).fetchall()
+        os_rows = dict(conn.execute(
+            "SELECT os_name, system_count FROM pmp_os_rollups WHERE snapshot_id = 2"
+        ).fetchall())
+        conn.close()
+
+        assert rollups == _raw_org_rows(db_path, 2)
+        assert 'Unknown' in os_rows
+        assert sum(os_rows.values()) == ORGS * SYSTEMS_PER_ORG
+
+    def test_rebuild_replaces_snapshot_rollups(self, db_path):
+        aggregator = PMPAggregator(db_path)
+        aggregator.build(2)
+        aggregator.build(2)
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM pmp_org_rollups").fetchone()[0] == ORGS
+        conn.close()
+
+    def test_ensure_built_builds_only_when_missing(self, db_path):
+        aggregator = PMPAggregator(db_path)
+
+        with patch.object(aggregator, 'build', wraps=aggregator.build) as build:
+            assert aggregator.ensure_built() == 2
+            assert aggregator.ensure_built() == 2
+
+        build.assert_called_once_with(2)
+        conn = sqlite3.connect(db_path)
+        assert latest_rollup_snapshot(conn) == 2
+        conn.close()
+
+    def test_empty_inventory(self, tmp_path):
+        path = tmp_path / "empty.db"
+        _create_db(path).close()
+
+        assert PMPAggregator(path).ensure_built() is None
+        assert PMPAggregator(path).build()['organizations'] == 0
+
+
+class TestEnhancedExtractorStage:
+    """PMPEnhancedExtractor builds rollups after extraction"""
+
+    def test_extract_all_systems_builds_rollups(self, tmp_path):
+        page = {'message_response': {'total': 2, 'limit': 25, 'scandetails': [
+            {'resource_id': '1', 'resource_name': 'PC1', 'branch_office_name': 'Org A',
+             'os_name': 'Windows 11', 'resource_health_status': 3},
+            {'resource_id': '2', 'resource_name': 'PC2', 'branch_office_name': 'Org B',
+             'os_name': 'Windows 11', 'resource_health_status': 1},
+        ]}}
+        oauth = MagicMock()
+        oauth.return_value.api_request.return_value.json.return_value = page
+
+        with patch.object(pmp_enhanced_extractor, 'PMPOAuthManager', oauth):
+            extractor = pmp_enhanced_extractor.PMPEnhancedExtractor(db_path=tmp_path / "pmp_config.db")
+            summary = extractor.extract_all_systems()
+
+        assert summary['organizations'] == 2
+        conn = sqlite3.connect(tmp_path / "pmp_config.db")
+        assert conn.execute(
+            "SELECT organization, high_risk FROM pmp_org_rollups ORDER BY organization"
+        ).fetchall() == [('Org A', 1), ('Org B', 0)]
+        conn.close()
+
+
+# =============================================================================
+# READERS
+# =============================================================================
+
+class TestComplianceFromRollups:
+    """PMPComplianceAnalyzer reads org rollups"""
+
+    def test_analyze_organizations(self, db_path):
+        by_org = PMPComplianceAnalyzer(db_path=db_path).analyze_organizations()
+
+        assert len(by_org) == ORGS
+        vulnerability = {
+            org: next(r for r in results if r.check_name == "Essential Eight: System Vulnerability Rate")
+            for org, results in by_org.items()
+        }
+        assert not vulnerability['Org 00'].passed
+        assert vulnerability['Org 00'].actual_value == 100.0
+
+        raw = {row[0]: row for row in _raw_org_rows(db_path, 2)}
+        coverage = next(r for r in by_org['Org 05'] if r.check_name == "Essential Eight: Scan Coverage")
+        assert coverage.actual_value == pytest.approx(raw['Org 05'][5] / raw['Org 05'][1] * 100)
+
+    def test_latest_snapshot_scan_metrics_from_rollups(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO patch_metrics (snapshot_id) VALUES (2)")
+        conn.execute("INSERT INTO severity_metrics (snapshot_id) VALUES (2)")
+        conn.execute("""
+            INSERT INTO system_health_metrics (snapshot_id, total_systems, healthy_systems, highly_vulnerable_systems)
+            VALUES (2, ?, 0, 0)
+        """, (ORGS * SYSTEMS_PER_ORG,))
+        conn.commit()
+        conn.close()
+        PMPAggregator(db_path).build(2)
+
+        results = PMPComplianceAnalyzer(db_path=db_path).analyze_latest_snapshot()
+
+        scanned = sum(row[5] for row in _raw_org_rows(db_path, 2))
+        coverage = next(r for r in results if r.check_name == "Essential Eight: Scan Coverage")
+        assert coverage.actual_value == pytest.approx(scanned / (ORGS * SYSTEMS_PER_ORG) * 100)
+        # API-reported metrics still win over rollups
+        healthy = next(r for r in results if r.check_name == "Custom MSP: Healthy System Ratio")
+        assert healthy.actual_value == 0
+
+
+class TestMSPDashboardFromRollups:
+    """PMPMSPDashboard sheets read the latest snapshot's rollups"""
+
+    def test_workbook_counts_latest_snapshot_only(self, db_path, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        from claude.tools.pmp.pmp_msp_dashboard import PMPMSPDashboard
+
+        start = time.perf_counter()
+        report = PMPMSPDashboard(db_path=db_path).generate_msp_dashboard(output_dir=tmp_path / "out")
+        elapsed = time.perf_counter() - start
+
+        wb = openpyxl.load_workbook(report)
+        summary = wb["Executive Summary"]
+        assert (summary['B5'].value, summary['B6'].value) == (ORGS, ORGS * SYSTEMS_PER_ORG)
+
+        top = wb["Top 10 Critical Orgs"]
+        assert (top['A4'].value, top['D4'].value) == ('Org 00', '100.0%')
+
+        os_sheet = wb["OS Distribution"]
+        counts = [os_sheet.cell(row=r, column=2).value for r in range(4, 4 + len(OS_NAMES))]
+        assert sum(counts) == ORGS * SYSTEMS_PER_ORG
+
+        critical = wb["Critical Systems"]
+        high_risk = sum(row[3] for row in _raw_org_rows(db_path, 2))
+        assert critical['A1'].value == f"Critical Systems - High Risk ({high_risk} systems)"
+
+        print(f"\n{ORGS}-org workbook ({ORGS * SYSTEMS_PER_ORG} systems): {elapsed:.2f}s")
+        assert elapsed < 10
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Test Suite for PMP Delta Store
+
+Tests snapshot diffing (inserted/changed/removed per snapshot), the
+materialised current-state table, history reconstruction, extractor delta
+mode, PMPIntelligenceService reads from the current table, and a DB-size /
+query-latency benchmark over 30 synthetic snapshots.
+
+Author: SRE Principal Engineer Agent
+Date: 2026-10-16
+Version: 1.0
+"""
+
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude.tools.pmp import pmp_complete_intelligence_extractor, pmp_systemreport_extractor
+from claude.tools.pmp.pmp_delta_store import SnapshotDeltaStore, has_current_state
+from claude.tools.pmp.pmp_intelligence_service import PMPIntelligenceService
+
+
+@pytest.fixture
+def store():
+    conn = sqlite3.connect(":memory:")
+    delta_store = SnapshotDeltaStore(conn)
+    delta_store.init_schema()
+    yield delta_store
+    conn.close()
+
+
+def _patch(update_id, failed=0, **extra):
+    return {'update_id': update_id, 'patch_name': f'KB{update_id}', 'failed': failed, **extra}
+
+
+# =============================================================================
+# DELTA STORE
+# =============================================================================
+
+class TestApplySnapshot:
+    """Diffing against the current state"""
+
+    def test_only_changes_are_stored(self, store):
+        store.apply_snapshot(1, 'missing_patches', [_patch(1), _patch(2), _patch(3)], 'update_id')
+
+        stats = store.apply_snapshot(
+            2, 'missing_patches', [_patch(1), _patch(2, failed=4), _patch(4)], 'update_id'
+        )
+
+        assert (stats.inserted, stats.changed, stats.removed, stats.unchanged) == (1, 1, 1, 1)
+        assert set(store.current_records('missing_patches')) == {'1', '2', '4'}
+        assert store.current_records('missing_patches')['2']['failed'] == 4
+        deltas = store.conn.execute(
+            "SELECT record_key, change_type FROM pmp_record_deltas WHERE snapshot_id = 2 ORDER BY record_key"
+        ).fetchall()
+        assert deltas == [('2', 'changed'), ('3', 'removed'), ('4', 'inserted')]
+
+    def test_key_order_does_not_count_as_change(self, store):
+        store.apply_snapshot(1, 'missing_patches', [{'update_id': 1, 'a': 1, 'b': 2}], 'update_id')
+
+        stats = store.apply_snapshot(2, 'missing_patches', [{'b': 2, 'a': 1, 'update_id': 1}], 'update_id')
+
+        assert stats.total_changes == 0
+
+    def test_removals_limited_to_scope_and_complete_snapshots(self, store):
+        for resource_id in (1, 2):
+            store.apply_snapshot(1, 'system_reports', [{'patch_id': 10}, {'patch_id': 11}],
+                                 key_field=lambda p, r=resource_id: f"{r}:{p['patch_id']}",
+                                 scope=str(resource_id))
+
+        store.apply_snapshot(2, 'system_reports', [{'patch_id': 10}],
+                             key_field=lambda p: f"1:{p['patch_id']}", scope='1')
+        partial = store.apply_snapshot(2, 'system_reports', [],
+                                       key_field=lambda p: f"2:{p['patch_id']}", scope='2',
+                                       complete=False)
+
+        assert partial.removed == 0
+        assert set(store.current_records('system_reports')) == {'1:10', '2:10', '2:11'}
+
+    def test_partial_batches_sum_into_snapshot_summary(self, store):
+        store.apply_snapshot(1, 'systems', [{'resource_id': 1}], 'resource_id')
+        for batch in ([{'resource_id': 1}, {'resource_id': 2}], [{'resource_id': 3}]):
+            store.apply_snapshot(2, 'systems', batch, 'resource_id', complete=False)
+
+        summary = store.conn.execute("""
+            SELECT inserted, changed, removed, unchanged FROM pmp_delta_snapshots
+            WHERE snapshot_id = 2 AND entity = 'systems' AND scope = ''
+        """).fetchone()
+
+        assert summary == (2, 0, 0, 1)
+
+    def test_state_at_reconstructs_past_snapshots(self, store):
+        snapshots = [
+            [_patch(1), _patch(2)],
+            [_patch(1, failed=1), _patch(3)],
+            [_patch(3), _patch(4)],
+        ]
+        for snapshot_id, records in enumerate(snapshots, start=1):
+            store.apply_snapshot(snapshot_id, 'missing_patches', records, 'update_id')
+
+        for snapshot_id, records in enumerate(snapshots, start=1):
+            expected = {str(r['update_id']): r for r in records}
+            assert store.state_at('missing_patches', snapshot_id) == expected
+
+    def test_has_current_state(self, store):
+        assert not has_current_state(sqlite3.connect(":memory:"), 'missing_patches')
+        assert not has_current_state(store.conn, 'missing_patches')
+
+        store.apply_snapshot(1, 'missing_patches', [_patch(1)], 'update_id')
+
+        assert has_current_state(store.conn, 'missing_patches')
+
+
+# =============================================================================
+# EXTRACTOR + SERVICE
+# =============================================================================
+
+class TestSystemReportDeltaMode:
+    """PMPSystemReportExtractor delta mode feeds get_patch_deployment_status"""
+
+    @pytest.fixture
+    def extractor(self, tmp_path):
+        with patch.object(pmp_systemreport_extractor, 'DB_PATH', tmp_path / "pmp_systemreports.db"), \
+                patch.object(pmp_systemreport_extractor, 'PMPOAuthManager', MagicMock()):
+            yield pmp_systemreport_extractor.PMPSystemReportExtractor(delta_storage=True)
+
+    def test_runs_store_changes_and_service_reads_current(self, extractor, tmp_path):
+        extractor.extraction_id = 1
+        extractor.save_systems([{'resource_id': 7, 'computer_name': 'GS1MELB01'}])
+        extractor.save_system_report(7, [
+            {'patch_id': 100, 'patch_name': 'KB5068864', 'patch_deployed': 0},
+            {'patch_id': 101, 'patch_name': 'KB5066137', 'patch_deployed': 0},
+        ])
+        extractor.extraction_id = 2
+        extractor.save_system_report(7, [
+            {'patch_id': 100, 'patch_name': 'KB5068864', 'patch_deployed': 1},
+            {'patch_id': 101, 'patch_name': 'KB5066137', 'patch_deployed': 0},
+        ])
+
+        conn = sqlite3.connect(extractor.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM system_reports").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM pmp_record_deltas").fetchone()[0] == 3
+        conn.close()
+
+        result = PMPIntelligenceService(db_path=tmp_path).get_patch_deployment_status("KB5068864")
+
+        assert [(r['system_name'], r['status_text']) for r in result.data] == [('GS1MELB01', 'Installed')]
+
+
+class TestCompleteExtractorDeltaMode:
+    """Installed/missing patch payloads without a patch list don't wipe current state"""
+
+    @pytest.fixture
+    def extractor(self, tmp_path):
+        module = pmp_complete_intelligence_extractor
+        with patch.object(module, 'DB_PATH', tmp_path / "pmp_config.db"), \
+                patch.object(module, 'PMPOAuthManager', MagicMock()):
+            extractor = module.PMPCompleteIntelligenceExtractor(delta_storage=True)
+            extractor.extraction_id = 1
+            extractor.extract_missing_patches({'missingpatches': [_patch(1), _patch(2)]}, 'missing_patches')
+            yield extractor
+
+    def _current_keys(self, extractor):
+        conn = sqlite3.connect(extractor.db_path)
+        keys = set(SnapshotDeltaStore(conn).current_records('missing_patches'))
+        conn.close()
+        return keys
+
+    def test_missing_list_removes_nothing(self, extractor):
+        extractor.extraction_id = 2
+        extractor.extract_missing_patches({}, 'missing_patches')
+
+        assert self._current_keys(extractor) == {'1', '2'}
+
+    def test_empty_list_removes_all(self, extractor):
+        extractor.extraction_id = 2
+        extractor.extract_missing_patches({'missingpatches': []}, 'missing_patches')
+
+        assert self._current_keys(extractor) == set()
+
+    def test_full_list_still_detects_removals(self, extractor):
+        extractor.extraction_id = 2
+        extractor.extract_missing_patches({'missingpatches': [_patch(2), _patch(3)]}, 'missing_patches')
+
+        assert self._current_keys(extractor) == {'2', '3'}
+
+
+class TestFailedPatchesCurrentState:
+    """get_failed_patches reads pmp_current_records in pmp_config.db"""
+
+    def test_failed_patches_from_current_table(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "pmp_config.db")
+        delta_store = SnapshotDeltaStore(conn)
+        delta_store.init_schema()
+        delta_store.apply_snapshot(1, 'missing_patches', [_patch(1, failed=6), _patch(2, failed=3)], 'update_id')
+        delta_store.apply_snapshot(2, 'missing_patches', [_patch(1, failed=0), _patch(2, failed=3)], 'update_id')
+        conn.commit()
+        conn.close()
+
+        result = PMPIntelligenceService(db_path=tmp_path).get_failed_patches()
+
+        assert [(r['patch_name'], r['failed_count']) for r in result.data] == [('KB2', 3)]
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+class TestThirtySnapshotBenchmark:
+    """Full-copy vs delta storage over 30 synthetic snapshots"""
+
+    SNAPSHOTS = 30
+    SYSTEMS = 200
+    PATCHES_PER_SYSTEM = 25
+    CHANGE_RATE = 0.02
+
+    @pytest.fixture(scope="class")
+    def databases(self, tmp_path_factory):
+        rng = random.Random(42)
+        full_dir = tmp_path_factory.mktemp("full_copy")
+        delta_dir = tmp_path_factory.mktemp("delta")
+
+        # Report state evolves: a few patches deploy each run
+        reports = {
+            resource_id: {
+                patch_id: {'patch_id': patch_id, 'patch_name': f'KB50{patch_id:04d}',
+                           'bulletin_id': f'MS-{patch_id}', 'severity': 3, 'patch_status': 202,
+                           'is_reboot_required': 0, 'patch_deployed': 0}
+                for patch_id in range(self.PATCHES_PER_SYSTEM)
+            }
+            for resource_id in range(1, self.SYSTEMS + 1)
+        }
+
+        full = sqlite3.connect(full_dir / "pmp_systemreports.db")
+        delta = sqlite3.connect(delta_dir / "pmp_systemreports.db")
+        for conn in (full, delta):
+            conn.executescript("""
+                CREATE TABLE systems (resource_id INTEGER PRIMARY KEY, computer_name TEXT);
+                CREATE TABLE system_reports (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, extraction_id INTEGER, resource_id INTEGER,
+                    patch_id INTEGER, patch_name TEXT, bulletin_id TEXT, severity INTEGER,
+                    patch_status INTEGER, approval_status INTEGER, is_reboot_required INTEGER,
+                    patch_deployed INTEGER, raw_data TEXT, extracted_at TEXT NOT NULL
+                );
+                CREATE INDEX idx_system_reports_resource ON system_reports(resource_id);
+                CREATE INDEX idx_system_reports_patch ON system_reports(patch_id);
+            """)
+            conn.executemany("INSERT INTO systems VALUES (?, ?)",
+                             [(r, f"SYS{r:04d}") for r in reports])
+        delta_store = SnapshotDeltaStore(delta)
+        delta_store.init_schema()
+
+        for extraction_id in range(1, self.SNAPSHOTS + 1):
+            if extraction_id > 1:
+                for patches in reports.values():
+                    for record in patches.values():
+                        if rng.random() < self.CHANGE_RATE:
+                            record['patch_deployed'] = 1 - record['patch_deployed']
+
+            # Full copy: what save_system_report writes every run
+            now = datetime.now().isoformat()
+            full.executemany("""
+                INSERT INTO system_reports
+                (extraction_id, resource_id, patch_id, patch_name, bulletin_id, severity, patch_status,
+                 approval_status, is_reboot_required, patch_deployed, raw_data, extracted_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (extraction_id, resource_id, p['patch_id'], p['patch_name'], p['bulletin_id'],
+                 p['severity'], p['patch_status'], None, p['is_reboot_required'],
+                 p['patch_deployed'], json.dumps(p), now)
+                for resource_id, patches in reports.items() for p in patches.values()
+            ])
+
+            # Delta: what save_system_report_delta writes every run
+            for resource_id, patches in reports.items():
+                delta_store.apply_snapshot(
+                    extraction_id, 'system_reports',
+                    [dict(p, resource_id=resource_id) for p in patches.values()],
+                    key_field=lambda p, r=resource_id: f"{r}:{p['patch_id']}",
+                    scope=str(resource_id)
+                )
+            full.commit()
+            delta.commit()
+
+        full.close()
+        delta.close()
+        return full_dir, delta_dir, reports
+
+    @staticmethod
+    def _db_bytes(db_path: Path) -> int:
+        conn = sqlite3.connect(db_path)
+        try:
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        finally:
+            conn.close()
+        return page_count * page_size
+
+    @staticmethod
+    def _mean_ms(service, patch_name, runs=10):
+        start = time.perf_counter()
+        for _ in range(runs):
+            result = service.get_patch_deployment_status(patch_name)
+        return (time.perf_counter() - start) * 1000 / runs, result
+
+    def test_db_size(self, databases):
+        full_dir, delta_dir, _ = databases
+
+        full_bytes = self._db_bytes(full_dir / "pmp_systemreports.db")
+        delta_bytes = self._db_bytes(delta_dir / "pmp_systemreports.db")
+
+        print(f"\n30 snapshots: full copy {full_bytes / 1e6:.1f}MB, delta {delta_bytes / 1e6:.1f}MB")
+        assert delta_bytes * 4 < full_bytes
+
+    def test_query_latency_and_results(self, databases):
+        full_dir, delta_dir, reports = databases
+        patch_name = "KB500007"
+
+        full_ms, full_result = self._mean_ms(PMPIntelligenceService(db_path=full_dir), patch_name)
+        delta_ms, delta_result = self._mean_ms(PMPIntelligenceService(db_path=delta_dir), patch_name)
+
+        print(f"\nget_patch_deployment_status: full copy {full_ms:.1f}ms, delta {delta_ms:.1f}ms")
+        # Full copy returns every run's row; the current table only the latest state
+        assert len(full_result.data) == self.SNAPSHOTS * self.SYSTEMS
+        expected = sorted((f"SYS{r:04d}", p[7]['patch_deployed']) for r, p in reports.items())
+        assert sorted((r['system_name'], r['patch_deployed']) for r in delta_result.data) == expected
+        assert delta_ms < full_ms
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Test Suite for PMP Page Fetcher
+
+Runs the concurrent extraction engine, and both extractors built on it,
+against a local fake PMP server:
+- AIMD rate controller (additive increase, one decrease per congestion event)
+- Gap-aware checkpointing with out-of-order page completion
+- 429 / 5xx handling (retry, gap logging) through PMPOAuthManager-style errors
+- Single writer connection per batch
+- Wall-clock comparison against one-page-at-a-time fetching
+
+Author: SRE Principal Engineer Agent
+Date: 2026-10-16
+Version: 1.0
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from claude.tools.pmp import pmp_resilient_extractor
+from claude.tools.pmp.pmp_dcapi_patch_extractor import pmp_dcapi_patch_extractor
+from claude.tools.pmp.pmp_page_fetcher import (
+    AIMDRateController, CheckpointTracker, PageFetcher, RATE_LIMITED_429
+)
+
+SCHEMA_DIR = Path(pmp_resilient_extractor.__file__).parent
+
+
+# =============================================================================
+# FAKE PMP SERVER
+# =============================================================================
+
+class FakePMPHandler(BaseHTTPRequestHandler):
+    """Serves scandetails and DCAPI systemreport pages"""
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        page = int(parse_qs(url.query)['page'][0])
+
+        with server.lock:
+            server.requests += 1
+            throttle = server.throttle_first > 0
+            if throttle:
+                server.throttle_first -= 1
+            server.in_flight += 1
+            server.max_seen = max(server.max_seen, server.in_flight)
+
+        try:
+            time.sleep(server.latency)
+            if throttle:
+                self._reply(429, {'error': 'rate limited'}, {'Retry-After': '0'})
+            elif page in server.fail_pages:
+                self._reply(500, {'error': 'internal'})
+            elif url.path == '/api/1.4/patch/scandetails':
+                self._reply(200, {'message_response': {'scandetails': [
+                    {'resource_id': page * 100 + i, 'resource_name': f'WS-{page}-{i}',
+                     'os_name': 'Windows 11', 'ip_address': '10.0.0.1',
+                     'branch_office_name': 'Test Org', 'resource_health_status': 1}
+                    for i in range(server.systems_per_page)
+                ]}})
+            else:
+                self._reply(200, {'message_response': {'systemreport': [
+                    {'resource_id': page * 100 + i,
+                     'patches': [{'patch_id': p, 'patchname': f'KB{p}', 'severity': 'Critical'}
+                                 for p in range(2)]}
+                    for i in range(server.systems_per_page)
+                ]}})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _reply(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeOAuthManager:
+    """PMPOAuthManager stand-in that talks to the fake server"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def get_valid_token(self):
+        return 'token'
+
+    def api_request(self, method, endpoint, handle_throttling=True, **kwargs):
+        # Same error surface as PMPOAuthManager.api_request
+        try:
+            response = requests.request(method, f"{self.base_url}{endpoint}", timeout=5, **kwargs)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"API request failed: {e}") from e
+
+
+@pytest.fixture
+def pmp_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakePMPHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.latency = 0.02
+    server.systems_per_page = 5
+    server.fail_pages = set()
+    server.throttle_first = 0
+    server.requests = server.in_flight = server.max_seen = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fast_rates():
+    """Lift the production AIMD ceiling so tests finish quickly"""
+    with patch.object(pmp_resilient_extractor, 'INITIAL_REQUEST_RATE', 200.0), \
+            patch.object(pmp_resilient_extractor, 'MAX_REQUEST_RATE', 400.0), \
+            patch.object(pmp_dcapi_patch_extractor, 'INITIAL_REQUEST_RATE', 200.0), \
+            patch.object(pmp_dcapi_patch_extractor, 'MAX_REQUEST_RATE', 400.0):
+        yield
+
+
+@pytest.fixture
+def resilient_extractor(tmp_path, pmp_server, fast_rates):
+    with patch.object(pmp_resilient_extractor, 'PMPOAuthManager',
+                      lambda: FakeOAuthManager(pmp_server.base_url)):
+        yield pmp_resilient_extractor.PMPResilientExtractor(db_path=tmp_path / "pmp.db")
+
+
+@pytest.fixture
+def dcapi_extractor(tmp_path, pmp_server, fast_rates):
+    db_path = tmp_path / "pmp.db"
+    # DCAPI extractor writes into an existing pmp_config.db (snapshots table)
+    conn = sqlite3.connect(db_path)
+    conn.executescript((SCHEMA_DIR / 'pmp_db_schema.sql').read_text())
+    conn.close()
+    with patch.object(pmp_dcapi_patch_extractor, 'PMPOAuthManager',
+                      lambda: FakeOAuthManager(pmp_server.base_url)):
+        yield pmp_dcapi_patch_extractor.PMPDCAPIExtractor(db_path=db_path)
+
+
+def _query(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class TestAIMDRateController:
+    """Additive increase / multiplicative decrease"""
+
+    def test_additive_increase_capped(self):
+        controller = AIMDRateController(initial_rate=4.0, max_rate=5.0, increase=0.5)
+
+        for _ in range(5):
+            controller.on_success()
+
+        assert controller.rate == 5.0
+
+    def test_burst_of_throttles_backs_off_once(self):
+        controller = AIMDRateController(initial_rate=8.0, min_rate=0.5)
+        issued = [controller.acquire() for _ in range(3)]
+
+        for issued_at in issued:
+            controller.on_throttle(issued_at, retry_after=0)
+
+        assert (controller.rate, controller.decreases) == (4.0, 1)
+
+        # A request issued after the decrease can back off again
+        controller.on_throttle(controller.acquire(), retry_after=0)
+        assert controller.rate == 2.0
+
+    def test_retry_after_pauses_next_slot(self):
+        controller = AIMDRateController(initial_rate=100.0)
+
+        controller.on_throttle(controller.acquire(), retry_after=0.2)
+        start = time.monotonic()
+        controller.acquire()
+
+        assert time.monotonic() - start >= 0.15
+
+
+class TestCheckpointTracker:
+    """Contiguous low-water mark"""
+
+    def test_out_of_order_pages(self):
+        tracker = CheckpointTracker(start_page=11)
+
+        assert tracker.mark(13) == 10
+        assert tracker.mark(12) == 10
+        assert tracker.mark(11) == 13
+        assert tracker.pending == 0
+
+
+class TestPageFetcher:
+    """Bounded window, gap-aware checkpoints, wall-clock gain"""
+
+    def test_checkpoint_never_passes_unfinished_page(self):
+        finished = set()
+        checkpoints = []
+
+        def fetch(page):
+            time.sleep(0.15 if page == 3 else 0.005)
+            return page
+
+        def on_checkpoint(last_page):
+            assert set(range(1, last_page + 1)) <= finished
+            checkpoints.append(last_page)
+
+        fetcher = PageFetcher(fetch, controller=AIMDRateController(initial_rate=1000, max_rate=1000),
+                              max_in_flight=4)
+        stats = fetcher.run(range(1, 26), on_page=lambda page, data: finished.add(page),
+                            on_checkpoint=on_checkpoint, checkpoint_interval=5)
+
+        assert stats.pages_fetched == 25
+        assert checkpoints[-1] == 25
+        assert checkpoints == sorted(checkpoints)
+
+    def test_callback_error_stops_run(self):
+        def on_page(page, data):
+            if page == 4:
+                raise sqlite3.OperationalError("disk I/O error")
+
+        fetcher = PageFetcher(lambda page: page,
+                              controller=AIMDRateController(initial_rate=1000, max_rate=1000))
+
+        with pytest.raises(sqlite3.OperationalError):
+            fetcher.run(range(1, 50), on_page=on_page)
+
+    def test_concurrent_window_beats_serial(self, pmp_server):
+        pmp_server.latency = 0.04
+        oauth = FakeOAuthManager(pmp_server.base_url)
+
+        def fetch(page):
+            return oauth.api_request('GET', '/api/1.4/patch/scandetails',
+                                     params={'page': page}, handle_throttling=False).json()
+
+        def timed(max_in_flight):
+            fetcher = PageFetcher(fetch, controller=AIMDRateController(initial_rate=1000, max_rate=1000),
+                                  max_in_flight=max_in_flight)
+            start = time.perf_counter()
+            stats = fetcher.run(range(1, 31), on_page=lambda page, data: None)
+            assert stats.pages_fetched == 30
+            return time.perf_counter() - start
+
+        serial = timed(1)
+        concurrent = timed(8)
+
+        assert pmp_server.max_seen > 1
+        assert concurrent < serial / 3, f"serial {serial:.2f}s vs concurrent {concurrent:.2f}s"
+
+
+# =============================================================================
+# EXTRACTORS
+# =============================================================================
+
+class TestResilientExtractorBatch:
+    """PMPResilientExtractor.extract_batch on the page fetcher"""
+
+    def test_batch_stores_all_pages_and_checkpoints(self, resilient_extractor):
+        summary = resilient_extractor.extract_batch()
+
+        db = resilient_extractor.db_path
+        assert (summary['pages_processed'], summary['errors']) == (50, 0)
+        assert _query(db, "SELECT COUNT(DISTINCT resource_id) FROM systems") == [(250,)]
+        assert _query(db, "SELECT last_page FROM extraction_checkpoints") == [(50,)]
+
+    def test_throttling_backs_off_and_recovers(self, resilient_extractor, pmp_server):
+        pmp_server.throttle_first = 3
+
+        summary = resilient_extractor.extract_batch()
+
+        assert summary['throttled_requests'] == 3
+        assert summary['errors'] == 0
+        assert _query(resilient_extractor.db_path, "SELECT COUNT(*) FROM extraction_gaps") == [(0,)]
+
+    def test_failed_page_logged_as_gap_and_checkpoint_advances(self, resilient_extractor, pmp_server):
+        pmp_server.fail_pages = {7}
+
+        summary = resilient_extractor.extract_batch()
+
+        db = resilient_extractor.db_path
+        assert summary['errors'] == 1
+        assert _query(db, "SELECT page_num, error_type, attempts FROM extraction_gaps") == \
+            [(7, '5xx_server_error', 3)]
+        assert _query(db, "SELECT last_page FROM extraction_checkpoints") == [(50,)]
+
+    def test_single_writer_connection(self, resilient_extractor):
+        with patch.object(pmp_resilient_extractor.sqlite3, 'connect',
+                          wraps=sqlite3.connect) as connect:
+            resilient_extractor.extract_batch()
+
+        # Snapshot, coverage, checkpoint load/update and one writer - not one per page
+        assert connect.call_count < 10
+
+
+class TestDCAPIExtractorBatch:
+    """PMPDCAPIExtractor.extract_batch on the page fetcher"""
+
+    def test_batch_stores_patch_mappings(self, dcapi_extractor, pmp_server):
+        pmp_server.throttle_first = 2
+
+        summary = dcapi_extractor.extract_batch()
+
+        db = dcapi_extractor.db_path
+        assert (summary['pages_processed'], summary['patches_extracted']) == (50, 500)
+        assert summary['throttled_requests'] == 2
+        assert _query(db, "SELECT COUNT(*) FROM dcapi_patch_mappings") == [(500,)]
+        assert _query(db, "SELECT last_page FROM dcapi_extraction_checkpoints") == [(50,)]
+
+    def test_gap_error_type_matches_extractor_enum(self, dcapi_extractor, pmp_server):
+        pmp_server.fail_pages = {12}
+
+        dcapi_extractor.extract_batch()
+
+        rows = _query(dcapi_extractor.db_path, "SELECT page_num, error_type FROM dcapi_extraction_gaps")
+        assert rows == [(12, pmp_dcapi_patch_extractor.ErrorType.SERVER_ERROR_5XX.value)]
+        assert RATE_LIMITED_429 == pmp_dcapi_patch_extractor.ErrorType.RATE_LIMITED_429.value
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the SmartContextLoader Result Cache
+
+Tests LRU eviction and stats in ContextLoadCache, and that the loader serves
+repeated queries from the cache until system_state.db changes.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+maia_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(maia_root / "claude" / "tools" / "sre"))
+
+from context_load_cache import ContextLoadCache, normalize_query
+from smart_context_loader import SmartContextLoader
+from system_state_etl import Phase, SystemStateETL
+
+
+class TestContextLoadCache(unittest.TestCase):
+    """LRU cache of context payloads"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ContextLoadCache(Path(self.temp_dir.name) / "cache.db", max_entries=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_near_identical_queries_share_a_key(self):
+        intent = {'category': 'technical_question', 'domains': ['sre', 'agents'], 'complexity': 5}
+        reordered = dict(intent, domains=['agents', 'sre'])
+
+        self.assertEqual(normalize_query("  Agent   Routing?? "), "agent routing")
+        self.assertEqual(
+            self.cache.make_key("Agent routing?", intent, "db:1"),
+            self.cache.make_key("agent  routing", reordered, "db:1"),
+        )
+        self.assertNotEqual(
+            self.cache.make_key("agent routing", intent, "db:1"),
+            self.cache.make_key("agent routing", intent, "db:2"),
+        )
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("a", {"content": "A"})
+        self.cache.put("b", {"content": "B"})
+        self.assertEqual(self.cache.get("a"), {"content": "A"})  # a is now most recent
+
+        self.cache.put("c", {"content": "C"})
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), {"content": "A"})
+        self.assertEqual(self.cache.get("c"), {"content": "C"})
+
+    def test_stats_persist_across_instances(self):
+        self.cache.record(hit=False, elapsed_ms=20.0)
+        self.cache.record(hit=True, elapsed_ms=2.0)
+        self.cache.record(hit=True, elapsed_ms=4.0)
+
+        stats = ContextLoadCache(self.cache.db_path).stats()
+
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+        self.assertAlmostEqual(stats['avg_hit_ms'], 3.0)
+        self.assertAlmostEqual(stats['avg_miss_ms'], 20.0)
+
+
+class TestSmartLoaderCaching(unittest.TestCase):
+    """load_for_intent is cached per DB generation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        db_dir = self.root / "claude" / "data" / "databases" / "system"
+        db_dir.mkdir(parents=True)
+        source = self.root / "SYSTEM_STATE.md"
+        source.write_text("# SYSTEM_STATE\n")
+        self.etl = SystemStateETL(db_dir / "system_state.db", source)
+        self.etl.init_database()
+        self._load_phase(101, "Agent routing upgrade")
+
+        self.loader = SmartContextLoader(maia_root=self.root, cache_path=self.root / "cache.db")
+        self.loader.use_semantic_search = False
+        if not self.loader.use_database:
+            self.skipTest("Database query interface not available")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _load_phase(self, number, title):
+        conn = sqlite3.connect(self.etl.db_path)
+        self.etl.load_phase(conn, Phase(phase_number=str(number), title=title, date="2025-11-21",
+                                        narrative_text=f"## PHASE {number}: {title}"), [], [], [], [])
+        conn.commit()
+        conn.close()
+
+    def test_repeat_query_served_from_cache(self):
+        first = self.loader.load_for_intent("Continue agent routing work", include_memory=False)
+        second = self.loader.load_for_intent("Continue  agent routing work. ", include_memory=False)
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.phases_loaded, first.phases_loaded)
+
+        stats = self.loader.cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_database_change_invalidates(self):
+        self.loader.load_for_intent("agent routing", include_memory=False)
+
+        self._load_phase(102, "Agent prompt templates")
+        result = self.loader.load_for_intent("agent routing", include_memory=False)
+
+        self.assertFalse(result.from_cache)
+        self.assertIn(102, result.phases_loaded)
+
+    def test_cache_can_be_disabled(self):
+        loader = SmartContextLoader(maia_root=self.root, use_cache=False)
+
+        self.assertFalse(loader.load_for_intent("agent routing", include_memory=False).from_cache)
+        self.assertEqual(loader.cache_stats(), {'enabled': False})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test Suite for SYSTEM_STATE Full-Text Phase Search
+
+Tests the phases_fts shadow table maintained by SystemStateETL.load_phase
+and the single-statement BM25 search used by the smart context loader.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+maia_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(maia_root / "claude" / "tools" / "sre"))
+
+from system_state_etl import Phase, SystemStateETL
+from system_state_queries import SystemStateQueries
+
+
+def _phase(number, title, achievement="", narrative=""):
+    return Phase(phase_number=str(number), title=title, date="2025-11-21",
+                 achievement=achievement, narrative_text=narrative)
+
+
+class TestPhaseFullTextSearch(unittest.TestCase):
+    """phases_fts stays in step with phases and ranks keyword matches"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "system_state.db"
+        self.source_path = Path(self.temp_dir.name) / "SYSTEM_STATE.md"
+        self.source_path.write_text("# SYSTEM_STATE\n")
+        self.etl = SystemStateETL(self.db_path, self.source_path)
+        self.etl.init_database()
+        self._load(
+            _phase(101, "Swarm routing upgrade", "Coordinator routing rewrite"),
+            _phase(102, "Voice dictation", narrative="Whisper transcription pipeline; routing unchanged"),
+            _phase(103, "Database health monitor", "SRE reliability checks"),
+            _phase(104, "Few-shot prompt templates", "Agent enhancement"),
+        )
+        self.queries = SystemStateQueries(self.db_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _load(self, *phases):
+        conn = sqlite3.connect(self.db_path)
+        for phase in phases:
+            self.etl.load_phase(conn, phase, [], [], [], [])
+        conn.commit()
+        conn.close()
+
+    def test_ranks_title_matches_first(self):
+        self.assertEqual(self.queries.search_phase_numbers(["routing"]), ["101", "102"])
+
+    def test_multiple_keywords_prefixes_and_punctuation(self):
+        results = self.queries.search_phase_numbers(["transcri", "few-shot", "monitor"])
+
+        self.assertEqual(set(results), {"102", "103", "104"})
+        self.assertEqual(self.queries.search_phase_numbers(["transcri", "few-shot"], limit=1), ["104"])
+        self.assertEqual(self.queries.search_phase_numbers(['"', "  "]), [])
+
+    def test_reload_replaces_indexed_text(self):
+        self._load(_phase(101, "Email triage", "Inbox rules"))
+
+        self.assertEqual(self.queries.search_phase_numbers(["routing"]), ["102"])
+        self.assertEqual(self.queries.search_phase_numbers(["inbox"]), ["101"])
+
+    def test_index_backfilled_for_existing_database(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TABLE phases_fts")
+        conn.commit()
+        conn.close()
+        self.assertEqual(set(self.queries.search_phase_numbers(["routing"])), {"101", "102"})
+
+        SystemStateETL(self.db_path, self.source_path).init_database()
+
+        self.assertEqual(self.queries.search_phase_numbers(["routing"]), ["101", "102"])
+
+    def test_search_latency_with_many_phases(self):
+        self._load(*[
+            _phase(1000 + i, f"Phase {i} maintenance", narrative="routine work " * 200)
+            for i in range(2000)
+        ])
+
+        start = time.perf_counter()
+        for _ in range(20):
+            result = self.queries.search_phase_numbers(["swarm", "routing", "prompt"], limit=10)
+        mean_ms = (time.perf_counter() - start) * 1000 / 20
+
+        self.assertEqual(result[0], "101")
+        self.assertLess(mean_ms, 20, f"Query too slow: {mean_ms:.2f}ms (target: <20ms)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Incremental SYSTEM_STATE ETL
+
+Tests that SystemStateETL.run only re-parses phases whose text changed,
+deletes phases removed from SYSTEM_STATE.md (keeping archived ones), and
+reprocesses everything with full=True.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+maia_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(maia_root / "claude" / "tools" / "sre"))
+
+from system_state_etl import SystemStateETL
+
+
+def _block(number, title, body="Routine maintenance."):
+    return (
+        f"## 🔧 PHASE {number}: {title} (2025-11-{number % 28 + 1:02d}) **COMPLETE**\n\n"
+        f"**Achievement**: {title} shipped\n\n{body}\n\n---\n"
+    )
+
+
+class TestIncrementalETL(unittest.TestCase):
+    """Content hashes decide which phases an ETL run touches"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.db_path = root / "system_state.db"
+        self.source_path = root / "SYSTEM_STATE.md"
+        self.archive_path = root / "SYSTEM_STATE_ARCHIVE.md"
+        self.blocks = {n: _block(n, f"Phase {n} work") for n in (101, 102, 103)}
+        self._write()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self):
+        self.source_path.write_text(
+            "# SYSTEM_STATE\n\n" + "\n".join(self.blocks[n] for n in sorted(self.blocks, reverse=True))
+        )
+
+    def _run(self, **kwargs):
+        return SystemStateETL(self.db_path, self.source_path).run(progress=False, **kwargs)
+
+    def _phase_numbers(self):
+        conn = sqlite3.connect(self.db_path)
+        numbers = sorted(row[0] for row in conn.execute("SELECT phase_number FROM phases"))
+        conn.close()
+        return numbers
+
+    def test_unchanged_phases_are_skipped(self):
+        first = self._run()
+        second = self._run()
+
+        self.assertEqual((first['phases_processed'], first['phases_unchanged']), (3, 0))
+        self.assertEqual((second['phases_processed'], second['phases_unchanged']), (0, 3))
+
+    def test_only_edited_phase_is_reloaded(self):
+        self._run()
+        self.blocks[102] = _block(102, "Phase 102 work", body="Rewrote the routing layer.")
+        self._write()
+
+        stats = self._run()
+
+        self.assertEqual((stats['phases_processed'], stats['phases_unchanged']), (1, 2))
+        conn = sqlite3.connect(self.db_path)
+        narrative = conn.execute(
+            "SELECT narrative_text FROM phases WHERE phase_number = 102"
+        ).fetchone()[0]
+        conn.close()
+        self.assertIn("Rewrote the routing layer.", narrative)
+
+    def test_removed_phase_is_deleted(self):
+        self._run()
+        del self.blocks[101]
+        self._write()
+
+        stats = self._run()
+
+        self.assertEqual(stats['phases_deleted'], 1)
+        self.assertEqual(self._phase_numbers(), [102, 103])
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM phases_fts").fetchone()[0], 2)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM phase_hashes").fetchone()[0], 2)
+        conn.close()
+
+    def test_archived_phase_is_kept(self):
+        self._run()
+        self.archive_path.write_text(self.blocks.pop(101))
+        self._write()
+
+        stats = self._run()
+
+        self.assertEqual(stats['phases_deleted'], 0)
+        self.assertEqual(self._phase_numbers(), [101, 102, 103])
+
+    def test_filtered_run_does_not_delete(self):
+        self._run()
+        del self.blocks[101]
+        self._write()
+
+        stats = self._run(phase_numbers=["102"])
+
+        self.assertEqual(stats['phases_deleted'], 0)
+        self.assertEqual(self._phase_numbers(), [101, 102, 103])
+
+    def test_full_run_reprocesses_everything(self):
+        self._run()
+
+        stats = self._run(full=True)
+
+        self.assertEqual((stats['phases_processed'], stats['phases_unchanged']), (3, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
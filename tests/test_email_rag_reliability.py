@@ -66,7 +66,7 @@ class TestEmailRAGReliability:
     @pytest.fixture
     def mock_ollama(self):
         """Mock Ollama embeddings"""
-        with mock.patch('claude.tools.email_rag_ollama.requests.post') as mock_post:
+        with mock.patch('claude.tools.core.embedding_service.requests.post') as mock_post:
             mock_post.return_value.json.return_value = {
                 'embeddings': [[0.1] * 768]  # nomic-embed-text is 768-dim
             }
@@ -244,7 +244,7 @@ except Exception as e:
             }
 
             # Mock Ollama connection failure during embedding call
-            with mock.patch('claude.tools.email_rag_ollama.requests.post', side_effect=ConnectionError("Connection refused")):
+            with mock.patch('claude.tools.core.embedding_service.requests.post', side_effect=ConnectionError("Connection refused")):
                 rag = EmailRAGOllama(db_path=temp_db_path, extract_contacts=False)
 
                 # Should raise during indexing when trying to get embeddings
@@ -397,7 +397,7 @@ class TestEndToEndReliability:
         Validates entire stack handles degraded conditions gracefully
         """
         with mock.patch('claude.tools.email_rag_ollama.MacOSMailBridge') as mock_bridge:
-            with mock.patch('claude.tools.email_rag_ollama.requests.post') as mock_ollama:
+            with mock.patch('claude.tools.core.embedding_service.requests.post') as mock_ollama:
                 # Setup mocks
                 instance = mock_bridge.return_value
                 instance.get_inbox_messages.return_value = [
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Email RAG Incremental Indexing Tests
+
+Tests the per-mailbox high-water mark in EmailRAGOllama.index_inbox: later
+runs request a narrower window, skip messages at or below the mark without
+fetching their content, and embed/upsert new mail in bulk.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+MAIA_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools import email_rag_ollama
+from claude.tools.core import embedding_service
+from claude.tools.email_rag_ollama import EmailRAGOllama
+
+
+def _header(number):
+    return {'id': str(number), 'subject': f'Subject {number}', 'date': f'2026-10-16T10:{number % 60:02d}:00'}
+
+
+def _content(message_id):
+    return {'id': message_id, 'subject': f'Subject {message_id}', 'from': 'a@example.com',
+            'date': '2026-10-16T10:00:00', 'content': f'Body {message_id}', 'read': True}
+
+
+@pytest.fixture
+def rag(tmp_path):
+    with mock.patch.object(email_rag_ollama, 'chromadb'), \
+            mock.patch.object(email_rag_ollama, 'Settings'), \
+            mock.patch.object(email_rag_ollama, 'MacOSMailBridge') as bridge_cls, \
+            mock.patch.object(embedding_service.requests, 'post') as post:
+        def embed(url, json, timeout):
+            inputs = json['input'] if isinstance(json['input'], list) else [json['input']]
+            response = mock.MagicMock()
+            response.json.return_value = {'embeddings': [[0.1, 0.2] for _ in inputs]}
+            return response
+
+        post.side_effect = embed
+        bridge = bridge_cls.return_value
+        bridge.get_inbox_messages.return_value = [_header(n) for n in range(101, 171)]
+        bridge.get_sent_messages.return_value = []
+        bridge.get_message_content.side_effect = _content
+
+        instance = EmailRAGOllama(db_path=str(tmp_path), extract_contacts=False)
+        instance.post = post
+        yield instance
+
+
+class TestIndexWatermark:
+    """Per-mailbox high-water mark for scheduled index runs"""
+
+    def test_first_run_upserts_in_batches_and_records_watermark(self, rag):
+        stats = rag.index_inbox(include_cc=False)
+
+        assert (stats['fetched'], stats['embedded'], stats['skipped']) == (70, 70, 0)
+        assert stats['elapsed_seconds'] >= 0
+        assert rag.collection.upsert.call_count == 2  # 64 + 6
+        assert rag.post.call_count <= 4  # batched embeds, not one per email
+
+        state = json.loads(Path(rag.index_state_file).read_text())
+        assert state['watermarks']['Inbox']['last_id'] == 170
+
+    def test_second_run_skips_below_watermark_without_fetching_content(self, rag):
+        rag.index_inbox(include_cc=False)
+        rag.mail_bridge.get_message_content.reset_mock()
+        rag.mail_bridge.get_inbox_messages.return_value = [_header(n) for n in range(101, 176)]
+
+        stats = rag.index_inbox(include_cc=False)
+
+        assert (stats['embedded'], stats['skipped']) == (5, 70)
+        assert rag.mail_bridge.get_message_content.call_count == 5
+        assert rag.index_state['watermarks']['Inbox']['last_id'] == 175
+
+    def test_window_narrows_to_time_since_last_fetch(self, rag):
+        rag.index_state['watermarks']['Inbox'] = {
+            'last_id': 100, 'last_fetch': (datetime.now() - timedelta(minutes=90)).isoformat()
+        }
+
+        rag.index_inbox(hours_ago=24, include_sent=False, include_cc=False)
+
+        assert rag.mail_bridge.get_inbox_messages.call_args.kwargs['hours_ago'] == 3
+
+    def test_failed_message_holds_watermark(self, rag):
+        def flaky(message_id):
+            if message_id == '120':
+                raise RuntimeError("Message unavailable")
+            return _content(message_id)
+
+        rag.mail_bridge.get_message_content.side_effect = flaky
+
+        stats = rag.index_inbox(include_cc=False)
+
+        assert stats['errors'] == 1
+        mark = rag.index_state['watermarks']['Inbox']
+        assert mark['last_id'] == 119
+        assert 'last_fetch' not in mark
+
+    def test_failed_batch_holds_watermark_and_continues(self, rag):
+        rag.mail_bridge.get_sent_messages.return_value = [_header(n) for n in range(201, 204)]
+        rag.collection.upsert.side_effect = [RuntimeError("Chroma unavailable"), None]
+
+        stats = rag.index_inbox(include_cc=False)
+
+        # First batch (Inbox 101-164) fails; the final batch still lands
+        assert (stats['errors'], stats['embedded']) == (64, 9)
+        assert rag.collection.upsert.call_count == 2
+        assert rag.index_state['watermarks']['Inbox'] == {}
+        assert rag.index_state['watermarks']['Sent Items']['last_id'] == 203
+        assert len(rag.index_state['indexed_emails']) == 9
+
+    def test_truncated_fetch_does_not_advance(self, rag):
+        rag.index_inbox(limit=70, include_cc=False)
+
+        assert 'Inbox' not in rag.index_state['watermarks']
+
+    def test_force_ignores_watermark(self, rag):
+        rag.index_inbox(include_cc=False)
+
+        stats = rag.index_inbox(force=True, include_cc=False)
+
+        assert stats['embedded'] == 70
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Personal Knowledge Graph Index Tests
+
+Tests the contiguous embedding matrix behind PersonalKnowledgeGraph.semantic_search
+(type/confidence masks, keyword boosts, top-k) and the CSR relationship
+adjacency used for neighbour expansion and multi-hop traversal, including a
+100k-node benchmark.
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+MAIA_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(MAIA_ROOT))
+
+from claude.tools.personal_knowledge_graph import (
+    NodeEmbeddingIndex, NodeType, PersonalKnowledgeGraph, RelationshipAdjacency,
+    RelationshipType, SemanticQuery
+)
+
+
+@pytest.fixture
+def graph(tmp_path):
+    kg = PersonalKnowledgeGraph(db_path=str(tmp_path / "kg.db"))
+    ids = {
+        "python": kg.add_node(NodeType.SKILL, "Python", "Programming language", {}),
+        "sre": kg.add_node(NodeType.SKILL, "SRE", "Site reliability with Python tooling", {}),
+        "orro": kg.add_node(NodeType.COMPANY, "Orro", "Managed services provider", {}),
+        "role": kg.add_node(NodeType.JOB, "Platform Engineer", "Python and SRE role", {}, confidence=0.4),
+        "goal": kg.add_node(NodeType.GOAL, "Principal", "Career goal", {}),
+    }
+    kg.add_relationship(ids["role"], ids["python"], RelationshipType.REQUIRES_SKILL, 0.9)
+    kg.add_relationship(ids["role"], ids["sre"], RelationshipType.REQUIRES_SKILL, 0.8)
+    kg.add_relationship(ids["orro"], ids["role"], RelationshipType.PART_OF, 0.5)
+    kg.add_relationship(ids["role"], ids["goal"], RelationshipType.LEADS_TO, 0.7)
+    return kg, ids
+
+
+def _reference_search(kg, query):
+    """The original per-node loop, for equivalence checks"""
+    query_embedding = kg._generate_text_embedding(query.query_text)
+    results = []
+    for node_id, embedding in kg.node_embeddings.items():
+        node = kg.nodes[node_id]
+        if query.node_types and node.node_type not in query.node_types:
+            continue
+        if node.confidence < query.min_confidence:
+            continue
+        similarity = kg._calculate_similarity(query_embedding, embedding)
+        for keyword in query.context_keywords:
+            if keyword.lower() in node.name.lower() or keyword.lower() in node.description.lower():
+                similarity += 0.2
+        results.append((node_id, min(similarity, 1.0)))
+    results.sort(key=lambda item: item[1], reverse=True)
+    return results[:query.max_results]
+
+
+class TestSemanticSearch:
+    """Vectorised semantic_search matches the per-node loop"""
+
+    @pytest.mark.parametrize("query", [
+        SemanticQuery("python engineering", min_confidence=0.0),
+        SemanticQuery("skills", node_types=[NodeType.SKILL, NodeType.JOB], min_confidence=0.0),
+        SemanticQuery("career", context_keywords=["python", "RELIABILITY"], max_results=3),
+    ])
+    def test_matches_reference_ranking(self, graph, query):
+        kg, _ = graph
+
+        results = kg.semantic_search(query)
+
+        expected = _reference_search(kg, query)
+        assert [r['node'].node_id for r in results] == [node_id for node_id, _ in expected]
+        for result, (_, similarity) in zip(results, expected):
+            assert result['similarity'] == pytest.approx(similarity, abs=1e-5)
+
+    def test_confidence_mask_excludes_low_confidence(self, graph):
+        kg, ids = graph
+
+        results = kg.semantic_search(SemanticQuery("role", min_confidence=0.5))
+
+        assert ids["role"] not in {r['node'].node_id for r in results}
+
+    def test_relationships_attached_in_creation_order(self, graph):
+        kg, ids = graph
+        query = SemanticQuery("role", node_types=[NodeType.JOB], min_confidence=0.0,
+                              relationship_types=[RelationshipType.REQUIRES_SKILL])
+
+        result = kg.semantic_search(query)[0]
+
+        assert result['node'].node_id == ids["role"]
+        assert [r.target_node_id for r in result['relationships']] == [ids["python"], ids["sre"]]
+
+    def test_index_rebuilt_from_database(self, graph, tmp_path):
+        kg, _ = graph
+        query = SemanticQuery("python", context_keywords=["sre"], min_confidence=0.0)
+
+        reloaded = PersonalKnowledgeGraph(db_path=str(tmp_path / "kg.db"))
+
+        assert [r['node'].node_id for r in reloaded.semantic_search(query)] == \
+            [r['node'].node_id for r in kg.semantic_search(query)]
+        assert len(reloaded.node_relationships) == 4
+
+
+class TestRelationshipTraversal:
+    """CSR adjacency expansion"""
+
+    def test_multi_hop_distances(self, graph):
+        kg, ids = graph
+
+        related = kg.get_related_nodes(ids["python"], depth=2)
+
+        hops = {node.node_id: hop for node, hop in related}
+        assert hops == {ids["role"]: 1, ids["sre"]: 2, ids["orro"]: 2, ids["goal"]: 2}
+
+    def test_traversal_respects_relationship_types(self, graph):
+        kg, ids = graph
+
+        related = kg.get_related_nodes(ids["python"], depth=3,
+                                       relationship_types=[RelationshipType.REQUIRES_SKILL])
+
+        assert {node.node_id for node, _ in related} == {ids["role"], ids["sre"]}
+
+    def test_unknown_node_has_no_neighbours(self, graph):
+        kg, _ = graph
+
+        assert kg.get_related_nodes("missing") == []
+        assert kg.node_relationships.relationship_ids("missing") == []
+
+
+class TestScaleBenchmark:
+    """Index operations at 100k nodes"""
+
+    NODES = 100_000
+    EDGES = 300_000
+
+    @pytest.fixture(scope="class")
+    def indexes(self):
+        rng = np.random.default_rng(7)
+        node_types = list(NodeType)
+        relationship_types = list(RelationshipType)
+
+        index = NodeEmbeddingIndex(384)
+        vectors = rng.random((self.NODES, 384), dtype=np.float32)
+        for i in range(self.NODES):
+            index[f"n{i}"] = vectors[i]
+            index.set_node_info(SimpleNamespace(
+                node_id=f"n{i}", node_type=node_types[i % len(node_types)],
+                confidence=(i % 10) / 10, name=f"node {i}", description=f"topic {i % 97}"
+            ))
+
+        adjacency = RelationshipAdjacency()
+        sources = rng.integers(0, self.NODES, self.EDGES)
+        targets = rng.integers(0, self.NODES, self.EDGES)
+        for i, (source, target) in enumerate(zip(sources, targets)):
+            adjacency.add(SimpleNamespace(
+                relationship_id=f"r{i}", source_node_id=f"n{source}", target_node_id=f"n{target}",
+                relationship_type=relationship_types[i % len(relationship_types)]
+            ))
+        adjacency.relationship_ids("n0")  # build CSR outside the timed section
+        return index, adjacency, vectors
+
+    def test_top_k_latency(self, indexes):
+        index, _, vectors = indexes
+        query = vectors[123]
+
+        start = time.perf_counter()
+        for _ in range(10):
+            results = index.top_k(query, 50, node_types=[NodeType.SKILL, NodeType.JOB],
+                                  min_confidence=0.5, boosts=index.keyword_boosts(["topic 42"], 0.2))
+        mean_ms = (time.perf_counter() - start) * 1000 / 10
+
+        assert len(results) == 50
+        assert all(score <= 1.0 for _, score in results)
+        assert mean_ms < 150, f"top-k too slow: {mean_ms:.1f}ms (target: <150ms)"
+
+    def test_traversal_latency(self, indexes):
+        _, adjacency, _ = indexes
+
+        start = time.perf_counter()
+        for _ in range(10):
+            reached = adjacency.traverse(["n1", "n2"], depth=3)
+        mean_ms = (time.perf_counter() - start) * 1000 / 10
+
+        assert reached and max(reached.values()) <= 3
+        assert mean_ms < 50, f"traversal too slow: {mean_ms:.1f}ms (target: <50ms)"